@@ -0,0 +1,6 @@
+"""Local performance benchmarks for ModelOps hot paths.
+
+Run with `make benchmark` or `uv run python -m benchmarks.hotpath --help`.
+Results are written as JSON under .benchmarks/ so runs can be compared
+over time with `--compare`.
+"""
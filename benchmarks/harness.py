@@ -0,0 +1,164 @@
+"""Timing, summary statistics and JSON result files for the benchmarks.
+
+A benchmark calls an operation repeatedly and records the wall time of each
+call. Each call may cover several operations (an end-to-end job runs N
+tasks), so throughput is reported as operations per second while the
+percentiles describe single calls.
+
+Result files hold one run each:
+
+    {"run": {...machine and git info...}, "results": [{name, ops_per_sec, p50_ms, ...}]}
+"""
+
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+DEFAULT_RESULTS_DIR = Path(".benchmarks")
+
+
+@dataclass
+class BenchResult:
+    """Summary of one benchmark."""
+
+    name: str
+    calls: int
+    ops: int
+    total_seconds: float
+    ops_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(
+    name: str, durations: list[float], ops_per_call: int = 1, **params: Any
+) -> BenchResult:
+    """Build a BenchResult from per-call wall times in seconds."""
+    ordered = sorted(durations)
+    total = sum(ordered)
+    ops = ops_per_call * len(ordered)
+    return BenchResult(
+        name=name,
+        calls=len(ordered),
+        ops=ops,
+        total_seconds=round(total, 6),
+        ops_per_sec=round(ops / total, 3) if total > 0 else 0.0,
+        mean_ms=round(statistics.fmean(ordered) * 1000, 6) if ordered else 0.0,
+        p50_ms=round(percentile(ordered, 50) * 1000, 6),
+        p99_ms=round(percentile(ordered, 99) * 1000, 6),
+        params=params,
+    )
+
+
+def time_calls(
+    fn: Callable[[], Any],
+    calls: int,
+    warmup: int = 0,
+    setup: Callable[[], Any] | None = None,
+) -> list[float]:
+    """Call fn repeatedly and return the wall time of each timed call.
+
+    Args:
+        fn: Operation to time
+        calls: Number of timed calls
+        warmup: Untimed calls made first
+        setup: Untimed callable run before every call (e.g. to reset state)
+
+    Returns:
+        Durations in seconds
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    durations = []
+    clock = time.perf_counter
+    for _ in range(calls):
+        if setup:
+            setup()
+        start = clock()
+        fn()
+        durations.append(clock() - start)
+    return durations
+
+
+def run_info() -> dict[str, Any]:
+    """Describe the machine and revision a run was made on."""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        sha = None
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_sha": sha,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "hostname": socket.gethostname(),
+    }
+
+
+def default_output_path(suite: str) -> Path:
+    """Timestamped result file under .benchmarks/."""
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    return DEFAULT_RESULTS_DIR / f"{suite}-{stamp}.json"
+
+
+def write_results(path: Path, results: list[BenchResult], info: dict[str, Any]) -> Path:
+    """Write a run to a JSON result file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"run": info, "results": [asdict(r) for r in results]}
+    path.write_text(json.dumps(data, indent=2) + "\n")
+    return path
+
+
+def load_results(path: Path) -> dict[str, dict[str, Any]]:
+    """Read a result file as {benchmark name: result}."""
+    data = json.loads(Path(path).read_text())
+    return {r["name"]: r for r in data["results"]}
+
+
+def format_table(results: list[BenchResult], baseline: dict[str, dict] | None = None) -> str:
+    """Render results, with the ops/sec change against a baseline if given."""
+    header = f"{'benchmark':<44} {'ops/sec':>12} {'p50 ms':>10} {'p99 ms':>10}"
+    if baseline is not None:
+        header += f" {'vs base':>9}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        line = f"{r.name:<44} {r.ops_per_sec:>12,.1f} {r.p50_ms:>10.3f} {r.p99_ms:>10.3f}"
+        if baseline is not None:
+            base = baseline.get(r.name)
+            if base and base["ops_per_sec"]:
+                change = (r.ops_per_sec / base["ops_per_sec"] - 1) * 100
+                line += f" {change:>+8.1f}%"
+            else:
+                line += f" {'new':>9}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,375 @@
+"""Hot-path benchmarks, runnable on a laptop.
+
+Covers the paths every simulation task goes through:
+
+- jsonrpc: JSON-RPC round trips over pipes at several payload sizes
+- warm_execute: WarmProcessManager.execute_task against tests/fixtures/test_bundle
+- provenance: ProvenanceStore.put_sim / get_sim
+- render_path: ProvenanceSchema.render_path for sim result paths
+- job_serde: job serialization and deserialization
+- dask_serde: SimReturns through Dask's wire/spill serialization, pickle vs out-of-band frames
+- end_to_end: run_simulation_job for N tasks on a Dask LocalCluster
+
+Usage:
+    uv run python -m benchmarks.hotpath                      # everything
+    uv run python -m benchmarks.hotpath --quick --only jsonrpc render_path
+    uv run python -m benchmarks.hotpath --compare .benchmarks/hotpath-<stamp>.json
+
+Results go to .benchmarks/hotpath-<timestamp>.json (see benchmarks.harness).
+"""
+
+import argparse
+import hashlib
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import traceback
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from .harness import (
+    BenchResult,
+    default_output_path,
+    format_table,
+    load_results,
+    run_info,
+    summarize,
+    time_calls,
+    write_results,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+TEST_BUNDLE = FIXTURES_DIR / "test_bundle"
+
+JSONRPC_PAYLOAD_SIZES = [64, 4 * 1024, 64 * 1024, 1024 * 1024]
+ENTRYPOINT = "test_module/bundle_simulation"
+
+
+def _scale(n: int, quick: bool) -> int:
+    return max(1, n // 10) if quick else n
+
+
+def _arrow_table(rows: int) -> bytes:
+    import polars as pl
+
+    df = pl.DataFrame(
+        {
+            "day": list(range(rows)),
+            "infected": [float(i % 97) for i in range(rows)],
+            "recovered": [float(i % 13) for i in range(rows)],
+        }
+    )
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def _sim_task(x: int, seed: int, bundle_ref: str = "sha256:" + "a" * 64):
+    from modelops_contracts import SimTask, UniqueParameterSet
+
+    return SimTask(
+        bundle_ref=bundle_ref,
+        entrypoint=ENTRYPOINT,
+        params=UniqueParameterSet.from_dict({"x": x, "size": 10}),
+        seed=seed,
+    )
+
+
+def bench_jsonrpc(quick: bool, **_) -> Iterator[BenchResult]:
+    """Echo round trips between a JSONRPCClient and a server thread over os.pipe."""
+    from modelops.worker.jsonrpc import JSONRPCClient, JSONRPCProtocol, JSONRPCServer
+
+    to_server_r, to_server_w = os.pipe()
+    to_client_r, to_client_w = os.pipe()
+    server = JSONRPCServer(
+        JSONRPCProtocol(os.fdopen(to_server_r, "rb"), os.fdopen(to_client_w, "wb"))
+    )
+    server.register("echo", lambda payload: payload)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client_out = os.fdopen(to_server_w, "wb")
+    client = JSONRPCClient(client_out, os.fdopen(to_client_r, "rb"))
+    try:
+        for size in JSONRPC_PAYLOAD_SIZES:
+            payload = "x" * size
+            calls = _scale(2000 if size <= 64 * 1024 else 200, quick)
+            durations = time_calls(
+                lambda payload=payload: client.call("echo", {"payload": payload}, timeout=30),
+                calls,
+                warmup=5,
+            )
+            yield summarize(f"jsonrpc.roundtrip[{size}B]", durations, payload_bytes=size)
+    finally:
+        client_out.close()  # EOF stops the server loop
+        thread.join(timeout=5)
+
+
+def bench_warm_execute(quick: bool, workdir: Path, **_) -> Iterator[BenchResult]:
+    """execute_task on an already warm process (the first call builds the venv)."""
+    from modelops.utils.test_bundle_digest import compute_test_bundle_digest
+    from modelops.worker.process_manager import WarmProcessManager
+
+    digest = compute_test_bundle_digest(TEST_BUNDLE)
+    manager = WarmProcessManager(
+        max_processes=1, venvs_dir=workdir / "venvs", force_fresh_venv=False
+    )
+    seeds = iter(range(10**9))
+
+    def execute():
+        manager.execute_task(
+            bundle_digest=digest,
+            bundle_path=TEST_BUNDLE,
+            entrypoint=ENTRYPOINT,
+            params={"size": 100},
+            seed=next(seeds),
+        )
+
+    try:
+        cold = time_calls(execute, 1)
+        yield summarize("warm_process.first_call", cold, note="includes venv creation")
+        yield summarize("warm_process.execute_task", time_calls(execute, _scale(500, quick)))
+    finally:
+        manager.shutdown_all()
+
+
+def bench_provenance(quick: bool, workdir: Path, **_) -> Iterator[BenchResult]:
+    """put_sim of new results, then get_sim of the same results."""
+    from modelops_contracts import SimReturn, TableArtifact
+
+    from modelops.services.provenance_schema import BUNDLE_INVALIDATION_SCHEMA
+    from modelops.services.provenance_store import ProvenanceStore
+
+    store = ProvenanceStore(
+        storage_dir=workdir / "provenance", schema=BUNDLE_INVALIDATION_SCHEMA
+    )
+    data = _arrow_table(1000)
+    checksum = hashlib.blake2b(data, digest_size=32).hexdigest()
+    calls = _scale(300, quick)
+    tasks = [_sim_task(i, seed=0) for i in range(calls)]
+    result = SimReturn(
+        task_id="0" * 64,
+        outputs={"timeseries": TableArtifact(size=len(data), inline=data, checksum=checksum)},
+    )
+
+    pending = iter(tasks)
+    yield summarize(
+        "provenance.put_sim",
+        time_calls(lambda: store.put_sim(next(pending), result), calls),
+        artifact_bytes=len(data),
+    )
+
+    pending = iter(tasks)
+    yield summarize(
+        "provenance.get_sim",
+        time_calls(lambda: store.get_sim(next(pending)), calls),
+        artifact_bytes=len(data),
+    )
+
+
+def bench_render_path(quick: bool, **_) -> Iterator[BenchResult]:
+    """Render the default sim result path (two hashes and a shard per call)."""
+    from modelops.services.provenance_schema import BUNDLE_INVALIDATION_SCHEMA
+
+    context = {
+        "bundle_digest": "b" * 64,
+        "param_id": hashlib.sha256(b"params").hexdigest(),
+        "seed": 42,
+    }
+    durations = time_calls(
+        lambda: BUNDLE_INVALIDATION_SCHEMA.sim_path(**context), _scale(20000, quick), warmup=100
+    )
+    yield summarize("provenance_schema.render_path", durations)
+
+
+def bench_job_serde(quick: bool, **_) -> Iterator[BenchResult]:
+    """Serialize a SimJob to JSON as the submission client does, and parse it back."""
+    import json
+
+    from modelops_contracts import SimJob
+
+    from modelops.client.job_submission import JobSubmissionClient
+    from modelops.runners.job_runner import deserialize_job
+
+    n_tasks = 1000
+    job = SimJob(
+        job_id="job-bench",
+        bundle_ref="sha256:" + "a" * 64,
+        tasks=[_sim_task(i // 10, seed=i % 10) for i in range(n_tasks)],
+    )
+    # Serialization needs no Azure connection; skip the client's constructor
+    submitter = JobSubmissionClient.__new__(JobSubmissionClient)
+    payload = submitter._serialize_job(job)
+    calls = _scale(50, quick)
+
+    yield summarize(
+        "job.serialize",
+        time_calls(lambda: submitter._serialize_job(job), calls, warmup=2),
+        n_tasks,
+        n_tasks=n_tasks,
+        json_bytes=len(payload),
+    )
+    yield summarize(
+        "job.deserialize",
+        time_calls(lambda: deserialize_job(json.loads(payload)), calls, warmup=2),
+        n_tasks,
+        n_tasks=n_tasks,
+        json_bytes=len(payload),
+    )
+
+
+def bench_dask_serde(quick: bool, **_) -> Iterator[BenchResult]:
+    """Serialize a 200-replicate aggregation input as Dask does for transfer and spill.
+
+    Compares plain pickle with the out-of-band handlers in
+    modelops.worker.serialization; peak_mb is the tracemalloc peak of one round trip.
+    """
+    import tracemalloc
+
+    from distributed.protocol import deserialize_bytes, serialize_bytelist
+    from modelops_contracts import SimReturn, TableArtifact
+
+    import modelops.worker.serialization  # noqa: F401
+
+    n_replicates = 200
+    data = _arrow_table(20000)
+    checksum = hashlib.blake2b(data, digest_size=32).hexdigest()
+    # Distinct bodies, as real replicates have
+    results = [
+        SimReturn(
+            task_id=f"{i:064x}",
+            outputs={
+                "timeseries": TableArtifact(
+                    size=len(data), inline=data[:-8] + i.to_bytes(8, "little"), checksum=checksum
+                )
+            },
+        )
+        for i in range(n_replicates)
+    ]
+    calls = _scale(20, quick)
+
+    for label, serializers in (("pickle", ("pickle",)), ("dask", ("dask", "pickle"))):
+
+        def roundtrip(serializers=serializers):
+            frames = serialize_bytelist(results, serializers=serializers)
+            deserialize_bytes(b"".join(frames))
+
+        tracemalloc.start()
+        roundtrip()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        yield summarize(
+            f"dask_serde.{label}",
+            time_calls(roundtrip, calls, warmup=1),
+            n_replicates,
+            n_replicates=n_replicates,
+            artifact_bytes=len(data),
+            peak_mb=round(peak / 2**20, 1),
+        )
+
+
+def bench_end_to_end(quick: bool, workdir: Path, tasks: int, **_) -> Iterator[BenchResult]:
+    """run_simulation_job on a LocalCluster loading the test bundle from disk.
+
+    Each repetition uses fresh seeds so results are computed rather than
+    served from the provenance cache. ops/sec is tasks per second.
+    """
+    from dask.distributed import Client, LocalCluster
+    from modelops_contracts import SimJob
+
+    from modelops.runners.job_runner import run_simulation_job
+    from modelops.utils.test_bundle_digest import compute_test_bundle_digest
+
+    # Workers read their configuration from the environment at startup
+    os.environ.update(
+        {
+            "MODELOPS_BUNDLE_SOURCE": "file",
+            "MODELOPS_BUNDLES_DIR": str(FIXTURES_DIR),
+            "MODELOPS_VENVS_DIR": str(workdir / "venvs"),
+            "MODELOPS_STORAGE_DIR": str(workdir / "provenance"),
+            "MODELOPS_FORCE_FRESH_VENV": "false",
+        }
+    )
+    bundle_ref = f"sha256:{compute_test_bundle_digest(TEST_BUNDLE)}"
+    n_tasks = _scale(tasks, quick)
+    n_params = max(1, n_tasks // 10)
+    repeats = 1 if quick else 3
+
+    def make_job(rep: int):
+        return SimJob(
+            job_id=f"bench-e2e-{rep}",
+            bundle_ref=bundle_ref,
+            tasks=[
+                _sim_task(i % n_params, seed=rep * n_tasks + i, bundle_ref=bundle_ref)
+                for i in range(n_tasks)
+            ],
+        )
+
+    with (
+        LocalCluster(n_workers=2, threads_per_worker=2, processes=True) as cluster,
+        Client(cluster) as client,
+    ):
+        run_simulation_job(make_job(-1), client)  # Warm venvs and processes
+        reps = iter(range(repeats))
+        durations = time_calls(lambda: run_simulation_job(make_job(next(reps)), client), repeats)
+    yield summarize("run_simulation_job", durations, n_tasks, n_tasks=n_tasks, workers=2)
+
+
+BENCHMARKS: dict[str, Callable[..., Iterator[BenchResult]]] = {
+    "jsonrpc": bench_jsonrpc,
+    "warm_execute": bench_warm_execute,
+    "provenance": bench_provenance,
+    "render_path": bench_render_path,
+    "job_serde": bench_job_serde,
+    "dask_serde": bench_dask_serde,
+    "end_to_end": bench_end_to_end,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks"
+    )
+    parser.add_argument("--quick", action="store_true", help="Run ~10x fewer iterations")
+    parser.add_argument(
+        "--tasks", type=int, default=200, help="Tasks per end-to-end job (default: 200)"
+    )
+    parser.add_argument("--output", type=Path, help="Result file (default: .benchmarks/...)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    baseline = load_results(args.compare) if args.compare else None
+    workdir = Path(tempfile.mkdtemp(prefix="modelops-bench-"))
+
+    results: list[BenchResult] = []
+    failed = []
+    try:
+        for name in args.only or BENCHMARKS:
+            print(f"Running {name}...", file=sys.stderr)
+            try:
+                for result in BENCHMARKS[name](quick=args.quick, workdir=workdir, tasks=args.tasks):
+                    results.append(result)
+            except Exception:
+                failed.append(name)
+                traceback.print_exc()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(format_table(results, baseline))
+    path = write_results(args.output or default_output_path("hotpath"), results, run_info())
+    print(f"\nResults written to {path}")
+    if failed:
+        print(f"Failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,13 @@
 
 Used to verify warm-process timeout handling. Never ship this pattern in
 production bundles.
+
+The "uninterruptible" entrypoint additionally ignores the runner's interrupt
+signals, standing in for a model stuck inside a C extension.
 """
 
 import logging
+import signal
 import time
 from typing import Any, Dict
 
@@ -18,5 +22,8 @@ def wire_function(entrypoint: str, params: Dict[str, Any], seed: int) -> Dict[st
         seed,
         params,
     )
+    if entrypoint.endswith("uninterruptible"):
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
     while True:
         time.sleep(1)
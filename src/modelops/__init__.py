@@ -1,9 +1,19 @@
 """ModelOps - Infrastructure orchestration for ML experimentation."""
 
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_attrs
 from ._version import __version__, get_version, get_version_info
 
-# Make key components available at package level
-from .services import DaskSimulationService, LocalSimulationService
+if TYPE_CHECKING:
+    from .services import DaskSimulationService, LocalSimulationService
+
+# Key components available at package level, imported on first access so
+# that `import modelops` (workers, the CLI, scripts) doesn't load dask
+_LAZY_ATTRS = {
+    "DaskSimulationService": ".services",
+    "LocalSimulationService": ".services",
+}
 
 __all__ = [
     "LocalSimulationService",
@@ -12,3 +22,5 @@ __all__ = [
     "get_version",
     "get_version_info",
 ]
+
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS)
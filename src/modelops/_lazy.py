@@ -0,0 +1,36 @@
+"""Lazily imported package attributes (PEP 562 module __getattr__).
+
+Package __init__ files re-export classes whose modules pull in heavy
+dependencies (dask.distributed, kubernetes, the Azure SDKs). Importing them
+on first access keeps `import modelops` and CLI start-up cheap.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attrs(package: str, attrs: dict[str, str]) -> tuple[Callable, Callable]:
+    """Build a package's __getattr__ and __dir__.
+
+    Args:
+        package: The package's __name__
+        attrs: Maps each lazy attribute to the relative module defining it
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in attrs:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(attrs[name], package), name)
+        namespace[name] = value  # Later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *attrs})
+
+    return __getattr__, __dir__
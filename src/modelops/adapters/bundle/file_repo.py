@@ -35,6 +35,9 @@ class FileBundleRepository:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # source path -> (tree snapshot, digest); revalidated by stat only
+        self._digest_cache: dict[Path, tuple[str, str]] = {}
+
     def ensure_local(self, bundle_ref: str) -> tuple[str, Path]:
         """Ensure bundle is available locally and return its digest and path.
 
@@ -69,7 +72,9 @@ class FileBundleRepository:
             test_bundle_path = self.bundles_dir / "test_bundle"
             if test_bundle_path.exists():
                 # Use deterministic test digest for test bundles
-                computed_digest = compute_test_bundle_digest(test_bundle_path)
+                computed_digest = self._cached_digest(
+                    test_bundle_path, compute_test_bundle_digest
+                )
                 if computed_digest == digest:
                     # Found matching bundle, cache it
                     logger.info(f"Found matching bundle for digest {digest[:12]}")
@@ -116,9 +121,9 @@ class FileBundleRepository:
         # Compute digest of the source bundle
         # Use deterministic test digest for test bundles
         if source_path.name == "test_bundle" or "test" in source_path.name.lower():
-            digest = compute_test_bundle_digest(source_path)
+            digest = self._cached_digest(source_path, compute_test_bundle_digest)
         else:
-            digest = self._compute_digest(source_path)
+            digest = self._cached_digest(source_path, self._compute_digest)
 
         # Check if already cached
         cache_path = self.cache_dir / digest
@@ -164,6 +169,61 @@ class FileBundleRepository:
                 # Release lock
                 fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
 
+    def _cached_digest(self, path: Path, compute) -> str:
+        """Return the digest of a bundle tree, rehashing only if it changed.
+
+        The tree is revalidated with a stat-only snapshot, so repeat lookups of
+        an unchanged bundle cost a directory walk instead of reading every file.
+
+        Args:
+            path: Bundle directory
+            compute: Digest function to use on a miss
+
+        Returns:
+            Digest hex string
+        """
+        key = path.resolve()
+        snapshot = self._tree_snapshot(key)
+        cached = self._digest_cache.get(key)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        digest = compute(path)
+        self._digest_cache[key] = (snapshot, digest)
+        return digest
+
+    @staticmethod
+    def _tree_snapshot(path: Path) -> str:
+        """Fingerprint a directory tree by relative path, size and mtime_ns.
+
+        Args:
+            path: Directory path
+
+        Returns:
+            Hex fingerprint that changes whenever any file is added, removed,
+            resized or touched
+        """
+        entries = []
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # Dangling symlink; the digest skips it too
+                    entries.append(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}")
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for item in sorted(entries):
+            hasher.update(item.encode())
+            hasher.update(b"\n")
+        return hasher.hexdigest()
+
     def _compute_digest(self, path: Path) -> str:
         """Compute SHA256 digest of a directory.
 
@@ -1,6 +1,7 @@
 """Execution environment adapters for ModelOps."""
 
 from .direct import DirectExecEnv
+from .fork_server import ForkServerExecEnv
 from .isolated_warm import IsolatedWarmExecEnv
 
-__all__ = ["DirectExecEnv", "IsolatedWarmExecEnv"]
+__all__ = ["DirectExecEnv", "ForkServerExecEnv", "IsolatedWarmExecEnv"]
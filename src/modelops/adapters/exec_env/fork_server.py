@@ -0,0 +1,35 @@
+"""Fork-server (zygote) execution environment.
+
+Sits between the two existing choices:
+
+- ColdDebugExecEnv spawns ultra_cold_runner.py per task: fully isolated, but
+  every task pays for a fresh interpreter, heavy imports and dep checks.
+- IsolatedWarmExecEnv reuses one subprocess per bundle: fast, but module
+  globals and C++ statics leak between tasks
+  (see docs/incidents/cpp_state_leakage_fix.md).
+
+ForkServerExecEnv keeps the warm pool, but each runner acts as a template
+process. It imports the bundle and its wire function once, then fork()s a
+child per task. The child runs against a copy-on-write snapshot of the
+template and writes its result over the usual Content-Length framed
+JSON-RPC channel, then exits. Whatever it mutates is discarded with it.
+
+Requires a platform with fork() (Linux/macOS). Template state created at
+import time is still shared by every task, by design.
+"""
+
+from typing import Any
+
+from .isolated_warm import IsolatedWarmExecEnv
+
+
+class ForkServerExecEnv(IsolatedWarmExecEnv):
+    """Warm template process per bundle, fresh forked child per task."""
+
+    FORK_PER_TASK = True
+
+    def health_check(self) -> dict[str, Any]:
+        """Check health of execution environment."""
+        health = super().health_check()
+        health["type"] = "fork_server"
+        return health
@@ -8,6 +8,7 @@ import base64
 import hashlib
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -17,7 +18,9 @@ from modelops_contracts.simulation import AggregationReturn, AggregationTask
 
 from ...services.provenance_schema import DEFAULT_SCHEMA, ProvenanceSchema
 from ...services.provenance_store import ProvenanceStore
+from ...services.tree_aggregation import PartialAggregation
 from ...worker.process_manager import WarmProcessManager
+from ...worker.venv_store import VenvStore
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,12 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
     for the same bundle digest to avoid repeated initialization.
     """
 
+    # How long a mutable bundle ref (path, tag) resolution is trusted
+    MUTABLE_REF_TTL_SECONDS = 5.0
+
+    # Run each task in a fresh fork of the warm process (see ForkServerExecEnv)
+    FORK_PER_TASK = False
+
     def __init__(
         self,
         bundle_repo: BundleRepository,
@@ -42,6 +51,8 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
         disable_provenance_cache: bool = False,
         azure_backend: dict[str, Any] | None = None,
         rpc_timeout_seconds: int = 30 * 60,
+        venv_store_dir: Path | None = None,
+        venv_store_ttl_seconds: float = 14 * 24 * 3600,
     ):
         """Initialize the execution environment.
 
@@ -55,6 +66,8 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
             force_fresh_venv: Force fresh venv creation for each execution (debugging)
             disable_provenance_cache: Disable provenance cache lookups (debugging)
             azure_backend: Azure backend configuration for automatic uploads
+            venv_store_dir: Optional node-level venv store shared across workers
+            venv_store_ttl_seconds: Unused venv templates older than this are removed
         """
         self.bundle_repo = bundle_repo
         self.venvs_dir = venvs_dir
@@ -71,14 +84,24 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
             azure_backend=azure_backend,
         )
 
+        venv_store = None
+        if venv_store_dir is not None:
+            venv_store = VenvStore(venv_store_dir, ttl_seconds=venv_store_ttl_seconds)
+
         # Create process manager
         self._process_manager = WarmProcessManager(
             venvs_dir=venvs_dir,
             max_processes=max_warm_processes,
             force_fresh_venv=force_fresh_venv,
             rpc_timeout_seconds=rpc_timeout_seconds,
+            venv_store=venv_store,
+            fork_per_task=self.FORK_PER_TASK,
         )
 
+        # bundle_ref -> (digest, local_path, expires_at); expires_at is None for
+        # digest-pinned refs, which can never resolve to different content
+        self._bundle_memo: dict[str, tuple[str, Path, float | None]] = {}
+
     def run(self, task: SimTask) -> SimReturn:
         """Execute simulation task.
 
@@ -189,6 +212,36 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
             logger.error(f"Aggregation execution failed: {e}")
             raise
 
+    def run_partial_aggregation(self, task: AggregationTask) -> PartialAggregation:
+        """Evaluate a likelihood target on one group of a tree-reduced aggregation.
+
+        Args:
+            task: AggregationTask holding the group's sim results
+
+        Returns:
+            PartialAggregation of the group's per-replicate log-likelihoods
+
+        Raises:
+            RuntimeError: If the target failed or returned only a loss
+        """
+        digest, bundle_path = self._resolve_bundle(task.bundle_ref)
+        result = self._process_manager.execute_aggregation(
+            bundle_digest=digest,
+            bundle_path=bundle_path,
+            target_entrypoint=str(task.target_entrypoint),
+            sim_returns=self._serialize_sim_returns(task.sim_returns),
+            target_data=task.target_data,
+            partial=True,
+        )
+        if "error" in result:
+            from modelops.utils.error_utils import format_aggregation_error
+
+            raise RuntimeError(format_aggregation_error(result))
+
+        return PartialAggregation.from_logliks(
+            result["loglik_per_rep"], [sr.task_id for sr in task.sim_returns]
+        )
+
     def health_check(self) -> dict[str, Any]:
         """Check health of execution environment."""
         return {
@@ -197,6 +250,15 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
             "venvs_dir": str(self.venvs_dir),
         }
 
+    def warm_bundle_refs(self) -> list[str]:
+        """Return bundle refs that currently have a live warm process.
+
+        Used by the client-side BundlePlacement to route tasks to workers that
+        already hold a warm process for the bundle.
+        """
+        warm = set(self._process_manager.warm_digests())
+        return [ref for ref, (digest, _, _) in list(self._bundle_memo.items()) if digest in warm]
+
     def shutdown(self):
         """Clean shutdown of all warm processes."""
         logger.info("Shutting down IsolatedWarmExecEnv")
@@ -210,12 +272,26 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
         Args:
             bundle_ref: Bundle reference to resolve
 
+        Resolutions are memoized per ref so repeat tasks skip the repository:
+        digest-pinned refs (sha256:... or repository@sha256:...) for the life of
+        the worker, mutable refs (paths, tags) for MUTABLE_REF_TTL_SECONDS.
+
         Returns:
             Tuple of (digest, local_path)
         """
+        now = time.monotonic()
+        memo = self._bundle_memo.get(bundle_ref)
+        if memo is not None:
+            digest, bundle_path, expires_at = memo
+            if (expires_at is None or now < expires_at) and bundle_path.exists():
+                return digest, bundle_path
+
         # SimTask supports both sha256:... and repository@sha256:... formats
         # The bundle repository should handle both
-        return self.bundle_repo.ensure_local(bundle_ref)
+        digest, bundle_path = self.bundle_repo.ensure_local(bundle_ref)
+        expires_at = None if "sha256:" in bundle_ref else now + self.MUTABLE_REF_TTL_SECONDS
+        self._bundle_memo[bundle_ref] = (digest, bundle_path, expires_at)
+        return digest, bundle_path
 
     def _create_sim_return(self, task: SimTask, raw_artifacts: dict[str, Any]) -> SimReturn:
         """Create SimReturn from task and raw subprocess artifacts.
@@ -239,9 +315,12 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
             pad = 2 if s.endswith("==") else 1 if s.endswith("=") else 0
             return (3 * (n // 4)) - pad
 
-        total_size = sum(
-            estimate_b64_size(v) if isinstance(v, str) else len(v) for v in raw_artifacts.values()
-        )
+        def wire_size(v: Any) -> int:
+            if isinstance(v, dict):  # Compressed envelope
+                v = v["inline"]
+            return estimate_b64_size(v) if isinstance(v, str) else len(v)
+
+        total_size = sum(wire_size(v) for v in raw_artifacts.values())
 
         # Warn about large payloads
         if total_size > 1024 * 1024:  # 1MB threshold
@@ -269,6 +348,14 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
         # Convert raw artifacts to TableArtifacts (always inline for MVP)
         outputs = {}
         for name, data in raw_artifacts.items():
+            # Outputs the runner compressed (MODELOPS_ARTIFACT_CODEC) stay compressed
+            # Arrow IPC; readers decompress them, and the checksum is over the
+            # uncompressed bytes
+            checksum = None
+            if isinstance(data, dict):
+                checksum = data["checksum"]
+                data = data["inline"]
+
             # Data comes back as base64-encoded strings from subprocess
             decoded_data = base64.b64decode(data) if isinstance(data, str) else data
 
@@ -298,7 +385,8 @@ class IsolatedWarmExecEnv(ExecutionEnvironment):
                     f"Empty table output detected for task {task.params.param_id[:8]}-seed{task.seed}"
                 )
 
-            checksum = hashlib.blake2b(decoded_data, digest_size=32).hexdigest()
+            if checksum is None:
+                checksum = hashlib.blake2b(decoded_data, digest_size=32).hexdigest()
 
             outputs[name] = TableArtifact(
                 size=len(decoded_data), inline=decoded_data, checksum=checksum
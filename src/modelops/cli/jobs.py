@@ -781,6 +781,13 @@ def status(
     if job_state.tasks_total > 0:
         progress = job_state.progress_percent or 0
         info(f"  Progress: {job_state.tasks_completed}/{job_state.tasks_total} ({progress:.1f}%)")
+        if job_state.tasks_per_second and not job_state.is_terminal:
+            from ..services.progress import format_eta
+
+            info(
+                f"  Throughput: {job_state.tasks_per_second:.1f} tasks/s, "
+                f"ETA {format_eta(job_state.eta_seconds)} (as of last update)"
+            )
 
     # Results or errors
     if job_state.results_path:
@@ -1008,6 +1015,10 @@ def _perform_sync(
                 description=f"Syncing job status from Kubernetes... [{idx + 1}/{total_jobs}]",
             )
 
+        # Jobs run by the runner service have no K8s Job; the service reports their status
+        if job.metadata.get("runner") == "service":
+            continue
+
         # Get Kubernetes job status
         try:
             k8s_job = batch_v1.read_namespaced_job(
@@ -1260,6 +1271,45 @@ def resume(
         raise typer.Exit(1)
 
 
+@app.command()
+def cancel(
+    job_id: str = typer.Argument(..., help="Job ID to cancel"),
+    env: str | None = env_option(),
+    reason: str | None = typer.Option(None, "--reason", help="Why the job is cancelled"),
+):
+    """Cancel a queued or running job.
+
+    Marks the job CANCELLED in the registry. A queued job is never picked up;
+    a running job's runner notices within its progress interval and cancels
+    the job's outstanding simulations and aggregations on the cluster.
+    """
+    from ..services.job_state import InvalidTransitionError, TerminalStateError
+    from .utils import resolve_env
+
+    env = resolve_env(env)
+
+    registry = _get_registry(env)
+    if not registry:
+        error("Job registry unavailable")
+        raise typer.Exit(1)
+
+    job_state = registry.get_job(job_id)
+    if not job_state:
+        error(f"Job {job_id} not found")
+        raise typer.Exit(1)
+
+    try:
+        registry.cancel_job(job_id, reason=reason)
+    except (InvalidTransitionError, TerminalStateError):
+        error(f"Job {job_id} cannot be cancelled (current: {job_state.status.value})")
+        raise typer.Exit(1) from None
+
+    success(f"✓ Job {job_id} cancelled")
+    if job_state.status == JobStatus.RUNNING:
+        info("The runner will stop its outstanding tasks shortly")
+        info(f"  mops jobs status {job_id}")
+
+
 @app.command()
 def validate(
     job_id: str = typer.Argument(..., help="Job ID to validate"),
@@ -0,0 +1,70 @@
+"""Lazily loaded sub-commands for the mops CLI.
+
+Sub-command modules import Pulumi, the kubernetes client and the Azure SDKs
+at module level. Registering them through LazyTyperGroup means a module is
+imported only when one of its commands runs (or its own --help is shown),
+so `mops --help` and `mops jobs status` don't pay for the others.
+"""
+
+import importlib
+from dataclasses import dataclass
+
+import typer.main
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A sub-command group defined by a Typer app in a modelops.cli module."""
+
+    module: str
+    help: str
+    attr: str = "app"
+    hidden: bool = False
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that imports sub-command modules on first use.
+
+    Subclasses set `lazy_subcommands`. Top-level help lists them from the
+    registered help text without importing anything.
+    """
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+    package = "modelops.cli"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: dict[str, TyperGroup] = {}
+        self._listing = False
+
+    def list_commands(self, ctx) -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_subcommands]
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        spec = self.lazy_subcommands.get(cmd_name)
+        if command is not None or spec is None:
+            return command
+        if self._listing:
+            # Stand-in carrying just what the help listing shows
+            return TyperCommand(cmd_name, help=spec.help, hidden=spec.hidden)
+        if cmd_name not in self._loaded:
+            self._loaded[cmd_name] = self._load(cmd_name, spec)
+        return self._loaded[cmd_name]
+
+    def _load(self, name: str, spec: LazySubcommand) -> TyperGroup:
+        module = importlib.import_module(f".{spec.module}", self.package)
+        group = typer.main.get_group(getattr(module, spec.attr))
+        # Same overrides app.add_typer(app, name=..., help=...) applies
+        group.name = name
+        group.help = spec.help
+        group.hidden = spec.hidden
+        return group
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
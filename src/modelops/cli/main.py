@@ -11,6 +11,46 @@ from pathlib import Path
 import typer
 
 from .display import error, info, warning
+from .lazy import LazySubcommand, LazyTyperGroup
+
+# Sub-commands are imported only when used (see lazy.py). Listed in help order.
+SUBCOMMANDS = {
+    # Primary commands for researchers
+    "infra": LazySubcommand(
+        "infra", " Infrastructure management - setup, status, teardown (RECOMMENDED)"
+    ),
+    "job": LazySubcommand("adaptive", " Run simulation and calibration jobs"),
+    "results": LazySubcommand("results", " View and manage experiment results"),
+    # Advanced component-specific commands (for power users), still visible
+    "cluster": LazySubcommand("cluster", "[dim]Manage Kubernetes clusters (advanced)[/dim]"),
+    "registry": LazySubcommand(
+        "registry", "[dim]Manage container registries (advanced)[/dim]"
+    ),
+    "storage": LazySubcommand("storage", "[dim]Manage blob storage (advanced)[/dim]"),
+    "workspace": LazySubcommand("workspace", "[dim]Manage Dask workspaces (advanced)[/dim]"),
+    # Keep adaptive available under its original name for backwards compatibility
+    "adaptive": LazySubcommand(
+        "adaptive", "[dim]Manage infrastructure for adaptive (e.g. calibration) jobs[/dim]"
+    ),
+    # Utility commands
+    "config": LazySubcommand("config", " Configure ModelOps settings"),
+    # Developer tools
+    "dev": LazySubcommand("dev", " Developer tools and testing utilities"),
+    "cleanup": LazySubcommand(
+        "cleanup", "[dim]Clean up Pulumi state and resources (advanced)[/dim]"
+    ),
+    "status": LazySubcommand(
+        "status", "[dim]Show infrastructure status (use 'mops infra status' instead)[/dim]"
+    ),
+    "jobs": LazySubcommand("jobs", "[dim]Submit and manage simulation jobs (advanced)[/dim]"),
+    # Falls back to an install hint if modelops-bundle is missing
+    "bundle": LazySubcommand("bundle", "Bundle packaging and registry management"),
+}
+
+
+class MopsGroup(LazyTyperGroup):
+    lazy_subcommands = SUBCOMMANDS
+
 
 # Create main CLI app
 app = typer.Typer(
@@ -19,6 +59,7 @@ app = typer.Typer(
     invoke_without_command=True,
     add_completion=False,
     rich_markup_mode="rich",
+    cls=MopsGroup,
 )
 
 
@@ -30,29 +71,6 @@ def _root(ctx: typer.Context):
         typer.echo("\nError: Missing command.", err=True)
         raise typer.Exit(1)
 
-# Import sub-commands
-from . import (
-    adaptive,
-    cleanup,
-    cluster,
-    dev,
-    infra,
-    jobs,
-    registry,
-    results,
-    status,
-    storage,
-    workspace,
-)
-from . import (
-    config as config_cli,
-)
-from . import (
-    init as init_cli,
-)
-
-# Register sub-commands
-
 
 # Top-level initialization
 @app.command()
@@ -86,100 +104,12 @@ def init(
         mops init --interactive      # Customize all settings
         mops init --force           # Overwrite existing config
     """
+    from . import init as init_cli
+
     output_path = Path(output.name) if output else None
     init_cli.init(interactive=interactive, output=output_path, force=force)
 
 
-# Primary commands for researchers
-app.add_typer(
-    infra.app,
-    name="infra",
-    help=" Infrastructure management - setup, status, teardown (RECOMMENDED)",
-)
-
-app.add_typer(adaptive.app, name="job", help=" Run simulation and calibration jobs")
-
-app.add_typer(results.app, name="results", help=" View and manage experiment results")
-
-# Advanced component-specific commands (for power users)
-app.add_typer(
-    cluster.app,
-    name="cluster",
-    help="[dim]Manage Kubernetes clusters (advanced)[/dim]",
-    hidden=False,  # Still visible but marked as advanced
-)
-
-app.add_typer(
-    registry.app,
-    name="registry",
-    help="[dim]Manage container registries (advanced)[/dim]",
-    hidden=False,
-)
-
-app.add_typer(
-    storage.app,
-    name="storage",
-    help="[dim]Manage blob storage (advanced)[/dim]",
-    hidden=False,
-)
-
-app.add_typer(
-    workspace.app,
-    name="workspace",
-    help="[dim]Manage Dask workspaces (advanced)[/dim]",
-    hidden=False,
-)
-
-# Keep adaptive available under its original name for backwards compatibility
-app.add_typer(
-    adaptive.app,
-    name="adaptive",
-    help="[dim]Manage infrastructure for adaptive (e.g. calibration) jobs[/dim]",
-    hidden=False,
-)
-
-# Utility commands
-app.add_typer(config_cli.app, name="config", help=" Configure ModelOps settings")
-
-# Developer tools
-app.add_typer(dev.app, name="dev", help=" Developer tools and testing utilities")
-
-app.add_typer(
-    cleanup.app,
-    name="cleanup",
-    help="[dim]Clean up Pulumi state and resources (advanced)[/dim]",
-    hidden=False,
-)
-
-app.add_typer(
-    status.app,
-    name="status",
-    help="[dim]Show infrastructure status (use 'mops infra status' instead)[/dim]",
-    hidden=False,
-)
-
-app.add_typer(
-    jobs.app,
-    name="jobs",
-    help="[dim]Submit and manage simulation jobs (advanced)[/dim]",
-    hidden=False,
-)
-
-# Conditionally add bundle subcommand if modelops-bundle is installed
-try:
-    from . import bundle
-
-    app.add_typer(
-        bundle.app,
-        name="bundle",
-        help="Bundle packaging and registry management",
-        hidden=False,
-    )
-except ImportError:
-    # modelops-bundle not installed, skip bundle commands
-    pass
-
-
 @app.command()
 def version():
     """Show ModelOps version and build information."""
@@ -11,6 +11,7 @@ from ..services.provenance_schema import (
     TOKEN_INVALIDATION_SCHEMA,
 )
 from ..services.provenance_store import ProvenanceStore
+from ..services.storage.download import DEFAULT_MAX_WORKERS, BlobDownload, download_blobs
 from .display import console, error, info, info_dict, section, success, warning
 
 app = typer.Typer(name="results", help="View and manage simulation results", no_args_is_help=True)
@@ -36,6 +37,83 @@ def _ellipsize(s: str, maxlen: int) -> str:
     return s if len(s) <= maxlen else s[: maxlen - 1] + "…"
 
 
+_DOWNLOAD_STATUSES = ("downloaded", "resumed", "skipped", "failed")
+
+
+def _local_path_for(rel: str, fmt: str, targets: list[str] | None) -> Path | None:
+    """Map a blob path inside a job view to its local path, or None to skip it."""
+    parts = rel.split("/")
+    want_parquet = fmt in ["parquet", "all"]
+    if rel == "manifest.json":
+        return Path(rel) if fmt in ["manifest", "all"] else None
+    if rel == "calibration/summary.json":
+        # Small and only present for calibration jobs, so always fetched
+        return Path(rel)
+    if not (want_parquet and rel.endswith(".parquet")):
+        return None
+    if parts[0] == "targets" and len(parts) >= 3:
+        if targets and parts[1] not in targets:
+            return None
+        return Path("targets") / parts[1] / "data.parquet"
+    if parts[0] in ("model_outputs", "index"):
+        return Path(parts[0]) / parts[-1]
+    return None
+
+
+def _find_latest_job(container_client, conn_str: str, verbose: bool) -> tuple[str, str] | None:
+    """Find the most recent job with results.
+
+    Tries, in order: the latest-job pointer blob written when job views are
+    uploaded, the job registry, and finally a listing of every job view
+    (for results written before the pointer existed).
+
+    Returns:
+        (job_id, description of where it was found), or None
+    """
+    from ..services.job_views import LATEST_JOB_BLOB
+
+    try:
+        blob_client = container_client.get_blob_client(LATEST_JOB_BLOB)
+        pointer = json.loads(blob_client.download_blob().readall())
+        return pointer["job_id"], f"created {pointer.get('created_at', 'unknown')}"
+    except Exception as e:
+        if verbose:
+            info(f"No latest-job pointer ({e}); checking job registry...")
+
+    try:
+        from ..services.job_registry import JobRegistry
+        from ..services.job_state import JobStatus
+        from ..services.storage.azure_versioned import AzureVersionedStore
+
+        registry = JobRegistry(AzureVersionedStore(conn_str, container="job-registry"))
+        for state in registry.list_jobs(
+            limit=10, status_filter=[JobStatus.SUCCEEDED, JobStatus.PARTIAL_SUCCESS]
+        ):
+            prefix = f"views/jobs/{state.job_id}/"
+            if next(iter(container_client.list_blobs(name_starts_with=prefix)), None):
+                return state.job_id, f"from job registry, created {state.created_at}"
+    except Exception as e:
+        if verbose:
+            info(f"Job registry unavailable ({e}); scanning job views...")
+
+    latest_job = None
+    latest_time = None
+    for blob in container_client.list_blobs(name_starts_with="views/jobs/"):
+        # manifest.json (simulation jobs) or calibration/summary.json (calibration jobs)
+        if blob.name.endswith("/manifest.json") or blob.name.endswith("/calibration/summary.json"):
+            parts = blob.name.split("/")
+            if (
+                len(parts) >= 3
+                and parts[2].startswith(("job-", "calib-"))
+                and (latest_time is None or blob.last_modified > latest_time)
+            ):
+                latest_time = blob.last_modified
+                latest_job = parts[2]
+    if latest_job is None:
+        return None
+    return latest_job, f"modified: {latest_time.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+
+
 @app.command("list")
 def cmd_list(
     storage_dir: Path = typer.Option(
@@ -227,10 +305,11 @@ def clear(
     """Clear cached results for a schema."""
     try:
         # Confirm if not forced
-        if not force:
-            if not typer.confirm(f"Clear all results for schema '{schema_name or 'current'}'?"):
-                warning("Cancelled")
-                return
+        if not force and not typer.confirm(
+            f"Clear all results for schema '{schema_name or 'current'}'?"
+        ):
+            warning("Cancelled")
+            return
 
         # Create provenance store
         store = ProvenanceStore(storage_dir)
@@ -253,29 +332,29 @@ def stats(
         "-s",
         help="Storage directory for provenance store",
     ),
+    rebuild: bool = typer.Option(
+        False, "--rebuild", help="Recount everything on disk instead of using the catalog"
+    ),
 ) -> None:
     """Show storage statistics."""
+    from ..services.storage_catalog import StorageCatalog
+
     try:
         if not storage_dir.exists():
             warning(f"Storage directory not found: {storage_dir}")
             return
 
-        # Calculate statistics
-        total_size = 0
-        num_sims = 0
-        num_aggs = 0
-        num_artifacts = 0
-
-        for path in storage_dir.rglob("*"):
-            if path.is_file():
-                total_size += path.stat().st_size
-                if path.name == "metadata.json":
-                    if "sims" in path.parts:
-                        num_sims += 1
-                    elif "aggs" in path.parts:
-                        num_aggs += 1
-                elif path.name.startswith("artifact_"):
-                    num_artifacts += 1
+        catalog = StorageCatalog(storage_dir)
+        if rebuild or not catalog.has_baseline():
+            info("Rebuilding storage catalog from disk...")
+            totals = catalog.rebuild()
+        else:
+            totals = catalog.totals()
+
+        total_size = sum(c.bytes for c in totals.values())
+        num_sims = sum(c.count for (_, _, kind, _), c in totals.items() if kind == "sim")
+        num_aggs = sum(c.count for (_, _, kind, _), c in totals.items() if kind == "agg")
+        num_artifacts = sum(c.artifacts for c in totals.values())
 
         section("Storage Statistics")
         info_dict(
@@ -289,12 +368,19 @@ def stats(
         )
 
         # Show schema breakdown
-        schema_dirs = [d for d in storage_dir.iterdir() if d.is_dir()]
-        if schema_dirs:
+        schema_sizes: dict[str, int] = {}
+        bundles: dict[str, set] = {}
+        for (schema_name, version, _, bundle), counts in totals.items():
+            label = f"{schema_name}/{version}"
+            schema_sizes[label] = schema_sizes.get(label, 0) + counts.bytes
+            bundles.setdefault(label, set()).add(bundle)
+        if schema_sizes:
             section("Schemas")
-            for schema_dir in schema_dirs:
-                schema_size = sum(f.stat().st_size for f in schema_dir.rglob("*") if f.is_file())
-                info(f"  {schema_dir.name}: {schema_size / (1024 * 1024):.2f} MB")
+            for label, size in sorted(schema_sizes.items()):
+                info(
+                    f"  {label}: {size / (1024 * 1024):.2f} MB "
+                    f"across {len(bundles[label])} bundle(s)"
+                )
 
     except Exception as e:
         error(f"Failed to get statistics: {e}")
@@ -327,6 +413,9 @@ def download(
     env: str | None = typer.Option(
         None, "--env", "-e", help="Environment name (dev, staging, prod)"
     ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--jobs", "-j", help="Number of files to download in parallel"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
 ) -> None:
     """Download job results from Azure blob storage.
@@ -334,12 +423,16 @@ def download(
     Downloads Parquet files and manifest for completed jobs from Azure.
     If no job ID is specified, uses the latest completed job.
 
+    Files are streamed to disk several at a time. Re-running the command skips
+    files whose size and ETag already match and resumes interrupted ones.
+
     Examples:
         mops results download                     # Download latest job results
         mops results download job-abc123          # Download specific job
         mops results download -o ./my-results     # Custom output directory
         mops results download --targets prevalence,incidence  # Specific targets
         mops results download --csv               # Download and convert to CSV
+        mops results download -j 16               # More parallel downloads
     """
     import os
 
@@ -363,7 +456,8 @@ def download(
             # Try to get from storage component
             if verbose:
                 info(
-                    f"Getting connection string from Pulumi stack (storage component, env={actual_env})..."
+                    "Getting connection string from Pulumi stack "
+                    f"(storage component, env={actual_env})..."
                 )
 
             conn_str = get_stack_output("storage", "connection_string", actual_env)
@@ -389,41 +483,13 @@ def download(
 
         # If no job_id, try to find the latest
         if not job_id:
-            if verbose:
-                info("Looking for latest completed job (by manifest)...")
-            else:
-                info("Looking for latest job...")
-            # List all job manifest files to find latest completed job
-            prefix = "views/jobs/"
-            blobs = container_client.list_blobs(name_starts_with=prefix)
-
-            # Track latest job by manifest.json or calibration/summary.json modification time
-            latest_job = None
-            latest_time = None
-
-            for blob in blobs:
-                # Look at manifest.json (simulation jobs) or calibration/summary.json (calibration jobs)
-                if blob.name.endswith("/manifest.json") or blob.name.endswith("/calibration/summary.json"):
-                    parts = blob.name.split("/")
-                    if len(parts) >= 3 and (
-                        parts[2].startswith("job-") or parts[2].startswith("calib-")
-                    ):
-                        job_id_candidate = parts[2]
-                        blob_time = blob.last_modified
-
-                        # Track the latest by modification time
-                        if latest_time is None or blob_time > latest_time:
-                            latest_time = blob_time
-                            latest_job = job_id_candidate
-
-            if not latest_job:
-                error("No completed jobs found in Azure storage (looked for manifest.json or calibration/summary.json)")
+            info("Looking for latest job...")
+            latest = _find_latest_job(container_client, conn_str, verbose)
+            if not latest:
+                error("No completed jobs found in Azure storage")
                 raise typer.Exit(code=1)
-
-            job_id = latest_job
-            info(
-                f"Using latest job: {job_id} (modified: {latest_time.strftime('%Y-%m-%d %H:%M:%S UTC')})"
-            )
+            job_id, source = latest
+            info(f"Using latest job: {job_id} ({source})")
 
         # Create output directory
         job_output_dir = output_dir / job_id
@@ -431,114 +497,84 @@ def download(
 
         section(f"Downloading results for job {job_id}")
 
-        # Download manifest if requested
-        if fmt in ["manifest", "all"]:
-            manifest_blob = f"views/jobs/{job_id}/manifest.json"
-            manifest_path = job_output_dir / "manifest.json"
-            try:
-                blob_client = container_client.get_blob_client(manifest_blob)
-                with open(manifest_path, "wb") as f:
-                    download_stream = blob_client.download_blob()
-                    f.write(download_stream.readall())
-                success(f"Downloaded manifest to {manifest_path}")
+        # One listing of the job view gives names, sizes and ETags for everything
+        target_list = [t.strip() for t in targets.split(",")] if targets else None
+        job_prefix = f"views/jobs/{job_id}/"
+        items = []
+        for blob in container_client.list_blobs(name_starts_with=job_prefix):
+            local = _local_path_for(blob.name[len(job_prefix) :], fmt, target_list)
+            if local is not None:
+                items.append(
+                    BlobDownload(blob.name, job_output_dir / local, blob.size, blob.etag)
+                )
 
-                # Parse manifest to show summary
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
-                    if "targets" in manifest:
-                        info(f"Available targets: {', '.join(manifest['targets'].keys())}")
-            except Exception as e:
+        if not items:
+            warning(f"No results found for job {job_id}")
+            raise typer.Exit(code=1)
+
+        def report(outcome):
+            rel = _relpath_maybe(str(outcome.item.local_path), job_output_dir)
+            if outcome.status == "failed":
+                warning(f"Failed {rel}: {outcome.error}")
+            elif outcome.status == "skipped":
                 if verbose:
-                    warning(f"Could not download manifest: {e}")
-
-        # Download Parquet files
-        if fmt in ["parquet", "all"]:
-            # List all parquet files for this job
-            prefix = f"views/jobs/{job_id}/targets/"
-            blobs = container_client.list_blobs(name_starts_with=prefix)
-
-            downloaded = 0
-            for blob in blobs:
-                if blob.name.endswith(".parquet"):
-                    # Extract target name from path
-                    parts = blob.name.split("/")
-                    if len(parts) >= 5:
-                        target_name = parts[4]
-
-                        # Check if we should download this target
-                        if targets:
-                            target_list = [t.strip() for t in targets.split(",")]
-                            if target_name not in target_list:
-                                continue
-
-                        # Create target directory
-                        target_dir = job_output_dir / "targets" / target_name
-                        target_dir.mkdir(parents=True, exist_ok=True)
-
-                        # Download the Parquet file
-                        output_path = target_dir / "data.parquet"
-                        blob_client = container_client.get_blob_client(blob.name)
-
-                        with open(output_path, "wb") as f:
-                            download_stream = blob_client.download_blob()
-                            f.write(download_stream.readall())
-
-                        info(f"Downloaded {target_name} ({blob.size:,} bytes)")
-                        downloaded += 1
-
-            if downloaded > 0:
-                success(f"Downloaded {downloaded} Parquet file(s) to {job_output_dir}")
+                    info(f"Up to date: {rel}")
             else:
-                warning("No Parquet files found for this job")
-
-        # Download model outputs
-        if fmt in ["parquet", "all"]:
-            prefix = f"views/jobs/{job_id}/model_outputs/"
-            blobs = container_client.list_blobs(name_starts_with=prefix)
-
-            outputs_downloaded = 0
-            for blob in blobs:
-                if blob.name.endswith(".parquet"):
-                    # Extract output name from path
-                    output_name = Path(blob.name).stem
-
-                    # Create model_outputs directory
-                    outputs_dir = job_output_dir / "model_outputs"
-                    outputs_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Download the Parquet file
-                    output_path = outputs_dir / f"{output_name}.parquet"
-                    blob_client = container_client.get_blob_client(blob.name)
-
-                    with open(output_path, "wb") as f:
-                        download_stream = blob_client.download_blob()
-                        f.write(download_stream.readall())
-
-                    info(f"Downloaded model output: {output_name} ({blob.size:,} bytes)")
-                    outputs_downloaded += 1
-
-            if outputs_downloaded > 0:
-                success(f"Downloaded {outputs_downloaded} model output(s)")
-
-        # Download calibration results if they exist (for calibration jobs)
-        calibration_blob = f"views/jobs/{job_id}/calibration/summary.json"
-        try:
-            blob_client = container_client.get_blob_client(calibration_blob)
-
-            # Create calibration directory
-            calib_dir = job_output_dir / "calibration"
-            calib_dir.mkdir(parents=True, exist_ok=True)
+                verb = "Resumed" if outcome.status == "resumed" else "Downloaded"
+                info(f"{verb} {rel} ({outcome.bytes_transferred:,} bytes)")
+
+        outcomes = download_blobs(container_client, items, max_workers=jobs, on_complete=report)
+        by_status = {s: [o for o in outcomes if o.status == s] for s in _DOWNLOAD_STATUSES}
+        fetched = by_status["downloaded"] + by_status["resumed"]
+        success(
+            f"{len(fetched)} file(s) downloaded "
+            f"({sum(o.bytes_transferred for o in fetched):,} bytes), "
+            f"{len(by_status['skipped'])} already up to date"
+        )
+        if by_status["failed"]:
+            warning(
+                f"{len(by_status['failed'])} file(s) failed; "
+                "re-run the command to resume them"
+            )
 
-            calib_path = calib_dir / "summary.json"
-            with open(calib_path, "wb") as f:
-                download_stream = blob_client.download_blob()
-                f.write(download_stream.readall())
+        n_targets = sum(1 for i in items if i.local_path.parent.parent.name == "targets")
+        if fmt in ["parquet", "all"] and n_targets == 0:
+            warning("No Parquet files found for this job")
 
-            success("Downloaded calibration summary")
+        manifest_path = job_output_dir / "manifest.json"
+        if fmt in ["manifest", "all"] and manifest_path.exists():
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+                if "targets" in manifest:
+                    info(f"Available targets: {', '.join(manifest['targets'].keys())}")
+            except Exception as e:
+                if verbose:
+                    warning(f"Could not read manifest: {e}")
+
+        # Summarize the job's result index (one file per writer instead of per-result probes)
+        fragments = sorted((job_output_dir / "index").glob("*.parquet"))
+        if fmt in ["parquet", "all"] and fragments:
+            import pyarrow.parquet as pq
+
+            rows = [r for frag in fragments for r in pq.read_table(frag).to_pylist()]
+            n_sims = sum(1 for r in rows if r["kind"] == "sim")
+            n_aggs = sum(1 for r in rows if r["kind"] == "agg")
+            n_errors = sum(1 for r in rows if r["status"] != "ok")
+            total_bytes = sum(r["size_bytes"] or 0 for r in rows)
+            success(
+                f"Result index: {n_sims} simulations, {n_aggs} aggregations, "
+                f"{n_errors} errors, {total_bytes:,} bytes of outputs"
+            )
+        elif verbose and fmt in ["parquet", "all"]:
+            warning("No result index found for this job")
 
-            # Parse and display calibration summary
-            with open(calib_path) as f:
-                calib_data = json.load(f)
+        # Show calibration results if this is a calibration job
+        calib_path = job_output_dir / "calibration" / "summary.json"
+        if calib_path.exists():
+            try:
+                with open(calib_path) as f:
+                    calib_data = json.load(f)
                 section("Calibration Results")
                 info(f"  Algorithm: {calib_data.get('algorithm', 'N/A')}")
                 summary = calib_data.get("summary", {})
@@ -550,11 +586,9 @@ def download(
                     info("  Best parameters:")
                     for param, value in calib_data["best_params"].items():
                         info(f"    {param}: {value}")
-
-        except Exception as e:
-            if verbose:
-                warning(f"Could not download calibration results: {e}")
-            # Not all jobs have calibration results, so this is not an error
+            except Exception as e:
+                if verbose:
+                    warning(f"Could not read calibration results: {e}")
 
         # Convert Parquet to CSV if requested
         if csv:
@@ -2,7 +2,6 @@
 
 from typing import Any
 
-import pulumi.automation as auto
 import typer
 
 from ..core import StackNaming, automation
@@ -14,91 +13,85 @@ from .utils import resolve_env
 app = typer.Typer(help="Infrastructure status and health checks")
 
 
-def get_all_stacks(env: str | None = None) -> dict[str, list[dict[str, Any]]]:
+def get_all_stacks(
+    env: str | None = None, refresh: bool = False
+) -> dict[str, list[dict[str, Any]]]:
     """Get all stacks across all components.
 
+    Stack outputs are read in parallel and served from the local output
+    cache while the stacks are unchanged.
+
     Args:
         env: Optional environment filter
+        refresh: Re-read every stack's outputs instead of using the cache
 
     Returns:
         Dictionary mapping component name to list of stack info
     """
-    all_stacks = {}
+    stack_infos = []
+    requests = []
 
     for component in WORK_DIRS.keys():
         try:
             work_dir = ensure_work_dir(component)
-            project_name = StackNaming.get_project_name(component)
 
             # Skip if directory doesn't have Pulumi.yaml
             if not (work_dir / "Pulumi.yaml").exists():
                 continue
 
-            # Create workspace to list stacks
-            from ..core.automation import workspace_options
-
-            ws = auto.LocalWorkspace(**workspace_options(project_name, work_dir).__dict__)
-
-            stacks = ws.list_stacks()
-            if stacks:
-                stack_infos = []
-                for s in stacks:
-                    # Parse stack name
-                    try:
-                        parsed = StackNaming.parse_stack_name(s.name)
-                        stack_env = parsed.get("env", "unknown")
+            for stack_name in automation.list_stack_names(component, work_dir):
+                # Parse stack name
+                try:
+                    parsed = StackNaming.parse_stack_name(stack_name)
+                except (ValueError, KeyError):
+                    # If we can't parse the stack name, skip it
+                    continue
+                stack_env = parsed.get("env", "unknown")
 
-                        # Filter by environment if specified
-                        if env and stack_env != env:
-                            continue
+                # Filter by environment if specified
+                if env and stack_env != env:
+                    continue
 
-                        # Get basic info
-                        info_dict = {
-                            "name": s.name,
-                            "env": stack_env,
+                # Get basic info
+                stack_infos.append(
+                    {
+                        "name": stack_name,
+                        "env": stack_env,
+                        "component": component,
+                        "status": "Unknown",
+                    }
+                )
+                # For adaptive, handle named infrastructures
+                if component == "adaptive" and parsed.get("run_id"):
+                    run_id = parsed["run_id"]
+                    requests.append(
+                        {
                             "component": component,
-                            "status": "Unknown",
+                            "env": stack_env,
+                            "run_id": run_id,
+                            "work_dir": str(work_dir / run_id),
                         }
-
-                        # Try to get outputs for more details
-                        try:
-                            # For adaptive, handle named infrastructures
-                            if component == "adaptive" and parsed.get("run_id"):
-                                outputs = automation.outputs(
-                                    component,
-                                    stack_env,
-                                    parsed["run_id"],
-                                    refresh=False,
-                                    work_dir=str(work_dir / parsed["run_id"]),
-                                )
-                            else:
-                                outputs = automation.outputs(
-                                    component,
-                                    stack_env,
-                                    refresh=False,
-                                    work_dir=str(work_dir),
-                                )
-
-                            if outputs:
-                                info_dict["status"] = "✓ Deployed"
-                                info_dict["outputs"] = outputs
-                            else:
-                                info_dict["status"] = "⚠ Not deployed"
-                        except Exception:
-                            # Keep Unknown status if we can't get outputs
-                            pass
-
-                        stack_infos.append(info_dict)
-                    except (ValueError, KeyError):
-                        # If we can't parse the stack name, skip it
-                        continue
-
-                if stack_infos:
-                    all_stacks[component] = stack_infos
+                    )
+                else:
+                    requests.append(
+                        {"component": component, "env": stack_env, "work_dir": str(work_dir)}
+                    )
         except Exception:
             # Skip components that have issues
             continue
 
+    all_stacks = {}
+    results = automation.outputs_many(requests, use_cache=not refresh)
+    for info_dict, outputs in zip(stack_infos, results, strict=True):
+        # Keep Unknown status if we can't get outputs
+        if not isinstance(outputs, Exception):
+            if outputs:
+                info_dict["status"] = "✓ Deployed"
+                info_dict["outputs"] = outputs
+            else:
+                info_dict["status"] = "⚠ Not deployed"
+        all_stacks.setdefault(info_dict["component"], []).append(info_dict)
+
     return all_stacks
 
 
@@ -108,6 +101,9 @@ def status_all(
     smoke_test: bool = typer.Option(
         False, "--smoke-test", help="Run smoke tests for connectivity validation"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-read stack outputs instead of using the local cache"
+    ),
 ):
     """Show status of all ModelOps infrastructure.
 
@@ -123,7 +119,7 @@ def status_all(
         return
 
     # Get all stacks
-    all_stacks = get_all_stacks(env_filter)
+    all_stacks = get_all_stacks(env_filter, refresh=refresh)
 
     if not all_stacks:
         warning("No deployed infrastructure found")
@@ -389,10 +385,13 @@ def main(
     smoke_test: bool = typer.Option(
         False, "--smoke-test", help="Run smoke tests for connectivity validation"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-read stack outputs instead of using the local cache"
+    ),
 ):
     """Show status of all ModelOps infrastructure.
 
     This is the default command when no subcommand is specified.
     """
     if ctx.invoked_subcommand is None:
-        status_all(env=env, smoke_test=smoke_test)
+        status_all(env=env, smoke_test=smoke_test, refresh=refresh)
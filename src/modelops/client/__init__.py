@@ -4,13 +4,32 @@ This package contains client libraries that run on the user's workstation
 and interact with the ModelOps infrastructure in the cluster.
 """
 
-from .base import ComponentState, ComponentStatus, InfraResult
-from .cluster_service import ClusterService
-from .infra_service import InfrastructureService
-from .job_submission import JobSubmissionClient
-from .registry_service import RegistryService
-from .storage_service import StorageService
-from .workspace_service import WorkspaceService
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attrs
+
+if TYPE_CHECKING:
+    from .base import ComponentState, ComponentStatus, InfraResult
+    from .cluster_service import ClusterService
+    from .infra_service import InfrastructureService
+    from .job_submission import JobSubmissionClient
+    from .registry_service import RegistryService
+    from .storage_service import StorageService
+    from .workspace_service import WorkspaceService
+
+# Imported on first access, so a CLI command only loads the SDKs
+# (kubernetes, Azure, Pulumi) of the services it uses
+_LAZY_ATTRS = {
+    "JobSubmissionClient": ".job_submission",
+    "InfrastructureService": ".infra_service",
+    "ClusterService": ".cluster_service",
+    "WorkspaceService": ".workspace_service",
+    "StorageService": ".storage_service",
+    "RegistryService": ".registry_service",
+    "ComponentState": ".base",
+    "ComponentStatus": ".base",
+    "InfraResult": ".base",
+}
 
 __all__ = [
     "JobSubmissionClient",
@@ -23,3 +42,5 @@ __all__ = [
     "ComponentStatus",
     "InfraResult",
 ]
+
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS)
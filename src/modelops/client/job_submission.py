@@ -241,6 +241,9 @@ class JobSubmissionClient:
             case _:
                 raise ValueError(f"Unknown job type: {type(job).__name__}")
 
+        if os.environ.get("MODELOPS_JOB_RUNNER", "job").lower() == "service":
+            return self._queue_for_service(job, blob_key, image)
+
         # Register job in tracking system (non-blocking)
         # job_id already has "job-" prefix, don't add another
         k8s_name = job.job_id
@@ -274,6 +277,36 @@ class JobSubmissionClient:
 
         return job.job_id
 
+    def _queue_for_service(self, job: Job, blob_key: str, image: str) -> str:
+        """Hand a job to the long-lived runner service instead of creating a K8s Job.
+
+        The job registry is the queue, so unlike K8s submission this fails
+        when the registry is unavailable.
+
+        Returns:
+            Job ID of the queued job
+
+        Raises:
+            RuntimeError: If the job registry is unavailable
+        """
+        if self.registry is None:
+            raise RuntimeError("MODELOPS_JOB_RUNNER=service requires the job registry")
+        self.registry.register_job(
+            job_id=job.job_id,
+            k8s_name=job.job_id,
+            namespace=self.namespace,
+            metadata={
+                "type": type(job).__name__,
+                "blob_key": blob_key,
+                "image": image,
+                "runner": "service",
+            },
+        )
+        self.registry.update_status(job.job_id, JobStatus.SUBMITTING)
+        self.registry.update_status(job.job_id, JobStatus.SCHEDULED)
+        self.registry.enqueue_job(job.job_id)
+        return job.job_id
+
     def submit_sim_job(
         self,
         study: SimulationStudy,
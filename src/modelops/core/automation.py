@@ -39,6 +39,7 @@ Future Improvements:
 import os
 import secrets
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -46,22 +47,29 @@ import pulumi.automation as auto
 
 from .naming import StackNaming
 from .paths import ensure_work_dir, get_backend_url
+from .stack_cache import StackOutputCache, checkpoint_stamp, local_stack_names
 
 
-def get_stack_output(component: str, output_key: str, env: str = "dev") -> str | None:
+def get_stack_output(
+    component: str, output_key: str, env: str = "dev", use_cache: bool = True
+) -> str | None:
     """Get a single output value from a Pulumi stack.
 
+    Reads go through the local output cache, so looking up several keys of
+    one stack starts the Pulumi engine at most once.
+
     Args:
         component: Component name (e.g., "storage", "infra", "registry")
         output_key: Key of the output to retrieve
         env: Environment name (dev, staging, prod)
+        use_cache: Use cached outputs when still valid
 
     Returns:
         The output value as a string, or None if not found
     """
     try:
         # Use the existing outputs function
-        stack_outputs = outputs(component, env, refresh=False)
+        stack_outputs = outputs(component, env, refresh=False, use_cache=use_cache)
 
         # Return the specific output
         if output_key in stack_outputs:
@@ -258,38 +266,133 @@ def remove_stack(
 
         # Remove the stack
         workspace.remove_stack(stack_name)
+        _invalidate_cached_outputs(component, env, run_id)
     except Exception as e:
         # If stack doesn't exist, that's fine
         if "no stack named" not in str(e).lower():
             raise
 
 
+def _to_cacheable(stack_outputs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: {"value": getattr(o, "value", o), "secret": getattr(o, "secret", False)}
+        for key, o in stack_outputs.items()
+    }
+
+
+def _from_cacheable(cached: dict[str, Any]) -> dict[str, Any]:
+    return {key: auto.OutputValue(o["value"], o["secret"]) for key, o in cached.items()}
+
+
 def outputs(
     component: str,
     env: str,
     run_id: str | None = None,
     refresh: bool = True,
     work_dir: str | None = None,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Get outputs from a Pulumi stack.
 
+    Without `refresh`, outputs come from the local cache (see
+    modelops.core.stack_cache) while the stack is unchanged, and the Pulumi
+    engine is only started on a miss. Fresh reads always update the cache.
+
     Args:
         component: Component name
         env: Environment name
         run_id: Optional run ID for adaptive stacks
         refresh: Whether to refresh stack before getting outputs
         work_dir: Optional custom work directory path
+        use_cache: Use cached outputs when still valid (ignored with refresh)
 
     Returns:
         Stack outputs dictionary
     """
+    project = StackNaming.get_project_name(component)
+    stack_name = StackNaming.get_stack_name(component, env, run_id)
+    backend_url = get_backend_url()
+    cache = StackOutputCache()
+
+    if use_cache and not refresh:
+        cached = cache.get(project, stack_name, backend_url)
+        if cached is not None:
+            return _from_cacheable(cached)
+
     # Ensure secure passphrase is configured
     _ensure_passphrase()
 
+    stamp = checkpoint_stamp(backend_url, project, stack_name)
     stack = select_stack(component, env, run_id, noop_program, work_dir)
     if refresh:
         stack.refresh(on_output=lambda _: None)
-    return stack.outputs()
+        stamp = None  # The refresh rewrote the checkpoint
+    result = stack.outputs()
+    cache.put(project, stack_name, backend_url, _to_cacheable(result), stamp=stamp)
+    return result
+
+
+def outputs_many(
+    requests: list[dict[str, Any]], use_cache: bool = True, max_workers: int = 8
+) -> list[dict[str, Any] | Exception]:
+    """Read the outputs of several stacks in parallel.
+
+    Each Pulumi read is a separate engine subprocess, so stacks are fetched
+    concurrently rather than one after another.
+
+    Args:
+        requests: outputs() keyword arguments per stack (component, env, ...)
+        use_cache: Use cached outputs when still valid
+        max_workers: Stacks read concurrently
+
+    Returns:
+        Outputs (or the exception raised) for each request, in order
+    """
+    # Create the passphrase file once, before threads could race to create it
+    _ensure_passphrase()
+
+    def fetch(kwargs: dict[str, Any]) -> dict[str, Any] | Exception:
+        try:
+            return outputs(**{"refresh": False, **kwargs}, use_cache=use_cache)
+        except Exception as e:
+            return e
+
+    if not requests:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as pool:
+        return list(pool.map(fetch, requests))
+
+
+def list_stack_names(component: str, work_dir: Path | None = None) -> list[str]:
+    """List the stacks of a component's project.
+
+    File backends are listed from the backend directory without starting
+    Pulumi; remote backends are asked through a LocalWorkspace.
+
+    Args:
+        component: Component name
+        work_dir: Project directory (defaults to the component's work dir)
+
+    Returns:
+        Stack names
+    """
+    project = StackNaming.get_project_name(component)
+    backend_url = get_backend_url()
+    names = local_stack_names(backend_url, project)
+    if names is not None:
+        return names
+
+    work_dir = work_dir or ensure_work_dir(component)
+    ws = auto.LocalWorkspace(**workspace_options(project, work_dir).__dict__)
+    return [s.name for s in ws.list_stacks()]
+
+
+def _invalidate_cached_outputs(component: str, env: str, run_id: str | None) -> None:
+    StackOutputCache().invalidate(
+        StackNaming.get_project_name(component),
+        StackNaming.get_stack_name(component, env, run_id),
+        get_backend_url(),
+    )
 
 
 def up(
@@ -314,7 +417,14 @@ def up(
         Stack outputs after update
     """
     stack = select_stack(component, env, run_id, program, work_dir)
+    _invalidate_cached_outputs(component, env, run_id)
     result = stack.up(on_output=on_output or (lambda _: None))
+    StackOutputCache().put(
+        StackNaming.get_project_name(component),
+        StackNaming.get_stack_name(component, env, run_id),
+        get_backend_url(),
+        _to_cacheable(result.outputs),
+    )
     return result.outputs
 
 
@@ -335,6 +445,7 @@ def destroy(
         work_dir: Optional custom work directory path
     """
     stack = select_stack(component, env, run_id, noop_program, work_dir)
+    _invalidate_cached_outputs(component, env, run_id)
     stack.destroy(on_output=on_output or (lambda _: None))
 
 
@@ -0,0 +1,175 @@
+"""Local cache of Pulumi stack outputs.
+
+Reading stack outputs through the Automation API starts the Pulumi engine
+(`pulumi stack select` plus `pulumi stack output`), which takes seconds per
+stack. Most CLI commands only need a couple of values that change when the
+stack is updated, so outputs are cached on disk:
+
+    ~/.modelops/cache/stack-outputs/{project}.{stack}.{backend hash}.json
+
+An entry is used while it is younger than the TTL (MODELOPS_STACK_CACHE_TTL
+seconds, default 600; 0 disables the cache) and, for file:// backends, while
+the stack's checkpoint file still has the modification time it had when the
+outputs were read. Any `pulumi up`/`destroy`, from the CLI or not, rewrites
+the checkpoint and so invalidates the entry. Remote backends rely on the TTL.
+
+Outputs can hold secrets (kubeconfigs, connection strings). They are
+decrypted by Pulumi before caching, so entries are written owner-only (0600),
+like the passphrase file that already sits under ~/.modelops.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .paths import MODELOPS_HOME
+
+CACHE_DIR = MODELOPS_HOME / "cache" / "stack-outputs"
+DEFAULT_TTL_SECONDS = 600.0
+
+
+def cache_ttl() -> float:
+    """TTL for cached outputs from MODELOPS_STACK_CACHE_TTL (seconds)."""
+    return float(os.environ.get("MODELOPS_STACK_CACHE_TTL", DEFAULT_TTL_SECONDS))
+
+
+def _backend_dir(backend_url: str) -> Path | None:
+    """Local directory of a file:// backend, None for remote backends."""
+    if not backend_url.startswith("file://"):
+        return None
+    return Path(os.path.expanduser(backend_url[len("file://") :]))
+
+
+def checkpoint_stamp(backend_url: str, project: str, stack: str) -> int | None:
+    """Modification time of a stack's checkpoint file, in nanoseconds.
+
+    Returns:
+        The checkpoint mtime, 0 if the stack has no checkpoint, or None when
+        the backend is not a local directory
+    """
+    backend_dir = _backend_dir(backend_url)
+    if backend_dir is None:
+        return None
+    stacks_dir = backend_dir / ".pulumi" / "stacks"
+    # Project-scoped layout first, then the legacy flat layout
+    for directory in (stacks_dir / project, stacks_dir):
+        for suffix in (".json", ".json.gz"):
+            try:
+                return (directory / f"{stack}{suffix}").stat().st_mtime_ns
+            except OSError:
+                continue
+    return 0
+
+
+def local_stack_names(backend_url: str, project: str) -> list[str] | None:
+    """List a project's stacks straight from a file:// backend.
+
+    Returns:
+        Sorted stack names, or None when the backend is remote and the
+        Pulumi CLI has to be asked instead
+    """
+    backend_dir = _backend_dir(backend_url)
+    if backend_dir is None:
+        return None
+    stacks_dir = backend_dir / ".pulumi" / "stacks"
+    names = set()
+    for directory, prefix in ((stacks_dir / project, ""), (stacks_dir, f"{project}-")):
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name.removesuffix(".gz")
+            if entry.is_file() and name.endswith(".json") and name.startswith(prefix):
+                names.add(name.removesuffix(".json"))
+    return sorted(names)
+
+
+class StackOutputCache:
+    """On-disk cache of stack outputs keyed by project, stack and backend."""
+
+    def __init__(self, cache_dir: Path | str | None = None, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per stack (default CACHE_DIR)
+            ttl: Maximum entry age in seconds (defaults to cache_ttl())
+        """
+        self.cache_dir = Path(cache_dir or CACHE_DIR)
+        self.ttl = cache_ttl() if ttl is None else ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _path(self, project: str, stack: str, backend_url: str) -> Path:
+        backend = hashlib.sha256(backend_url.encode()).hexdigest()[:12]
+        return self.cache_dir / f"{project}.{stack}.{backend}.json"
+
+    def get(self, project: str, stack: str, backend_url: str) -> dict[str, Any] | None:
+        """Return cached outputs as {key: {"value": ..., "secret": ...}}, or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            entry = json.loads(self._path(project, stack, backend_url).read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.ttl:
+            return None
+        if entry.get("stamp") != checkpoint_stamp(backend_url, project, stack):
+            return None
+        return entry["outputs"]
+
+    def put(
+        self,
+        project: str,
+        stack: str,
+        backend_url: str,
+        outputs: dict[str, Any],
+        stamp: int | None = None,
+    ) -> None:
+        """Store outputs read from a stack.
+
+        Args:
+            project: Pulumi project name
+            stack: Stack name
+            backend_url: Backend the stack lives in
+            outputs: {key: {"value": ..., "secret": ...}}
+            stamp: Checkpoint stamp taken before the outputs were read (so a
+                concurrent update is never cached as current); read now if None
+        """
+        if not self.enabled:
+            return
+        if stamp is None:
+            stamp = checkpoint_stamp(backend_url, project, stack)
+        entry = {"fetched_at": time.time(), "stamp": stamp, "outputs": outputs}
+        path = self._path(project, stack, backend_url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "w") as f:  # mkstemp creates the file 0600
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Unserializable outputs or an unwritable home: just don't cache
+            pass
+
+    def invalidate(self, project: str, stack: str, backend_url: str) -> None:
+        """Drop the entry for one stack."""
+        self._path(project, stack, backend_url).unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Drop every entry; returns how many were removed."""
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -4,14 +4,28 @@
 This script runs inside a Kubernetes Job pod, downloads the job
 specification from blob storage, and executes it based on job type.
 Handles both SimJob (batch simulation) and CalibrationJob (adaptive).
+
+With MODELOPS_RUNNER_MODE=service it instead runs as a long-lived service
+(e.g. a Deployment) that takes jobs from the job registry's queue one after
+another, keeping one Dask client, and with it the worker plugin registration
+and cached cluster capabilities, across jobs. Jobs reach the queue when
+submitted with MODELOPS_JOB_RUNNER=service.
 """
 
 import json
 import logging
 import os
+import signal
+import socket
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from typing import Any
 
+import numpy as np
 from azure.storage.blob import BlobServiceClient
 from dask.distributed import Client
 from modelops_contracts import (
@@ -24,6 +38,8 @@ from modelops_contracts import (
 )
 from modelops_contracts.adaptive import AdaptiveAlgorithm
 
+from modelops.services.job_state import JobCancelledError
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -61,9 +77,13 @@ def _get_required_env(name: str, description: str) -> str:
     return value
 
 
-def load_job_from_blob() -> Job:
+def load_job_from_blob(blob_key: str | None = None) -> Job:
     """Download and deserialize job from blob storage.
 
+    Args:
+        blob_key: Blob storage key of the job specification. Defaults to the
+            JOB_BLOB_KEY environment variable.
+
     Returns:
         Deserialized Job object (SimJob or CalibrationJob)
 
@@ -72,7 +92,8 @@ def load_job_from_blob() -> Job:
         Exception: If download or deserialization fails
     """
     # Get configuration from environment with validation
-    blob_key = _get_required_env("JOB_BLOB_KEY", "Blob storage key for the job specification")
+    if blob_key is None:
+        blob_key = _get_required_env("JOB_BLOB_KEY", "Blob storage key for the job specification")
     conn_str = _get_required_env(
         "AZURE_STORAGE_CONNECTION_STRING",
         "Azure Storage connection string for accessing job blobs",
@@ -210,36 +231,74 @@ def run_simulation_job(job: SimJob, client: Client) -> None:
         target_entrypoints = job.target_spec.data["target_entrypoints"]
         logger.info(f"Will evaluate {len(target_entrypoints)} targets: {target_entrypoints}")
 
+    # Look up every task in the provenance store and only submit the misses
+    from modelops.services.job_planning import plan_job
+
+    plan_store = _make_planning_store()
+    plan = plan_job(task_groups, plan_store)
+    logger.info(f"Cache plan: {plan.summary}")
+
+    # Live progress for `mops jobs status`: simulations plus one aggregation per target
+    n_aggregations = len(task_groups) * len(target_entrypoints)
+    with (
+        _make_progress_reporter(job.job_id, len(job.tasks) + n_aggregations) as progress,
+        _make_index_recorder(job.job_id) as index,
+    ):
+        _record_plan(job.job_id, plan, progress)
+        progress.task_done(plan.summary.hits)
+        _run_simulation_tasks(
+            job, sim_service, plan, plan_store, target_entrypoints, progress, index
+        )
+
+
+def _run_simulation_tasks(
+    job, sim_service, plan, plan_store, target_entrypoints, progress, index
+) -> None:
+    """Submit, gather and write views for a simulation job's tasks."""
     # Submit replicate sets - run simulations once, then evaluate each target
     # This avoids redundant computation and Dask serialization limits
     from modelops_contracts import ReplicateSet
 
+    task_groups = plan.task_groups
     futures = []
     sim_futures_by_param = {}  # Store sim futures for model outputs collection
 
     for param_id, replicate_tasks in task_groups.items():
         base_task = replicate_tasks[0]
-        replicate_set = ReplicateSet(
-            base_task=base_task,
-            n_replicates=len(replicate_tasks),
-            seed_offset=0,  # Seeds already set in tasks
-        )
-
-        # Submit simulations ONCE per parameter set
-        sim_futures = sim_service.submit_replicates(replicate_set)
+        miss_tasks = plan.misses(param_id)
+
+        # Submit simulations ONCE per parameter set, skipping cached results
+        sim_futures = []
+        if miss_tasks:
+            replicate_set = ReplicateSet(base_task=miss_tasks[0], n_replicates=len(miss_tasks))
+            # Run each replicate with the seed its task declares (they need not be consecutive)
+            seeds = np.fromiter((t.seed for t in miss_tasks), np.uint64, len(miss_tasks))
+            sim_futures = sim_service.submit_replicates(replicate_set, seeds=seeds)
+            progress.watch(sim_futures)
+            _index_simulations(job.job_id, index, miss_tasks, sim_futures)
         sim_futures_by_param[param_id] = sim_futures  # Store for later gathering
-        logger.info(f"  Submitted {len(replicate_tasks)} replicate(s) for param {param_id[:8]}")
+        n_cached = len(replicate_tasks) - len(miss_tasks)
+        logger.info(
+            f"  Submitted {len(miss_tasks)} replicate(s) for param {param_id[:8]}"
+            + (f" ({n_cached} cached)" if n_cached else "")
+        )
 
         # Evaluate EACH target on the same simulation results
         if target_entrypoints:
+            # Cached results go in as refs the aggregating worker loads itself
+            sim_inputs = plan.inputs(param_id, sim_futures)
             for target in target_entrypoints:
                 agg_future = sim_service.submit_aggregation(
-                    sim_futures,
+                    sim_inputs,
                     target,
                     bundle_ref=base_task.bundle_ref,
                     param_id=param_id,
                 )
                 futures.append((param_id, target, agg_future))
+                progress.watch([agg_future])
+                _index_aggregation(
+                    job.job_id, index, param_id, base_task.bundle_ref, target, agg_future
+                )
                 logger.info(f"    Evaluating target {target} on param {param_id[:8]}")
         else:
             # No targets - return raw simulation results
@@ -261,21 +320,35 @@ def run_simulation_job(job: SimJob, client: Client) -> None:
     # Gather results
     param_futures_list = futures  # Save the (param_id, future) pairs
     results = sim_service.gather([f for *_, f in futures])
+    if progress.cancelled.is_set():
+        # The reporter saw `mops jobs cancel` and cancelled the outstanding futures
+        raise JobCancelledError(f"Job {job.job_id} was cancelled")
     logger.info(f"Job complete: {len(results)} results")
 
     # Gather raw simulation outputs for model_outputs collection
     logger.info("Gathering raw simulation outputs for model outputs...")
     raw_sim_returns_by_param = {}
     for param_id, sim_futures in sim_futures_by_param.items():
-        sim_returns = sim_service.gather(sim_futures)
+        sim_returns = sim_service.gather(sim_futures) if sim_futures else []
+        if plan.hits(param_id):
+            sim_returns = plan.results(param_id, sim_returns, plan_store)
         raw_sim_returns_by_param[param_id] = sim_returns
     logger.info(f"Gathered {len(raw_sim_returns_by_param)} parameter sets with simulation outputs")
 
+    if plan.summary.hits and not target_entrypoints:
+        # gather_sims only saw the simulations that ran; report every replicate
+        results = [raw_sim_returns_by_param[param_id] for param_id, *_ in futures]
+
+    # Index the results no done-callback recorded: cache hits and speculative winners
+    _record_result_index(
+        job, index, task_groups, raw_sim_returns_by_param, param_futures_list, results
+    )
+
     # Build results by target
     results_by_target = {}
     default_results = []
 
-    for (param_id, target, _), result in zip(param_futures_list, results):
+    for (param_id, target, _), result in zip(param_futures_list, results, strict=True):
         if target:
             target_name = target.split("/")[-1] if "/" in target else target
             results_by_target.setdefault(target_name, []).append(result)
@@ -305,29 +378,14 @@ def run_simulation_job(job: SimJob, client: Client) -> None:
     # Write Parquet views for post-job analysis (only for jobs with targets)
     if target_entrypoints and results_by_target:
         try:
-            from pathlib import Path
-
             from modelops.services.job_views import write_job_view, write_replicates_view
-            from modelops.services.provenance_store import ProvenanceStore
 
             logger.info("Writing job results to Parquet views...")
 
             # Initialize ProvenanceStore with Azure backend if connection string is available
             prov_store = None
-            conn_str = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
-            if conn_str:
-                try:
-                    prov_store = ProvenanceStore(
-                        storage_dir=Path("/tmp/modelops/provenance"),
-                        azure_backend={
-                            "container": "results",
-                            "connection_string": conn_str,
-                        },
-                    )
-                    logger.info("ProvenanceStore initialized with Azure backend")
-                except Exception as e:
-                    logger.warning(f"Could not initialize ProvenanceStore with Azure: {e}")
-                    prov_store = None
+            if os.environ.get("AZURE_STORAGE_CONNECTION_STRING"):
+                prov_store = _make_provenance_store()
 
             view_path = write_job_view(
                 job, results_by_target, prov_store=prov_store, raw_sim_returns=raw_sim_returns_by_param
@@ -374,6 +432,234 @@ def run_simulation_job(job: SimJob, client: Client) -> None:
     logger.info(f"Job {job.job_id} completed successfully")
 
 
+def _make_provenance_store():
+    """Create the runner's ProvenanceStore, with Azure uploads when configured.
+
+    Returns:
+        ProvenanceStore, or None if it could not be created
+    """
+    from pathlib import Path
+
+    from modelops.services.provenance_store import ProvenanceStore
+
+    azure_backend = None
+    conn_str = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+    if conn_str:
+        azure_backend = {"container": "results", "connection_string": conn_str}
+    try:
+        prov_store = ProvenanceStore(
+            storage_dir=Path("/tmp/modelops/provenance"), azure_backend=azure_backend
+        )
+        if azure_backend:
+            logger.info("ProvenanceStore initialized with Azure backend")
+        return prov_store
+    except Exception as e:
+        logger.warning(f"Could not initialize ProvenanceStore: {e}")
+        return None
+
+
+def _make_planning_store():
+    """Create a ProvenanceStore that sees the workers' results, for cache planning.
+
+    The store is built from the workers' RuntimeConfig. Workers keep results
+    under their own storage_dir, so the runner can only find them when that
+    directory is a shared volume (MODELOPS_SHARED_STORAGE) or the workers
+    upload to Azure (MODELOPS_UPLOAD_TO_AZURE). Otherwise planning is disabled:
+    a store private to the runner would report every task missing.
+
+    Planning is on by default; MODELOPS_CACHE_PLANNING=false (or disabling
+    the provenance cache with MODELOPS_DISABLE_PROVENANCE) submits every task.
+
+    Returns:
+        ProvenanceStore, or None to plan every task as a miss
+    """
+    from pathlib import Path
+
+    from modelops.services.provenance_store import ProvenanceStore
+    from modelops.worker.config import RuntimeConfig
+
+    if os.environ.get("MODELOPS_CACHE_PLANNING", "true").lower() != "true":
+        return None
+    if os.environ.get("MODELOPS_DISABLE_PROVENANCE", "").lower() in ("1", "true"):
+        return None
+
+    config = RuntimeConfig.from_env()
+    azure_backend = config.azure_backend()
+    if azure_backend is None and not config.shared_storage:
+        logger.info(
+            "Cache planning disabled: worker results are not shared with the runner "
+            "(set MODELOPS_SHARED_STORAGE or MODELOPS_UPLOAD_TO_AZURE)"
+        )
+        return None
+    try:
+        store = ProvenanceStore(storage_dir=Path(config.storage_dir), azure_backend=azure_backend)
+    except Exception as e:
+        logger.warning(f"Cache planning disabled, could not open {config.storage_dir}: {e}")
+        return None
+    if not (config.shared_storage or store.supports_remote_uploads()):
+        logger.warning("Cache planning disabled: could not connect to the workers' Azure storage")
+        return None
+    return store
+
+
+def _record_plan(job_id: str, plan, progress) -> None:
+    """Record the plan summary in the job registry, if the reporter has one."""
+    if progress.registry is None:
+        return
+    try:
+        progress.registry.record_plan(job_id, plan.summary.to_dict())
+    except Exception as e:
+        logger.warning(f"Failed to record cache plan for job {job_id}: {e}")
+
+
+def _make_progress_reporter(job_id: str, tasks_total: int = 0):
+    """Create a ProgressReporter writing to the job registry when it is reachable.
+
+    Without a registry connection progress is only logged.
+
+    Returns:
+        ProgressReporter (use as a context manager)
+    """
+    from modelops.services.progress import ProgressReporter
+
+    registry = None
+    try:
+        registry = _make_job_registry()
+    except Exception as e:
+        logger.warning(f"Job registry unavailable, progress will only be logged: {e}")
+    return ProgressReporter.from_env(registry, job_id, tasks_total=tasks_total)
+
+
+def _make_job_registry():
+    """Create the JobRegistry from AZURE_STORAGE_CONNECTION_STRING.
+
+    Returns:
+        JobRegistry, or None when no connection string is set
+    """
+    conn_str = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+    if not conn_str:
+        return None
+
+    from modelops.services.job_registry import JobRegistry
+    from modelops.services.storage.azure_versioned import AzureVersionedStore
+
+    return JobRegistry(AzureVersionedStore(connection_string=conn_str, container="job-registry"))
+
+
+def _make_index_recorder(job_id: str):
+    """Create an IndexRecorder for the job's result index.
+
+    Without a provenance store results are not indexed.
+
+    Returns:
+        IndexRecorder (use as a context manager)
+    """
+    from modelops.services.result_index import IndexRecorder, JobResultIndex
+
+    index = None
+    try:
+        prov_store = _make_provenance_store()
+        if prov_store is not None:
+            index = JobResultIndex(prov_store, job_id)
+    except Exception as e:
+        logger.warning(f"Result index unavailable for job {job_id}: {e}")
+    return IndexRecorder.from_env(index)
+
+
+def _index_simulations(job_id, index, tasks, sim_futures) -> None:
+    """Record each simulation in the result index as soon as its future finishes.
+
+    Callbacks run on Dask's single callback thread, so they only queue the
+    entry; the recorder's flush thread fetches the result to build it. A
+    future that fails or is cancelled (e.g. it lost a speculative race) records
+    nothing; the final pass in _record_result_index covers the winner.
+    """
+    from modelops.services.result_index import sim_entry
+
+    if index.prov_store is None:
+        return
+
+    def on_done(task, future):
+        if future.status != "finished":
+            return
+        key = ("sim", task.params.param_id, task.seed, None)
+        index.record_deferred(
+            key, lambda: sim_entry(job_id, task, future.result(), index.prov_store)
+        )
+
+    for task, adapter in zip(tasks, sim_futures, strict=True):
+        adapter.wrapped.add_done_callback(partial(on_done, task))
+
+
+def _index_aggregation(job_id, index, param_id, bundle_ref, target, agg_future) -> None:
+    """Record an aggregation in the result index as soon as its future finishes.
+
+    The entry's path comes from the result's aggregation_id, so nothing
+    gathers the replicates it aggregated, and like simulations it is built on
+    the recorder's flush thread rather than Dask's callback thread.
+    """
+    from modelops.services.result_index import agg_entry
+
+    if index.prov_store is None:
+        return
+
+    def build(future):
+        return agg_entry(job_id, param_id, bundle_ref, target, future.result(), index.prov_store)
+
+    def on_done(future):
+        if future.status == "finished":
+            index.record_deferred(("agg", param_id, None, str(target)), partial(build, future))
+
+    agg_future.wrapped.add_done_callback(on_done)
+
+
+def _record_result_index(
+    job, index, task_groups, sim_returns_by_param, agg_futures, agg_results
+) -> None:
+    """Record the results of this run that done-callbacks did not.
+
+    Cache hits never had a future, and a speculative winner is not the future
+    the callback was registered on. Never fails the job: the index is an
+    accelerator, and validation probes storage for results it lacks.
+
+    Args:
+        job: SimJob being executed
+        index: IndexRecorder of the job
+        task_groups: param_id -> replicate SimTasks
+        sim_returns_by_param: param_id -> gathered SimReturns (or exceptions)
+        agg_futures: (param_id, target, future) tuples in submission order
+        agg_results: Gathered results aligned with agg_futures
+    """
+    from modelops.services.result_index import agg_entry, sim_entry
+
+    prov_store = index.prov_store
+    if prov_store is None:
+        return
+
+    try:
+        entries = []
+        for param_id, tasks in task_groups.items():
+            sim_returns = sim_returns_by_param.get(param_id, [])
+            for task, sim_return in zip(tasks, sim_returns, strict=True):
+                if isinstance(sim_return, Exception):
+                    continue
+                if not index.is_recorded("sim", param_id, task.seed):
+                    entries.append(sim_entry(job.job_id, task, sim_return, prov_store))
+
+            for (agg_param_id, target, _), result in zip(agg_futures, agg_results, strict=True):
+                if agg_param_id != param_id or not target or isinstance(result, Exception):
+                    continue
+                if not index.is_recorded("agg", param_id, target=str(target)):
+                    bundle_ref = tasks[0].bundle_ref
+                    entries.append(
+                        agg_entry(job.job_id, param_id, bundle_ref, target, result, prov_store)
+                    )
+
+        index.record(entries)
+    except Exception as e:
+        logger.warning(f"Failed to record result index for job {job.job_id}: {e}")
+
+
 def run_calibration_job(job: CalibrationJob, client: Client) -> None:
     """Execute a calibration job.
 
@@ -427,53 +713,58 @@ def run_calibration_job(job: CalibrationJob, client: Client) -> None:
             "modelops-calabaria calibration module not available. Using basic implementation."
         )
 
-    # Fallback to basic implementation if calibration wire not available
-    # Create simulation service
-    sim_service = DaskSimulationService(client)
+    # Fallback to the built-in steady-state ask/tell driver
+    from modelops.services.calibration_driver import SteadyStateCalibration
 
-    # Initialize algorithm based on type
-    algo = create_adaptive_algorithm(job.algorithm, job.algorithm_config)
-
-    # Run ask/tell loop
-    iteration = 0
-    while not algo.finished() and iteration < job.max_iterations:
-        iteration += 1
-        logger.info(f"Iteration {iteration}/{job.max_iterations}")
-
-        # Ask for parameters
-        param_sets = algo.ask(n=16)  # Batch size could be configurable
-        if not param_sets:
-            logger.info("No more parameters to evaluate")
-            break
-
-        # Submit simulations
-        futures = []
-        for params in param_sets:
-            # Create task for these parameters
-            task = SimTask(
-                bundle_ref=job.bundle_ref,
-                entrypoint="models.main/baseline",  # Should be in job config
-                params=params,
-                seed=iteration * 1000 + len(futures),  # Simple seed generation
-            )
-            future = sim_service.submit(task)
-            futures.append(future)
+    target_entrypoints = job.target_spec.data.get("target_entrypoints", [])
+    if not target_entrypoints:
+        raise ValueError(
+            "Calibration job has no target_spec.data['target_entrypoints'] to evaluate"
+        )
 
-        # Gather results
-        sim_results = sim_service.gather(futures)
+    config = job.algorithm_config
+    sim_service = DaskSimulationService(client)
+    algo = create_adaptive_algorithm(job.algorithm, config)
+
+    # max_iterations counted generations of batch_size trials in the old generational
+    # loop; keep the same evaluation budget unless max_trials is given explicitly
+    max_trials = config.get("max_trials", job.max_iterations * config.get("batch_size", 16))
+
+    # Progress is counted in trials
+    with _make_progress_reporter(job.job_id, max_trials or 0) as progress:
+        driver = SteadyStateCalibration(
+            sim_service,
+            algo,
+            bundle_ref=job.bundle_ref,
+            entrypoint=config.get("entrypoint", "models.main/baseline"),
+            target_entrypoints=target_entrypoints,
+            n_replicates=config.get("n_replicates", 1),
+            max_trials=max_trials,
+            max_in_flight=config.get("max_in_flight"),
+            target_weights=job.target_spec.weights,
+            max_loss=job.convergence_criteria.get("max_loss"),
+            progress=progress,
+        )
+        n_trials = driver.run()
+        if progress.cancelled.is_set():
+            raise JobCancelledError(f"Job {job.job_id} was cancelled after {n_trials} trials")
 
-        # Evaluate against targets
-        trial_results = evaluate_results(sim_results, job.target_spec)
+    logger.info(f"Calibration job {job.job_id} completed after {n_trials} trials")
 
-        # Tell algorithm
-        algo.tell(trial_results)
 
-        # Check convergence
-        if check_convergence(trial_results, job.convergence_criteria):
-            logger.info("Convergence criteria met")
-            break
+def evaluate_results(sim_results, target_spec: TargetSpec):
+    """Evaluate simulation results against targets.
 
-    logger.info(f"Calibration job {job.job_id} completed after {iteration} iterations")
+    Args:
+        sim_results: List of SimReturn objects
+        target_spec: Target specification
+
+    Returns:
+        List of TrialResult objects
+    """
+    # This would implement actual evaluation logic
+    # For now, raise NotImplementedError
+    raise NotImplementedError("Result evaluation not yet implemented")
 
 
 def create_adaptive_algorithm(algorithm: str, config: dict[str, Any]) -> AdaptiveAlgorithm:
@@ -511,50 +802,183 @@ def create_adaptive_algorithm(algorithm: str, config: dict[str, Any]) -> Adaptiv
     )
 
 
-def evaluate_results(sim_results, target_spec: TargetSpec):
-    """Evaluate simulation results against targets.
+def run_job(job: Job, client: Client) -> None:
+    """Execute a job of any type on the cluster.
 
     Args:
-        sim_results: List of SimReturn objects
-        target_spec: Target specification
+        job: SimJob or CalibrationJob
+        client: Dask client connected to cluster
+
+    Raises:
+        ValueError: If the job type is unknown
+    """
+    match job:
+        case SimJob():
+            run_simulation_job(job, client)
+        case CalibrationJob():
+            run_calibration_job(job, client)
+        case _:
+            raise ValueError(f"Unknown job type: {type(job).__name__}")
+
+
+def _claim_next_job(registry, runner_id: str, lease_seconds: float):
+    """Claim the oldest queued job this runner can get.
 
     Returns:
-        List of TrialResult objects
+        The claimed JobState, or None if the queue is empty or every queued
+        job was claimed elsewhere or cancelled
     """
-    # This would implement actual evaluation logic
-    # For now, raise NotImplementedError
-    raise NotImplementedError("Result evaluation not yet implemented")
+    for job_id in registry.queued_jobs():
+        state = registry.claim_job(job_id, runner_id, lease_seconds=lease_seconds)
+        if state is not None:
+            return state
+    return None
 
 
-def check_convergence(trial_results, criteria: dict[str, float]) -> bool:
-    """Check if convergence criteria are met.
+@contextmanager
+def _hold_lease(registry, job_id: str, runner_id: str, lease_seconds: float):
+    """Renew a claimed job's lease in the background while the body runs."""
+    done = threading.Event()
+
+    def heartbeat() -> None:
+        while not done.wait(lease_seconds / 3):
+            try:
+                if not registry.renew_lease(job_id, runner_id, lease_seconds):
+                    # Cancelled (the ProgressReporter stops the job), or requeued
+                    # after missed renewals
+                    logger.warning(f"Runner {runner_id} no longer holds job {job_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to renew the lease of job {job_id}: {e}")
+
+    thread = threading.Thread(target=heartbeat, name=f"lease-{job_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        thread.join()
+
+
+def serve(
+    client: Client,
+    registry,
+    poll_interval: float | None = None,
+    stop: threading.Event | None = None,
+    max_jobs: int | None = None,
+    load_job=load_job_from_blob,
+    lease_seconds: float | None = None,
+) -> int:
+    """Run queued jobs from the job registry until stopped.
+
+    Jobs are claimed one at a time (JobRegistry.claim_job moves them to
+    RUNNING), run on the shared client, then moved to VALIDATING for
+    `mops jobs validate`, or to FAILED with the error. The client's worker
+    plugin registration and cluster capabilities carry over between jobs.
+
+    A claim is a lease that a heartbeat thread renews while the job runs.
+    Between jobs the runner also requeues jobs whose runner let its lease
+    run out (JobRegistry.reclaim_stale_jobs), so a job whose pod died is
+    picked up again instead of staying RUNNING.
 
     Args:
-        trial_results: Latest trial results
-        criteria: Convergence criteria
+        client: Dask client connected to cluster, reused for every job
+        registry: JobRegistry holding the queue
+        poll_interval: Seconds between queue checks while idle. Defaults to the
+            MODELOPS_RUNNER_POLL_SECONDS environment variable (1).
+        stop: Event that ends the loop after the current job
+        max_jobs: Stop after running this many jobs (default: no limit)
+        load_job: Loads a job from its blob key
+        lease_seconds: Claim lease length, also the interval between stale
+            claim checks. Defaults to the MODELOPS_RUNNER_LEASE_SECONDS
+            environment variable (300).
 
     Returns:
-        True if converged
+        Number of jobs run
     """
-    # Simple implementation - would be more sophisticated
-    if not criteria:
-        return False
+    from modelops.services.cluster_session import session_for
+    from modelops.services.job_state import JobStatus
+
+    if poll_interval is None:
+        poll_interval = float(os.environ.get("MODELOPS_RUNNER_POLL_SECONDS", "1"))
+    if lease_seconds is None:
+        lease_seconds = float(os.environ.get("MODELOPS_RUNNER_LEASE_SECONDS", "300"))
+    stop = stop or threading.Event()
+    runner_id = f"{socket.gethostname()}:{os.getpid()}"
+    session = session_for(client)
+    logger.info(f"Runner service {runner_id} waiting for jobs")
+
+    n_jobs = 0
+    next_reclaim = 0.0
+    while not stop.is_set() and (max_jobs is None or n_jobs < max_jobs):
+        try:
+            if time.monotonic() >= next_reclaim:
+                next_reclaim = time.monotonic() + lease_seconds
+                registry.reclaim_stale_jobs()
+            state = _claim_next_job(registry, runner_id, lease_seconds)
+        except Exception as e:
+            # Transient registry errors must not end a long-lived service
+            logger.warning(f"Could not take a job from the queue, retrying: {e}")
+            stop.wait(poll_interval)
+            continue
+        if state is None:
+            stop.wait(poll_interval)
+            continue
+        n_jobs += 1
+        waited = time.time() - datetime.fromisoformat(state.created_at).timestamp()
+        logger.info(f"Claimed job {state.job_id} ({waited:.1f}s after submission)")
 
-    # Check if loss is below threshold
-    if "max_loss" in criteria:
-        losses = [r.loss for r in trial_results if r.status == "COMPLETED"]
-        if losses and min(losses) < criteria["max_loss"]:
-            return True
+        try:
+            with _hold_lease(registry, state.job_id, runner_id, lease_seconds):
+                session.refresh()  # Notices a replaced scheduler before submitting anything
+                job = load_job(state.metadata["blob_key"])
+                run_job(job, client)
+        except JobCancelledError as e:
+            logger.info(f"{e}; its futures were cancelled")
+            continue
+        except Exception as e:
+            logger.error(f"Job {state.job_id} failed: {e}", exc_info=True)
+            try:
+                registry.finalize_job(
+                    state.job_id,
+                    JobStatus.FAILED,
+                    error_info={"message": str(e), "code": type(e).__name__},
+                )
+            except Exception as update_e:
+                logger.warning(f"Failed to record failure of job {state.job_id}: {update_e}")
+            continue
 
-    return False
+        try:
+            registry.update_status(state.job_id, JobStatus.VALIDATING)
+        except Exception as e:
+            logger.warning(f"Failed to move job {state.job_id} to validating: {e}")
+        logger.info(f"Job {state.job_id} completed successfully")
+
+    logger.info(f"Runner service {runner_id} stopping after {n_jobs} job(s)")
+    return n_jobs
+
+
+def _serve_main(client: Client) -> None:
+    """Service mode: run queued jobs until SIGTERM."""
+    registry = _make_job_registry()
+    if registry is None:
+        raise MissingEnvironmentVariableError(
+            "Runner service mode needs AZURE_STORAGE_CONNECTION_STRING for the job queue"
+        )
+    stop = threading.Event()
+    # Finish the current job, then exit (pods get SIGTERM on scale-down/rollout)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    serve(client, registry, stop=stop)
 
 
 def main():
     """Main entry point for job runner."""
     try:
-        # Load job from blob
-        job = load_job_from_blob()
-        logger.info(f"Loaded {job.job_type} job: {job.job_id}")
+        service_mode = os.environ.get("MODELOPS_RUNNER_MODE", "job").lower() == "service"
+        if not service_mode:
+            # Load job from blob
+            job = load_job_from_blob()
+            logger.info(f"Loaded {job.job_type} job: {job.job_id}")
 
         # Connect to Dask scheduler
         scheduler_addr = os.environ.get("DASK_SCHEDULER_ADDRESS", "tcp://dask-scheduler:8786")
@@ -565,17 +989,18 @@ def main():
             f"Connected to Dask cluster with {len(client.scheduler_info()['workers'])} workers"
         )
 
+        if service_mode:
+            _serve_main(client)
+            return
+
         # Dispatch based on job type
-        match job:
-            case SimJob():
-                run_simulation_job(job, client)
-            case CalibrationJob():
-                run_calibration_job(job, client)
-            case _:
-                raise ValueError(f"Unknown job type: {type(job).__name__}")
+        run_job(job, client)
 
         logger.info("Job execution completed successfully")
 
+    except JobCancelledError as e:
+        # Exit cleanly so Kubernetes does not retry a cancelled job
+        logger.info(str(e))
     except Exception as e:
         logger.error(f"Job execution failed: {e}", exc_info=True)
         sys.exit(1)
@@ -1,6 +1,19 @@
 """Simulation service implementations."""
 
-from .dask_simulation import DaskSimulationService
-from .simulation import LocalSimulationService
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attrs
+
+if TYPE_CHECKING:
+    from .dask_simulation import DaskSimulationService
+    from .simulation import LocalSimulationService
+
+# Imported on first access; dask_simulation pulls in dask.distributed
+_LAZY_ATTRS = {
+    "DaskSimulationService": ".dask_simulation",
+    "LocalSimulationService": ".simulation",
+}
 
 __all__ = ["LocalSimulationService", "DaskSimulationService"]
+
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,180 @@
+"""Locality-aware placement of simulation tasks across the worker fleet.
+
+Each worker resolves bundles and builds venvs on first use, then keeps a warm
+subprocess per bundle digest (see WarmProcessManager). When a job touches
+several bundles, e.g. a model comparison, letting the scheduler place tasks
+freely means every worker ends up warming every bundle and the
+max_warm_processes LRU pool thrashes.
+
+BundlePlacement keeps a periodically refreshed view of which workers hold a
+warm process for each bundle and routes tasks to them with loose worker
+restrictions. The set of workers for a bundle is only widened when the
+bundle's in-flight backlog exceeds what its current workers can absorb.
+"""
+
+import logging
+import time
+from collections import defaultdict
+
+from dask.distributed import Client
+from dask.distributed import Future as DaskFuture
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_warm_bundles(dask_worker) -> list[str]:
+    """Report bundle refs with a live warm process on this worker.
+
+    Runs on every worker via client.run(). Execution environments without a
+    warm pool report nothing, which disables routing for that worker.
+    """
+    exec_env = getattr(dask_worker, "modelops_exec_env", None)
+    warm_bundle_refs = getattr(exec_env, "warm_bundle_refs", None)
+    if warm_bundle_refs is None:
+        return []
+    return list(warm_bundle_refs())
+
+
+class BundlePlacement:
+    """Track warm bundles per worker and choose workers for new tasks.
+
+    The warm view comes from a census of workers (client.run), cached for
+    refresh_interval seconds. Between censuses, workers selected for a bundle
+    are remembered optimistically so consecutive submissions keep landing on
+    the same workers while their processes are still starting.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        refresh_interval: float = 30.0,
+        backlog_factor: float = 2.0,
+    ):
+        """Initialize placement tracking.
+
+        Args:
+            client: Dask client connected to the cluster
+            refresh_interval: Seconds between worker censuses
+            backlog_factor: Pending tasks allowed per worker thread before the
+                bundle is spread to additional workers
+        """
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.backlog_factor = backlog_factor
+
+        self._warm: dict[str, set[str]] = {}  # bundle_ref -> worker addresses
+        self._nthreads: dict[str, int] = {}  # worker address -> threads
+        self._inflight: dict[str, list[DaskFuture]] = defaultdict(list)
+        self._last_refresh: float | None = None
+
+    def refresh(self, force: bool = False) -> None:
+        """Refresh the warm-bundle view from the workers.
+
+        Args:
+            force: Refresh even if the cached view is still fresh
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_refresh is not None
+            and now - self._last_refresh < self.refresh_interval
+        ):
+            return
+        self._last_refresh = now
+
+        try:
+            info = self.client.scheduler_info()
+            reports = self.client.run(_worker_warm_bundles)
+        except Exception as e:
+            # Keep routing on the previous view rather than failing submission
+            logger.debug(f"Could not refresh bundle placement: {e}")
+            return
+
+        self._nthreads = {
+            addr: worker.get("nthreads", 1) or 1
+            for addr, worker in info.get("workers", {}).items()
+        }
+
+        warm: dict[str, set[str]] = defaultdict(set)
+        for addr, refs in reports.items():
+            if addr not in self._nthreads:
+                continue
+            for ref in refs:
+                warm[ref].add(addr)
+
+        # Workers chosen for bundles with work still in flight may not have
+        # reported yet (venv still building) - keep them
+        for bundle_ref, addrs in self._warm.items():
+            if self._pending(bundle_ref):
+                warm[bundle_ref] |= addrs & self._nthreads.keys()
+
+        self._warm = dict(warm)
+
+    def workers_for(self, bundle_ref: str, n_tasks: int) -> list[str] | None:
+        """Choose workers for n_tasks new tasks of a bundle.
+
+        Workers already warm for the bundle are preferred. Additional workers,
+        starting with those holding the fewest warm bundles, are only added
+        while the bundle's backlog exceeds backlog_factor tasks per thread.
+
+        Args:
+            bundle_ref: Bundle reference of the tasks
+            n_tasks: Number of tasks about to be submitted
+
+        Returns:
+            Worker addresses to restrict to, or None if no workers are known
+        """
+        self.refresh()
+        if not self._nthreads:
+            return None
+
+        selected = self._warm.get(bundle_ref, set()) & self._nthreads.keys()
+        backlog = self._pending(bundle_ref) + n_tasks
+        capacity = sum(self._nthreads[addr] for addr in selected)
+
+        if selected and backlog <= capacity * self.backlog_factor:
+            return sorted(selected)
+
+        bundles_per_worker = dict.fromkeys(self._nthreads, 0)
+        for addrs in self._warm.values():
+            for addr in addrs:
+                if addr in bundles_per_worker:
+                    bundles_per_worker[addr] += 1
+        candidates = sorted(
+            (addr for addr in self._nthreads if addr not in selected),
+            key=lambda addr: (bundles_per_worker[addr], addr),
+        )
+
+        added = []
+        for addr in candidates:
+            if selected and backlog <= capacity * self.backlog_factor:
+                break
+            selected = selected | {addr}
+            capacity += self._nthreads[addr]
+            added.append(addr)
+
+        if added:
+            logger.info(
+                f"Spreading bundle {bundle_ref[:24]} to {len(added)} more worker(s) "
+                f"(backlog={backlog}, workers={len(selected)})"
+            )
+        self._warm[bundle_ref] = selected
+        return sorted(selected)
+
+    def track(self, bundle_ref: str, futures: list[DaskFuture]) -> None:
+        """Record submitted futures so backlog can be measured.
+
+        Args:
+            bundle_ref: Bundle reference of the tasks
+            futures: Dask futures returned by submit/map
+        """
+        self._inflight[bundle_ref].extend(futures)
+
+    def _pending(self, bundle_ref: str) -> int:
+        """Count unfinished tracked futures for a bundle, dropping finished ones."""
+        futures = self._inflight.get(bundle_ref)
+        if not futures:
+            return 0
+        pending = [f for f in futures if not f.done()]
+        self._inflight[bundle_ref] = pending
+        return len(pending)
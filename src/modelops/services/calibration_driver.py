@@ -0,0 +1,321 @@
+"""Asynchronous steady-state ask/tell driver for calibration jobs.
+
+The generational loop (ask a batch, gather it, tell it) waits for the slowest
+simulation of every batch while the rest of the cluster idles. This driver
+instead keeps a fixed number of trials in flight: as each trial's
+aggregation lands it is told to the algorithm and a replacement is asked
+for immediately.
+
+A trial is one parameter set: its replicates are submitted with
+submit_replicates and each target is evaluated with submit_aggregation, so
+the trial completes when all of its target aggregations have completed.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from dask.distributed import as_completed
+from modelops_contracts import (
+    ReplicateSet,
+    SimTask,
+    TrialResult,
+    TrialStatus,
+    UniqueParameterSet,
+)
+from modelops_contracts.adaptive import AdaptiveAlgorithm
+
+from ..utils.seeds import derive_single_seed
+from .dask_simulation import DaskSimulationService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Trial:
+    """Bookkeeping for one parameter set in flight."""
+
+    params: UniqueParameterSet
+    targets: list[str]
+    submitted_at: float
+    losses: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    sim_futures: list = field(default_factory=list)  # Adapters of its replicates
+
+    @property
+    def done(self) -> bool:
+        return len(self.losses) + len(self.errors) == len(self.targets)
+
+
+def cluster_capacity(client, n_replicates: int) -> int:
+    """Number of trials that keep every worker thread busy.
+
+    Args:
+        client: Dask client
+        n_replicates: Simulations per trial
+
+    Returns:
+        Trials to keep in flight (at least 1)
+    """
+    workers = client.scheduler_info().get("workers", {})
+    threads = sum(w.get("nthreads", 1) for w in workers.values())
+    return max(1, threads // max(1, n_replicates))
+
+
+class SteadyStateCalibration:
+    """Keep a target number of calibration trials in flight.
+
+    Example:
+        >>> driver = SteadyStateCalibration(
+        ...     sim_service, algo, bundle_ref, "models.main/baseline",
+        ...     ["targets.incidence/fit"], n_replicates=4, max_trials=256,
+        ... )
+        >>> n_told = driver.run()
+    """
+
+    def __init__(
+        self,
+        sim_service: DaskSimulationService,
+        algorithm: AdaptiveAlgorithm,
+        bundle_ref: str,
+        entrypoint: str,
+        target_entrypoints: list[str],
+        n_replicates: int = 1,
+        max_trials: int | None = None,
+        max_in_flight: int | None = None,
+        target_weights: dict[str, float] | None = None,
+        max_loss: float | None = None,
+        progress: Any | None = None,
+    ):
+        """Initialize the driver.
+
+        Args:
+            sim_service: Simulation service used to submit replicates and aggregations
+            algorithm: Adaptive algorithm to ask/tell
+            bundle_ref: Bundle to simulate
+            entrypoint: Simulation entrypoint
+            target_entrypoints: Targets evaluated for every trial
+            n_replicates: Replicates per trial
+            max_trials: Stop after this many trials have been told (None for no limit)
+            max_in_flight: Trials kept in flight (default: sized to cluster capacity)
+            target_weights: Weight per target name when combining losses (default 1.0)
+            max_loss: Stop once a completed trial's loss falls below this
+            progress: ProgressReporter notified as each trial is told; its futures are
+                tracked so a job cancel stops them, and the loop ends once it fires
+        """
+        if not target_entrypoints:
+            raise ValueError("Calibration requires at least one target entrypoint")
+
+        self.sim_service = sim_service
+        self.algorithm = algorithm
+        self.bundle_ref = bundle_ref
+        self.entrypoint = entrypoint
+        self.target_entrypoints = list(target_entrypoints)
+        self.n_replicates = n_replicates
+        self.max_trials = max_trials
+        self.max_in_flight = max_in_flight or cluster_capacity(sim_service.client, n_replicates)
+        self.target_weights = target_weights or {}
+        self.max_loss = max_loss
+        self.progress = progress
+
+        self.n_asked = 0
+        self.n_told = 0
+        self.best: TrialResult | None = None
+
+    def run(self) -> int:
+        """Run until the algorithm finishes, the budget is spent or loss converges.
+
+        Returns:
+            Number of trials told to the algorithm
+        """
+        start = time.perf_counter()
+        # Dask future key -> (future, [(trial, target, adapter), ...]) for outstanding
+        # aggregations
+        pending: dict[str, tuple] = {}
+        completed = as_completed()
+
+        logger.info(
+            f"Steady-state calibration: {self.max_in_flight} trials in flight, "
+            f"{self.n_replicates} replicate(s) x {len(self.target_entrypoints)} target(s)"
+        )
+
+        in_flight = self._fill(self.max_in_flight, pending, completed)
+        while in_flight:
+            future = next(completed)
+            if self.progress is not None and self.progress.cancelled.is_set():
+                logger.info("Calibration job cancelled, not telling outstanding trials")
+                break
+            _, waiting = pending[future.key]
+            trial, target, adapter = waiting.pop()
+            if not waiting:
+                del pending[future.key]
+
+            if adapter.wrapped is not future:
+                # Resubmitted after a speculative duplicate won; wait for the new one
+                self._watch(trial, target, adapter, pending, completed)
+                continue
+
+            self._record(trial, target, future)
+            if not trial.done:
+                continue
+
+            in_flight -= 1
+            result = self._trial_result(trial)
+            self.algorithm.tell([result])
+            self.n_told += 1
+            if self.progress is not None:
+                self.progress.task_done()
+            self._track_best(result)
+
+            if self._should_stop(result):
+                break
+            in_flight += self._fill(self.max_in_flight - in_flight, pending, completed)
+
+        if pending:
+            # Budget spent or converged: don't leave orphaned work on the cluster,
+            # including the simulations the outstanding aggregations wait for
+            trials = {id(t): t for _, waiting in pending.values() for t, *_ in waiting}
+            sim_futures = [a.wrapped for t in trials.values() for a in t.sim_futures]
+            logger.info(
+                f"Cancelling {len(pending)} outstanding aggregation(s) "
+                f"and {len(sim_futures)} simulation(s)"
+            )
+            self.sim_service.client.cancel([f for f, _ in pending.values()] + sim_futures)
+
+        elapsed = time.perf_counter() - start
+        best = f"{self.best.loss:.6g}" if self.best else "n/a"
+        logger.info(
+            f"Calibration told {self.n_told} trial(s) in {elapsed:.1f}s "
+            f"({self.n_told / elapsed if elapsed else 0:.2f} trials/s), best loss {best}"
+        )
+        return self.n_told
+
+    def _budget_left(self) -> int | None:
+        if self.max_trials is None:
+            return None
+        return max(0, self.max_trials - self.n_asked)
+
+    def _fill(self, n: int, pending: dict, completed: as_completed) -> int:
+        """Ask for up to n parameter sets and submit them as trials."""
+        budget = self._budget_left()
+        if budget is not None:
+            n = min(n, budget)
+        if n <= 0 or self.algorithm.finished():
+            return 0
+
+        param_sets = self.algorithm.ask(n=n)
+        for params in param_sets:
+            trial = self._submit_trial(params, pending, completed)
+            logger.debug(f"Submitted trial {trial.params.param_id[:8]}")
+        self.n_asked += len(param_sets)
+        return len(param_sets)
+
+    def _submit_trial(
+        self, params: UniqueParameterSet, pending: dict, completed: as_completed
+    ) -> _Trial:
+        # Deterministic per param_id so repeated proposals hit content-addressed keys;
+        # kept below 2**32 to leave room for replicate offsets within uint64
+        seed = derive_single_seed(params.param_id) % (2**32)
+        base_task = SimTask(
+            bundle_ref=self.bundle_ref,
+            entrypoint=self.entrypoint,
+            params=params,
+            seed=seed,
+        )
+        replicate_set = ReplicateSet(base_task=base_task, n_replicates=self.n_replicates)
+        sim_futures = self.sim_service.submit_replicates(replicate_set)
+        if self.progress is not None:
+            self.progress.track(sim_futures)
+
+        trial = _Trial(
+            params=params,
+            targets=self.target_entrypoints,
+            submitted_at=time.time(),
+            sim_futures=sim_futures,
+        )
+        for target in self.target_entrypoints:
+            agg_future = self.sim_service.submit_aggregation(
+                sim_futures,
+                target,
+                bundle_ref=self.bundle_ref,
+                param_id=params.param_id,
+            )
+            if self.progress is not None:
+                self.progress.track([agg_future])
+            self._watch(trial, target, agg_future, pending, completed)
+        return trial
+
+    @staticmethod
+    def _watch(trial: _Trial, target: str, adapter, pending: dict, completed) -> None:
+        dask_future = adapter.wrapped
+        pending.setdefault(dask_future.key, (dask_future, []))[1].append((trial, target, adapter))
+        completed.add(dask_future)
+
+    @staticmethod
+    def _record(trial: _Trial, target: str, future) -> None:
+        if future.status == "error":
+            trial.errors[target] = repr(future.exception())
+            return
+        if future.status == "cancelled":
+            # Lost worker or user cancel; result() would raise and end the whole loop
+            trial.errors[target] = "aggregation cancelled"
+            return
+        result = future.result()
+        loss = getattr(result, "loss", None)
+        if loss is None or not math.isfinite(loss):
+            trial.errors[target] = f"non-finite loss: {loss}"
+        else:
+            trial.losses[target] = float(loss)
+
+    def _trial_result(self, trial: _Trial) -> TrialResult:
+        """Combine per-target losses into one TrialResult."""
+        diagnostics = {
+            "n_replicates": self.n_replicates,
+            "wall_time_s": round(time.time() - trial.submitted_at, 3),
+        }
+        if trial.errors:
+            diagnostics["errors"] = trial.errors
+            logger.warning(f"Trial {trial.params.param_id[:8]} failed: {trial.errors}")
+            return TrialResult(
+                param_id=trial.params.param_id,
+                loss=float("nan"),
+                status=TrialStatus.FAILED,
+                diagnostics=diagnostics,
+            )
+
+        loss = 0.0
+        for target, target_loss in trial.losses.items():
+            name = target.split("/")[-1]
+            loss += self.target_weights.get(name, 1.0) * target_loss
+            diagnostics[f"loss_{name}"] = target_loss
+        return TrialResult(
+            param_id=trial.params.param_id,
+            loss=loss,
+            status=TrialStatus.COMPLETED,
+            diagnostics=diagnostics,
+        )
+
+    def _track_best(self, result: TrialResult) -> None:
+        if result.status != TrialStatus.COMPLETED:
+            return
+        if self.best is None or result.loss < self.best.loss:
+            self.best = result
+            logger.info(f"New best loss {result.loss:.6g} (param {result.param_id[:8]})")
+
+    def _should_stop(self, result: TrialResult) -> bool:
+        if self.algorithm.finished():
+            logger.info("Algorithm finished")
+            return True
+        if self.max_trials is not None and self.n_told >= self.max_trials:
+            logger.info(f"Trial budget of {self.max_trials} reached")
+            return True
+        if (
+            self.max_loss is not None
+            and result.status == TrialStatus.COMPLETED
+            and result.loss < self.max_loss
+        ):
+            logger.info("Convergence criteria met")
+            return True
+        return False
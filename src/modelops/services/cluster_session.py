@@ -0,0 +1,166 @@
+"""Per-client cluster state shared by every service built on the same client.
+
+DaskSimulationService used to register the worker plugin and query the
+scheduler for worker resources every time it was constructed or asked to
+aggregate. A one-shot job runner pays that once, but a long-lived runner
+(see runners/job_runner.py, service mode) builds a service per job on one
+client, and each registration makes every worker run the plugin's setup
+again.
+
+A ClusterSession remembers, per Client:
+
+- which plugins are registered: the scheduler hands them to workers that join
+  later, so registering again adds nothing
+- the scheduler's worker capabilities (addresses, threads, resources), cached
+  until the scheduler reports a worker joining or leaving on its "all" event
+  topic; callbacks registered with on_change() hear about those changes
+
+The cached info is for capabilities only. Per-worker metrics in it (memory,
+executing counts) are as old as the last change and must not be relied on.
+If the scheduler itself is replaced (refresh() sees a new scheduler id), the
+plugin registrations are forgotten so the next service registers again.
+"""
+
+import logging
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from dask.distributed import Client
+
+logger = logging.getLogger(__name__)
+
+# Scheduler events on the "all" topic that change the set of workers
+WORKER_EVENTS = ("add-worker", "remove-worker")
+# Our own topic, used to learn when the scheduler has our subscriptions
+PROBE_TOPIC = "modelops-session-probe"
+
+_sessions: "weakref.WeakKeyDictionary[Client, ClusterSession]" = weakref.WeakKeyDictionary()
+_sessions_lock = threading.Lock()
+
+
+def session_for(client: Client) -> "ClusterSession":
+    """The ClusterSession of a client, created on first use."""
+    with _sessions_lock:
+        session = _sessions.get(client)
+        if session is None:
+            session = _sessions[client] = ClusterSession(client)
+        return session
+
+
+class ClusterSession:
+    """Plugin registrations and cached scheduler capabilities of one client."""
+
+    def __init__(self, client: Client):
+        self.client = client
+        self.plugins: set[str] = set()
+        self._info: dict[str, Any] | None = None
+        self._generation = 0  # Bumped by every worker change
+        self._scheduler_id: str | None = None
+        self._subscribed = False
+        self._confirmed = False  # The scheduler delivers our events
+        self._listeners: list[Callable[[dict], None]] = []
+        # Never held across a scheduler call: event handlers run on the client's
+        # event loop, which those calls wait for
+        self._lock = threading.Lock()
+        self._plugin_lock = threading.Lock()
+
+    def register_plugin(self, plugin: Any, name: str) -> bool:
+        """Register a plugin with the cluster unless this session already did.
+
+        Returns:
+            True if the plugin was registered now, False if it already was
+        """
+        with self._plugin_lock:
+            if name in self.plugins:
+                return False
+            self.client.register_plugin(plugin, name=name)
+            self.plugins.add(name)
+            return True
+
+    def scheduler_info(self) -> dict[str, Any]:
+        """Scheduler identity with its workers, cached until the workers change."""
+        with self._lock:
+            if self._info is not None:
+                return self._info
+            self._subscribe()
+            confirmed, generation = self._confirmed, self._generation
+        if not confirmed and self._subscribed:
+            self._probe()
+        info = self.client.scheduler_info()
+        with self._lock:
+            self._scheduler_id = info.get("id")
+            # Without change events a cached copy could go stale, and a change
+            # during the call may not be reflected in it
+            if confirmed and generation == self._generation:
+                self._info = info
+        return info
+
+    def has_resource(self, name: str) -> bool:
+        """Whether any worker advertises the named resource (e.g. "aggregation")."""
+        workers = self.scheduler_info().get("workers", {})
+        return any(name in worker.get("resources", {}) for worker in workers.values())
+
+    def on_change(self, callback: Callable[[dict], None]) -> None:
+        """Call callback(event) when a worker joins or leaves the cluster."""
+        with self._lock:
+            self._listeners.append(callback)
+            self._subscribe()
+
+    def refresh(self) -> dict[str, Any]:
+        """Re-read the scheduler info, resetting registrations if the scheduler changed."""
+        with self._lock:
+            self._info = None
+        previous = self._scheduler_id
+        info = self.scheduler_info()
+        if previous is not None and info.get("id") != previous:
+            logger.warning(
+                f"Scheduler changed ({previous} -> {info.get('id')}), "
+                "plugins will be registered again"
+            )
+            with self._plugin_lock:
+                self.plugins.clear()
+            with self._lock:
+                self._subscribed = self._confirmed = False
+            self.scheduler_info()  # Subscribes with the new scheduler
+        return info
+
+    def _subscribe(self) -> None:
+        """Subscribe to the scheduler's worker events (called with the lock held)."""
+        if self._subscribed:
+            return
+        try:
+            # These only queue messages on the client's ordered stream to the
+            # scheduler. Once a probe comes back, both subscriptions are active.
+            # The handler replaces any other "all" handler of the client.
+            self.client.subscribe_topic("all", self._on_event)
+            self.client.subscribe_topic(PROBE_TOPIC, self._on_probe)
+            self._subscribed = True
+        except Exception as e:
+            logger.debug(f"Could not subscribe to scheduler events, info will not be cached: {e}")
+
+    def _probe(self) -> None:
+        try:
+            self.client.log_event(PROBE_TOPIC, {"client": self.client.id})
+        except Exception as e:
+            logger.debug(f"Could not probe the scheduler event subscription: {e}")
+
+    def _on_probe(self, event: tuple[float, Any]) -> None:
+        with self._lock:
+            self._confirmed = True
+
+    def _on_event(self, event: tuple[float, Any]) -> None:
+        _, msg = event
+        if not isinstance(msg, dict) or msg.get("action") not in WORKER_EVENTS:
+            return
+        with self._lock:
+            self._info = None
+            self._generation += 1
+            listeners = list(self._listeners)
+        logger.debug(f"Cluster changed: {msg['action']} {msg.get('worker', '')}")
+        for callback in listeners:
+            try:
+                callback(msg)
+            except Exception as e:
+                logger.warning(f"Cluster change callback failed: {e}")
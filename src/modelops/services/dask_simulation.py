@@ -22,8 +22,14 @@ Without these measures, jobs freeze at 18/20 aggregations with 3998/4000 simulat
 completed - a consistent pattern indicating thread starvation.
 """
 
+import dataclasses
+import hashlib
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import CancelledError
 
+import numpy as np
 from dask.distributed import Client, get_worker, wait
 from dask.distributed import Future as DaskFuture
 from modelops_contracts import SimReturn, SimTask
@@ -34,8 +40,19 @@ from modelops_contracts.simulation import (
     ReplicateSet,
 )
 
+from ..worker.cancellation import dask_task_scope
 from ..worker.config import RuntimeConfig
 from ..worker.plugin import ModelOpsWorkerPlugin
+from .bundle_placement import BundlePlacement
+from .cluster_session import session_for
+from .job_planning import CachedSimRef
+from .speculation import StragglerMonitor
+from .tree_aggregation import (
+    PartialAggregation,
+    reduction_groups,
+    tree_aggregation_id,
+    tree_fan_in_from_env,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +87,86 @@ class TaskKeys:
         # Bundle ref truncation is less risky as it's for display
         return f"sim-{seed}-{bundle_ref[:12]}"
 
+    @staticmethod
+    def content_sim_key(task: SimTask) -> str:
+        """Generate content-addressed simulation key: sim-{hash}
+
+        The key is derived only from what determines the result (bundle digest,
+        entrypoint, param_id, seed), so identical work submitted by different
+        jobs or calibration iterations maps to the same Dask key and is
+        coalesced by the scheduler instead of being run twice.
+        """
+        digest = _content_hash(
+            _bundle_digest(task.bundle_ref),
+            task.entrypoint,
+            task.params.param_id,
+            task.seed,
+        )
+        return f"sim-{digest}"
+
+    @staticmethod
+    def content_agg_key(
+        bundle_ref: str, target_entrypoint: str, sim_keys: list[str], mode: str = "direct"
+    ) -> str:
+        """Generate content-addressed aggregation key: agg-{hash}
+
+        Derived from the bundle digest, the target, how it is aggregated
+        ("direct", or "tree-{fan_in}" for a tree reduction, whose root returns
+        a different result) and the (content-addressed) keys of its inputs, so
+        the same aggregation over the same replicates shares one task.
+        """
+        digest = _content_hash(
+            _bundle_digest(bundle_ref), target_entrypoint, mode, *sorted(sim_keys)
+        )
+        return f"agg-{digest}"
+
+
+def _bundle_digest(bundle_ref: str) -> str:
+    """Extract the digest from a bundle ref (e.g. "repo@sha256:abc..." -> "abc...").
+
+    Mirrors ProvenanceStore._sim_path_context so that keys and storage paths
+    agree on bundle identity.
+    """
+    if ":" in bundle_ref:
+        return bundle_ref.split(":", 1)[1]
+    return bundle_ref
+
+
+def _content_hash(*parts) -> str:
+    """Stable 32-char hex digest over the given key components."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def replicate_tasks(
+    replicate_set: ReplicateSet, seeds: Sequence[int] | np.ndarray | None = None
+) -> list[SimTask]:
+    """Expand a replicate set into one SimTask per replicate.
+
+    Args:
+        replicate_set: Base task and replicate count
+        seeds: Explicit seed per replicate (e.g. from derive_seed_array) instead
+            of the set's consecutive base_task.seed + seed_offset + i
+
+    Returns:
+        Replicate tasks in seed order
+
+    Raises:
+        ValueError: If the number of seeds does not match n_replicates
+    """
+    if seeds is None:
+        return replicate_set.tasks()
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    if len(seeds) != replicate_set.n_replicates:
+        raise ValueError(
+            f"Got {len(seeds)} seeds for a replicate set of {replicate_set.n_replicates}"
+        )
+    base_task = replicate_set.base_task
+    return [dataclasses.replace(base_task, seed=seed) for seed in seeds.tolist()]
+
 
 def _worker_run_task(task: SimTask) -> SimReturn:
     """Execute task on worker using plugin-initialized runtime.
@@ -96,7 +193,9 @@ def _worker_run_task(task: SimTask) -> SimReturn:
         )
 
     start = time.perf_counter()
-    result = worker.modelops_runtime.execute(task)
+    # Stop the subprocess work if Dask cancels this task while it runs
+    with dask_task_scope():
+        result = worker.modelops_runtime.execute(task)
     duration_ms = (time.perf_counter() - start) * 1000
 
     # Diagnostic: sim task timing
@@ -126,7 +225,8 @@ def _worker_run_aggregation(task: AggregationTask) -> AggregationReturn:
 
     # Use the IsolatedWarmExecEnv's run_aggregation method
     # TODO: why go around the modelops_runtime?
-    return worker.modelops_exec_env.run_aggregation(task)
+    with dask_task_scope():
+        return worker.modelops_exec_env.run_aggregation(task)
 
 
 def _inline_bytes(sim_returns):
@@ -146,6 +246,74 @@ def _inline_bytes(sim_returns):
     return total, n_outputs, max_single
 
 
+def _load_cached(sim_returns):
+    """Resolve CachedSimRefs among aggregation inputs, returning (results, n_cached).
+
+    Cached results are loaded here instead of being shipped through the
+    scheduler; the runtime recomputes any that are no longer stored.
+    """
+    n_cached = sum(isinstance(r, CachedSimRef) for r in sim_returns)
+    if n_cached:
+        sim_returns = [
+            _worker_run_task(r.task) if isinstance(r, CachedSimRef) else r for r in sim_returns
+        ]
+    return sim_returns, n_cached
+
+
+def _worker_run_partial_aggregation(
+    *sim_returns, target_ep, bundle_ref, run_id=None, param_id=None
+) -> PartialAggregation:
+    """Evaluate a likelihood target on one group of replicates (tree-reduction leaf).
+
+    Runs wherever Dask places it, which is normally the worker already holding
+    most of the group's replicates.
+    """
+    import time
+
+    worker = get_worker()
+    start = time.perf_counter()
+    sim_returns, n_cached = _load_cached(sim_returns)
+
+    exec_env = getattr(worker, "modelops_exec_env", None)
+    if exec_env is None or not hasattr(exec_env, "run_partial_aggregation"):
+        raise RuntimeError(
+            f"Execution environment {type(exec_env).__name__} does not support tree aggregation"
+        )
+    task = AggregationTask(
+        bundle_ref=bundle_ref, target_entrypoint=target_ep, sim_returns=list(sim_returns)
+    )
+    with dask_task_scope():
+        partial = exec_env.run_partial_aggregation(task)
+
+    total_bytes, _, _ = _inline_bytes(sim_returns)
+    logger.info(
+        f"AGG_TIMING: run_id={run_id or 'N/A'} param_id={(param_id or 'N/A')[:8]} "
+        f"target={target_ep.split('/')[-1]} stage=leaf n_sim_returns={len(sim_returns)} "
+        f"n_cached={n_cached} total_inline_mb={total_bytes / (1024 * 1024):.2f} "
+        f"duration_ms={(time.perf_counter() - start) * 1000:.1f} worker={worker.address}"
+    )
+    return partial
+
+
+def _worker_combine_partials(*partials: PartialAggregation) -> PartialAggregation:
+    """Inner node of a tree-reduced aggregation."""
+    return PartialAggregation.combine(partials)
+
+
+def _worker_finish_tree_aggregation(
+    *partials: PartialAggregation, target_ep, bundle_ref, fan_in
+) -> AggregationReturn:
+    """Root of a tree-reduced aggregation: the loss over all replicates."""
+    total = PartialAggregation.combine(partials)
+    return AggregationReturn(
+        aggregation_id=tree_aggregation_id(bundle_ref, target_ep, total.task_ids),
+        loss=total.loss,
+        diagnostics={"tree_fan_in": fan_in, "log_marginal": total.logsumexp},
+        outputs={},
+        n_replicates=total.n_replicates,
+    )
+
+
 def _worker_run_aggregation_direct(*sim_returns, target_ep, bundle_ref, run_id=None, param_id=None):
     """Aggregate results directly without gather to avoid deadlock.
 
@@ -158,7 +326,8 @@ def _worker_run_aggregation_direct(*sim_returns, target_ep, bundle_ref, run_id=N
     eliminating the deadlock while keeping aggregation on workers (not scheduler).
 
     Args:
-        *sim_returns: Materialized SimReturn objects (Dask passes these)
+        *sim_returns: Materialized SimReturn objects (Dask passes these), or
+            CachedSimRefs for results the runner found in the provenance store
         target_ep: Target entrypoint string
         bundle_ref: Bundle reference
         run_id: Optional run identifier for diagnostic correlation
@@ -178,6 +347,8 @@ def _worker_run_aggregation_direct(*sim_returns, target_ep, bundle_ref, run_id=N
     # Extract target suffix for logging
     target_suffix = target_ep.split('/')[-1] if target_ep else "unknown"
 
+    sim_returns, n_cached = _load_cached(sim_returns)
+
     # Cheap payload size accounting (no cloudpickle, just inline bytes)
     total_bytes, n_outputs, max_single = _inline_bytes(sim_returns)
     total_mb = total_bytes / (1024 * 1024)
@@ -195,7 +366,7 @@ def _worker_run_aggregation_direct(*sim_returns, target_ep, bundle_ref, run_id=N
     # Diagnostic: aggregation timing, payload size, and locality
     logger.info(
         f"AGG_TIMING: run_id={run_id or 'N/A'} param_id={(param_id or 'N/A')[:8]} "
-        f"target={target_suffix} n_sim_returns={len(sim_returns)} "
+        f"target={target_suffix} n_sim_returns={len(sim_returns)} n_cached={n_cached} "
         f"n_outputs={n_outputs} total_inline_mb={total_mb:.2f} "
         f"max_single_kb={max_single/1024:.1f} duration_ms={duration_ms:.1f} "
         f"worker={worker.address}"
@@ -228,13 +399,64 @@ class DaskSimulationService(SimulationService):
 
     This service submits simulation tasks to a Dask cluster and
     manages the WorkerPlugin lifecycle.
+
+    Key modes:
+        By default every submission gets unique keys (random run_id, pure=False),
+        so identical work submitted twice runs twice. With content_addressed_keys
+        enabled, simulation keys are derived from (bundle digest, entrypoint,
+        param_id, seed) and submitted with pure=True semantics: the scheduler
+        coalesces identical in-flight work across clients, and workers that see
+        a task whose result is already stored short-circuit through the
+        provenance cache in the execution environment.
+
+    Placement:
+        With locality_aware enabled, simulation tasks are routed with loose worker
+        restrictions to workers that already hold a warm process for the task's
+        bundle, and a bundle is only spread to more workers when its backlog
+        grows (see BundlePlacement).
+
+    Stragglers:
+        With speculative enabled, simulation tasks that run far longer than
+        their peers get a duplicate on another worker and the first result wins
+        (see StragglerMonitor).
+
+    Tree aggregation:
+        With tree_fan_in k, aggregations over more than k replicates evaluate
+        the target on groups of k replicates near their data and combine the
+        partial summaries k at a time (see tree_aggregation). Only for targets
+        that return per-replicate log-likelihoods.
     """
 
-    def __init__(self, client: Client):
+    # Class-level defaults so instances built without __init__ still work
+    content_addressed_keys: bool = False
+    placement: BundlePlacement | None = None
+    straggler_monitor: StragglerMonitor | None = None
+    tree_fan_in: int = 0
+
+    def __init__(
+        self,
+        client: Client,
+        content_addressed_keys: bool | None = None,
+        locality_aware: bool | None = None,
+        speculative: bool | None = None,
+        tree_fan_in: int | None = None,
+    ):
         """Initialize the service.
 
         Args:
             client: Dask client connected to a cluster
+            content_addressed_keys: Derive task keys from task content so identical
+                work is deduplicated across submissions. Defaults to the
+                MODELOPS_CONTENT_ADDRESSED_KEYS environment variable (off).
+            locality_aware: Route tasks to workers with a warm process for their
+                bundle. Defaults to the MODELOPS_LOCALITY_AWARE_PLACEMENT
+                environment variable (off).
+            speculative: Launch duplicates of straggling simulation tasks.
+                Defaults to the MODELOPS_SPECULATIVE_EXECUTION environment
+                variable (off).
+            tree_fan_in: Tree-reduce aggregations in groups of this many
+                replicates. Defaults to the MODELOPS_AGG_TREE_FANIN environment
+                variable (0, off).
 
         Note:
             Workers create their own RuntimeConfig from environment variables.
@@ -243,6 +465,34 @@ class DaskSimulationService(SimulationService):
         self.client = client
         self._plugin_installed = False
 
+        if content_addressed_keys is None:
+            content_addressed_keys = (
+                os.environ.get("MODELOPS_CONTENT_ADDRESSED_KEYS", "false").lower() == "true"
+            )
+        self.content_addressed_keys = content_addressed_keys
+        if self.content_addressed_keys:
+            logger.info("Using content-addressed task keys (in-flight deduplication enabled)")
+
+        if locality_aware is None:
+            locality_aware = (
+                os.environ.get("MODELOPS_LOCALITY_AWARE_PLACEMENT", "false").lower() == "true"
+            )
+        if locality_aware:
+            self.placement = BundlePlacement(client)
+            logger.info("Using locality-aware bundle placement")
+
+        if speculative is None:
+            speculative = (
+                os.environ.get("MODELOPS_SPECULATIVE_EXECUTION", "false").lower() == "true"
+            )
+        if speculative:
+            self.straggler_monitor = StragglerMonitor(client)
+            logger.info("Using speculative re-execution of straggling tasks")
+
+        self.tree_fan_in = tree_fan_in_from_env() if tree_fan_in is None else tree_fan_in
+        if self.tree_fan_in:
+            logger.info(f"Tree-reducing aggregations with fan-in {self.tree_fan_in}")
+
         # Install the worker plugin
         self._install_plugin()
 
@@ -251,18 +501,39 @@ class DaskSimulationService(SimulationService):
         if self._plugin_installed:
             return
 
-        logger.info("Installing ModelOps worker plugin on all workers")
-
         # Create the plugin (workers will read their own environment)
         plugin = ModelOpsWorkerPlugin()
 
-        # Register it with the cluster
-        # Use the current API - register_plugin() handles all plugin types
-        # register_worker_plugin() is deprecated since 2023.9.2
-        self.client.register_plugin(plugin, name="modelops-runtime-v1")
+        # Register it with the cluster, once per client: a long-lived runner builds a
+        # service per job, and each registration reruns setup on every worker.
+        # register_plugin() handles all plugin types (register_worker_plugin() is
+        # deprecated since 2023.9.2)
+        if session_for(self.client).register_plugin(plugin, name="modelops-runtime-v1"):
+            logger.info("Worker plugin installed successfully")
+        else:
+            logger.debug("Worker plugin already installed by this client")
 
         self._plugin_installed = True
-        logger.info("Worker plugin installed successfully")
+
+    def _placement_kwargs(self, bundle_ref: str, n_tasks: int) -> dict:
+        """Worker restrictions for tasks of one bundle, if placement is enabled."""
+        if self.placement is None:
+            return {}
+        workers = self.placement.workers_for(bundle_ref, n_tasks)
+        if not workers:
+            return {}
+        # Loose restrictions: a preference, never a reason for a task to stall
+        return {"workers": workers, "allow_other_workers": True}
+
+    def _track_placement(self, bundle_ref: str, dask_futures: list[DaskFuture]) -> None:
+        """Record submitted futures for backlog accounting."""
+        if self.placement is not None:
+            self.placement.track(bundle_ref, dask_futures)
+
+    def _watch(self, adapters: list[DaskFutureAdapter], tasks: list[SimTask]) -> None:
+        """Hand simulation futures to the straggler monitor, if enabled."""
+        if self.straggler_monitor is not None:
+            self.straggler_monitor.track(adapters, tasks)
 
     def submit(self, task: SimTask) -> Future[SimReturn]:
         """Submit a simulation task to the cluster.
@@ -273,15 +544,24 @@ class DaskSimulationService(SimulationService):
         Returns:
             Future for the result
         """
+        if self.content_addressed_keys:
+            key = TaskKeys.content_sim_key(task)
+        else:
+            key = TaskKeys.single_sim_key(task.seed, task.bundle_ref)  # For debugging
+
         # Submit to Dask - the task will be executed by the worker plugin
         dask_future = self.client.submit(
             _worker_run_task,
             task,
-            pure=False,  # Tasks have unique IDs
-            key=TaskKeys.single_sim_key(task.seed, task.bundle_ref),  # For debugging
+            pure=self.content_addressed_keys,  # Unique tasks unless content-addressed
+            key=key,
+            **self._placement_kwargs(task.bundle_ref, 1),
         )
+        self._track_placement(task.bundle_ref, [dask_future])
 
-        return DaskFutureAdapter(dask_future)
+        adapter = DaskFutureAdapter(dask_future)
+        self._watch([adapter], [task])
+        return adapter
 
     def gather(self, futures: list[Future[SimReturn]]) -> list[SimReturn | Exception]:
         """Gather results from submitted tasks.
@@ -297,11 +577,13 @@ class DaskSimulationService(SimulationService):
             List of results in same order as input futures.
             Failed futures return Exception objects as values.
         """
-        dask_futures = [f.wrapped for f in futures]
-
         # Wait for ALL futures to complete (parallel wait)
         # This is critical for performance - don't call .result() sequentially!
-        wait(dask_futures)
+        if self.straggler_monitor is None:
+            wait([f.wrapped for f in futures])
+        else:
+            self._wait_speculative(futures)
+        dask_futures = [f.wrapped for f in futures]
 
         # All futures are now done - collect results (non-blocking)
         results: list[SimReturn | Exception] = []
@@ -315,6 +597,28 @@ class DaskSimulationService(SimulationService):
                     results.append(e)
         return results
 
+    def _wait_speculative(self, futures: list[DaskFutureAdapter]) -> None:
+        """Wait for futures whose adapters the straggler monitor may redirect.
+
+        A future that lost a speculative race is cancelled and its adapter
+        pointed at the winner, so wait on whatever each adapter currently wraps
+        until all of them have completed without being cancelled.
+        """
+        interval = self.straggler_monitor.policy.poll_interval
+        while True:
+            current = [f.wrapped for f in futures]
+            try:
+                wait(current, timeout=interval)
+            except TimeoutError:
+                continue
+            except CancelledError:
+                # A loser was cancelled; its adapter has already been redirected
+                pass
+            # Redirection happens before the loser is cancelled, so unchanged
+            # adapters mean every result is final
+            if all(f.wrapped is c for f, c in zip(futures, current, strict=True)):
+                return
+
     def submit_batch(self, tasks: list[SimTask]) -> list[Future[SimReturn]]:
         """Submit multiple tasks efficiently.
 
@@ -324,14 +628,30 @@ class DaskSimulationService(SimulationService):
         Returns:
             List of futures, one per task
         """
+        if self.content_addressed_keys:
+            keys = [TaskKeys.content_sim_key(t) for t in tasks]
+        else:
+            keys = [TaskKeys.single_sim_key(t.seed, t.bundle_ref) for t in tasks]
+
+        # Placement applies to a whole map call, so only route single-bundle batches
+        bundle_refs = {t.bundle_ref for t in tasks}
+        placement_kwargs = {}
+        if len(bundle_refs) == 1:
+            placement_kwargs = self._placement_kwargs(next(iter(bundle_refs)), len(tasks))
+
         dask_futures = self.client.map(
             _worker_run_task,
             tasks,
-            pure=False,
-            key=[TaskKeys.single_sim_key(t.seed, t.bundle_ref) for t in tasks],
+            pure=self.content_addressed_keys,
+            key=keys,
+            **placement_kwargs,
         )
+        if len(bundle_refs) == 1:
+            self._track_placement(next(iter(bundle_refs)), dask_futures)
 
-        return [DaskFutureAdapter(f) for f in dask_futures]
+        adapters = [DaskFutureAdapter(f) for f in dask_futures]
+        self._watch(adapters, tasks)
+        return adapters
 
     def submit_replicate_set(
         self, replicate_set: ReplicateSet, target_entrypoint: str | None = None
@@ -383,13 +703,8 @@ class DaskSimulationService(SimulationService):
             # This prevents deadlock in tests/local clusters without resources
             submit_kwargs = {"pure": False}
             try:
-                # Check scheduler info for worker resources
-                info = self.client.scheduler_info()
-                has_aggregation_resource = any(
-                    "aggregation" in worker.get("resources", {})
-                    for worker in info.get("workers", {}).values()
-                )
-                if has_aggregation_resource:
+                # Check worker resources (cached until workers join or leave)
+                if session_for(self.client).has_resource("aggregation"):
                     submit_kwargs["resources"] = {"aggregation": 1}
                     logger.debug("Using aggregation resource constraint")
             except Exception:
@@ -420,7 +735,10 @@ class DaskSimulationService(SimulationService):
             return DaskFutureAdapter(results_future)
 
     def submit_replicates(
-        self, replicate_set: ReplicateSet, run_id: str | None = None
+        self,
+        replicate_set: ReplicateSet,
+        run_id: str | None = None,
+        seeds: Sequence[int] | np.ndarray | None = None,
     ) -> list[Future[SimReturn]]:
         """Submit replicates without aggregation, returning individual simulation futures.
 
@@ -433,30 +751,42 @@ class DaskSimulationService(SimulationService):
         Args:
             replicate_set: Set of replicates to run
             run_id: Unique identifier for this submission to prevent key collisions.
-                    If not provided, one will be generated.
+                    If not provided, one will be generated. Ignored when
+                    content-addressed keys are enabled.
+            seeds: Explicit per-replicate seeds (a compact vector, e.g. a uint64
+                   array) replacing the set's consecutive seeds
 
         Returns:
             List of futures, one per replicate
         """
         import uuid
 
-        if run_id is None:
-            run_id = uuid.uuid4().hex[:10]
+        tasks = replicate_tasks(replicate_set, seeds)
 
-        tasks = replicate_set.tasks()
-        param_id = replicate_set.base_task.params.param_id
-        # Include run_id in keys to prevent collisions across concurrent submissions
-        keys = [f"sim-{run_id}-{param_id}-{i}" for i in range(replicate_set.n_replicates)]
+        if self.content_addressed_keys:
+            # Same (bundle, entrypoint, param_id, seed) -> same key, shared across jobs
+            keys = [TaskKeys.content_sim_key(t) for t in tasks]
+        else:
+            if run_id is None:
+                run_id = uuid.uuid4().hex[:10]
+            param_id = replicate_set.base_task.params.param_id
+            # Include run_id in keys to prevent collisions across concurrent submissions
+            keys = [f"sim-{run_id}-{param_id}-{i}" for i in range(replicate_set.n_replicates)]
 
         # Submit all replicates as individual tasks
+        bundle_ref = replicate_set.base_task.bundle_ref
         replicate_futures = self.client.map(
             _worker_run_task,
             tasks,
-            pure=False,
+            pure=self.content_addressed_keys,
             key=keys,
+            **self._placement_kwargs(bundle_ref, len(tasks)),
         )
+        self._track_placement(bundle_ref, replicate_futures)
 
-        return [DaskFutureAdapter(f) for f in replicate_futures]
+        adapters = [DaskFutureAdapter(f) for f in replicate_futures]
+        self._watch(adapters, tasks)
+        return adapters
 
     def submit_aggregation(
         self,
@@ -473,7 +803,9 @@ class DaskSimulationService(SimulationService):
         simulation results across workers efficiently and avoid inline serialization limits.
 
         Args:
-            sim_futures: List of simulation result futures to aggregate
+            sim_futures: List of simulation result futures to aggregate. Items
+                may also be CachedSimRefs (see job_planning), which the
+                aggregating worker loads from the provenance store.
             target_entrypoint: Target entrypoint to evaluate
             bundle_ref: Bundle reference for the aggregation task
             param_id: Parameter set ID for task naming
@@ -488,8 +820,9 @@ class DaskSimulationService(SimulationService):
         if run_id is None:
             run_id = uuid.uuid4().hex[:10]
 
-        # Unwrap DaskFutureAdapter to get raw Dask futures
-        dask_futures = [f.wrapped for f in sim_futures]
+        # Unwrap DaskFutureAdapter to get raw Dask futures; cached refs are
+        # passed through as plain arguments
+        dask_futures = [f if isinstance(f, CachedSimRef) else f.wrapped for f in sim_futures]
 
         # Pass futures directly as dependencies - Dask will materialize them
         # before calling _worker_run_aggregation_direct. No need to scatter
@@ -500,26 +833,92 @@ class DaskSimulationService(SimulationService):
         # BEFORE calling the aggregation function, so deadlock risk is eliminated.
         # Omitting the constraint lets Dask's scheduler pick workers with better locality
         # (workers that already hold the simulation data), avoiding costly data transfers.
-        submit_kwargs = {"pure": False}
-
-        # Include run_id in key to prevent collisions across concurrent submissions
-        target_suffix = target_entrypoint.split('/')[-1]
-        agg_key = f"agg-{run_id}-{param_id}-{target_suffix}"
-
-        # Submit aggregation with futures as dependencies
-        # Dask will materialize them before calling the function
-        agg_future = self.client.submit(
-            _worker_run_aggregation_direct,
-            *dask_futures,
-            target_ep=target_entrypoint,
-            bundle_ref=bundle_ref,
-            run_id=run_id,
-            param_id=param_id,
-            key=agg_key,
-            **submit_kwargs,
-        )
+        submit_kwargs = {"pure": self.content_addressed_keys}
+        tree = self.tree_fan_in and len(dask_futures) > self.tree_fan_in
+
+        if self.content_addressed_keys:
+            # Inputs are content-addressed, so the aggregation can be too. A
+            # cached ref counts under the key its simulation would have had.
+            sim_keys = [
+                TaskKeys.content_sim_key(f.task) if isinstance(f, CachedSimRef) else f.key
+                for f in dask_futures
+            ]
+            mode = f"tree-{self.tree_fan_in}" if tree else "direct"
+            agg_key = TaskKeys.content_agg_key(bundle_ref, target_entrypoint, sim_keys, mode)
+        else:
+            # Include run_id in key to prevent collisions across concurrent submissions
+            target_suffix = target_entrypoint.split('/')[-1]
+            agg_key = f"agg-{run_id}-{param_id}-{target_suffix}"
+
+        def submit(inputs: list, key: str, pure: bool) -> DaskFuture:
+            agg_kwargs = {
+                "target_ep": target_entrypoint,
+                "bundle_ref": bundle_ref,
+                "run_id": run_id,
+                "param_id": param_id,
+            }
+            if self.tree_fan_in and len(inputs) > self.tree_fan_in:
+                return self._submit_tree_aggregation(inputs, key, pure, agg_kwargs)
+            # Submit aggregation with futures as dependencies
+            # Dask will materialize them before calling the function
+            return self.client.submit(
+                _worker_run_aggregation_direct, *inputs, key=key, pure=pure, **agg_kwargs
+            )
+
+        agg_future = submit(dask_futures, agg_key, **submit_kwargs)
+        adapter = DaskFutureAdapter(agg_future)
+
+        if self.straggler_monitor is not None:
+            # If a speculative duplicate replaces an input, rerun on the winners
+            sim_adapters = [f for f in sim_futures if not isinstance(f, CachedSimRef)]
+
+            def resubmit(inputs: list[DaskFuture]) -> DaskFuture:
+                # Put the current futures back between the cached refs
+                current = iter(inputs)
+                merged = [f if isinstance(f, CachedSimRef) else next(current) for f in sim_futures]
+                return submit(merged, f"{agg_key}-spec-{uuid.uuid4().hex[:6]}", pure=False)
+
+            self.straggler_monitor.track_dependent(adapter, sim_adapters, resubmit)
 
-        return DaskFutureAdapter(agg_future)
+        return adapter
+
+    def _submit_tree_aggregation(
+        self, inputs: list, key: str, pure: bool, agg_kwargs: dict
+    ) -> DaskFuture:
+        """Submit leaves over groups of tree_fan_in inputs, inner nodes, and the root.
+
+        Groups are consecutive inputs; Dask runs each leaf on the worker that
+        holds most of its group's bytes, so only the partial summaries move.
+        """
+        fan_in = self.tree_fan_in
+        level = [
+            self.client.submit(
+                _worker_run_partial_aggregation,
+                *group,
+                key=f"{key}-leaf-{i}",
+                pure=pure,
+                **agg_kwargs,
+            )
+            for i, group in enumerate(reduction_groups(inputs, fan_in))
+        ]
+        depth = 0
+        while len(level) > fan_in:
+            depth += 1
+            level = [
+                self.client.submit(
+                    _worker_combine_partials, *group, key=f"{key}-l{depth}-{i}", pure=pure
+                )
+                for i, group in enumerate(reduction_groups(level, fan_in))
+            ]
+        return self.client.submit(
+            _worker_finish_tree_aggregation,
+            *level,
+            target_ep=agg_kwargs["target_ep"],
+            bundle_ref=agg_kwargs["bundle_ref"],
+            fan_in=fan_in,
+            key=key,
+            pure=pure,
+        )
 
     def submit_batch_with_aggregation(
         self, replicate_sets: list[ReplicateSet], target_entrypoint: str
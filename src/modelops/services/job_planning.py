@@ -0,0 +1,163 @@
+"""Cache-aware planning of simulation jobs.
+
+Workers already short-circuit tasks whose results are in the provenance
+store, but only after the task has been scheduled, shipped and queued. For
+sweeps that repeat earlier work (resumes, grown parameter grids, re-run
+targets), the runner now looks up every (bundle, param_id, seed) in one
+batched probe before submitting anything, and submits only the misses.
+
+Cached results are not loaded by the runner up front: aggregations receive
+a CachedSimRef in the hit's place, and the worker running the aggregation
+loads it through its execution environment (which recomputes the
+simulation if the stored result has gone missing in the meantime). The
+runner itself reads cached results back only once the job's work is done,
+for the result index and job views (see JobPlan.results).
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from modelops_contracts import SimReturn, SimTask
+
+from .provenance_store import ProvenanceStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedSimRef:
+    """Stand-in for a simulation result found in the provenance store."""
+
+    task: SimTask
+    size_bytes: int  # Stored artifact bytes
+
+
+@dataclass
+class PlanSummary:
+    """What planning found for a job."""
+
+    tasks: int
+    hits: int
+    misses: int
+    cached_bytes: int
+    seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits}/{self.tasks} simulations cached "
+            f"({self.cached_bytes / (1024 * 1024):.1f} MB), {self.misses} to run, "
+            f"planned in {self.seconds:.2f}s"
+        )
+
+
+@dataclass
+class JobPlan:
+    """Per-parameter-set split of a job's tasks into cache hits and misses."""
+
+    task_groups: dict[str, list[SimTask]]
+    # param_id -> CachedSimRef or None (miss), aligned with task_groups[param_id]
+    cached: dict[str, list[CachedSimRef | None]]
+    summary: PlanSummary
+
+    def misses(self, param_id: str) -> list[SimTask]:
+        """Tasks of a parameter set that still have to run, in task order."""
+        return [
+            task
+            for task, ref in zip(self.task_groups[param_id], self.cached[param_id], strict=True)
+            if ref is None
+        ]
+
+    def hits(self, param_id: str) -> list[CachedSimRef]:
+        """Cached results of a parameter set, in task order."""
+        return [ref for ref in self.cached[param_id] if ref is not None]
+
+    def inputs(self, param_id: str, miss_futures: list[Any]) -> list[Any]:
+        """Merge submitted futures and cached refs back into task order.
+
+        Args:
+            param_id: Parameter set
+            miss_futures: Futures for misses(param_id), in the same order
+
+        Returns:
+            One future or CachedSimRef per task of the parameter set
+        """
+        pending = iter(miss_futures)
+        return [ref if ref is not None else next(pending) for ref in self.cached[param_id]]
+
+    def results(
+        self, param_id: str, miss_results: list[Any], prov_store: ProvenanceStore
+    ) -> list[SimReturn | Exception]:
+        """Merge gathered results with cached ones loaded from the store, in task order.
+
+        Args:
+            param_id: Parameter set
+            miss_results: Gathered results (or exceptions) for misses(param_id)
+            prov_store: Store the plan was made against
+
+        Returns:
+            One SimReturn per task; a cached result that can no longer be
+            loaded is an exception value, like a failed simulation
+        """
+        pending = iter(miss_results)
+        merged: list[SimReturn | Exception] = []
+        for ref in self.cached[param_id]:
+            if ref is None:
+                merged.append(next(pending))
+                continue
+            result = prov_store.get_sim(ref.task)
+            if result is None:
+                result = LookupError(
+                    f"Cached result for param {param_id[:8]} seed {ref.task.seed} "
+                    "is no longer in the provenance store"
+                )
+            merged.append(result)
+        return merged
+
+
+def plan_job(
+    task_groups: dict[str, list[SimTask]], prov_store: ProvenanceStore | None
+) -> JobPlan:
+    """Look up every task of a job in the provenance store.
+
+    Args:
+        task_groups: param_id -> replicate tasks, as from SimJob.get_task_groups()
+        prov_store: Store to probe; None plans every task as a miss
+
+    Returns:
+        JobPlan with a summary of hits and misses
+    """
+    start = time.perf_counter()
+    all_tasks = [task for tasks in task_groups.values() for task in tasks]
+
+    sizes: list[int | None] = [None] * len(all_tasks)
+    if prov_store is not None and all_tasks:
+        try:
+            sizes = prov_store.probe_sims(all_tasks)
+        except Exception as e:
+            # Planning is an optimization: fall back to running everything
+            logger.warning(f"Cache lookup failed, submitting all tasks: {e}")
+
+    cached: dict[str, list[CachedSimRef | None]] = {}
+    position = 0
+    for param_id, tasks in task_groups.items():
+        group_sizes = sizes[position : position + len(tasks)]
+        position += len(tasks)
+        cached[param_id] = [
+            None if size is None else CachedSimRef(task=task, size_bytes=size)
+            for task, size in zip(tasks, group_sizes, strict=True)
+        ]
+
+    hits = sum(size is not None for size in sizes)
+    summary = PlanSummary(
+        tasks=len(all_tasks),
+        hits=hits,
+        misses=len(all_tasks) - hits,
+        cached_bytes=sum(size for size in sizes if size is not None),
+        seconds=round(time.perf_counter() - start, 3),
+    )
+    return JobPlan(task_groups=task_groups, cached=cached, summary=summary)
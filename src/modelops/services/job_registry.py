@@ -28,12 +28,21 @@ from .output_manifest import (
 )
 from .provenance_schema import ProvenanceSchema
 from .provenance_store import ProvenanceStore
+from .result_index import JobResultIndex
 from .storage.retry import create_with_retry, get_json, update_with_retry
 from .storage.versioned import VersionedStore
 
 logger = logging.getLogger(__name__)
 
 
+class _LeaseLostError(Exception):
+    """The job is no longer running under the lease being renewed or expired."""
+
+
+def _lease_expiry(lease_seconds: float) -> str:
+    return (datetime.now(UTC) + timedelta(seconds=lease_seconds)).isoformat()
+
+
 @dataclass
 class ValidationResult:
     """Result of output validation for a job.
@@ -206,6 +215,9 @@ class JobRegistry:
         job_id: str,
         tasks_completed: int | None = None,
         tasks_total: int | None = None,
+        completed_delta: int | None = None,
+        tasks_per_second: float | None = None,
+        eta_seconds: float | None = None,
     ) -> JobState:
         """Update job progress counters.
 
@@ -216,6 +228,10 @@ class JobRegistry:
             job_id: Job identifier
             tasks_completed: Number of completed tasks
             tasks_total: Total number of tasks
+            completed_delta: Tasks completed since the last update, added to the
+                stored count (used by ProgressReporter to coalesce updates)
+            tasks_per_second: Recent throughput
+            eta_seconds: Estimated seconds until all tasks are complete
 
         Returns:
             Updated JobState
@@ -225,18 +241,51 @@ class JobRegistry:
         def update_fn(state_dict: dict) -> dict:
             if tasks_completed is not None:
                 state_dict["tasks_completed"] = tasks_completed
+            if completed_delta:
+                current = state_dict.get("tasks_completed", 0)
+                state_dict["tasks_completed"] = current + completed_delta
             if tasks_total is not None:
                 state_dict["tasks_total"] = tasks_total
+            if tasks_per_second is not None:
+                state_dict["tasks_per_second"] = tasks_per_second
+                state_dict["eta_seconds"] = eta_seconds
             state_dict["updated_at"] = now_iso()
             return state_dict
 
         updated = update_with_retry(self.store, key, update_fn, max_attempts=3)
 
-        if tasks_completed is not None:
-            logger.debug(f"Updated job {job_id} progress: {tasks_completed}/{tasks_total or '?'}")
+        if tasks_completed is not None or completed_delta:
+            logger.debug(
+                f"Updated job {job_id} progress: "
+                f"{updated.get('tasks_completed')}/{updated.get('tasks_total') or '?'}"
+            )
 
         return JobState.from_dict(updated)
 
+    def record_plan(self, job_id: str, plan: dict[str, Any]) -> JobState:
+        """Record the job's cache plan (hits, misses, bytes) in its metadata.
+
+        Like update_progress, this does not validate state transitions.
+
+        Args:
+            job_id: Job identifier
+            plan: Plan summary, e.g. PlanSummary.to_dict()
+
+        Returns:
+            Updated JobState
+        """
+        key = self._make_key(job_id)
+
+        def update_fn(state_dict: dict) -> dict:
+            metadata = state_dict.get("metadata") or {}
+            metadata["plan"] = plan
+            state_dict["metadata"] = metadata
+            state_dict["updated_at"] = now_iso()
+            return state_dict
+
+        updated = update_with_retry(self.store, key, update_fn, max_attempts=3)
+        return JobState.from_dict(updated)
+
     def get_job(self, job_id: str) -> JobState | None:
         """Get current job state.
 
@@ -347,6 +396,10 @@ class JobRegistry:
     def cancel_job(self, job_id: str, reason: str | None = None) -> JobState:
         """Cancel a job.
 
+        A queued job is then never claimed. A running job's runner sees the
+        status through its ProgressReporter and cancels the job's outstanding
+        futures (`mops jobs cancel`).
+
         Args:
             job_id: Job identifier
             reason: Optional cancellation reason
@@ -360,6 +413,162 @@ class JobRegistry:
 
         return self.update_status(job_id, JobStatus.CANCELLED, **kwargs)
 
+    # Queue for the runner service (job_runner.serve): one small marker per
+    # scheduled job, so polling lists a handful of keys rather than every job.
+
+    def _queue_key(self, job_id: str) -> str:
+        return f"{self.prefix}/_queue/{job_id}.json"
+
+    def enqueue_job(self, job_id: str) -> None:
+        """Queue a scheduled job for the runner service.
+
+        Args:
+            job_id: Job identifier (the job must be registered)
+        """
+        entry = {"job_id": job_id, "queued_at": now_iso()}
+        create_with_retry(self.store, self._queue_key(job_id), entry)
+        logger.info(f"Queued job {job_id} for the runner service")
+
+    def queued_jobs(self) -> list[str]:
+        """IDs of queued jobs, oldest first."""
+        queued = []
+        for key in self.store.list_keys(f"{self.prefix}/_queue/"):
+            entry = get_json(self.store, key)
+            if entry is not None:
+                queued.append((entry.get("queued_at", ""), entry["job_id"]))
+        return [job_id for _, job_id in sorted(queued)]
+
+    def claim_job(
+        self, job_id: str, runner_id: str, lease_seconds: float | None = None
+    ) -> JobState | None:
+        """Move a queued job to RUNNING for one runner and take it off the queue.
+
+        The status update is a compare-and-swap, so when several runners race
+        for the same job exactly one of them gets it.
+
+        Args:
+            job_id: Queued job identifier
+            runner_id: Identifies the claiming runner (recorded in metadata)
+            lease_seconds: Length of the claim lease. The runner must renew it
+                (renew_lease) before it runs out, or reclaim_stale_jobs will
+                requeue the job. None claims without a lease.
+
+        Returns:
+            The running JobState, or None if the job was claimed by another
+            runner, cancelled or deleted in the meantime
+        """
+        metadata = {"runner_id": runner_id}
+        if lease_seconds is not None:
+            metadata["lease_expires_at"] = _lease_expiry(lease_seconds)
+        try:
+            state = self.update_status(job_id, JobStatus.RUNNING, metadata=metadata)
+        except (KeyError, InvalidTransitionError, TerminalStateError) as e:
+            logger.debug(f"Not claiming job {job_id}: {e}")
+            state = None
+        try:
+            self.store.delete(self._queue_key(job_id))
+        except Exception as e:
+            # A leftover marker is harmless: the next claim of it returns None
+            logger.warning(f"Failed to remove queue entry of job {job_id}: {e}")
+        return state
+
+    def renew_lease(self, job_id: str, runner_id: str, lease_seconds: float) -> bool:
+        """Extend the claim lease of a running job (the runner's heartbeat).
+
+        Args:
+            job_id: Job identifier
+            runner_id: Runner that claimed the job
+            lease_seconds: New lease length, from now
+
+        Returns:
+            False if the job no longer runs under this runner: it finished, was
+            cancelled, or its lease ran out and it was requeued
+        """
+
+        def update_fn(state_dict: dict) -> dict:
+            metadata = state_dict.get("metadata") or {}
+            if (
+                state_dict.get("status") != JobStatus.RUNNING.value
+                or metadata.get("runner_id") != runner_id
+            ):
+                raise _LeaseLostError(job_id)
+            metadata["lease_expires_at"] = _lease_expiry(lease_seconds)
+            state_dict["metadata"] = metadata
+            return state_dict
+
+        try:
+            update_with_retry(self.store, self._make_key(job_id), update_fn, max_attempts=3)
+        except (KeyError, _LeaseLostError):
+            return False
+        return True
+
+    def reclaim_stale_jobs(self, max_reclaims: int = 3) -> list[str]:
+        """Requeue running jobs whose runner stopped renewing its claim lease.
+
+        A runner that dies mid-job (evicted pod, lost node) leaves its job
+        RUNNING. Once the lease has run out, the job goes back to SCHEDULED and
+        onto the queue; after max_reclaims requeues it is FAILED instead. Jobs
+        claimed without a lease are left alone.
+
+        Args:
+            max_reclaims: Requeues allowed before the job is failed
+
+        Returns:
+            IDs of the jobs requeued or failed
+        """
+        now = datetime.now(UTC)
+        reclaimed = []
+        for state in self.list_jobs(limit=10000, status_filter=[JobStatus.RUNNING]):
+            expires_at = (state.metadata or {}).get("lease_expires_at")
+            if expires_at is None or datetime.fromisoformat(expires_at) > now:
+                continue
+            try:
+                requeued = self._expire_lease(state.job_id, expires_at, max_reclaims)
+            except (KeyError, _LeaseLostError):
+                continue  # Renewed, finished or reclaimed by another runner meanwhile
+            if requeued:
+                self.enqueue_job(state.job_id)
+                logger.warning(f"Requeued job {state.job_id}: its runner's lease ran out")
+            else:
+                logger.error(f"Failed job {state.job_id}: its runner was lost too many times")
+            reclaimed.append(state.job_id)
+        return reclaimed
+
+    def _expire_lease(self, job_id: str, expires_at: str, max_reclaims: int) -> bool:
+        """Move a job whose lease ran out back to SCHEDULED, or to FAILED.
+
+        RUNNING -> SCHEDULED is not a transition update_status allows; an
+        expired lease is the one way back, so this is its own compare-and-swap.
+
+        Returns:
+            True if the job was moved back to SCHEDULED
+        """
+
+        def update_fn(state_dict: dict) -> dict:
+            metadata = state_dict.get("metadata") or {}
+            if (
+                state_dict.get("status") != JobStatus.RUNNING.value
+                or metadata.get("lease_expires_at") != expires_at
+            ):
+                raise _LeaseLostError(job_id)
+            runner_id = metadata.pop("runner_id", None)
+            del metadata["lease_expires_at"]
+            metadata["reclaims"] = metadata.get("reclaims", 0) + 1
+            state_dict["metadata"] = metadata
+            state_dict["updated_at"] = now_iso()
+            if metadata["reclaims"] > max_reclaims:
+                state_dict["status"] = JobStatus.FAILED.value
+                state_dict["error_message"] = (
+                    f"Runner lost {metadata['reclaims']} times (last: {runner_id})"
+                )
+                state_dict["error_code"] = "RunnerLost"
+            else:
+                state_dict["status"] = JobStatus.SCHEDULED.value
+            return state_dict
+
+        updated = update_with_retry(self.store, self._make_key(job_id), update_fn)
+        return updated["status"] == JobStatus.SCHEDULED.value
+
     def count_jobs_by_status(self) -> dict[JobStatus, int]:
         """Get count of jobs grouped by status.
 
@@ -425,16 +634,18 @@ class JobRegistry:
             logger.info(f"Job {job_id} has no expected outputs, skipping validation")
             return ValidationResult(status="unavailable", error="No expected outputs defined")
 
-        # Check each expected output
+        # The job's result index (one read) spares a probe per result it lists
+        indexed = self._indexed_outputs(job_id)
+        if indexed is not None:
+            logger.info(f"Validating job {job_id} against its result index")
+
         verified_outputs = []
         missing_outputs = []
 
         for output_dict in job_state.expected_outputs:
             try:
                 output_spec = OutputSpec(**output_dict)
-                path = self.provenance.storage_dir / output_spec.provenance_path
-
-                if path.exists():
+                if self._output_exists(output_spec, indexed):
                     verified_outputs.append(output_spec.provenance_path)
                 else:
                     missing_outputs.append(output_spec.provenance_path)
@@ -459,6 +670,50 @@ class JobRegistry:
             missing_outputs=missing_outputs,
         )
 
+    def _indexed_outputs(self, job_id: str) -> tuple[set[str], set[tuple]] | None:
+        """Load successful results from the job's result index.
+
+        Returns:
+            (provenance paths, (param_id, seed) sim keys), or None if the job
+            has no index
+        """
+        if not self.provenance:
+            return None
+        try:
+            entries = JobResultIndex(self.provenance, job_id).read()
+        except Exception as e:
+            logger.warning(f"Could not read result index for job {job_id}: {e}")
+            return None
+        if not entries:
+            return None
+
+        ok = [e for e in entries if e.status == "ok"]
+        paths = {e.provenance_path for e in ok}
+        sim_keys = {(e.param_id, e.seed) for e in ok if e.kind == "sim"}
+        return paths, sim_keys
+
+    def _output_exists(
+        self, spec: OutputSpec, indexed: tuple[set[str], set[tuple]] | None
+    ) -> bool:
+        """Check an expected output, probing storage unless the index lists it.
+
+        The index only proves presence: a runner that died before recording a
+        result, or a resume run that recorded it under its own job id, leaves
+        results in storage that the index does not know about.
+        """
+        if indexed is not None and self._spec_in_index(spec, *indexed):
+            return True
+        return (self.provenance.storage_dir / spec.provenance_path).exists()
+
+    @staticmethod
+    def _spec_in_index(spec: OutputSpec, paths: set[str], sim_keys: set[tuple]) -> bool:
+        """Check an expected output against indexed results."""
+        if spec.provenance_path in paths:
+            return True
+        # Manifest paths may be rendered without the schema root; sims are
+        # uniquely identified by (param_id, seed) within a job
+        return spec.output_type == "simulation" and (spec.param_id, spec.seed) in sim_keys
+
     def transition_to_validating(self, job_id: str) -> JobState:
         """Transition job to VALIDATING state when K8s completes.
 
@@ -552,8 +807,22 @@ class JobRegistry:
 
         resumable_tasks = []
 
+        # Results may have landed since validation (e.g. from an earlier resume)
+        missing_outputs = job_state.missing_outputs
+        if self.provenance:
+            indexed = self._indexed_outputs(job_id)
+            candidates = set(missing_outputs)
+            still_missing = []
+            for output_dict in job_state.expected_outputs:
+                output_spec = OutputSpec(**output_dict)
+                if output_spec.provenance_path not in candidates:
+                    continue
+                if not self._output_exists(output_spec, indexed):
+                    still_missing.append(output_spec.provenance_path)
+            missing_outputs = still_missing
+
         # Parse missing outputs to reconstruct tasks
-        for output_path in job_state.missing_outputs:
+        for output_path in missing_outputs:
             # Find the corresponding OutputSpec
             for output_dict in job_state.expected_outputs:
                 output_spec = OutputSpec(**output_dict)
@@ -108,6 +108,8 @@ class JobState:
     # Progress tracking
     tasks_total: int = 0
     tasks_completed: int = 0
+    tasks_per_second: float | None = None  # Recent throughput reported by the runner
+    eta_seconds: float | None = None  # Estimated time remaining at updated_at
 
     # Error information
     error_message: str | None = None
@@ -196,6 +198,12 @@ class TerminalStateError(Exception):
     pass
 
 
+class JobCancelledError(Exception):
+    """Raised by the job runner when the job was cancelled while it ran."""
+
+    pass
+
+
 class JobExistsError(Exception):
     """Raised when attempting to register a job that already exists."""
 
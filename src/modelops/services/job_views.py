@@ -17,6 +17,10 @@ from modelops_contracts import AggregationReturn, SimJob, TargetSpec
 
 logger = logging.getLogger(__name__)
 
+# Pointer blob naming the most recently uploaded job view, so clients can find
+# the latest job without listing every view under views/jobs/
+LATEST_JOB_BLOB = "views/latest.json"
+
 
 # TODO/FIXME: make output_dir use ProvenanceSchema
 def write_job_view(
@@ -218,6 +222,7 @@ def write_job_view(
             # Upload the entire job directory (including manifest)
             remote_prefix = f"views/jobs/{job.job_id}"
             prov_store.upload_directory(job_dir, remote_prefix)
+            _publish_latest_job(prov_store, job.job_id, manifest["created_at"])
 
             if blob_urls:
                 logger.info(f"Job views uploaded to: {base_url}")
@@ -337,6 +342,20 @@ def write_replicates_view(
     return replicates_path
 
 
+def _publish_latest_job(prov_store: Any, job_id: str, created_at: str) -> None:
+    """Point LATEST_JOB_BLOB at a freshly uploaded job view."""
+    backend = getattr(prov_store, "_azure_backend", None)
+    if backend is None:
+        return
+    try:
+        backend.save_json(
+            LATEST_JOB_BLOB,
+            {"job_id": job_id, "prefix": f"views/jobs/{job_id}", "created_at": created_at},
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update latest job pointer: {e}")
+
+
 def _write_model_outputs(
     output_dir: Path,
     raw_sim_returns_by_param: dict[str, list[Any]],
@@ -0,0 +1,300 @@
+"""Coalesced, rate-limited job progress reporting.
+
+Every JobRegistry write is a read-modify-write CAS round trip against blob
+storage, so writing once per finished task cannot keep up with thousands of
+completions per second. ProgressReporter counts completions locally (Dask
+done-callbacks only bump a counter) and a background thread flushes the
+accumulated delta, with throughput and ETA, at most once per
+`min_interval` seconds: every `flush_interval` seconds, or sooner once
+`flush_every` completions are waiting.
+
+Deltas are added to the stored count rather than overwriting it, so a
+resumed job keeps counting from where the previous run stopped. A failed
+flush keeps its delta for the next attempt; progress is best-effort and
+never fails the job.
+
+The same thread notices a user cancel (`mops jobs cancel`): at most every
+`flush_interval` seconds it reads the job's status, and once it is
+CANCELLED every unfinished future passed to watch() or track() is
+cancelled on the cluster and `cancelled` is set for the runner to stop.
+"""
+
+import logging
+import os
+import threading
+import time
+from functools import partial
+from typing import Any
+
+from .job_state import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def format_eta(seconds: float | None) -> str:
+    """Render an ETA in seconds as e.g. '1h 05m', '4m 10s' or '12s'."""
+    if seconds is None:
+        return "unknown"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressReporter:
+    """Count task completions locally and flush them to the JobRegistry."""
+
+    def __init__(
+        self,
+        registry: Any | None,
+        job_id: str,
+        tasks_total: int = 0,
+        flush_interval: float = 10.0,
+        flush_every: int = 1000,
+        min_interval: float = 1.0,
+        smoothing: float = 0.3,
+    ):
+        """Initialize the reporter (call start() to begin flushing).
+
+        Args:
+            registry: JobRegistry to write to, or None to only log progress
+            job_id: Job being reported on
+            tasks_total: Expected number of tasks (can grow via add_total)
+            flush_interval: Flush at least this often while tasks complete (seconds)
+            flush_every: Flush early once this many completions are waiting
+            min_interval: Never flush more often than this (seconds)
+            smoothing: Weight of the newest window in the throughput average
+        """
+        self.registry = registry
+        self.job_id = job_id
+        self.tasks_total = tasks_total
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+        self.min_interval = min_interval
+        self.smoothing = smoothing
+
+        self.completed = 0
+        self.tasks_per_second: float | None = None
+        self.n_flushes = 0
+
+        self.cancelled = threading.Event()
+
+        self._unflushed = 0
+        self._total_dirty = tasks_total > 0
+        self._started_at = time.monotonic()
+        self._last_flush = self._started_at
+        self._status_checked = self._started_at
+        self._tracked: set[Any] = set()
+        self._cancelling = False
+        self._last_completed = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(
+        cls, registry: Any | None, job_id: str, tasks_total: int = 0
+    ) -> "ProgressReporter":
+        """Build a reporter using MODELOPS_PROGRESS_* environment variables."""
+        return cls(
+            registry,
+            job_id,
+            tasks_total=tasks_total,
+            flush_interval=float(os.environ.get("MODELOPS_PROGRESS_INTERVAL", 10.0)),
+            flush_every=int(os.environ.get("MODELOPS_PROGRESS_EVERY", 1000)),
+        )
+
+    # Counting
+
+    def add_total(self, n: int) -> None:
+        """Grow the expected task count."""
+        with self._lock:
+            self.tasks_total += n
+            self._total_dirty = True
+
+    def task_done(self, n: int = 1) -> None:
+        """Record finished tasks. Cheap and safe to call from any thread."""
+        with self._lock:
+            self.completed += n
+            self._unflushed += n
+            due = self._unflushed >= self.flush_every
+        if due:
+            self._wake.set()
+
+    def watch(self, adapters: list[Any]) -> None:
+        """Count each future as done when it finishes, fails or is cancelled.
+
+        Watched futures are also tracked for cancellation, see track().
+
+        Args:
+            adapters: DaskFutureAdapters (or anything with a `wrapped` Dask future)
+        """
+        self._track(adapters, count=True)
+
+    def track(self, adapters: list[Any]) -> None:
+        """Cancel these futures if the job is cancelled before they finish.
+
+        A future is forgotten once it finishes, unless its adapter has been
+        pointed at a speculative duplicate by then.
+
+        Args:
+            adapters: DaskFutureAdapters (or anything with a `wrapped` Dask future)
+        """
+        self._track(adapters, count=False)
+
+    def _track(self, adapters: list[Any], count: bool) -> None:
+        with self._lock:
+            self._tracked.update(adapters)
+            cancelling = self._cancelling
+        for adapter in adapters:
+            adapter.wrapped.add_done_callback(partial(self._on_done, adapter, count))
+        if cancelling:
+            self._cancel_tracked()  # Submitted before the runner noticed
+
+    def _on_done(self, adapter: Any, count: bool, future: Any) -> None:
+        with self._lock:
+            if adapter.wrapped is future:
+                self._tracked.discard(adapter)
+        if count:
+            self.task_done()
+
+    # Cancellation
+
+    def check_cancelled(self) -> bool:
+        """Read the job's status and cancel tracked futures if it was cancelled.
+
+        Returns:
+            True if the job has been cancelled
+        """
+        if self.cancelled.is_set():
+            return True
+        if self.registry is None:
+            return False
+        self._status_checked = time.monotonic()
+        try:
+            state = self.registry.get_job(self.job_id)
+        except Exception as e:
+            logger.debug(f"Could not check whether job {self.job_id} was cancelled: {e}")
+            return False
+        return self._observe(state)
+
+    def cancel(self) -> None:
+        """Stop the job's work: set `cancelled` and cancel unfinished tracked futures."""
+        with self._lock:
+            self._cancelling = True
+        self._cancel_tracked()
+        self.cancelled.set()
+
+    def _observe(self, state: Any) -> bool:
+        if self.cancelled.is_set():
+            return True
+        if getattr(state, "status", None) != JobStatus.CANCELLED:
+            return False
+        logger.warning(f"Job {self.job_id} was cancelled, stopping its work")
+        self.cancel()
+        return True
+
+    def _cancel_tracked(self) -> None:
+        with self._lock:
+            adapters, self._tracked = list(self._tracked), set()
+        futures = [a.wrapped for a in adapters if not a.wrapped.done()]
+        if not futures:
+            return
+        logger.info(f"Cancelling {len(futures)} outstanding future(s) of job {self.job_id}")
+        try:
+            futures[0].client.cancel(futures)
+        except Exception as e:
+            logger.warning(f"Failed to cancel futures of job {self.job_id}: {e}")
+
+    # Flushing
+
+    def start(self) -> "ProgressReporter":
+        """Start the background flush thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"progress-{self.job_id}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the flush thread and write whatever is still pending."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "ProgressReporter":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            # Bound the write rate even when completions arrive in a flood
+            wait = self.min_interval - (time.monotonic() - self._last_flush)
+            if wait > 0 and self._stop.wait(wait):
+                return
+            self.flush()
+            if time.monotonic() - self._status_checked >= self.flush_interval:
+                self.check_cancelled()
+
+    def flush(self) -> bool:
+        """Write the coalesced delta, throughput and ETA.
+
+        Returns:
+            True if anything was written
+        """
+        now = time.monotonic()
+        with self._lock:
+            delta, self._unflushed = self._unflushed, 0
+            total_dirty, self._total_dirty = self._total_dirty, False
+            completed, total = self.completed, self.tasks_total
+        if not delta and not total_dirty:
+            return False
+
+        tps = self.tasks_per_second
+        elapsed = now - self._last_flush
+        if elapsed > 0 and completed > self._last_completed:
+            rate = (completed - self._last_completed) / elapsed
+            tps = rate if tps is None else self.smoothing * rate + (1 - self.smoothing) * tps
+        eta = max(0, total - completed) / tps if total and tps else None
+
+        rate_str = f"{tps:.1f}" if tps else "?"
+        logger.info(
+            f"Job {self.job_id} progress: {completed}/{total or '?'} tasks, "
+            f"{rate_str} tasks/s, ETA {format_eta(eta)}"
+        )
+
+        if self.registry is not None:
+            try:
+                state = self.registry.update_progress(
+                    self.job_id,
+                    tasks_total=total if total_dirty else None,
+                    completed_delta=delta,
+                    tasks_per_second=round(tps or 0.0, 3),
+                    eta_seconds=round(eta, 1) if eta is not None else None,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to report progress for job {self.job_id}: {e}")
+                with self._lock:
+                    self._unflushed += delta
+                    self._total_dirty = self._total_dirty or total_dirty
+                return False
+            # The write read the current state, so it doubles as a cancel check
+            self._status_checked = now
+            self._observe(state)
+
+        self.tasks_per_second = tps
+        self._last_flush = now
+        self._last_completed = completed
+        self.n_flushes += 1
+        return True
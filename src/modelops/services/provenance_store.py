@@ -3,24 +3,82 @@
 This module provides a single storage system that replaces both the
 SimulationCache and CAS (Content-Addressed Storage). It uses input-addressed
 storage (hash of inputs) rather than content-addressed storage.
+
+Simulation results are stored in one of two layouts, chosen with the
+`layout` argument or MODELOPS_PROVENANCE_LAYOUT:
+
+    directory  (default) one directory per result holding metadata.json,
+               result.json and Arrow + Parquet copies of each artifact
+    segments   results appended as records to packed segment files under
+               {schema}/v{version}/segments (see segment_store); Arrow only,
+               no per-result files, and whole segments are uploaded as blobs
+
+In the segments layout, results written earlier in the directory layout are
+still read. Aggregation results always use the directory layout.
+
+Artifact bodies can be deduplicated by content (opt in with
+MODELOPS_PROVENANCE_DEDUP=true): identical outputs, such as those of
+deterministic models across seeds or all-zero early epidemic tables, are then
+stored once.
+
+    {storage_dir}/_blobs/{digest[:2]}/{digest}.{arrow,parquet,json}
+
+In the directory layout a result's artifact files are hard links to these
+blobs and result.json names each artifact's blob digest, so readers are
+unchanged and a blob's link count is its reference count: clear_schema()
+deletes blobs no longer linked from any result. In the segments layout each
+blob is one record, referenced by digest from the result records.
 """
 
+import errno
+import hashlib
 import json
 import logging
 import os
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from modelops_contracts import ErrorInfo, SimReturn, SimTask, TableArtifact
 from modelops_contracts.simulation import AggregationReturn, AggregationTask
 
 from .provenance_schema import DEFAULT_SCHEMA, ProvenanceSchema
+from .segment_store import DEFAULT_SEGMENT_BYTES, SegmentStore
+from .storage_catalog import Measurement, StorageCatalog, measure
 from .storage_utils import atomic_write
 
+if TYPE_CHECKING:
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
+LAYOUTS = ("directory", "segments")
+BLOB_DIR = "_blobs"
+
+
+def artifact_digest(data: bytes) -> str:
+    """Content address of an artifact body (BLAKE2b-256, like TableArtifact checksums)."""
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def _to_parquet(arrow_ipc: bytes) -> bytes:
+    """Convert an Arrow IPC artifact to Parquet for long-term storage."""
+    from io import BytesIO
+
+    import polars as pl
+
+    buffer = BytesIO()
+    pl.read_ipc(arrow_ipc).write_parquet(
+        buffer,
+        compression="zstd",  # Best compression/speed tradeoff
+        compression_level=3,  # Fast enough, good compression
+    )
+    return buffer.getvalue()
+
 
 @dataclass
 class StoredResult:
@@ -44,6 +102,8 @@ class ProvenanceStore:
         storage_dir: Path,
         schema: ProvenanceSchema = DEFAULT_SCHEMA,
         azure_backend: dict | None = None,
+        layout: str | None = None,
+        dedup: bool | None = None,
     ):
         """Initialize provenance store.
 
@@ -51,10 +111,27 @@ class ProvenanceStore:
             storage_dir: Root directory for local storage (always used)
             schema: Schema for path generation
             azure_backend: Optional Azure configuration for automatic uploads
+            layout: "directory" or "segments" for simulation results. Defaults
+                to the MODELOPS_PROVENANCE_LAYOUT environment variable
+                (directory).
+            dedup: Store identical artifact bodies once. Defaults to the
+                MODELOPS_PROVENANCE_DEDUP environment variable (off).
+
+        Raises:
+            ValueError: If the layout is unknown
         """
+        layout = layout or os.environ.get("MODELOPS_PROVENANCE_LAYOUT", "directory")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown provenance layout {layout!r} (expected one of {LAYOUTS})")
         self.storage_dir = Path(storage_dir)
         self.schema = schema
+        self.layout = layout
+        if dedup is None:
+            dedup = os.environ.get("MODELOPS_PROVENANCE_DEDUP", "false").lower() == "true"
+        self.dedup = dedup
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = StorageCatalog(self.storage_dir)
+        self.catalog.ensure_baseline()
 
         # Initialize Azure backend if configured for automatic uploads
         self._azure_backend = None
@@ -72,6 +149,11 @@ class ProvenanceStore:
                 logger.info("ProvenanceStore: Continuing with local-only storage")
                 self._azure_backend = None
 
+        self._segments: SegmentStore | None = None
+        self._uploads: ThreadPoolExecutor | None = None
+        if layout == "segments":
+            self._segments = self._open_segments()
+
         backend_msg = " with Azure uploads" if self._azure_backend else " (local-only)"
         logger.info(f"Initialized ProvenanceStore at {storage_dir}{backend_msg}")
 
@@ -114,6 +196,12 @@ class ProvenanceStore:
         Returns:
             SimReturn if found, None otherwise
         """
+        if self._segments is not None:
+            stored = self._get_sim_from_segments(task)
+            if stored is not None:
+                return stored
+            # Fall back to results stored before switching layouts
+
         # Generate storage path
         path_context = self._sim_path_context(task)
         result_dir = self.storage_dir / self.schema.sim_path(**path_context)
@@ -124,6 +212,7 @@ class ProvenanceStore:
             if self._azure_backend:
                 remote_path = self.schema.sim_path(**path_context)
                 if self._download_from_azure(remote_path, result_dir):
+                    self._record_in_catalog(result_dir, None)
                     logger.debug(f"Downloaded sim result from Azure: {remote_path}")
                 else:
                     return None
@@ -170,9 +259,10 @@ class ProvenanceStore:
                 elif parquet_file.exists():
                     # Fallback: read from Parquet and convert to Arrow IPC
                     try:
-                        import polars as pl
                         from io import BytesIO
 
+                        import polars as pl
+
                         logger.debug(f"Loading {name} from Parquet (Arrow missing)")
                         df = pl.read_parquet(parquet_file)
                         buffer = BytesIO()
@@ -224,6 +314,55 @@ class ProvenanceStore:
             logger.error(f"Failed to load simulation result from {result_dir}: {e}")
             return None
 
+    def probe_sims(self, tasks: Sequence[SimTask], max_workers: int = 16) -> list[int | None]:
+        """Check which simulation results are stored, without loading artifacts.
+
+        Reads only each result's result.json, from several threads since the
+        storage directory may be a network mount. A result missing locally is
+        looked up in the remote backend, if configured, with a single blob
+        read (remote segments are not consulted).
+
+        Args:
+            tasks: Simulation tasks to look up
+            max_workers: Concurrent probes
+
+        Returns:
+            For each task, the stored artifact bytes, or None if the result is
+            missing, unreadable or a stored error
+        """
+
+        def probe(task: SimTask) -> int | None:
+            key = self.sim_result_path(task)
+            record = self._segments.get_meta(key) if self._segments is not None else None
+            if record is not None:
+                result_data = record["result"]
+            else:
+                try:
+                    with open(self.storage_dir / key / "result.json") as f:
+                        result_data = json.load(f)
+                except (OSError, ValueError):
+                    result_data = self._load_remote_json(f"{key}/result.json")
+                    if result_data is None:
+                        return None
+            if "error" in result_data:
+                return None
+            return sum(a.get("size", 0) for a in result_data.get("outputs", {}).values())
+
+        if len(tasks) <= 1:
+            return [probe(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+            return list(pool.map(probe, tasks))
+
+    def _load_remote_json(self, key: str) -> dict | None:
+        """Read a JSON blob from the remote backend; None if absent or unreadable."""
+        if not self._azure_backend:
+            return None
+        try:
+            return json.loads(self._azure_backend.load(key))
+        except Exception as e:
+            logger.debug(f"No remote result at {key}: {e}")
+            return None
+
     def put_sim(self, task: SimTask, result: SimReturn) -> str:
         """Store simulation result.
 
@@ -232,24 +371,20 @@ class ProvenanceStore:
             result: Simulation result to store
 
         Returns:
-            Storage path for the result
+            Storage path for the result (in the segments layout, the path the
+            result would have in the directory layout)
         """
+        if self._segments is not None:
+            return self._put_sim_in_segments(task, result)
+
         # Generate storage path
-        path_context = self._sim_path_context(task)
-        result_dir = self.storage_dir / self.schema.sim_path(**path_context)
+        result_dir = self.storage_dir / self.sim_result_path(task)
         result_dir.mkdir(parents=True, exist_ok=True)
+        replaced = self._measure_existing(result_dir)
 
         try:
             # Store metadata
-            metadata = {
-                "bundle_ref": task.bundle_ref,
-                "entrypoint": str(task.entrypoint),
-                "params": dict(task.params.params),
-                "seed": task.seed,
-                "outputs": task.outputs,
-                "param_id": task.params.param_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
+            metadata = self._sim_metadata(task)
             self._write_json_atomic(result_dir / "metadata.json", metadata)
 
             # No longer storing manifest - removed from SimTask
@@ -280,16 +415,21 @@ class ProvenanceStore:
                 if not artifact.inline:
                     continue
 
+                # Content address of the body, when deduplicating
+                digest = artifact_digest(artifact.inline) if self.dedup else None
+
                 # Handle metadata separately - it's JSON, not tabular data
                 if name == "metadata":
                     json_file = result_dir / f"artifact_{name}.json"
-                    atomic_write(json_file, artifact.inline)
+                    self._write_artifact(json_file, artifact.inline, digest)
 
                     result_data["outputs"][name] = {
                         "size": artifact.size,
                         "checksum": artifact.checksum,
                         "json_size": json_file.stat().st_size if json_file.exists() else 0,
                     }
+                    if digest:
+                        result_data["outputs"][name]["blob"] = digest
 
                     logger.debug(f"Stored {name}: JSON={artifact.size} bytes")
                     continue
@@ -297,18 +437,13 @@ class ProvenanceStore:
                 # Store tabular artifacts in both Arrow (fast cache) and Parquet (efficient storage)
                 # Fast cache: Arrow IPC (for quick reads)
                 arrow_file = result_dir / f"artifact_{name}.arrow"
-                atomic_write(arrow_file, artifact.inline)
+                self._write_artifact(arrow_file, artifact.inline, digest)
 
                 # Long-term storage: Parquet (better compression)
                 try:
-                    import polars as pl
-
                     parquet_file = result_dir / f"artifact_{name}.parquet"
-                    df = pl.read_ipc(artifact.inline)
-                    df.write_parquet(
-                        parquet_file,
-                        compression="zstd",  # Best compression/speed tradeoff
-                        compression_level=3,  # Fast enough, good compression
+                    self._write_artifact(
+                        parquet_file, lambda data=artifact.inline: _to_parquet(data), digest
                     )
 
                     # Store artifact metadata with both file sizes
@@ -321,6 +456,8 @@ class ProvenanceStore:
                         "arrow_size": arrow_size,
                         "parquet_size": parquet_size,
                     }
+                    if digest:
+                        result_data["outputs"][name]["blob"] = digest
 
                     logger.debug(
                         f"Stored {name}: Arrow={arrow_size} bytes, Parquet={parquet_size} bytes "
@@ -333,14 +470,22 @@ class ProvenanceStore:
                         "size": artifact.size,
                         "checksum": artifact.checksum,
                     }
+                    if digest:
+                        result_data["outputs"][name]["blob"] = digest
 
             self._write_json_atomic(result_dir / "result.json", result_data)
 
             # Also upload to Azure if configured
             # DISABLED FOR DEMO - Azure uploads causing performance issues
             # if self._azure_backend:
-            #     self._upload_to_azure(result_dir, self.schema.sim_path(**path_context))
+            #     self._upload_to_azure(result_dir, self.sim_result_path(task))
 
+            formats = {
+                name: "parquet" if (result_dir / f"artifact_{name}.parquet").exists() else "arrow"
+                for name in result_data["outputs"]
+                if name != "metadata"
+            }
+            self._record_in_catalog(result_dir, replaced, self._scan_meta(task, formats))
             logger.debug(f"Stored simulation result at {result_dir}")
             return str(result_dir)
 
@@ -348,6 +493,118 @@ class ProvenanceStore:
             logger.error(f"Failed to store simulation result: {e}")
             raise
 
+    def _sim_metadata(self, task: SimTask) -> dict[str, Any]:
+        return {
+            "bundle_ref": task.bundle_ref,
+            "entrypoint": str(task.entrypoint),
+            "params": dict(task.params.params),
+            "seed": task.seed,
+            "outputs": task.outputs,
+            "param_id": task.params.param_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+
+    def _scan_meta(self, task: SimTask, formats: dict[str, str]) -> dict[str, Any]:
+        """Catalog metadata that lets scan() prune results without opening them."""
+        return {
+            "bundle_digest": self._sim_path_context(task)["bundle_digest"],
+            "param_id": task.params.param_id,
+            "seed": task.seed,
+            "params": dict(task.params.params),
+            "outputs": formats,
+        }
+
+    def _put_sim_in_segments(self, task: SimTask, result: SimReturn) -> str:
+        """Append a simulation result to the segment store as one record."""
+        key = self.sim_result_path(task)
+        result_data: dict[str, Any] = {"task_id": result.task_id, "outputs": {}}
+        blobs: dict[str, bytes] = {}
+
+        if result.error:
+            result_data["error"] = {
+                "error_type": result.error.error_type,
+                "message": result.error.message,
+                "retryable": result.error.retryable,
+            }
+            if result.error_details:
+                result_data["error_details"] = {
+                    "size": result.error_details.size,
+                    "checksum": result.error_details.checksum,
+                }
+                if result.error_details.inline:
+                    blobs["error_details"] = result.error_details.inline
+
+        for name, artifact in result.outputs.items():
+            if not artifact.inline:
+                continue
+            result_data["outputs"][name] = {"size": artifact.size, "checksum": artifact.checksum}
+            if not self.dedup:
+                blobs[f"artifact_{name}"] = artifact.inline
+                continue
+            # Each distinct body is one record, shared by every result that has it
+            digest = artifact_digest(artifact.inline)
+            result_data["outputs"][name]["blob"] = digest
+            blob_key = f"{BLOB_DIR}/{digest}"
+            if blob_key not in self._segments:
+                self._segments.put(blob_key, {}, {"data": artifact.inline})
+
+        replaced_size = self._segments.size(key)
+        size = self._segments.put(
+            key, {"metadata": self._sim_metadata(task), "result": result_data}, blobs
+        )
+        try:
+            now = datetime.now(UTC).timestamp()
+            replaced = None if replaced_size is None else Measurement(replaced_size, 0, now)
+            formats = {name: "segment" for name in result_data["outputs"] if name != "metadata"}
+            self.catalog.record(
+                key,
+                Measurement(size, len(result_data["outputs"]), now),
+                replaced,
+                self._scan_meta(task, formats),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update storage catalog for {key}: {e}")
+        logger.debug(f"Stored simulation result in segment store: {key}")
+        return str(self.storage_dir / key)
+
+    def _get_sim_from_segments(self, task: SimTask) -> SimReturn | None:
+        record = self._segments.get(self.sim_result_path(task))
+        if record is None:
+            return None
+        meta, blobs = record
+        result_data = meta["result"]
+
+        outputs = {}
+        for name, artifact_data in result_data["outputs"].items():
+            if "blob" in artifact_data:
+                blob = self._segments.get(f"{BLOB_DIR}/{artifact_data['blob']}")
+                if blob is None:
+                    logger.warning(f"Missing blob {artifact_data['blob']} for {name}")
+                    return None
+                data = blob[1]["data"]
+            else:
+                data = blobs[f"artifact_{name}"]
+            outputs[name] = TableArtifact(
+                size=len(data), inline=data, checksum=artifact_data["checksum"]
+            )
+        error = error_details = None
+        if "error" in result_data:
+            error = ErrorInfo(**result_data["error"])
+            if "error_details" in blobs:
+                error_details = TableArtifact(
+                    size=len(blobs["error_details"]),
+                    inline=blobs["error_details"],
+                    checksum=result_data["error_details"]["checksum"],
+                )
+
+        return SimReturn(
+            task_id=result_data["task_id"],
+            outputs=outputs,
+            error=error,
+            error_details=error_details,
+            cached=True,
+        )
+
     def get_agg(self, task: AggregationTask) -> AggregationReturn | None:
         """Retrieve aggregation result if it exists.
 
@@ -396,9 +653,9 @@ class ProvenanceStore:
             Storage path for the result
         """
         # Generate storage path
-        path_context = self._agg_path_context(task)
-        result_dir = self.storage_dir / self.schema.agg_path(**path_context)
+        result_dir = self.storage_dir / self.agg_result_path(task)
         result_dir.mkdir(parents=True, exist_ok=True)
+        replaced = self._measure_existing(result_dir)
 
         try:
             # Store metadata with param_id
@@ -437,6 +694,7 @@ class ProvenanceStore:
 
             self._write_json_atomic(result_dir / "result.json", result_data)
 
+            self._record_in_catalog(result_dir, replaced)
             logger.debug(f"Stored aggregation result at {result_dir}")
             return str(result_dir)
 
@@ -445,38 +703,188 @@ class ProvenanceStore:
             raise
 
     def list_results(self, result_type: str = "sim", limit: int = 100) -> list[dict[str, Any]]:
-        """List stored results with metadata.
+        """List the most recently stored results with metadata.
+
+        Reads the storage catalog instead of walking the tree, so only the
+        returned results' metadata files are opened.
 
         Args:
             result_type: "sim" or "agg"
             limit: Maximum number of results
 
         Returns:
-            List of result metadata dicts
+            List of result metadata dicts, newest first
         """
         results = []
-        search_dir = (
-            self.storage_dir / self.schema.name / f"v{self.schema.version}" / f"{result_type}s"
+        paths = self.catalog.recent(
+            self.schema.name, f"v{self.schema.version}", result_type, limit
         )
-
-        if not search_dir.exists():
-            return results
-
-        # Walk directory tree
-        for result_dir in search_dir.rglob("metadata.json"):
-            if len(results) >= limit:
-                break
-
+        for path in paths:
+            metadata_file = self.storage_dir / path / "metadata.json"
+            record = self._segments.get_meta(path) if self._segments is not None else None
+            if record is not None:
+                results.append({**record["metadata"], "path": str(metadata_file.parent)})
+                continue
             try:
-                with open(result_dir) as f:
+                with open(metadata_file) as f:
                     metadata = json.load(f)
-                    metadata["path"] = str(result_dir.parent)
+                    metadata["path"] = str(metadata_file.parent)
                     results.append(metadata)
+            except FileNotFoundError:
+                continue  # Removed since it was cataloged
             except Exception as e:
-                logger.warning(f"Failed to read metadata from {result_dir}: {e}")
+                logger.warning(f"Failed to read metadata from {metadata_file}: {e}")
 
         return results
 
+    def scan(
+        self,
+        kind: str = "sim",
+        output_name: str = "table",
+        filters: "dict[str, Any] | pl.Expr | None" = None,
+    ) -> "pl.LazyFrame":
+        """Query one output of many stored simulation results as a LazyFrame.
+
+        Results are pruned on their catalog metadata first, so only matching
+        results' files are touched. The rest is lazy: Parquet and Arrow files
+        are scanned (Arrow memory-mapped), and polars pushes column selection
+        and row predicates on the output's own columns down into the reads.
+        Each row carries bundle_digest, param_id, seed and the "params.<name>"
+        columns of its result, unless the output already has a column of
+        that name.
+
+        Args:
+            kind: Result kind; only "sim" results store tabular outputs
+            output_name: Output artifact to read (e.g. "prevalence")
+            filters: Either a mapping of bundle_digest, param_id, seed or
+                parameter name to a value or a collection of accepted values,
+                or a polars expression over the index columns (bundle_digest,
+                param_id, seed, "params.<name>")
+
+        Returns:
+            LazyFrame over the matching results' rows
+
+        Example:
+            >>> store.scan("sim", "prevalence", {"params.beta": [0.1, 0.2]}) \\
+            ...     .group_by("params.beta").agg(pl.col("infected").mean()).collect()
+        """
+        import polars as pl
+
+        if kind != "sim":
+            raise ValueError(f"Only simulation outputs can be scanned, not {kind!r}")
+
+        index = self.catalog.sim_index(self.schema.name, f"v{self.schema.version}")
+        format_col = f"output.{output_name}"
+        if format_col not in index.columns:
+            return pl.LazyFrame()
+        candidates = index.filter(pl.col(format_col).is_not_null())
+        if isinstance(filters, pl.Expr):
+            candidates = candidates.filter(filters)
+        elif filters:
+            for name, value in filters.items():
+                column = name if name in index.columns else f"params.{name}"
+                if column not in index.columns:
+                    return pl.LazyFrame()  # No stored result has this parameter
+                if isinstance(value, (list, tuple, set, frozenset, range)):
+                    candidates = candidates.filter(pl.col(column).is_in(list(value)))
+                else:
+                    candidates = candidates.filter(pl.col(column) == value)
+
+        root = f"{self.storage_dir}/"
+        candidates = candidates.with_columns(
+            pl.concat_str(
+                pl.lit(root),
+                pl.col("path"),
+                pl.lit(f"/artifact_{output_name}."),
+                pl.col(format_col),
+            ).alias("_file")
+        )
+        meta_columns = [
+            c for c in candidates.columns if not c.startswith("output.") and c != "path"
+        ]
+
+        frames = []
+        for fmt, group in candidates.partition_by(format_col, as_dict=True).items():
+            fmt = fmt[0]
+            if fmt == "parquet":
+                lf = pl.scan_parquet(group["_file"].to_list(), include_file_paths="_file")
+            elif fmt == "arrow":
+                lf = pl.scan_ipc(
+                    group["_file"].to_list(), memory_map=True, include_file_paths="_file"
+                )
+            else:
+                lf = self._scan_segment_outputs(group, output_name)
+            data_columns = set(lf.collect_schema().names())
+            attach = [c for c in meta_columns if c == "_file" or c not in data_columns]
+            frames.append(
+                lf.join(group.lazy().select(attach), on="_file", how="left").drop("_file")
+            )
+
+        if not frames:
+            return pl.LazyFrame()
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def _scan_segment_outputs(self, group: "pl.DataFrame", output_name: str) -> "pl.LazyFrame":
+        """Outputs of results in the segment store, read into memory (they are not files)."""
+        import polars as pl
+
+        if self._segments is None:
+            return pl.LazyFrame(schema={"_file": pl.String})  # Written by a segments store
+        tables = []
+        for path, file in zip(group["path"], group["_file"], strict=True):
+            record = self._segments.get(path)
+            if record is None:
+                continue
+            artifact = record[0]["result"]["outputs"].get(output_name, {})
+            if "blob" in artifact:
+                blob = self._segments.get(f"{BLOB_DIR}/{artifact['blob']}")
+                data = blob[1]["data"] if blob is not None else None
+            else:
+                data = record[1].get(f"artifact_{output_name}")
+            if data:
+                tables.append(pl.read_ipc(data).with_columns(pl.lit(file).alias("_file")))
+        if not tables:
+            return pl.LazyFrame(schema={"_file": pl.String})
+        return pl.concat(tables, how="diagonal_relaxed").lazy()
+
+    def _measure_existing(self, result_dir: Path) -> Measurement | None:
+        """Footprint of a result about to be overwritten, if there is one."""
+        if not (result_dir / "metadata.json").exists():
+            return None
+        try:
+            return measure(result_dir)
+        except OSError:
+            return None
+
+    def _record_in_catalog(
+        self, result_dir: Path, replaced: Measurement | None, meta: dict[str, Any] | None = None
+    ) -> None:
+        """Account for a stored result; never fails the write itself."""
+        try:
+            rel = result_dir.relative_to(self.storage_dir).as_posix()
+            self.catalog.record(rel, measure(result_dir), replaced, meta)
+        except Exception as e:
+            logger.warning(f"Failed to update storage catalog for {result_dir}: {e}")
+
+    def sim_result_path(self, task: SimTask) -> str:
+        """Storage path of a simulation result, relative to storage_dir."""
+        return self.schema.sim_path(**self._sim_path_context(task))
+
+    def agg_result_path(self, task: AggregationTask) -> str:
+        """Storage path of an aggregation result, relative to storage_dir."""
+        return self.schema.agg_path(**self._agg_path_context(task))
+
+    def agg_result_path_by_id(
+        self, bundle_ref: str, target_entrypoint: Any, aggregation_id: str
+    ) -> str:
+        """Storage path of an aggregation result whose id is already known.
+
+        An AggregationReturn carries its id, so the path can be found without
+        the simulation results the id was derived from.
+        """
+        context = self._agg_id_path_context(bundle_ref, target_entrypoint, aggregation_id)
+        return self.schema.agg_path(**context)
+
     def _sim_path_context(self, task: SimTask) -> dict[str, Any]:
         """Generate path context for simulation task."""
         # Extract the actual digest from bundle_ref (e.g., "sha256:abc123..." -> "abc123...")
@@ -523,16 +931,21 @@ class ProvenanceStore:
 
     def _agg_path_context(self, task: AggregationTask) -> dict[str, Any]:
         """Generate path context for aggregation task."""
+        return self._agg_id_path_context(
+            task.bundle_ref, task.target_entrypoint, task.aggregation_id()
+        )
+
+    def _agg_id_path_context(
+        self, bundle_ref: str, target_entrypoint: Any, aggregation_id: str
+    ) -> dict[str, Any]:
+        """Generate path context for an aggregation identified by its id."""
         # Extract the actual digest from bundle_ref (e.g., "sha256:abc123..." -> "abc123...")
-        if ":" in task.bundle_ref:
-            bundle_digest = task.bundle_ref.split(":", 1)[1]
-        else:
-            bundle_digest = task.bundle_ref
+        bundle_digest = bundle_ref.split(":", 1)[1] if ":" in bundle_ref else bundle_ref
 
         context = {
             "bundle_digest": bundle_digest,  # Already a digest, don't hash again!
-            "target": str(task.target_entrypoint).replace("/", "_"),
-            "aggregation_id": task.aggregation_id(),
+            "target": str(target_entrypoint).replace("/", "_"),
+            "aggregation_id": aggregation_id,
         }
 
         # For token invalidation, would need model_digest from bundle manifest
@@ -554,11 +967,132 @@ class ProvenanceStore:
         if schema_dir.exists():
             import shutil
 
+            reopen = self._segments is not None and target_schema == self.schema.name
+            if reopen:
+                self._segments.close()
             shutil.rmtree(schema_dir)
+            if reopen:
+                self._segments = self._open_segments()
+            self.catalog.record_clear(target_schema)
             logger.info(f"Cleared schema '{target_schema}' data")
+            self.collect_blobs()
         else:
             logger.info(f"Schema '{target_schema}' has no data to clear")
 
+    def _blob_path(self, digest: str, suffix: str) -> Path:
+        return self.storage_dir / BLOB_DIR / digest[:2] / f"{digest}{suffix}"
+
+    def _write_artifact(
+        self, path: Path, data: bytes | Callable[[], bytes], digest: str | None
+    ) -> None:
+        """Write an artifact file, as a hard link to its blob when deduplicating.
+
+        ``data`` may be a callable so that derived files (Parquet) are only
+        produced when no blob for the digest exists yet.
+        """
+        if digest is not None:
+            blob = self._blob_path(digest, path.suffix)
+            for attempt in range(2):
+                try:
+                    if not blob.exists():
+                        atomic_write(blob, data() if callable(data) else data)
+                    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+                    os.link(blob, tmp)
+                    os.replace(tmp, path)
+                    return
+                except FileNotFoundError:
+                    continue  # Collected between the check and the link
+                except OSError as e:
+                    if e.errno != errno.EMLINK or attempt:
+                        logger.debug(f"Cannot link {path.name} to its blob: {e}")
+                        break
+                    # Out of links: start a fresh blob, existing links stay valid
+                    blob.unlink(missing_ok=True)
+        atomic_write(path, data() if callable(data) else data)
+
+    def collect_blobs(self) -> tuple[int, int]:
+        """Delete artifact blobs no result links to any more.
+
+        A blob's hard link count is its reference count: one link for the blob
+        itself plus one per result artifact file. Blobs only reachable from the
+        segments layout live inside segment files and are not affected.
+
+        Returns:
+            (blobs deleted, bytes freed)
+        """
+        blob_root = self.storage_dir / BLOB_DIR
+        if not blob_root.exists():
+            return 0, 0
+        deleted = freed = 0
+        for shard in os.scandir(blob_root):
+            if not shard.is_dir():
+                continue
+            with os.scandir(shard.path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_nlink == 1 and not entry.name.startswith("."):
+                            os.unlink(entry.path)
+                            deleted += 1
+                            freed += st.st_size
+                    except FileNotFoundError:
+                        continue
+        if deleted:
+            logger.info(f"Collected {deleted} unreferenced artifact blobs ({freed} bytes)")
+        return deleted, freed
+
+    def _open_segments(self) -> SegmentStore:
+        root = self.schema.render_path(self.schema.root_template, {})
+        return SegmentStore(
+            self.storage_dir / root / "segments",
+            segment_bytes=int(
+                os.environ.get("MODELOPS_PROVENANCE_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES)
+            ),
+            on_seal=self._upload_segment,
+            on_remove=self._remove_remote_segment,
+        )
+
+    def _segment_blob_key(self, path: Path) -> str:
+        return path.relative_to(self.storage_dir).as_posix()
+
+    def _upload_segment(self, segment_path: Path, index_path: Path) -> None:
+        """Upload a sealed segment and its index as two blobs, in the background."""
+        if not self._azure_backend:
+            return
+
+        def upload() -> None:
+            try:
+                # Segment first: a remote index never points at a missing segment
+                for path in (segment_path, index_path):
+                    self._azure_backend.save(self._segment_blob_key(path), path.read_bytes())
+                logger.debug(f"Uploaded segment {segment_path.name}")
+            except FileNotFoundError:
+                pass  # Compacted away before it was uploaded
+            except Exception as e:
+                logger.error(f"Failed to upload segment {segment_path.name}: {e}")
+
+        self._upload_executor().submit(upload)
+
+    def _upload_executor(self) -> ThreadPoolExecutor:
+        # One thread, so uploads and deletions of a segment happen in order
+        if self._uploads is None:
+            self._uploads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-upload")
+        return self._uploads
+
+    def _remove_remote_segment(self, segment_path: Path, index_path: Path) -> None:
+        """Delete a compacted-away segment's blobs, after any pending upload of it."""
+        if not self._azure_backend:
+            return
+
+        def remove() -> None:
+            for path in (index_path, segment_path):
+                try:
+                    self._azure_backend.delete(self._segment_blob_key(path))
+                except Exception as e:
+                    logger.debug(f"Could not delete remote segment blob {path.name}: {e}")
+
+        self._upload_executor().submit(remove)
+
     def _upload_to_azure(self, local_dir: Path, remote_prefix: str):
         """Upload local directory to remote backend, including subdirectories.
 
@@ -633,7 +1167,12 @@ class ProvenanceStore:
         """Shutdown any background tasks."""
         # Note: The existing AzureBlobBackend doesn't have a shutdown method
         # It uses synchronous operations so no cleanup needed
-        pass
+        if self._segments is not None:
+            # Seal the open segment so it is indexed and uploaded
+            self._segments.close()
+        if self._uploads is not None:
+            self._uploads.shutdown(wait=True)
+            self._uploads = None
 
     def try_read_json(self, path: str) -> dict[str, Any] | None:
         """Try to read JSON file, returning None if missing or invalid.
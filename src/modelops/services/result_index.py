@@ -0,0 +1,380 @@
+"""Job-scoped result index linking a job to its provenance entries.
+
+ProvenanceStore is input-addressed and its metadata carries no job_id, so
+answering "which results belong to job X" used to mean probing every
+expected path. The job runner now appends one row per result to a per-job
+index as results land:
+
+    {storage_dir}/{schema}/v{version}/views/jobs/{job_id}/index/part-*.parquet
+
+Fragments are immutable and append-only (IndexRecorder writes one whenever
+enough results have completed, so a runner that dies mid-job leaves the
+fragments written so far), and are uploaded next to the job views when a
+remote backend is configured. Validation, resume and download trust the
+index for the results it lists and only probe storage for the rest.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from modelops_contracts import SimReturn, SimTask
+from modelops_contracts.simulation import AggregationReturn
+
+from .provenance_store import ProvenanceStore
+from .storage_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexEntry:
+    """One result recorded for a job."""
+
+    job_id: str
+    kind: str  # "sim" or "agg"
+    param_id: str
+    seed: int | None  # None for aggregations
+    target: str | None  # Target entrypoint, None for simulations
+    provenance_path: str  # Relative to the ProvenanceStore storage_dir
+    n_outputs: int
+    size_bytes: int
+    checksum: str  # Combined checksum of all output artifacts
+    status: str  # "ok" or "error"
+    loss: float | None = None
+    recorded_at: str = ""
+
+
+def entry_key(entry: IndexEntry) -> tuple:
+    """Identity of the result an entry records; newer entries replace older ones."""
+    return (entry.kind, entry.param_id, entry.seed, entry.target)
+
+
+def _combined_checksum(outputs: dict[str, Any]) -> str:
+    """Combine per-artifact checksums into one stable digest."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for name in sorted(outputs):
+        hasher.update(f"{name}:{outputs[name].checksum}\n".encode())
+    return hasher.hexdigest()
+
+
+def sim_entry(
+    job_id: str, task: SimTask, result: SimReturn, prov_store: ProvenanceStore
+) -> IndexEntry:
+    """Build an index entry for a simulation result.
+
+    Args:
+        job_id: Job the result belongs to
+        task: Task that produced the result
+        result: Simulation result
+        prov_store: Store whose schema determines the provenance path
+
+    Returns:
+        IndexEntry for the result
+    """
+    return IndexEntry(
+        job_id=job_id,
+        kind="sim",
+        param_id=task.params.param_id,
+        seed=task.seed,
+        target=None,
+        provenance_path=prov_store.sim_result_path(task),
+        n_outputs=len(result.outputs),
+        size_bytes=sum(a.size for a in result.outputs.values()),
+        checksum=_combined_checksum(result.outputs),
+        status="error" if result.error else "ok",
+        recorded_at=datetime.now(UTC).isoformat(),
+    )
+
+
+def agg_entry(
+    job_id: str,
+    param_id: str,
+    bundle_ref: str,
+    target_entrypoint: str,
+    result: AggregationReturn,
+    prov_store: ProvenanceStore,
+) -> IndexEntry:
+    """Build an index entry for an aggregation result.
+
+    The path comes from the result's own aggregation_id, so the simulation
+    results it aggregated are not needed.
+
+    Args:
+        job_id: Job the result belongs to
+        param_id: Parameter set the aggregation covers
+        bundle_ref: Bundle the aggregation ran with
+        target_entrypoint: Target that was evaluated
+        result: Aggregation result
+        prov_store: Store whose schema determines the provenance path
+
+    Returns:
+        IndexEntry for the result
+    """
+    return IndexEntry(
+        job_id=job_id,
+        kind="agg",
+        param_id=param_id,
+        seed=None,
+        target=str(target_entrypoint),
+        provenance_path=prov_store.agg_result_path_by_id(
+            bundle_ref, target_entrypoint, result.aggregation_id
+        ),
+        n_outputs=len(result.outputs),
+        size_bytes=sum(a.size for a in result.outputs.values()),
+        checksum=_combined_checksum(result.outputs),
+        status="ok",
+        loss=result.loss,
+        recorded_at=datetime.now(UTC).isoformat(),
+    )
+
+
+class JobResultIndex:
+    """Append-only per-job index stored as Parquet fragments."""
+
+    def __init__(self, prov_store: ProvenanceStore, job_id: str):
+        """Initialize the index for one job.
+
+        Args:
+            prov_store: ProvenanceStore the indexed results live in
+            job_id: Job identifier
+        """
+        self.prov_store = prov_store
+        self.job_id = job_id
+        schema = prov_store.schema
+        self.local_dir = (
+            prov_store.storage_dir
+            / schema.name
+            / f"v{schema.version}"
+            / "views"
+            / "jobs"
+            / job_id
+            / "index"
+        )
+        self.remote_prefix = f"views/jobs/{job_id}/index"
+
+    def append(self, entries: list[IndexEntry]) -> Path | None:
+        """Write entries as a new immutable fragment.
+
+        Args:
+            entries: Entries to record
+
+        Returns:
+            Path of the written fragment, or None if there was nothing to write
+        """
+        if not entries:
+            return None
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist([asdict(e) for e in entries])
+        buf = io.BytesIO()
+        pq.write_table(table, buf, compression="zstd")
+        data = buf.getvalue()
+
+        name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+        path = self.local_dir / name
+        atomic_write(path, data)
+
+        if self.prov_store.supports_remote_uploads():
+            try:
+                self.prov_store._azure_backend.save(f"{self.remote_prefix}/{name}", data)
+            except Exception as e:
+                # Local fragment is still valid; don't fail the job over the index
+                logger.error(f"Failed to upload result index fragment {name}: {e}")
+
+        logger.info(f"Recorded {len(entries)} results in index for job {self.job_id}")
+        return path
+
+    def read(self) -> list[IndexEntry]:
+        """Read all entries, newest record winning per result.
+
+        Falls back to downloading fragments from the remote backend when none
+        exist locally.
+
+        Returns:
+            Entries for the job (empty if the job has no index)
+        """
+        fragments = self._fragments()
+        if (
+            not fragments
+            and self.prov_store.supports_remote_uploads()
+            and self.prov_store._download_from_azure(self.remote_prefix, self.local_dir)
+        ):
+            fragments = self._fragments()
+        if not fragments:
+            return []
+
+        import pyarrow.parquet as pq
+
+        names = {f.name for f in fields(IndexEntry)}
+        latest: dict[tuple, IndexEntry] = {}
+        for fragment in fragments:
+            for row in pq.read_table(fragment).to_pylist():
+                entry = IndexEntry(**{k: v for k, v in row.items() if k in names})
+                key = entry_key(entry)
+                current = latest.get(key)
+                if current is None or entry.recorded_at >= current.recorded_at:
+                    latest[key] = entry
+        return list(latest.values())
+
+    def _fragments(self) -> list[Path]:
+        if not self.local_dir.exists():
+            return []
+        return sorted(self.local_dir.glob("part-*.parquet"))
+
+
+class IndexRecorder:
+    """Buffer entries recorded from done-callbacks and append them as fragments.
+
+    Recording only appends to a list, so it is safe from Dask's callback
+    thread, which every progress and index callback shares. Entries that need
+    a finished future's result are recorded as builders and built on the
+    background thread, which writes the buffer as one fragment every
+    `flush_interval` seconds, or sooner once `flush_every` entries are
+    waiting; close() writes the rest. A failed write keeps its entries for
+    the next attempt, and the index never fails the job.
+    """
+
+    def __init__(
+        self,
+        index: JobResultIndex | None,
+        flush_interval: float = 30.0,
+        flush_every: int = 1000,
+    ):
+        """Initialize the recorder (call start() to begin flushing).
+
+        Args:
+            index: Index to append to, or None to drop entries
+            flush_interval: Write at least this often while results land (seconds)
+            flush_every: Write early once this many entries are waiting
+        """
+        self.index = index
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+
+        self._pending: list[IndexEntry | tuple[tuple, Callable[[], IndexEntry]]] = []
+        self._recorded: set[tuple] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(cls, index: JobResultIndex | None) -> "IndexRecorder":
+        """Build a recorder using MODELOPS_INDEX_* environment variables."""
+        return cls(
+            index,
+            flush_interval=float(os.environ.get("MODELOPS_INDEX_INTERVAL", 30.0)),
+            flush_every=int(os.environ.get("MODELOPS_INDEX_EVERY", 1000)),
+        )
+
+    @property
+    def prov_store(self) -> ProvenanceStore | None:
+        """Store the recorded results live in, or None when nothing is recorded."""
+        return self.index.prov_store if self.index is not None else None
+
+    def record(self, entries: list[IndexEntry]) -> None:
+        """Queue entries for the next fragment. Cheap and safe to call from any thread."""
+        if self.index is None or not entries:
+            return
+        with self._lock:
+            self._pending.extend(entries)
+            self._recorded.update(entry_key(e) for e in entries)
+            due = len(self._pending) >= self.flush_every
+        if due:
+            self._wake.set()
+
+    def record_deferred(self, key: tuple, build: Callable[[], IndexEntry]) -> None:
+        """Queue an entry to be built on the flush thread, e.g. from a future's result.
+
+        Args:
+            key: (kind, param_id, seed, target) of the result, as entry_key() gives
+            build: Returns the entry; if it raises, the result is not recorded
+        """
+        if self.index is None:
+            return
+        with self._lock:
+            self._pending.append((key, build))
+            self._recorded.add(key)
+            due = len(self._pending) >= self.flush_every
+        if due:
+            self._wake.set()
+
+    def is_recorded(
+        self, kind: str, param_id: str, seed: int | None = None, target: str | None = None
+    ) -> bool:
+        """Whether a result has already been recorded by this recorder."""
+        with self._lock:
+            return (kind, param_id, seed, target) in self._recorded
+
+    def start(self) -> "IndexRecorder":
+        """Start the background flush thread."""
+        if self._thread is None and self.index is not None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"index-{self.index.job_id}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the flush thread and write whatever is still pending."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=60)
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "IndexRecorder":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> bool:
+        """Append pending entries as one fragment.
+
+        Returns:
+            True if a fragment was written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        entries = []
+        for item in pending:
+            if isinstance(item, IndexEntry):
+                entries.append(item)
+                continue
+            key, build = item
+            try:
+                entries.append(build())
+            except Exception as e:
+                logger.warning(f"Could not index result {key} of job {self.index.job_id}: {e}")
+                with self._lock:
+                    self._recorded.discard(key)
+        if not entries:
+            return False
+        try:
+            self.index.append(entries)
+        except Exception as e:
+            logger.warning(f"Failed to record result index for job {self.index.job_id}: {e}")
+            with self._lock:
+                self._pending[:0] = entries
+            return False
+        return True
@@ -0,0 +1,517 @@
+"""Log-structured storage of results in packed segment files.
+
+The directory layout gives every simulation result its own directory of
+four or more small files, each written with an fsync'ed atomic rename. A
+1M-simulation sweep turns into millions of inodes locally and millions of
+blobs remotely. SegmentStore instead appends each result as one record to
+a large segment file:
+
+    {root}/{writer}-{seq}.seg    records, appended by a single writer
+    {root}/{writer}-{seq}.idx    offset index, written when the segment is sealed
+
+A record is a fixed header followed by its key, a JSON metadata document
+and the concatenated blobs:
+
+    magic | key_len | meta_len | body_len | timestamp_ns | crc32  (32 bytes)
+
+Every store instance appends to segments of its own (named after a random
+writer id), so the worker processes sharing a storage directory never write
+to the same file. A segment is sealed once it reaches `segment_bytes` or
+has been idle for a while: it is fsync'ed, its index is written next to it
+and `on_seal` is called (ProvenanceStore uploads the pair as two blobs).
+Records are not fsync'ed individually; a record torn by a crash fails its
+CRC check and reads as a miss.
+
+Readers keep an in-memory index of key -> location. Sealed segments are
+indexed from their .idx files, open segments of other writers by scanning
+record headers from where the last scan stopped. When a key was written
+more than once, the newest record wins.
+
+Compaction rewrites the live records of sealed segments that are mostly
+dead (superseded), of small segments and of open segments abandoned by
+crashed writers into a new sealed segment, then deletes the originals. It
+runs in a background thread after a segment is sealed, guarded by a lock
+file so that one process compacts at a time. Readers that find a segment
+gone rebuild their index.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .storage_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+RECORD_MAGIC = b"MSEG"
+_HEADER = struct.Struct("<4sIIQqI")  # magic, key_len, meta_len, body_len, timestamp_ns, crc32
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+INDEX_VERSION = 1
+
+
+class _Entry(NamedTuple):
+    """Location of a record."""
+
+    segment: str  # Segment file name
+    offset: int
+    key_len: int
+    meta_len: int
+    body_len: int
+    timestamp_ns: int
+
+    @property
+    def length(self) -> int:
+        return _HEADER.size + self.key_len + self.meta_len + self.body_len
+
+
+@dataclass
+class _Segment:
+    """Reader-side state of one segment file."""
+
+    sealed: bool
+    scanned: int = 0  # Bytes of an open segment indexed so far
+
+
+class _Writer:
+    """Append handle on the segment this store writes to."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        self.size = 0
+        self.entries: list[tuple[str, _Entry]] = []
+        self.last_write = time.monotonic()
+
+    def append(self, buffers: list[bytes]) -> int:
+        """Write buffers at the end of the segment; returns their offset."""
+        offset = self.size
+        pending = [memoryview(b) for b in buffers if b]
+        while pending:
+            written = os.writev(self.fd, pending)
+            self.size += written
+            while pending and written >= len(pending[0]):
+                written -= len(pending.pop(0))
+            if written:
+                pending[0] = pending[0][written:]
+        self.last_write = time.monotonic()
+        return offset
+
+    def close(self, sync: bool) -> None:
+        if sync:
+            os.fsync(self.fd)
+        os.close(self.fd)
+
+
+class SegmentStore:
+    """Key -> (metadata, blobs) store appending records to packed segment files."""
+
+    def __init__(
+        self,
+        root: Path | str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        idle_seconds: float = 600.0,
+        refresh_interval: float = 1.0,
+        auto_compact: bool = True,
+        on_seal: Callable[[Path, Path], None] | None = None,
+        on_remove: Callable[[Path, Path], None] | None = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the segment files
+            segment_bytes: Seal a segment once it grows past this size
+            idle_seconds: Seal a segment that has not been written to for this
+                long before appending to it again; compaction treats open
+                segments untouched for twice as long as abandoned
+            refresh_interval: Minimum seconds between directory rescans when
+                looking for records written by other processes
+            auto_compact: Compact in a background thread after sealing
+            on_seal: Called with (segment, index) paths after a segment is sealed
+            on_remove: Called with (segment, index) paths after compaction
+                deleted a segment
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.idle_seconds = idle_seconds
+        self.refresh_interval = refresh_interval
+        self.auto_compact = auto_compact
+        self.on_seal = on_seal
+        self.on_remove = on_remove
+
+        self.writer_id = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._writer: _Writer | None = None
+        self._index: dict[str, _Entry] = {}
+        self._segments: dict[str, _Segment] = {}
+        self._refreshed = float("-inf")
+        self._lock = threading.RLock()
+        self._compactor: threading.Thread | None = None
+
+    # Writing
+
+    def put(self, key: str, meta: dict[str, Any], blobs: dict[str, bytes]) -> int:
+        """Append a record, superseding any earlier record for the key.
+
+        Args:
+            key: Record key
+            meta: JSON-serializable metadata; the blob names and sizes are
+                added under "blobs"
+            blobs: Named binary payloads
+
+        Returns:
+            Size of the record in bytes
+        """
+        meta = {**meta, "blobs": {name: len(data) for name, data in blobs.items()}}
+        key_bytes = key.encode("utf-8")
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        body = list(blobs.values())
+        body_len = sum(len(b) for b in body)
+
+        crc = zlib.crc32(meta_bytes, zlib.crc32(key_bytes))
+        for data in body:
+            crc = zlib.crc32(data, crc)
+        timestamp_ns = time.time_ns()
+        header = _HEADER.pack(
+            RECORD_MAGIC, len(key_bytes), len(meta_bytes), body_len, timestamp_ns, crc
+        )
+
+        with self._lock:
+            writer = self._active_writer()
+            offset = writer.append([header, key_bytes, meta_bytes, *body])
+            entry = _Entry(
+                writer.path.name, offset, len(key_bytes), len(meta_bytes), body_len, timestamp_ns
+            )
+            writer.entries.append((key, entry))
+            self._index[key] = entry
+            self._segments[writer.path.name].scanned = writer.size
+            if writer.size >= self.segment_bytes:
+                self._seal()
+        return entry.length
+
+    def _active_writer(self) -> _Writer:
+        writer = self._writer
+        if writer is not None and time.monotonic() - writer.last_write > self.idle_seconds:
+            # Never append to a segment compaction may consider abandoned
+            self._seal()
+            writer = None
+        if writer is None:
+            self._seq += 1
+            writer = _Writer(self.root / f"{self.writer_id}-{self._seq:06d}.seg")
+            self._segments[writer.path.name] = _Segment(sealed=False)
+            self._writer = writer
+        return writer
+
+    def _seal(self) -> None:
+        """Sync and close the active segment and write its index."""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.close(sync=True)
+        index_path = _write_index(writer.path, writer.entries)
+        self._segments[writer.path.name].sealed = True
+        logger.debug(f"Sealed segment {writer.path.name} ({writer.size} bytes)")
+        self._notify(self.on_seal, writer.path, index_path)
+        if self.auto_compact:
+            self._start_compaction()
+
+    def flush(self) -> None:
+        """Seal the active segment, if any."""
+        with self._lock:
+            self._seal()
+
+    def close(self) -> None:
+        """Seal the active segment and wait for a running compaction."""
+        self.flush()
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    # Reading
+
+    def get(self, key: str) -> tuple[dict[str, Any], dict[str, bytes]] | None:
+        """Read a record.
+
+        Returns:
+            (metadata, blobs), or None if the key is unknown or its record is
+            damaged
+        """
+        raw = self._read(key, whole=True)
+        if raw is None:
+            return None
+        entry, data = raw
+        start = _HEADER.size + entry.key_len
+        body_start = start + entry.meta_len
+        crc = _HEADER.unpack_from(data)[5]
+        if zlib.crc32(data[_HEADER.size :]) != crc:
+            logger.warning(f"Damaged record for {key} in segment {entry.segment}")
+            return None
+
+        meta = json.loads(data[start:body_start])
+        blobs = {}
+        position = body_start
+        for name, size in meta["blobs"].items():
+            blobs[name] = bytes(data[position : position + size])
+            position += size
+        return meta, blobs
+
+    def get_meta(self, key: str) -> dict[str, Any] | None:
+        """Read only a record's metadata (without checking its CRC)."""
+        raw = self._read(key, whole=False)
+        if raw is None:
+            return None
+        entry, data = raw
+        try:
+            return json.loads(data[_HEADER.size + entry.key_len :])
+        except ValueError:
+            return None
+
+    def size(self, key: str) -> int | None:
+        """Size in bytes of the key's current record, or None if there is none."""
+        entry = self._lookup(key)
+        return None if entry is None else entry.length
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    def _lookup(self, key: str) -> _Entry | None:
+        entry = self._index.get(key)
+        if entry is None:
+            self.refresh()
+            entry = self._index.get(key)
+        return entry
+
+    def _read(self, key: str, whole: bool) -> tuple[_Entry, bytes] | None:
+        for attempt in range(2):
+            entry = self._lookup(key)
+            if entry is None:
+                return None
+            length = entry.length if whole else _HEADER.size + entry.key_len + entry.meta_len
+            try:
+                with open(self.root / entry.segment, "rb") as f:
+                    data = os.pread(f.fileno(), length, entry.offset)
+            except FileNotFoundError:
+                # Compacted away since we indexed it
+                if attempt:
+                    return None
+                self.refresh(force=True)
+                continue
+            if len(data) < length or data[:4] != RECORD_MAGIC:
+                return None
+            return entry, data
+        return None
+
+    def refresh(self, force: bool = False) -> None:
+        """Index records written by other processes since the last refresh.
+
+        Args:
+            force: Rescan even if the last refresh was less than
+                refresh_interval seconds ago
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._refreshed < self.refresh_interval:
+                return
+            self._refreshed = now
+
+            names = sorted(p.name for p in self.root.glob("*.seg"))
+            present = set(names)
+            if any(name not in present for name in self._segments):
+                # Segments were compacted away: start over
+                self._index.clear()
+                self._segments = {
+                    name: state for name, state in self._segments.items() if self._is_active(name)
+                }
+                if self._writer is not None:
+                    self._merge(self._writer.entries)
+
+            for name in names:
+                state = self._segments.get(name)
+                if state is not None and (state.sealed or self._is_active(name)):
+                    continue
+                if state is None:
+                    state = self._segments[name] = _Segment(sealed=False)
+                index_path = (self.root / name).with_suffix(".idx")
+                if index_path.exists():
+                    self._merge(_read_index(index_path))
+                    state.sealed = True
+                else:
+                    entries, state.scanned = _scan(self.root / name, state.scanned)
+                    self._merge(entries)
+
+    def _is_active(self, name: str) -> bool:
+        return self._writer is not None and self._writer.path.name == name
+
+    def _merge(self, entries: list[tuple[str, _Entry]]) -> None:
+        for key, entry in entries:
+            current = self._index.get(key)
+            if current is None or entry.timestamp_ns >= current.timestamp_ns:
+                self._index[key] = entry
+
+    # Compaction
+
+    def _start_compaction(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(
+            target=self._compact_quietly, name="modelops-segment-compaction", daemon=True
+        )
+        self._compactor.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning(f"Segment compaction failed in {self.root}: {e}")
+
+    def compact(self, min_dead_ratio: float = 0.5) -> int:
+        """Rewrite mostly-dead, small and abandoned segments into one new segment.
+
+        Args:
+            min_dead_ratio: Rewrite a sealed segment once at least this
+                fraction of its bytes belongs to superseded records
+
+        Returns:
+            Number of segments removed (0 if another process is compacting)
+        """
+        with open(self.root / ".compact.lock", "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            self.refresh(force=True)
+            with self._lock:
+                candidates = self._compaction_candidates(min_dead_ratio)
+                live = [(k, e) for k, e in self._index.items() if e.segment in candidates]
+            if not candidates:
+                return 0
+
+            merged = self._rewrite(sorted(live, key=lambda item: item[1].timestamp_ns))
+            with self._lock:
+                for key, old, new in merged:
+                    if self._index.get(key) == old:
+                        self._index[key] = new
+                for name in candidates:
+                    self._segments.pop(name, None)
+
+            for name in sorted(candidates):
+                segment_path = self.root / name
+                index_path = segment_path.with_suffix(".idx")
+                index_path.unlink(missing_ok=True)
+                segment_path.unlink(missing_ok=True)
+                self._notify(self.on_remove, segment_path, index_path)
+            logger.info(
+                f"Compacted {len(candidates)} segments into one ({len(merged)} live records)"
+            )
+            return len(candidates)
+
+    def _compaction_candidates(self, min_dead_ratio: float) -> set[str]:
+        live_bytes: dict[str, int] = {}
+        for entry in self._index.values():
+            live_bytes[entry.segment] = live_bytes.get(entry.segment, 0) + entry.length
+
+        abandoned_before = time.time() - 2 * self.idle_seconds
+        dead, small, abandoned = set(), set(), set()
+        for name, state in self._segments.items():
+            if self._is_active(name):
+                continue
+            try:
+                st = (self.root / name).stat()
+            except FileNotFoundError:
+                continue
+            if not state.sealed:
+                if st.st_mtime < abandoned_before:
+                    abandoned.add(name)
+                # Otherwise another writer may still append to it
+            elif st.st_size - live_bytes.get(name, 0) >= min_dead_ratio * st.st_size:
+                dead.add(name)
+            elif st.st_size < self.segment_bytes // 4:
+                small.add(name)
+        if len(small) < 2:
+            small = set()  # Merging a single small segment would only rename it
+        return dead | small | abandoned
+
+    def _rewrite(self, live: list[tuple[str, _Entry]]) -> list[tuple[str, _Entry, _Entry]]:
+        """Copy records verbatim into a new sealed segment."""
+        if not live:
+            return []
+        with self._lock:
+            self._seq += 1
+            path = self.root / f"{self.writer_id}-{self._seq:06d}c.seg"
+        writer = _Writer(path)
+        merged = []
+        for key, entry in live:
+            with open(self.root / entry.segment, "rb") as f:
+                data = os.pread(f.fileno(), entry.length, entry.offset)
+            if len(data) < entry.length:
+                continue
+            new = entry._replace(segment=path.name, offset=writer.append([data]))
+            writer.entries.append((key, new))
+            merged.append((key, entry, new))
+        writer.close(sync=True)
+        index_path = _write_index(path, writer.entries)
+        with self._lock:
+            self._segments[path.name] = _Segment(sealed=True, scanned=writer.size)
+        self._notify(self.on_seal, path, index_path)
+        return merged
+
+    def _notify(self, callback, segment_path: Path, index_path: Path) -> None:
+        if callback is None:
+            return
+        try:
+            callback(segment_path, index_path)
+        except Exception as e:
+            logger.warning(f"Segment callback failed for {segment_path.name}: {e}")
+
+
+def _write_index(segment_path: Path, entries: list[tuple[str, _Entry]]) -> Path:
+    index_path = segment_path.with_suffix(".idx")
+    records = [
+        [key, e.offset, e.key_len, e.meta_len, e.body_len, e.timestamp_ns] for key, e in entries
+    ]
+    content = json.dumps({"version": INDEX_VERSION, "records": records}, separators=(",", ":"))
+    atomic_write(index_path, content.encode("utf-8"))
+    return index_path
+
+
+def _read_index(index_path: Path) -> list[tuple[str, _Entry]]:
+    with open(index_path, "rb") as f:
+        data = json.load(f)
+    name = index_path.with_suffix(".seg").name
+    return [(key, _Entry(name, *location)) for key, *location in data["records"]]
+
+
+def _scan(segment_path: Path, start: int) -> tuple[list[tuple[str, _Entry]], int]:
+    """Index the complete records of an open segment from `start`.
+
+    Returns:
+        (entries, offset where scanning stopped)
+    """
+    entries = []
+    offset = start
+    try:
+        with open(segment_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            while offset + _HEADER.size <= size:
+                header = os.pread(f.fileno(), _HEADER.size, offset)
+                magic, key_len, meta_len, body_len, timestamp_ns, _ = _HEADER.unpack(header)
+                entry = _Entry(segment_path.name, offset, key_len, meta_len, body_len, timestamp_ns)
+                if magic != RECORD_MAGIC or offset + entry.length > size:
+                    break  # Being written, or torn by a crash
+                key = os.pread(f.fileno(), key_len, offset + _HEADER.size).decode("utf-8")
+                entries.append((key, entry))
+                offset += entry.length
+    except FileNotFoundError:
+        pass
+    return entries, offset
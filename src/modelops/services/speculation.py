@@ -0,0 +1,263 @@
+"""Speculative re-execution of straggling simulation tasks.
+
+Aggregations and job completion wait on the slowest replicate, so one pod on
+a noisy node or a warm process stuck in GC holds up a whole parameter set
+until rpc_timeout_seconds fires. Simulations are deterministic given their
+seed and results are stored input-addressed, so running the same task twice
+is safe.
+
+StragglerMonitor polls the scheduler from a background thread. It records
+how long tasks run per (bundle_ref, entrypoint), and when a running task
+exceeds `multiple` x the `percentile` duration of its group it submits a
+duplicate restricted to other workers. The first copy to finish wins: the
+caller's future adapter is redirected to it, the loser is cancelled, and
+aggregations that depended on the straggler are resubmitted against the
+winner.
+
+Durations are measured from the first poll that sees a task processing on a
+worker, so queueing time is excluded (to within poll_interval).
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from dask.distributed import Client
+from dask.distributed import Future as DaskFuture
+from modelops_contracts import SimTask
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SpeculationPolicy:
+    """When to launch a speculative duplicate."""
+
+    percentile: float = 0.9  # Reference duration percentile of completed tasks
+    multiple: float = 2.0  # Speculate past multiple x the reference duration
+    min_samples: int = 10  # Completed tasks needed before a group is judged
+    min_runtime: float = 5.0  # Never speculate tasks running less than this (seconds)
+    poll_interval: float = 2.0  # Seconds between scheduler polls
+    history: int = 200  # Durations kept per group
+
+    @classmethod
+    def from_env(cls) -> "SpeculationPolicy":
+        """Build a policy from MODELOPS_SPECULATION_* environment variables."""
+        return cls(
+            percentile=float(os.environ.get("MODELOPS_SPECULATION_PERCENTILE", cls.percentile)),
+            multiple=float(os.environ.get("MODELOPS_SPECULATION_MULTIPLE", cls.multiple)),
+            min_samples=int(os.environ.get("MODELOPS_SPECULATION_MIN_SAMPLES", cls.min_samples)),
+            min_runtime=float(os.environ.get("MODELOPS_SPECULATION_MIN_RUNTIME", cls.min_runtime)),
+        )
+
+
+@dataclass
+class _Tracked:
+    """A simulation future under watch."""
+
+    adapter: Any  # DaskFutureAdapter handed to the caller
+    primary: DaskFuture
+    task: SimTask
+    group: tuple[str, str]
+    submitted_at: float
+    started_at: float | None = None
+    worker: str | None = None
+    duplicate: DaskFuture | None = None
+    speculated: bool = False
+    dependents: list["_Dependent"] = field(default_factory=list)
+
+
+@dataclass
+class _Dependent:
+    """An aggregation submitted on top of tracked simulation futures."""
+
+    adapter: Any
+    sim_adapters: list[Any]
+    submit: Any  # Callable[[list[DaskFuture]], DaskFuture]
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+class StragglerMonitor:
+    """Watch simulation futures and race duplicates against stragglers."""
+
+    def __init__(self, client: Client, policy: SpeculationPolicy | None = None):
+        """Initialize the monitor.
+
+        Args:
+            client: Dask client connected to the cluster
+            policy: Speculation thresholds (defaults from environment)
+        """
+        self.client = client
+        self.policy = policy or SpeculationPolicy.from_env()
+        self.n_speculated = 0
+        self.n_won = 0
+
+        self._tracked: dict[str, _Tracked] = {}  # primary key -> tracked
+        self._durations: dict[tuple[str, str], deque] = defaultdict(
+            lambda: deque(maxlen=self.policy.history)
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def track(self, adapters: list[Any], tasks: list[SimTask]) -> None:
+        """Start watching simulation futures.
+
+        Args:
+            adapters: DaskFutureAdapters returned to the caller
+            tasks: Task behind each adapter
+        """
+        with self._lock:
+            for adapter, task in zip(adapters, tasks, strict=True):
+                self._tracked[adapter.wrapped.key] = _Tracked(
+                    adapter=adapter,
+                    primary=adapter.wrapped,
+                    task=task,
+                    group=(task.bundle_ref, str(task.entrypoint)),
+                    submitted_at=time.monotonic(),
+                )
+        self._ensure_running()
+
+    def track_dependent(self, adapter: Any, sim_adapters: list[Any], submit) -> None:
+        """Register an aggregation to resubmit if one of its inputs is replaced.
+
+        Args:
+            adapter: DaskFutureAdapter for the aggregation
+            sim_adapters: Simulation adapters the aggregation consumes
+            submit: Callable taking the current input futures, returning a new
+                aggregation future
+        """
+        dependent = _Dependent(adapter=adapter, sim_adapters=sim_adapters, submit=submit)
+        with self._lock:
+            for sim in sim_adapters:
+                tracked = self._tracked.get(sim.wrapped.key)
+                if tracked is not None:
+                    tracked.dependents.append(dependent)
+
+    def _ensure_running(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="modelops-straggler-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.policy.poll_interval)
+            try:
+                self.poll()
+            except Exception as e:
+                logger.debug(f"Straggler monitor poll failed: {e}")
+            with self._lock:
+                if not self._tracked:
+                    self._thread = None
+                    return
+
+    def poll(self) -> None:
+        """Run one monitoring pass: time tasks, resolve races, launch duplicates."""
+        now = time.monotonic()
+        processing = self.client.processing()
+        running_on = {key: worker for worker, keys in processing.items() for key in keys}
+
+        with self._lock:
+            for key, tracked in list(self._tracked.items()):
+                if tracked.duplicate is not None:
+                    if self._resolve(tracked):
+                        del self._tracked[key]
+                    continue
+
+                if tracked.primary.done():
+                    if tracked.primary.status == "finished":
+                        self._durations[tracked.group].append(self._duration(tracked, now))
+                    del self._tracked[key]
+                    continue
+
+                worker = running_on.get(key)
+                if worker is None:
+                    continue
+                if tracked.started_at is None:
+                    tracked.started_at = now
+                    tracked.worker = worker
+                    continue
+
+                if tracked.speculated:
+                    continue
+                threshold = self._threshold(tracked.group)
+                if threshold is not None and now - tracked.started_at > threshold:
+                    self._speculate(tracked, list(processing), now - tracked.started_at)
+
+    def _duration(self, tracked: _Tracked, now: float) -> float:
+        if tracked.started_at is not None:
+            return now - tracked.started_at
+        # Finished between two polls: it ran for at most one poll interval
+        return min(now - tracked.submitted_at, self.policy.poll_interval)
+
+    def _threshold(self, group: tuple[str, str]) -> float | None:
+        durations = self._durations[group]
+        if len(durations) < self.policy.min_samples:
+            return None
+        reference = _percentile(list(durations), self.policy.percentile)
+        return max(self.policy.min_runtime, self.policy.multiple * reference)
+
+    def _speculate(self, tracked: _Tracked, workers: list[str], elapsed: float) -> None:
+        from .dask_simulation import _worker_run_task
+
+        others = [w for w in workers if w != tracked.worker]
+        if not others:
+            return
+
+        tracked.speculated = True
+        tracked.duplicate = self.client.submit(
+            _worker_run_task,
+            tracked.task,
+            key=f"{tracked.primary.key}-spec-{uuid.uuid4().hex[:6]}",
+            pure=False,
+            workers=others,
+            allow_other_workers=False,
+        )
+        self.n_speculated += 1
+        logger.info(
+            f"Task {tracked.primary.key} running {elapsed:.1f}s on {tracked.worker}; "
+            f"launched speculative duplicate {tracked.duplicate.key}"
+        )
+
+    def _resolve(self, tracked: _Tracked) -> bool:
+        """Pick the winner of a primary/duplicate race once either finishes.
+
+        Returns:
+            True when the race is decided
+        """
+        primary, duplicate = tracked.primary, tracked.duplicate
+        if primary.status == "finished":
+            duplicate.cancel()
+            return True
+        if duplicate.status != "finished":
+            if duplicate.done():
+                # Duplicate failed: fall back to waiting on the primary alone
+                tracked.duplicate = None
+            return False
+
+        # Duplicate won: hand it to the caller and retire the straggler
+        self.n_won += 1
+        tracked.adapter.wrapped = duplicate
+        for dependent in tracked.dependents:
+            old = dependent.adapter.wrapped
+            if old.done():
+                continue
+            dependent.adapter.wrapped = dependent.submit(
+                [s.wrapped for s in dependent.sim_adapters]
+            )
+            old.cancel()
+        primary.cancel()
+        logger.info(f"Speculative duplicate {duplicate.key} beat {primary.key}")
+        return True
@@ -0,0 +1,167 @@
+"""Concurrent, resumable blob downloads to local files.
+
+Result views can be multi-GB, so blobs are streamed chunk by chunk straight
+to disk instead of being read into memory first. Each file is written to a
+`.part` file next to its destination and renamed into place once complete.
+
+A small sidecar (`.<name>.etag`) records the ETag and size of the blob a
+complete local file came from; it is written only after the file is renamed
+into place. A `.part` file has its own sidecar (`.<name>.part.etag`) with the
+ETag it was started against. On the next run:
+
+- a complete file whose size and sidecar ETag match the blob is skipped
+- a `.part` file started against the same ETag is resumed from its length
+- anything else is downloaded from scratch
+
+Chunks are appended in order, so the length of a `.part` file is always the
+number of contiguous bytes received and is a safe resume offset.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class BlobDownload:
+    """A blob to fetch and where to put it."""
+
+    blob_name: str
+    local_path: Path
+    size: int | None = None
+    etag: str | None = None
+
+
+@dataclass
+class DownloadOutcome:
+    """What happened to one BlobDownload."""
+
+    item: BlobDownload
+    status: str  # "downloaded", "resumed", "skipped" or "failed"
+    bytes_transferred: int = 0
+    error: str | None = None
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.etag")
+
+
+def _part_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.part")
+
+
+def _read_sidecar(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(_sidecar_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sidecar(path: Path, etag: str | None, size: int | None) -> None:
+    _sidecar_path(path).write_text(json.dumps({"etag": etag, "size": size}))
+
+
+def is_current(item: BlobDownload) -> bool:
+    """Return True when the local file already matches the blob's size and ETag."""
+    path = item.local_path
+    if item.etag is None or not path.is_file():
+        return False
+    if item.size is not None and path.stat().st_size != item.size:
+        return False
+    return _read_sidecar(path).get("etag") == item.etag
+
+
+def download_blob_to_path(container_client: Any, item: BlobDownload) -> DownloadOutcome:
+    """Stream one blob to disk, skipping or resuming where possible.
+
+    Args:
+        container_client: Azure ContainerClient holding the blob
+        item: Blob to download and its destination
+
+    Returns:
+        DownloadOutcome for the item (errors are raised, not captured)
+    """
+    path = item.local_path
+    if is_current(item):
+        return DownloadOutcome(item, "skipped")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    part = _part_path(path)
+
+    offset = 0
+    if part.exists() and item.etag is not None and _read_sidecar(part).get("etag") == item.etag:
+        offset = part.stat().st_size
+    if item.size is not None and offset > item.size:
+        offset = 0
+
+    blob_client = container_client.get_blob_client(item.blob_name)
+    kwargs: dict[str, Any] = {}
+    if item.etag is not None:
+        # Fail rather than splice bytes from a blob that changed under us
+        from azure.core import MatchConditions
+
+        kwargs = {"etag": item.etag, "match_condition": MatchConditions.IfNotModified}
+    if offset:
+        kwargs["offset"] = offset
+
+    transferred = 0
+    if item.size is None or offset < item.size:
+        stream = blob_client.download_blob(**kwargs)
+        _write_sidecar(part, item.etag, item.size)
+        with open(part, "ab" if offset else "wb") as f:
+            for chunk in stream.chunks():
+                f.write(chunk)
+                transferred += len(chunk)
+
+    # Until the new sidecar is written, the old one no longer matches the file
+    os.replace(part, path)
+    _write_sidecar(path, item.etag, item.size)
+    _sidecar_path(part).unlink(missing_ok=True)
+    return DownloadOutcome(item, "resumed" if offset else "downloaded", transferred)
+
+
+def download_blobs(
+    container_client: Any,
+    items: Iterable[BlobDownload],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_complete: Callable[[DownloadOutcome], None] | None = None,
+) -> list[DownloadOutcome]:
+    """Download many blobs concurrently.
+
+    A failed blob does not stop the others; its outcome carries the error and
+    its `.part` file is kept so the next run can resume it.
+
+    Args:
+        container_client: Azure ContainerClient holding the blobs
+        items: Blobs to download
+        max_workers: Number of blobs fetched in parallel
+        on_complete: Called from the calling thread as each blob finishes
+
+    Returns:
+        Outcomes in completion order
+    """
+    outcomes = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            pool.submit(download_blob_to_path, container_client, item): item for item in items
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to download {item.blob_name}: {e}")
+                outcome = DownloadOutcome(item, "failed", error=str(e))
+            outcomes.append(outcome)
+            if on_complete:
+                on_complete(outcome)
+    return outcomes
@@ -0,0 +1,489 @@
+"""Incremental accounting of what a ProvenanceStore holds on disk.
+
+Answering "how much is stored" or "what was stored recently" used to mean
+walking the whole storage tree and stat-ing or opening every file, which
+takes minutes on workers with millions of cached artifacts. The store now
+records each result as it is written:
+
+    {storage_dir}/_catalog/journal.jsonl   one line per stored/cleared result
+    {storage_dir}/_catalog/summary.json    counters folded up to a journal offset
+
+Counters (results, bytes and artifact files per schema, version, kind and
+bundle) are the summary plus whatever the journal added since. Readers fold
+the tail and compact it into the summary once it grows, so stats stay cheap.
+Listings read the journal backwards and stop after `limit` results.
+
+Journal lines are appended with a single O_APPEND write, so concurrent
+writers in several processes do not interleave. A missing summary means the
+catalog has no trustworthy baseline (the store predates it, or the catalog
+was deleted); rebuild() recovers it with a parallel os.scandir walk that
+only stats files. Rebuild on a quiescent store: results written during the
+walk may be missed until the next rebuild.
+
+Simulation entries also carry the result's metadata (bundle digest,
+param_id, seed, parameter values, stored output formats), so sim_index()
+can answer "which results match" without opening result directories. The
+index is cached as Parquet next to the journal and brought up to date by
+folding only the lines appended since:
+
+    {storage_dir}/_catalog/scan/{schema}-v{version}-sim.parquet
+"""
+
+import io
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .storage_utils import atomic_write
+
+if TYPE_CHECKING:
+    import polars as pl
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIR = "_catalog"
+RESULT_KINDS = {"sims": "sim", "aggs": "agg"}
+
+# Fold the journal into summary.json once this many bytes are unfolded
+COMPACT_BYTES = 1 << 20
+
+
+@dataclass
+class CatalogCounts:
+    """Running totals for one (schema, version, kind, bundle) group."""
+
+    count: int = 0
+    bytes: int = 0
+    artifacts: int = 0
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """On-disk footprint of one result directory."""
+
+    bytes: int
+    artifacts: int
+    mtime: float
+
+
+def measure(result_dir: Path | str) -> Measurement:
+    """Sum the files of one result directory with a single scandir."""
+    total = artifacts = 0
+    mtime = 0.0
+    with os.scandir(result_dir) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                continue
+            st = entry.stat(follow_symlinks=False)
+            total += st.st_size
+            mtime = max(mtime, st.st_mtime)
+            if entry.name.startswith("artifact_"):
+                artifacts += 1
+    return Measurement(total, artifacts, mtime)
+
+
+def _group(path: str) -> tuple[str, str, str, str] | None:
+    """(schema, version, kind, bundle) of a result path relative to storage_dir."""
+    parts = path.split("/")
+    if len(parts) < 5 or parts[2] not in RESULT_KINDS:
+        return None
+    return parts[0], parts[1], RESULT_KINDS[parts[2]], parts[3]
+
+
+def _reverse_lines(path: Path, block_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield the lines of a file from last to first without reading it all."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines.pop(0)
+            yield from reversed(lines)
+        yield tail
+
+
+class StorageCatalog:
+    """Journal and counters describing results under a storage directory."""
+
+    def __init__(self, storage_dir: Path | str):
+        """Initialize the catalog (nothing is read until needed).
+
+        Args:
+            storage_dir: ProvenanceStore root directory
+        """
+        self.storage_dir = Path(storage_dir)
+        self.dir = self.storage_dir / CATALOG_DIR
+        self.journal_path = self.dir / "journal.jsonl"
+        self.summary_path = self.dir / "summary.json"
+
+    # Writing
+
+    def has_baseline(self) -> bool:
+        """True when the counters account for everything in the store."""
+        return self.summary_path.exists()
+
+    def ensure_baseline(self) -> None:
+        """Start an empty baseline when the store holds nothing but the catalog.
+
+        A store with existing results and no baseline is left alone; readers
+        rebuild it on first use.
+        """
+        if self.has_baseline() or not self.storage_dir.exists():
+            return
+        with os.scandir(self.storage_dir) as it:
+            if any(entry.name != CATALOG_DIR for entry in it):
+                return
+        self._write_summary(0, {})
+
+    def record(
+        self,
+        path: str,
+        size: Measurement,
+        replaced: Measurement | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a result written to `path` (relative to storage_dir).
+
+        Args:
+            path: Result directory relative to storage_dir
+            size: Footprint after the write
+            replaced: Footprint of the result that was overwritten, if any
+            meta: Scan metadata of a simulation result (see sim_index)
+        """
+        entry: dict[str, Any] = {
+            "path": path,
+            "bytes": size.bytes - (replaced.bytes if replaced else 0),
+            "artifacts": size.artifacts - (replaced.artifacts if replaced else 0),
+            "ts": round(time.time(), 3),
+        }
+        if replaced is not None:
+            entry["replaced"] = True
+        if meta is not None:
+            entry["meta"] = meta
+        self._append(entry)
+
+    def record_clear(self, schema: str) -> None:
+        """Record that every result of a schema was deleted."""
+        self._append({"op": "clear", "schema": schema, "ts": round(time.time(), 3)})
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode()
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    # Reading
+
+    def totals(self) -> dict[tuple[str, str, str, str], CatalogCounts]:
+        """Counters per (schema, version, kind, bundle), rebuilding if needed."""
+        if not self.has_baseline():
+            return self.rebuild()
+
+        offset, counters = self._read_summary()
+        end = offset
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Partially written line; fold it next time
+                    end += len(raw)
+                    self._fold(counters, raw)
+
+        if end - offset >= COMPACT_BYTES:
+            self._write_summary(end, counters)
+        return counters
+
+    def recent(self, schema: str, version: str, kind: str, limit: int) -> list[str]:
+        """Paths of the most recently stored results of one kind, newest first."""
+        if not self.has_baseline():
+            self.rebuild()
+        if not self.journal_path.exists():
+            return []
+
+        seen: set[str] = set()
+        paths: list[str] = []
+        for raw in _reverse_lines(self.journal_path):
+            if len(paths) >= limit:
+                break
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            if entry.get("op") == "clear":
+                if entry["schema"] == schema:
+                    break
+                continue
+            path = entry["path"]
+            group = _group(path)
+            if path in seen or group is None or group[:3] != (schema, version, kind):
+                continue
+            seen.add(path)
+            paths.append(path)
+        return paths
+
+    def sim_index(self, schema: str, version: str) -> "pl.DataFrame":
+        """Metadata of every stored simulation result of one schema version.
+
+        One row per result with columns path, bundle_digest, param_id, seed,
+        "params.<name>" per parameter and "output.<name>" per stored output
+        (its format: "parquet", "arrow" or "segment"). Results cataloged
+        before entries carried metadata are described from their
+        metadata.json, once, when they are first indexed.
+
+        Args:
+            schema: Schema name
+            version: Schema version directory (e.g. "v1")
+
+        Returns:
+            Polars DataFrame, in storage order
+        """
+        import polars as pl
+
+        if not self.has_baseline():
+            self.rebuild()
+        cache = self.dir / "scan" / f"{schema}-{version}-sim.parquet"
+        state_path = cache.with_suffix(".json")
+        journal_id = self._journal_id()
+
+        frame = None
+        offset = 0
+        try:
+            state = json.loads(state_path.read_text())
+            if state["journal"] == journal_id:
+                frame = pl.read_parquet(cache)
+                offset = state["offset"]
+        except (OSError, ValueError, KeyError):
+            pass  # No usable cache; index the whole journal
+
+        rows, end, cleared = self._sim_rows(schema, version, offset)
+        if cleared:
+            frame = None
+        if rows:
+            new = pl.DataFrame(rows, infer_schema_length=None, strict=False)
+            if frame is not None:
+                new = pl.concat([frame, new], how="diagonal_relaxed")
+            frame = new.unique("path", keep="last", maintain_order=True)
+        if frame is None:
+            frame = pl.DataFrame(
+                schema={
+                    "path": pl.String,
+                    "bundle_digest": pl.String,
+                    "param_id": pl.String,
+                    "seed": pl.Int64,
+                }
+            )
+
+        if end != offset or cleared:
+            buffer = io.BytesIO()
+            frame.write_parquet(buffer)
+            atomic_write(cache, buffer.getvalue())
+            atomic_write(state_path, json.dumps({"journal": journal_id, "offset": end}).encode())
+        return frame
+
+    def _journal_id(self) -> int | None:
+        """Identity of the journal file; rebuild() replaces it with a new one."""
+        try:
+            return os.stat(self.journal_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _sim_rows(
+        self, schema: str, version: str, offset: int
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """Index rows from journal lines after `offset`: (rows, end offset, cleared)."""
+        rows: dict[str, dict[str, Any]] = {}
+        cleared = False
+        end = offset
+        if not self.journal_path.exists():
+            return [], end, cleared
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Partially written line; index it next time
+                end += len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    continue
+                if entry.get("op") == "clear":
+                    if entry["schema"] == schema:
+                        rows.clear()
+                        cleared = True
+                    continue
+                group = _group(entry["path"])
+                if group is None or group[:3] != (schema, version, "sim"):
+                    continue
+                meta = entry.get("meta") or self._legacy_meta(entry["path"])
+                if meta is None:
+                    continue
+                row = {
+                    "path": entry["path"],
+                    "bundle_digest": meta["bundle_digest"],
+                    "param_id": meta["param_id"],
+                    "seed": meta["seed"],
+                }
+                row.update({f"params.{k}": v for k, v in meta["params"].items()})
+                row.update({f"output.{k}": v for k, v in meta["outputs"].items()})
+                rows.pop(entry["path"], None)  # The latest write of a path wins
+                rows[entry["path"]] = row
+        return list(rows.values()), end, cleared
+
+    def _legacy_meta(self, path: str) -> dict[str, Any] | None:
+        """Scan metadata of a result cataloged without it, from its directory."""
+        result_dir = self.storage_dir / path
+        try:
+            metadata = json.loads((result_dir / "metadata.json").read_text())
+            names = os.listdir(result_dir)
+        except (OSError, ValueError):
+            return None
+        outputs = {}
+        for name in names:
+            stem, _, suffix = name.partition(".")
+            if stem.startswith("artifact_") and suffix in ("parquet", "arrow"):
+                output = stem[len("artifact_") :]
+                if outputs.get(output) != "parquet":
+                    outputs[output] = suffix
+        bundle_ref = metadata.get("bundle_ref", "")
+        return {
+            "bundle_digest": bundle_ref.split(":", 1)[-1],
+            "param_id": metadata.get("param_id"),
+            "seed": metadata.get("seed"),
+            "params": metadata.get("params") or {},
+            "outputs": outputs,
+        }
+
+    @staticmethod
+    def _fold(counters: dict, raw: bytes) -> None:
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return
+        if entry.get("op") == "clear":
+            for key in [k for k in counters if k[0] == entry["schema"]]:
+                del counters[key]
+            return
+        group = _group(entry["path"])
+        if group is None:
+            return
+        counts = counters.setdefault(group, CatalogCounts())
+        if not entry.get("replaced"):
+            counts.count += 1
+        counts.bytes += entry["bytes"]
+        counts.artifacts += entry["artifacts"]
+
+    def _read_summary(self) -> tuple[int, dict[tuple[str, str, str, str], CatalogCounts]]:
+        data = json.loads(self.summary_path.read_text())
+        counters = {
+            tuple(row[:4]): CatalogCounts(*row[4:]) for row in data.get("counters", [])
+        }
+        return data["journal_offset"], counters
+
+    def _write_summary(self, offset: int, counters: dict) -> None:
+        data = {
+            "journal_offset": offset,
+            "counters": [
+                [*key, c.count, c.bytes, c.artifacts] for key, c in sorted(counters.items())
+            ],
+            "updated_at": time.time(),
+        }
+        atomic_write(self.summary_path, json.dumps(data).encode())
+
+    # Recovery
+
+    def rebuild(
+        self, max_workers: int | None = None
+    ) -> dict[tuple[str, str, str, str], CatalogCounts]:
+        """Recreate journal and counters from what is on disk.
+
+        Walks {schema}/v{version}/{sims,aggs}/{bundle}/ trees in parallel, one
+        bundle per task, with os.scandir. Only directory entries are read and
+        files are stat-ed; no result file is opened.
+
+        Args:
+            max_workers: Threads walking bundles in parallel
+
+        Returns:
+            The rebuilt counters
+        """
+        started = time.monotonic()
+        roots = list(self._bundle_roots())
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            found = [r for results in pool.map(self._walk_bundle, roots) for r in results]
+
+        # Oldest first, so listings read newest results from the journal tail
+        found.sort(key=lambda r: r[1].mtime)
+        counters: dict[tuple[str, str, str, str], CatalogCounts] = {}
+        lines = []
+        for path, size in found:
+            counts = counters.setdefault(_group(path), CatalogCounts())
+            counts.count += 1
+            counts.bytes += size.bytes
+            counts.artifacts += size.artifacts
+            entry = {
+                "path": path,
+                "bytes": size.bytes,
+                "artifacts": size.artifacts,
+                "ts": round(size.mtime, 3),
+            }
+            lines.append(json.dumps(entry, separators=(",", ":")) + "\n")
+
+        journal = "".join(lines).encode()
+        atomic_write(self.journal_path, journal)
+        self._write_summary(len(journal), counters)
+        logger.info(
+            f"Rebuilt storage catalog: {len(found)} results in {len(roots)} bundles "
+            f"({time.monotonic() - started:.1f}s)"
+        )
+        return counters
+
+    def _bundle_roots(self) -> Iterator[Path]:
+        if not self.storage_dir.exists():
+            return
+        for schema in os.scandir(self.storage_dir):
+            if schema.name == CATALOG_DIR or not schema.is_dir():
+                continue
+            for version in os.scandir(schema.path):
+                if not version.is_dir():
+                    continue
+                for kind in RESULT_KINDS:
+                    kind_dir = Path(version.path) / kind
+                    if kind_dir.is_dir():
+                        yield from (Path(b.path) for b in os.scandir(kind_dir) if b.is_dir())
+
+    def _walk_bundle(self, root: Path) -> list[tuple[str, Measurement]]:
+        found = []
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            is_result = False
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name == "metadata.json":
+                            is_result = True
+            except OSError as e:
+                logger.warning(f"Skipping {current} during catalog rebuild: {e}")
+                continue
+            if is_result:
+                rel = os.path.relpath(current, self.storage_dir).replace(os.sep, "/")
+                found.append((rel, measure(current)))
+            stack.extend(subdirs)
+        return found
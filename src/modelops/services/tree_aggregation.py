@@ -0,0 +1,91 @@
+"""Tree reduction of aggregations over large replicate sets.
+
+A regular aggregation ships every replicate of a parameter set to one worker
+and hands them to the target in a single JSON-RPC call. For hundreds of
+replicates that worker is a network hotspot and the call is the job's
+critical path.
+
+Likelihood targets do not need all replicates in one place: the loss is
+-(logsumexp(loglik_per_rep) - log R), and (logsumexp, R) over a group of
+replicates is a sufficient statistic that combines exactly. With a fan-in k,
+DaskSimulationService evaluates the target on groups of k replicates (Dask
+runs each group where most of its replicates already are), combines the small
+PartialAggregations k at a time, and finishes with the loss at the root.
+
+Targets that only return a loss cannot be split; their leaves fail with an
+error saying so. Enable tree reduction only for jobs whose targets return
+per-replicate log-likelihoods.
+"""
+
+import hashlib
+import math
+import os
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PartialAggregation:
+    """Sufficient statistics of a likelihood target over a group of replicates."""
+
+    logsumexp: float  # logsumexp of the group's per-replicate log-likelihoods
+    n_replicates: int
+    task_ids: tuple[str, ...]  # SimReturn task_ids, in replicate order
+
+    @classmethod
+    def from_logliks(cls, loglik_per_rep: Sequence[float], task_ids: Sequence[str]):
+        """Summarize one group's per-replicate log-likelihoods."""
+        if len(loglik_per_rep) != len(task_ids):
+            raise ValueError(
+                f"Got {len(loglik_per_rep)} log-likelihoods for {len(task_ids)} replicates"
+            )
+        return cls(_logsumexp(loglik_per_rep), len(loglik_per_rep), tuple(task_ids))
+
+    @classmethod
+    def combine(cls, parts: Iterable["PartialAggregation"]) -> "PartialAggregation":
+        """Merge summaries of disjoint groups, keeping replicate order."""
+        parts = list(parts)
+        if not parts:
+            raise ValueError("Nothing to combine")
+        return cls(
+            logsumexp=_logsumexp([p.logsumexp for p in parts]),
+            n_replicates=sum(p.n_replicates for p in parts),
+            task_ids=tuple(tid for p in parts for tid in p.task_ids),
+        )
+
+    @property
+    def loss(self) -> float:
+        """Negative log of the mean replicate likelihood, as for a single aggregation."""
+        return -(self.logsumexp - math.log(self.n_replicates))
+
+
+def _logsumexp(values: Sequence[float]) -> float:
+    peak = max(values)
+    if math.isinf(peak):
+        return peak
+    return peak + math.log(sum(math.exp(v - peak) for v in values))
+
+
+def reduction_groups[T](items: Sequence[T], fan_in: int) -> list[list[T]]:
+    """Split items into consecutive groups of at most fan_in."""
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    return [list(items[i : i + fan_in]) for i in range(0, len(items), fan_in)]
+
+
+def tree_aggregation_id(bundle_ref: str, target_entrypoint: Any, task_ids: Sequence[str]) -> str:
+    """Identifier of a tree-reduced aggregation over the given replicates."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (bundle_ref, str(target_entrypoint), *task_ids):
+        h.update(part.encode())
+        h.update(b"\0")
+    return f"tree-{h.hexdigest()}"
+
+
+def tree_fan_in_from_env() -> int:
+    """Fan-in from MODELOPS_AGG_TREE_FANIN; 0 (the default) disables tree reduction."""
+    fan_in = int(os.environ.get("MODELOPS_AGG_TREE_FANIN", "0") or 0)
+    if fan_in == 1 or fan_in < 0:
+        raise ValueError(f"MODELOPS_AGG_TREE_FANIN must be 0 (off) or at least 2, got {fan_in}")
+    return fan_in
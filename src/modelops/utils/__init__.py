@@ -1,5 +1,5 @@
 """ModelOps utilities."""
 
-from .seeds import derive_replicate_seeds
+from .seeds import derive_replicate_seeds, derive_seed_array
 
-__all__ = ["derive_replicate_seeds"]
+__all__ = ["derive_replicate_seeds", "derive_seed_array"]
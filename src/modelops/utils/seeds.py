@@ -5,6 +5,11 @@ that comply with the modelops-contracts uint64 requirement.
 """
 
 import hashlib
+from collections.abc import Sequence
+
+import numpy as np
+
+SEED_NAMESPACE = "contracts:seed:v1"
 
 
 def derive_replicate_seeds(param_id: str, n_replicates: int) -> list[int]:
@@ -29,19 +34,46 @@ def derive_replicate_seeds(param_id: str, n_replicates: int) -> list[int]:
         >>> all(0 <= s < 2**64 for s in seeds)
         True
     """
-    seeds = []
-    for i in range(n_replicates):
-        # Create unique string for this param_id and replicate
-        seed_str = f"contracts:seed:v1|{param_id}:{i}"
+    return derive_seed_array([param_id], n_replicates).tolist()
+
+
+def derive_seed_array(param_ids: Sequence[str], n_replicates: int | Sequence[int]) -> np.ndarray:
+    """Derive replicate seeds for many parameter sets at once.
+
+    Bit-compatible with derive_replicate_seeds: the result is
+    derive_replicate_seeds(param_id, n) for each param_id, concatenated. Each
+    param_id's hash prefix is absorbed once and copied per replicate, and the
+    digests are decoded in a single NumPy call instead of one int per seed.
 
-        # Use BLAKE2b with 8-byte output for uint64 range
-        seed_bytes = hashlib.blake2b(seed_str.encode("utf-8"), digest_size=8).digest()
+    Args:
+        param_ids: Parameter set IDs
+        n_replicates: Replicates per parameter set, one count for all or one each
 
-        # Convert to integer within uint64 range
-        seed = int.from_bytes(seed_bytes, "little") & ((1 << 64) - 1)
-        seeds.append(seed)
+    Returns:
+        uint64 array of sum(n_replicates) seeds; with a single count it can be
+        reshaped to (len(param_ids), n_replicates)
 
-    return seeds
+    Example:
+        >>> seeds = derive_seed_array(["abc123", "def456"], 3)
+        >>> seeds.reshape(2, 3)[0].tolist() == derive_replicate_seeds("abc123", 3)
+        True
+    """
+    counts = [n_replicates] * len(param_ids) if isinstance(n_replicates, int) else n_replicates
+    if len(counts) != len(param_ids):
+        raise ValueError(f"Got {len(counts)} replicate counts for {len(param_ids)} param_ids")
+
+    suffixes = [str(i).encode() for i in range(max(counts, default=0))]
+    digests = []
+    for param_id, n in zip(param_ids, counts, strict=True):
+        # The hashed string is "{SEED_NAMESPACE}|{param_id}:{replicate index}"
+        prefix = hashlib.blake2b(f"{SEED_NAMESPACE}|{param_id}:".encode(), digest_size=8)
+        for suffix in suffixes[:n]:
+            h = prefix.copy()
+            h.update(suffix)
+            digests.append(h.digest())
+
+    # Each 8-byte digest is a little-endian uint64
+    return np.frombuffer(b"".join(digests), dtype="<u8").astype(np.uint64)
 
 
 def derive_single_seed(param_id: str, replicate_index: int = 0) -> int:
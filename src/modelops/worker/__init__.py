@@ -4,10 +4,24 @@ This module implements the WorkerPlugin architecture for clean
 lifecycle management and dependency injection.
 """
 
-from .config import RuntimeConfig
-from .plugin import ModelOpsWorkerPlugin
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attrs
+
+if TYPE_CHECKING:
+    from .config import RuntimeConfig
+    from .plugin import ModelOpsWorkerPlugin
+
+# Imported on first access, so the light modules of this package (framing,
+# jsonrpc, config) can be used without loading dask
+_LAZY_ATTRS = {
+    "ModelOpsWorkerPlugin": ".plugin",
+    "RuntimeConfig": ".config",
+}
 
 __all__ = [
     "ModelOpsWorkerPlugin",
     "RuntimeConfig",
 ]
+
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,104 @@
+"""Cooperative cancellation for tasks running in warm subprocesses.
+
+A CancelToken is bound to the thread executing a task with cancel_scope().
+WarmProcessManager picks it up with current_token() and passes it to the
+JSON-RPC client, which sends a `cancel` notification when the token fires.
+The subprocess runner then interrupts the wire function (or kills the forked
+task child) and answers the request, so the warm process stays in the pool.
+
+On Dask workers, dask_task_scope() fires the token when the scheduler cancels
+or releases the running task, e.g. because its future was cancelled or the
+job runner that owned it went away.
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class CancelToken(threading.Event):
+    """Event that records why it was set."""
+
+    def __init__(self):
+        super().__init__()
+        self.reason: str | None = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation of the task holding this token."""
+        if not self.is_set():
+            self.reason = reason
+            self.set()
+
+
+class TaskCancelledError(Exception):
+    """Raised when a task was cancelled before it produced a result."""
+
+
+_current: contextvars.ContextVar[CancelToken | None] = contextvars.ContextVar(
+    "modelops_cancel_token", default=None
+)
+
+
+def current_token() -> CancelToken | None:
+    """Return the cancel token bound to the running task, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """Bind a cancel token to the current thread's task."""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+# Worker task states in which a running task's result is no longer wanted
+_ABANDONED_STATES = {"cancelled", "released", "forgotten"}
+
+
+@contextlib.contextmanager
+def dask_task_scope(poll_interval: float = 1.0) -> Iterator[CancelToken]:
+    """Cancel scope that fires when Dask abandons the task running this thread.
+
+    Must be entered from inside a task on a Dask worker. Outside a worker the
+    scope is inert.
+
+    Args:
+        poll_interval: Seconds between checks of the task's worker-side state
+    """
+    from distributed import get_worker
+    from distributed.worker import thread_state
+
+    token = CancelToken()
+    try:
+        worker = get_worker()
+        key = thread_state.key
+    except (ValueError, AttributeError):
+        with cancel_scope(token):
+            yield token
+        return
+
+    done = threading.Event()
+
+    def watch() -> None:
+        while not done.wait(poll_interval):
+            ts = worker.state.tasks.get(key)
+            state = ts.state if ts is not None else "forgotten"
+            if state in _ABANDONED_STATES:
+                logger.info(f"Task {key} is {state} on the worker; cancelling subprocess work")
+                token.cancel(f"dask task {state}")
+                return
+
+    watcher = threading.Thread(target=watch, name=f"cancel-watch-{key}", daemon=True)
+    watcher.start()
+    try:
+        with cancel_scope(token):
+            yield token
+    finally:
+        done.set()
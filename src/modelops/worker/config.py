@@ -26,13 +26,16 @@ class RuntimeConfig:
     azure_connection_string: str | None = None  # Optional explicit connection string
 
     # Execution environment
-    executor_type: str = "isolated_warm"  # "isolated_warm", "direct"
+    executor_type: str = "isolated_warm"  # "isolated_warm", "fork_server", "direct", "cold"
     venvs_dir: str = "/tmp/modelops/venvs"
     storage_dir: str = "/tmp/modelops/provenance"  # Provenance storage location
+    shared_storage: bool = False  # storage_dir is a volume the job runner mounts too
     max_warm_processes: int = 128
     mem_limit_bytes: int | None = None
     inline_artifact_max_bytes: int = 64_000  # Artifacts smaller than this are inlined
     rpc_timeout_seconds: int = 30 * 60  # Max time waiting for JSON-RPC responses
+    venv_store_dir: str | None = None  # Node-level venv/wheel cache shared across pods
+    venv_store_ttl_days: float = 14.0  # Remove venv templates unused for this long
 
     # Process pool configuration
     force_fresh_venv: bool = False  # Never reuse venvs (for debugging)
@@ -83,6 +86,9 @@ class RuntimeConfig:
         )
         config.venvs_dir = os.environ.get("MODELOPS_VENVS_DIR", config.venvs_dir)
         config.storage_dir = os.environ.get("MODELOPS_STORAGE_DIR", config.storage_dir)
+        config.shared_storage = (
+            os.environ.get("MODELOPS_SHARED_STORAGE", "false").lower() == "true"
+        )
         config.max_warm_processes = int(
             os.environ.get("MODELOPS_MAX_WARM_PROCESSES", config.max_warm_processes)
         )
@@ -93,6 +99,11 @@ class RuntimeConfig:
             os.environ.get("MODELOPS_RPC_TIMEOUT_SECONDS", config.rpc_timeout_seconds)
         )
 
+        config.venv_store_dir = os.environ.get("MODELOPS_VENV_STORE_DIR", config.venv_store_dir)
+        config.venv_store_ttl_days = float(
+            os.environ.get("MODELOPS_VENV_STORE_TTL_DAYS", config.venv_store_ttl_days)
+        )
+
         mem_limit = os.environ.get("MODELOPS_MEM_LIMIT_BYTES")
         if mem_limit:
             config.mem_limit_bytes = int(mem_limit)
@@ -113,6 +124,15 @@ class RuntimeConfig:
 
         return config
 
+    def azure_backend(self) -> dict | None:
+        """ProvenanceStore azure_backend settings, or None if uploads are disabled."""
+        if not self.upload_to_azure:
+            return None
+        return {
+            "container": self.azure_container,
+            "connection_string": self.azure_connection_string,
+        }
+
     def validate(self) -> None:
         """Validate configuration.
 
@@ -140,9 +160,10 @@ class RuntimeConfig:
                 )
 
         # Executor type validation
-        if self.executor_type not in ["isolated_warm", "direct", "cold"]:
+        if self.executor_type not in ["isolated_warm", "fork_server", "direct", "cold"]:
             raise ValueError(
                 f"Invalid executor_type: {self.executor_type}. "
                 f"Valid options: isolated_warm (warm pool, fast), "
+                f"fork_server (warm template, fresh fork per task), "
                 f"direct (no pool, in-process), cold (fresh process per task, slowest)"
             )
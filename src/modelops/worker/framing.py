@@ -0,0 +1,271 @@
+"""Content-Length framing and message codecs for the worker/runner protocol.
+
+Shared by modelops.worker.jsonrpc (parent side) and subprocess_runner.py
+(inside bundle venvs). The runner cannot import modelops, so this module
+must stay standalone: stdlib only, with msgpack and orjson used when they
+happen to be importable. The runner loads it by file path.
+
+Frames look like LSP messages:
+
+    Content-Length: 1234\\r\\n
+    Content-Type: application/msgpack\\r\\n      (only for msgpack bodies)
+    \\r\\n
+    <body>
+
+Reading goes through a reusable buffer filled with readinto(), so headers
+cost one read per buffer rather than one syscall per byte on the parent's
+unbuffered pipes, and a body is copied once into its final buffer. Writes
+send header and body with a single writev() when the stream is a pipe.
+
+Codecs:
+    json     Always available. Decoded with orjson when installed (falling
+             back to the stdlib for NaN/Infinity literals and big integers),
+             encoded with the stdlib, since orjson turns NaN into null.
+    msgpack  Binary, used when both sides have msgpack installed and the
+             parent offered it during the "ready" handshake. Messages that
+             msgpack cannot represent (e.g. integers beyond 64 bits) are sent
+             as json frames; frames are always decoded by their Content-Type.
+"""
+
+import json
+import os
+from typing import Any, BinaryIO
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSON = "json"
+MSGPACK = "msgpack"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class FrameError(ValueError):
+    """A frame could not be read or decoded."""
+
+
+def available_codecs() -> list[str]:
+    """Codecs this process can use, most preferred first."""
+    return [MSGPACK, JSON] if msgpack is not None else [JSON]
+
+
+def choose_codec(offered: list[str] | None) -> str:
+    """Pick the preferred codec both sides support (json if none is shared)."""
+    for codec in available_codecs():
+        if offered and codec in offered:
+            return codec
+    return JSON
+
+
+def encode(message: Any, codec: str = JSON) -> tuple[bytes, str | None]:
+    """Serialize a message.
+
+    Returns:
+        (body, content type); the content type is None for json bodies
+    """
+    if codec == MSGPACK and msgpack is not None:
+        try:
+            return msgpack.packb(message, use_bin_type=True), MSGPACK_CONTENT_TYPE
+        except (OverflowError, TypeError, ValueError):
+            pass  # Not representable in msgpack; send this one as json
+    return json.dumps(message, separators=(",", ":")).encode("utf-8"), None
+
+
+def decode(body: bytes | bytearray, content_type: str | None = None) -> Any:
+    """Deserialize a frame body according to its Content-Type header.
+
+    Raises:
+        FrameError: If the body is not valid for its codec
+    """
+    if content_type and content_type.startswith(MSGPACK_CONTENT_TYPE):
+        if msgpack is None:
+            raise FrameError("Received a msgpack frame but msgpack is not installed")
+        try:
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        except Exception as e:
+            raise FrameError(f"Invalid msgpack: {e}") from e
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity or big integers; the stdlib decides
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise FrameError(f"Invalid JSON: {e}") from e
+
+
+class FrameReader:
+    """Reads Content-Length frames from a binary stream through a reusable buffer.
+
+    The reader may buffer bytes past the end of a frame, so all frames of a
+    stream must be read through the same FrameReader.
+    """
+
+    def __init__(self, stream: BinaryIO, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """Initialize the reader.
+
+        Args:
+            stream: Binary stream to read from
+            buffer_size: Size of the read buffer (also the longest header line)
+        """
+        self.stream = stream
+        self._buf = bytearray(buffer_size)
+        self._start = 0  # First unconsumed byte
+        self._end = 0  # End of the bytes read so far
+        self._readinto = None
+
+    @property
+    def buffered(self) -> int:
+        """Bytes already read from the stream but not yet consumed."""
+        return self._end - self._start
+
+    def _read_into(self, target: memoryview) -> int:
+        """Read at most len(target) bytes with a single call on the stream."""
+        if self._readinto is None:
+            # readinto1 on buffered streams makes at most one raw read
+            self._readinto = getattr(self.stream, "readinto1", None) or self.stream.readinto
+        return self._readinto(target) or 0
+
+    def _fill(self) -> int:
+        """Read more bytes into the buffer; returns how many (0 at EOF)."""
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buf):
+            if self._start == 0:
+                raise FrameError(f"Invalid header: line exceeds {len(self._buf)} bytes")
+            # Move the unconsumed tail to the front
+            pending = self._end - self._start
+            self._buf[:pending] = self._buf[self._start : self._end]
+            self._start, self._end = 0, pending
+        with memoryview(self._buf) as view:
+            n = self._read_into(view[self._end :])
+        self._end += n
+        return n
+
+    def _read_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while True:
+            newline = self._buf.find(b"\n", self._start, self._end)
+            if newline < 0:
+                if self._fill():
+                    continue
+                if not headers and self._start == self._end:
+                    raise EOFError("Stream closed while reading headers")
+                partial = bytes(self._buf[self._start : self._end])
+                raise FrameError(f"Incomplete header: {partial[:40]!r}")
+
+            line = bytes(self._buf[self._start : newline]).rstrip(b"\r")
+            self._start = newline + 1
+            if not line:
+                # Blank line (CRLF or LF) ends the headers
+                return headers
+            try:
+                text = line.decode("utf-8")
+            except UnicodeDecodeError:
+                raise FrameError(f"Invalid header encoding: {line[:20]!r}") from None
+            if ":" not in text:
+                raise FrameError(f"Invalid header: {text}")
+            key, value = text.split(":", 1)
+            # Lowercase keys for case-insensitive lookup
+            headers[key.strip().lower()] = value.strip()
+
+    def read_frame(self) -> tuple[dict[str, str], bytes | bytearray]:
+        """Read one frame.
+
+        Returns:
+            (headers with lowercase keys, body)
+
+        Raises:
+            EOFError: If the stream is closed before a frame starts
+            FrameError: If the frame is malformed or truncated
+        """
+        headers = self._read_headers()
+        if "content-length" not in headers:
+            raise FrameError("Missing Content-Length header")
+        try:
+            length = int(headers["content-length"])
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            raise FrameError(f"Invalid Content-Length: {headers['content-length']}") from None
+
+        buffered = self._end - self._start
+        if buffered >= length:
+            body = bytes(self._buf[self._start : self._start + length])
+            self._start += length
+            return headers, body
+
+        # Copy what is buffered, then read the rest straight into the body
+        body = bytearray(length)
+        with memoryview(self._buf) as src:
+            body[:buffered] = src[self._start : self._end]
+        self._start = self._end = 0
+        received = buffered
+        with memoryview(body) as view:
+            while received < length:
+                n = self._read_into(view[received:])
+                if not n:
+                    raise FrameError(
+                        f"Incomplete message: expected {length} bytes, got {received}"
+                    )
+                received += n
+        return headers, body
+
+
+def _pipe_fileno(stream: BinaryIO) -> int | None:
+    """File descriptor to writev() to, or None to use the stream's own write()."""
+    if not hasattr(os, "writev"):
+        return None
+    try:
+        # Only for pipes and sockets; writing behind a seekable stream's back
+        # would desynchronize its position
+        if stream.seekable():
+            return None
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _writev_all(fd: int, buffers: list[bytes]) -> None:
+    pending = [memoryview(b) for b in buffers if b]
+    while pending:
+        written = os.writev(fd, pending)
+        while pending and written >= len(pending[0]):
+            written -= len(pending.pop(0))
+        if written:
+            pending[0] = pending[0][written:]
+
+
+def write_frame(stream: BinaryIO, body: bytes, content_type: str | None = None) -> None:
+    """Write one frame and flush it.
+
+    Header and body go out in one writev() call on pipes; other streams get
+    two write() calls and a flush. Callers serialize concurrent writers.
+
+    Args:
+        stream: Binary stream to write to
+        body: Encoded message
+        content_type: Content-Type header value, omitted if None
+    """
+    header = f"Content-Length: {len(body)}\r\n"
+    if content_type:
+        header += f"Content-Type: {content_type}\r\n"
+    header_bytes = (header + "\r\n").encode("ascii")
+
+    fd = _pipe_fileno(stream)
+    if fd is None:
+        stream.write(header_bytes)
+        stream.write(body)
+        stream.flush()
+        return
+    stream.flush()  # Anything already buffered goes first
+    _writev_all(fd, [header_bytes, body])
@@ -1,17 +1,25 @@
 """Minimal JSON-RPC implementation for subprocess communication.
 
 Uses Content-Length framing like Language Server Protocol for robust
-message boundary detection over stdio pipes.
+message boundary detection over stdio pipes. Framing and codecs live in
+framing.py, which the subprocess runner shares.
 """
 
 import logging
 import queue
 import sys
 import threading
+import time
 from typing import Any, BinaryIO, Dict
 
+from .framing import JSON, FrameError, FrameReader, available_codecs, decode, encode, write_frame
+
 logger = logging.getLogger(__name__)
 
+# Error codes the subprocess runner uses when it stops a request on our behalf
+REQUEST_CANCELLED = -32800
+DEADLINE_EXCEEDED = -32002
+
 
 class JSONRPCError(Exception):
     """Base exception for JSON-RPC errors."""
@@ -23,6 +31,21 @@ class JSONRPCError(Exception):
         super().__init__(f"JSON-RPC Error {code}: {message}")
 
 
+class RequestCancelledError(JSONRPCError):
+    """The subprocess stopped a request after a cancel notification.
+
+    The subprocess acknowledged the cancellation and is still usable.
+    """
+
+
+class DeadlineExceededError(JSONRPCError, TimeoutError):
+    """The subprocess stopped a request that ran past its deadline.
+
+    The subprocess is still usable. Also a TimeoutError, so callers handling
+    timeouts generically keep working.
+    """
+
+
 class JSONRPCProtocol:
     """Minimal JSON-RPC 2.0 protocol handler with Content-Length framing.
 
@@ -46,6 +69,8 @@ class JSONRPCProtocol:
 
         self.input_stream = input_stream
         self.output_stream = output_stream
+        self.codec = JSON
+        self._reader: FrameReader | None = None
         self._next_id = 1
 
     def send_request(self, method: str, params: dict[str, Any]) -> None:
@@ -64,6 +89,15 @@ class JSONRPCProtocol:
         self._next_id += 1
         self._write_message(request)
 
+    def send_notification(self, method: str, params: dict[str, Any]) -> None:
+        """Send a JSON-RPC notification (a request without an id, never answered).
+
+        Args:
+            method: Method name
+            params: Parameters for the method
+        """
+        self._write_message({"jsonrpc": "2.0", "method": method, "params": params})
+
     def send_response(self, request_id: int, result: Any) -> None:
         """Send a JSON-RPC response.
 
@@ -99,6 +133,19 @@ class JSONRPCProtocol:
 
         self._write_message(error_response)
 
+    def use_codec(self, codec: str) -> None:
+        """Switch the codec used for outgoing messages.
+
+        Incoming frames are always decoded according to their Content-Type,
+        so the two directions can switch independently.
+
+        Args:
+            codec: A codec from framing.available_codecs()
+        """
+        if codec not in available_codecs():
+            raise ValueError(f"Codec not available: {codec}")
+        self.codec = codec
+
     def read_message(self) -> dict[str, Any]:
         """Read a JSON-RPC message with Content-Length framing.
 
@@ -109,71 +156,14 @@ class JSONRPCProtocol:
             JSONRPCError: If message is invalid
             EOFError: If stream is closed
         """
-        # Read headers (binary mode)
-        headers = {}
-        while True:
-            line = self.input_stream.readline()
-            if not line:
-                raise EOFError("Stream closed while reading headers")
+        if self._reader is None:
+            self._reader = FrameReader(self.input_stream)
 
-            # Decode from bytes and strip CRLF
-            try:
-                line_str = line.decode("utf-8").rstrip("\r\n")
-            except UnicodeDecodeError:
-                # Partial or corrupted read
-                raise JSONRPCError(-32700, f"Invalid header encoding: {line[:20]!r}")
-
-            if not line_str:
-                # Empty line marks end of headers
-                break
-
-            # Parse header
-            if ":" not in line_str:
-                # Check if this might be a partial read
-                if len(line_str) < 10 and line_str.isalpha():
-                    # Likely a partial header - the stream is corrupted
-                    raise JSONRPCError(-32700, f"Invalid header (partial read?): {line_str}")
-                raise JSONRPCError(-32700, f"Invalid header: {line_str}")
-
-            key, value = line_str.split(":", 1)
-            # Store headers with lowercase keys for case-insensitive lookup
-            headers[key.strip().lower()] = value.strip()
-
-        # Check for Content-Length (case-insensitive)
-        if "content-length" not in headers:
-            raise JSONRPCError(-32700, "Missing Content-Length header")
-
-        try:
-            content_length = int(headers["content-length"])
-        except ValueError:
-            raise JSONRPCError(-32700, f"Invalid Content-Length: {headers['content-length']}")
-
-        # Read body (binary mode - already in bytes)
-        # CRITICAL: Must read in a loop as read() may return fewer bytes than requested
-        body_chunks = []
-        bytes_remaining = content_length
-        while bytes_remaining > 0:
-            chunk = self.input_stream.read(bytes_remaining)
-            if not chunk:
-                # EOF before getting all data
-                raise JSONRPCError(
-                    -32700,
-                    f"Incomplete message: expected {content_length} bytes, got {content_length - bytes_remaining}",
-                )
-            body_chunks.append(chunk)
-            bytes_remaining -= len(chunk)
-
-        body = b"".join(body_chunks)
-
-        # Parse JSON from bytes
         try:
-            # Import json locally to avoid Python 3.13 scope issue
-            import json as json_module
-
-            message = json_module.loads(body.decode("utf-8"))
-        except ValueError as e:
-            # Note: Using ValueError to catch JSON decode errors in Python 3.13
-            raise JSONRPCError(-32700, f"Invalid JSON: {e}")
+            headers, body = self._reader.read_frame()
+            message = decode(body, headers.get("content-type"))
+        except FrameError as e:
+            raise JSONRPCError(-32700, str(e)) from e
 
         # Validate JSON-RPC structure
         if not isinstance(message, dict):
@@ -190,20 +180,8 @@ class JSONRPCProtocol:
         Args:
             message: Message to send
         """
-        # Serialize to JSON and encode to bytes
-        # Import json locally to avoid Python 3.13 scope issue
-        import json as json_module
-
-        body = json_module.dumps(message, separators=(",", ":"))
-        body_bytes = body.encode("utf-8")
-
-        # Write Content-Length header (as bytes)
-        header = f"Content-Length: {len(body_bytes)}\r\n\r\n"
-        self.output_stream.write(header.encode("utf-8"))
-
-        # Write body (as bytes - this was the bug!)
-        self.output_stream.write(body_bytes)
-        self.output_stream.flush()
+        body, content_type = encode(message, self.codec)
+        write_frame(self.output_stream, body, content_type)
 
 
 class JSONRPCServer:
@@ -322,18 +300,35 @@ class JSONRPCClient:
         for _, q in items:
             q.put(exc)
 
-    def call(self, method: str, params: dict[str, Any], timeout: float | None = None) -> Any:
+    def call(
+        self,
+        method: str,
+        params: dict[str, Any],
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+        cancel_grace: float = 10.0,
+    ) -> Any:
         """Call a remote method and wait for response.
 
+        If the call times out or `cancel` is set, a `cancel` notification is
+        sent and the subprocess is given cancel_grace seconds to acknowledge
+        it. An acknowledged cancellation leaves the subprocess usable.
+
         Args:
             method: Method name to call
             params: Method parameters as a dict
+            timeout: Seconds to wait for the response (None waits forever)
+            cancel: Event that, once set, cancels the request
+            cancel_grace: Seconds to wait for the subprocess to acknowledge a cancel
 
         Returns:
             Result from the method
 
         Raises:
             JSONRPCError: If remote method returns an error
+            RequestCancelledError: If the request was cancelled and acknowledged
+            DeadlineExceededError: If the subprocess stopped the request at its deadline
+            TimeoutError: If no response (or cancel acknowledgement) arrived in time
         """
         # Track request ID
         request_id = self.protocol._next_id
@@ -348,11 +343,24 @@ class JSONRPCClient:
         # Send request
         self.protocol.send_request(method, params)
 
+        timed_out = False
         try:
-            try:
-                message = response_queue.get(timeout=timeout)
-            except queue.Empty:
-                raise TimeoutError(f"JSON-RPC call '{method}' timed out after {timeout} seconds")
+            message = self._wait_for_response(response_queue, timeout, cancel)
+            if message is None:
+                if cancel is not None and cancel.is_set():
+                    reason = "was cancelled"
+                else:
+                    timed_out = True
+                    reason = f"timed out after {timeout} seconds"
+                # Ask the subprocess to stop the request rather than abandoning it
+                self.protocol.send_notification("cancel", {"id": request_id})
+                try:
+                    message = response_queue.get(timeout=cancel_grace)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"JSON-RPC call '{method}' {reason}; subprocess did not stop "
+                        f"within {cancel_grace} seconds"
+                    ) from None
         finally:
             with self._lock:
                 self._pending.pop(request_id, None)
@@ -362,10 +370,38 @@ class JSONRPCClient:
 
         if "error" in message:
             error = message["error"]
-            raise JSONRPCError(error["code"], error["message"], error.get("data"))
+            code = error["code"]
+            if timed_out and code == REQUEST_CANCELLED:
+                # Stopped because we gave up waiting, not because the caller cancelled
+                code = DEADLINE_EXCEEDED
+            error_cls = {
+                REQUEST_CANCELLED: RequestCancelledError,
+                DEADLINE_EXCEEDED: DeadlineExceededError,
+            }.get(code, JSONRPCError)
+            raise error_cls(code, error["message"], error.get("data"))
 
         return message.get("result")
 
+    @staticmethod
+    def _wait_for_response(
+        response_queue: queue.Queue, timeout: float | None, cancel: threading.Event | None
+    ) -> Any:
+        """Wait for a response, returning None on timeout or cancellation."""
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Poll in short slices only when there is a cancel event to watch
+            wait = 0.25 if cancel is not None else None
+            if end is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = remaining if wait is None else min(wait, remaining)
+            try:
+                return response_queue.get(timeout=wait)
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    return None
+
     def _ensure_reader_locked(self) -> None:
         """Start the reader thread if it isn't already running (call with lock held)."""
         if self._reader_thread and self._reader_thread.is_alive():
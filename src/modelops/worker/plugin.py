@@ -12,6 +12,7 @@ from pathlib import Path
 from dask.distributed import WorkerPlugin
 from modelops_contracts.ports import BundleRepository, ExecutionEnvironment
 
+from . import serialization  # noqa: F401  (registers Dask serializers for SimReturn)
 from .config import RuntimeConfig
 
 logger = logging.getLogger(__name__)
@@ -172,20 +173,21 @@ class ModelOpsWorkerPlugin(WorkerPlugin):
         Returns:
             ExecutionEnvironment implementation based on config
         """
-        # Create Azure backend configuration if uploads are enabled
-        azure_backend = None
-        if config.upload_to_azure:
-            azure_config = {
-                "container": config.azure_container,
-                "connection_string": config.azure_connection_string,
-            }
-            # Only set azure_backend if upload is enabled
-            azure_backend = azure_config
-
-        if config.executor_type == "isolated_warm":
-            from modelops.adapters.exec_env.isolated_warm import IsolatedWarmExecEnv
-
-            return IsolatedWarmExecEnv(
+        # Azure backend configuration, if uploads are enabled
+        azure_backend = config.azure_backend()
+
+        if config.executor_type in ("isolated_warm", "fork_server"):
+            if config.executor_type == "fork_server":
+                # Warm template per bundle, fresh fork per task (no state leakage)
+                from modelops.adapters.exec_env.fork_server import (
+                    ForkServerExecEnv as exec_env_class,
+                )
+            else:
+                from modelops.adapters.exec_env.isolated_warm import (
+                    IsolatedWarmExecEnv as exec_env_class,
+                )
+
+            return exec_env_class(
                 bundle_repo=bundle_repo,
                 venvs_dir=Path(config.venvs_dir),
                 storage_dir=storage_dir,
@@ -194,6 +196,8 @@ class ModelOpsWorkerPlugin(WorkerPlugin):
                 force_fresh_venv=config.force_fresh_venv,
                 azure_backend=azure_backend,
                 rpc_timeout_seconds=getattr(config, "rpc_timeout_seconds", 30 * 60),
+                venv_store_dir=Path(config.venv_store_dir) if config.venv_store_dir else None,
+                venv_store_ttl_seconds=config.venv_store_ttl_days * 24 * 3600,
             )
         elif config.executor_type == "direct":
             # Simple in-process execution for testing
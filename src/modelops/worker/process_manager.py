@@ -30,7 +30,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .jsonrpc import JSONRPCClient
+from .cancellation import TaskCancelledError, current_token
+from .framing import JSON, available_codecs
+from .jsonrpc import DeadlineExceededError, JSONRPCClient, RequestCancelledError
+from .venv_store import VenvStore
 
 logger = logging.getLogger(__name__)
 
@@ -128,13 +131,20 @@ class WarmProcess:
         except Exception:
             return ""
 
-    def safe_call(self, method: str, params: dict, timeout: float | None = None):
+    def safe_call(
+        self,
+        method: str,
+        params: dict,
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+    ):
         """Make a thread-safe JSON-RPC call to the subprocess.
 
         Args:
             method: Method name to call
             params: Method parameters
             timeout: Timeout in seconds
+            cancel: Event that cancels the call when set
 
         Returns:
             Result from the subprocess
@@ -147,7 +157,7 @@ class WarmProcess:
                 raise RuntimeError("Process is not alive")
 
             effective_timeout = timeout if timeout is not None else self.default_timeout
-            return self.client.call(method, params, timeout=effective_timeout)
+            return self.client.call(method, params, timeout=effective_timeout, cancel=cancel)
 
 
 class WarmProcessManager:
@@ -164,6 +174,8 @@ class WarmProcessManager:
         venvs_dir: Path = Path("/tmp/modelops/venvs"),
         force_fresh_venv: bool = False,
         rpc_timeout_seconds: int = 30 * 60,
+        venv_store: VenvStore | None = None,
+        fork_per_task: bool = False,
     ):
         """Initialize the process manager.
 
@@ -171,12 +183,24 @@ class WarmProcessManager:
             max_processes: Maximum number of warm processes to maintain
             venvs_dir: Directory for virtual environments
             force_fresh_venv: Force fresh venv creation for each execution (debugging)
+            venv_store: Optional node-level store to clone venvs from and share
+                the uv wheel cache with other workers (bypassed by force_fresh_venv)
+            fork_per_task: Run runners as fork servers: each task executes in a
+                fresh fork of the pre-imported runner instead of the runner itself
         """
         self.max_processes = max_processes
         self.venvs_dir = Path(venvs_dir)
         self.venvs_dir.mkdir(parents=True, exist_ok=True)
         self.force_fresh_venv = force_fresh_venv
         self.rpc_timeout_seconds = rpc_timeout_seconds
+        self.venv_store = None if force_fresh_venv else venv_store
+        self.fork_per_task = fork_per_task
+
+        if self.venv_store is not None:
+            try:
+                self.venv_store.gc()
+            except OSError as e:
+                logger.warning(f"Venv store GC failed: {e}")
 
         # Use OrderedDict for LRU behavior
         self._processes: OrderedDict[str, WarmProcess] = OrderedDict()
@@ -325,6 +349,8 @@ class WarmProcessManager:
         # Clean environment
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"  # Ensure unbuffered output
+        if self.venv_store is not None:
+            env.update(self.venv_store.env())  # Shared uv wheel cache
 
         # Start the subprocess with venv's Python and standalone runner
         # Redirect stderr to file to prevent deadlock with large messages
@@ -338,6 +364,7 @@ class WarmProcessManager:
                 str(venv_path),
                 "--bundle-digest",
                 bundle_digest,
+                *(["--fork-per-task"] if self.fork_per_task else []),
             ],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
@@ -394,10 +421,14 @@ class WarmProcessManager:
                 default_timeout=self.rpc_timeout_seconds,
             )
 
-            result = warm_process.safe_call("ready", {}, timeout=10.0)
+            result = warm_process.safe_call(
+                "ready", {"codecs": available_codecs()}, timeout=10.0
+            )
             if not result.get("ready"):
                 raise RuntimeError(f"Process not ready: {result}")
+            client.protocol.use_codec(result.get("codec", JSON))
 
+            self._publish_venv(bundle_path, venv_path)
             return warm_process
         except Exception as e:
             # Clean up on failure
@@ -485,8 +516,10 @@ class WarmProcessManager:
         venv_path = self.venvs_dir / venv_key
         logger.info(f"Using venv path: {venv_path}")
 
-        # Create venv if it doesn't exist
+        # Create venv if it doesn't exist, preferring a clone of a shared template
         venv_python = venv_path / "bin" / "python"
+        if not venv_path.exists() and self.venv_store is not None:
+            self.venv_store.clone(self._compute_deps_hash(bundle_path), venv_path)
         if not venv_path.exists():
             logger.info(f"Creating new venv at {venv_path}")
             try:
@@ -515,6 +548,8 @@ class WarmProcessManager:
         # Clean environment
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"  # Ensure unbuffered output
+        if self.venv_store is not None:
+            env.update(self.venv_store.env())  # Shared uv wheel cache
 
         # Create the subprocess using venv's Python
         # The subprocess will:
@@ -532,6 +567,7 @@ class WarmProcessManager:
                 str(venv_path),
                 "--bundle-digest",
                 bundle_digest,
+                *(["--fork-per-task"] if self.fork_per_task else []),
             ],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
@@ -565,9 +601,11 @@ class WarmProcessManager:
 
         # Wait for ready signal
         try:
-            result = client.call("ready", {})  # Pass empty params dict
+            # Offer our codecs; the runner answers with the one it picked
+            result = client.call("ready", {"codecs": available_codecs()})
             if not result.get("ready"):
                 raise RuntimeError(f"Process not ready: {result}")
+            client.protocol.use_codec(result.get("codec", JSON))
         except Exception as e:
             # Clean up on failure
             process.terminate()
@@ -589,6 +627,8 @@ class WarmProcessManager:
                 error_msg += f"\nStderr: {stderr_text}"
             raise RuntimeError(error_msg)
 
+        self._publish_venv(bundle_path, venv_path)
+
         return WarmProcess(
             process=process,
             client=client,
@@ -599,6 +639,21 @@ class WarmProcessManager:
             default_timeout=self.rpc_timeout_seconds,
         )
 
+    def _publish_venv(self, bundle_path: Path, venv_path: Path) -> None:
+        """Offer a venv whose runner reported ready as the shared template.
+
+        Best effort: failing to publish never fails process creation.
+        """
+        if self.venv_store is None:
+            return
+        deps_hash = self._compute_deps_hash(bundle_path)
+        if self.venv_store.has_template(deps_hash):
+            return
+        try:
+            self.venv_store.publish(deps_hash, venv_path)
+        except Exception as e:
+            logger.warning(f"Failed to publish venv {venv_path.name}: {e}")
+
     def _evict_lru(self):
         """Evict the least recently used process."""
         if not self._processes:
@@ -624,18 +679,29 @@ class WarmProcessManager:
         entrypoint: str,
         params: dict,
         seed: int,
+        deadline: float | None = None,
     ) -> dict[str, str]:
         """Execute a task in a warm process.
 
+        The subprocess stops the task at its deadline, and when the task's
+        cancel token fires (see modelops.worker.cancellation), without losing
+        its warm state.
+
         Args:
             bundle_digest: Bundle digest
             bundle_path: Path to the bundle
             entrypoint: Entrypoint identifying model and scenario
             params: Task parameters
             seed: Random seed
+            deadline: Absolute wall-clock deadline (time.time()); defaults to
+                rpc_timeout_seconds from now
 
         Returns:
             Task results as dict of artifact name to base64-encoded strings
+
+        Raises:
+            TaskCancelledError: If the task was cancelled
+            DeadlineExceededError: If the task ran past its deadline
         """
         # Log execution sizes for debugging
         import sys
@@ -649,17 +715,23 @@ class WarmProcessManager:
         # Get or create warm process
         process = self.get_process(bundle_digest, bundle_path)
 
+        deadline = deadline if deadline is not None else time.time() + self.rpc_timeout_seconds
         try:
             # Execute task via JSON-RPC using safe_call
             result = process.safe_call(
                 "execute",
-                {"entrypoint": entrypoint, "params": params, "seed": seed},
-                timeout=self.rpc_timeout_seconds,
+                {"entrypoint": entrypoint, "params": params, "seed": seed, "deadline": deadline},
+                timeout=self._call_timeout(deadline),
+                cancel=current_token(),
             )
 
             # Result should already be base64-encoded strings
             return result
 
+        except (RequestCancelledError, DeadlineExceededError) as e:
+            # The subprocess stopped the task itself and is still warm - keep it
+            self._release(process, f"Task {entrypoint} (seed={seed})", e)
+
         except Exception as e:
             # Process might be broken, remove it
             tail = process.tail_stderr()
@@ -698,6 +770,8 @@ class WarmProcessManager:
         target_entrypoint: str,
         sim_returns: list[dict[str, Any]],  # Already serialized SimReturns
         target_data: dict[str, Any] | None = None,
+        deadline: float | None = None,
+        partial: bool = False,
     ) -> dict[str, Any]:
         """Execute aggregation task in a warm process.
 
@@ -711,27 +785,45 @@ class WarmProcessManager:
             target_entrypoint: Target evaluation entrypoint
             sim_returns: List of simulation results (already serialized)
             target_data: Optional empirical data
+            deadline: Absolute wall-clock deadline (time.time()); defaults to
+                rpc_timeout_seconds from now
+            partial: Return per-replicate log-likelihoods for one group of a
+                tree-reduced aggregation instead of a loss
 
         Returns:
             Aggregation result with loss and diagnostics
+
+        Raises:
+            TaskCancelledError: If the aggregation was cancelled
+            DeadlineExceededError: If the aggregation ran past its deadline
         """
         # Get or create warm process - SAME pool as simulations!
         process = self.get_process(bundle_digest, bundle_path)
 
+        deadline = deadline if deadline is not None else time.time() + self.rpc_timeout_seconds
+        params = {
+            "target_entrypoint": target_entrypoint,
+            "sim_returns": sim_returns,
+            "target_data": target_data,
+            "deadline": deadline,
+        }
+        if partial:
+            params["partial"] = True
         try:
             # Execute aggregation via JSON-RPC using safe_call
             result = process.safe_call(
                 "aggregate",  # New method!
-                {
-                    "target_entrypoint": target_entrypoint,
-                    "sim_returns": sim_returns,
-                    "target_data": target_data,
-                },
-                timeout=self.rpc_timeout_seconds,
+                params,
+                timeout=self._call_timeout(deadline),
+                cancel=current_token(),
             )
 
             return result
 
+        except (RequestCancelledError, DeadlineExceededError) as e:
+            # The subprocess stopped the aggregation itself and is still warm - keep it
+            self._release(process, f"Aggregation {target_entrypoint}", e)
+
         except Exception as e:
             tail = process.tail_stderr()
 
@@ -763,6 +855,24 @@ class WarmProcessManager:
 
             raise
 
+    # Extra time the client waits past a deadline for the subprocess to enforce it
+    DEADLINE_SLACK_SECONDS = 5.0
+
+    def _call_timeout(self, deadline: float) -> float:
+        """Client-side timeout: a backstop in case the subprocess can't enforce the deadline."""
+        return max(0.0, deadline - time.time()) + self.DEADLINE_SLACK_SECONDS
+
+    @staticmethod
+    def _release(process: WarmProcess, what: str, error: Exception) -> None:
+        """Surface a request the subprocess stopped on our behalf, keeping the process."""
+        logger.warning(
+            f"{what} stopped in warm process (pid={process.process.pid}), "
+            f"process kept: {error.message}"
+        )
+        if isinstance(error, RequestCancelledError):
+            raise TaskCancelledError(f"{what} cancelled") from error
+        raise error
+
     def shutdown_all(self):
         """Shutdown all warm processes."""
         logger.info(f"Shutting down {len(self._processes)} warm processes")
@@ -776,3 +886,7 @@ class WarmProcessManager:
     def active_count(self) -> int:
         """Return the count of active processes."""
         return len(self._processes)
+
+    def warm_digests(self) -> list[str]:
+        """Return bundle digests that currently have a live warm process."""
+        return [p.bundle_digest for p in list(self._processes.values()) if p.is_alive()]
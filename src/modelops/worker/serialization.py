@@ -0,0 +1,63 @@
+"""Dask serializers for simulation results.
+
+By default SimReturn objects move between workers (and to spill files) through
+pickle, which copies every artifact body into the pickle stream on the way out
+and again on the way in. The handlers registered here pickle everything except
+the large ``bytes`` objects (artifact bodies), which are emitted as separate
+frames instead. Dask sends, compresses and spills those frames as they are, so
+the sending side makes no copy and each frame can be compressed on its own.
+
+Registration happens on import. The worker plugin imports this module, and the
+simulation service imports the plugin, so every worker and client that handles
+SimReturns has the handlers.
+"""
+
+import io
+import pickle
+from typing import Any
+
+import cloudpickle
+from distributed.protocol import dask_deserialize, dask_serialize
+from modelops_contracts import SimReturn, TableArtifact
+
+# Bytes objects at least this large leave the pickle stream as their own frame
+OUT_OF_BAND_MIN_BYTES = 1024
+
+
+class _FramePickler(cloudpickle.Pickler):
+    """cloudpickle (contract types hold mappingproxies) with large bytes kept out of band."""
+
+    def __init__(self, file: io.BytesIO, buffers: list[memoryview]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._buffers = buffers
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if type(obj) is bytes and len(obj) >= OUT_OF_BAND_MIN_BYTES:
+            self._buffers.append(memoryview(obj))
+            return len(self._buffers)
+        return None
+
+
+class _FrameUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, frames: list):
+        super().__init__(file)
+        self._frames = frames
+
+    def persistent_load(self, pid: int) -> bytes:
+        # Artifacts hold bytes: a frame that arrives as a memoryview is copied once here
+        return bytes(self._frames[pid])
+
+
+@dask_serialize.register((SimReturn, TableArtifact))
+def serialize_result(obj: SimReturn | TableArtifact) -> tuple[dict, list]:
+    """Split a result into a pickled frame plus one frame per artifact body."""
+    buffers: list[memoryview] = []
+    stream = io.BytesIO()
+    _FramePickler(stream, buffers).dump(obj)
+    return {"out_of_band": len(buffers)}, [stream.getbuffer(), *buffers]
+
+
+@dask_deserialize.register((SimReturn, TableArtifact))
+def deserialize_result(header: dict, frames: list) -> SimReturn | TableArtifact:
+    """Inverse of serialize_result."""
+    return _FrameUnpickler(io.BytesIO(frames[0]), frames).load()
@@ -26,12 +26,15 @@ Why standalone is absolutely necessary:
    - WarmProcess in proces_manager.py does use the jsonrpc.py module in ModelOps
    - This script (no ModelOps) runs inside the venv
    - Communication via JSON-RPC 2.0 over stdin/stdout (language-agnostic)
-   - All data serialized to JSON/base64 for clean boundary
+   - All data serialized to JSON (msgpack if both sides have it)/base64 for
+     clean boundary
 
 5. Why JSON-RPC is inlined here:
    - Cannot import from modelops.worker.jsonrpc (ModelOps not in venv)
    - Must be self-contained for true isolation
    - The protocol is simple enough to inline without issues
+   - Framing and codecs come from the sibling framing.py, which is
+     stdlib-only and loaded by file path rather than imported from modelops
 
 Debugging note: After extensive debugging, we found that mixing Python
 environments (parent with ModelOps, child without) caused subtle issues.
@@ -40,20 +43,26 @@ The solution is complete isolation with this standalone runner.
 
 import argparse
 import base64
+import collections
 import contextlib
 import fcntl
 import hashlib
 import logging
 import math
 import os
+import queue
+import select
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import traceback
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # -----------------------------------------------------------------------------
 # Logging (stderr only; stdout is reserved for JSON-RPC)
@@ -70,6 +79,26 @@ logger = logging.getLogger("runner")
 # -----------------------------------------------------------------------------
 
 
+def _load_framing():
+    """Load framing.py from next to this script.
+
+    It is stdlib-only and shared with modelops.worker.jsonrpc. It is loaded by
+    path under a private name because modelops is not importable here.
+    """
+    import importlib.util
+
+    name = "_modelops_runner_framing"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, Path(__file__).with_name("framing.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+framing = _load_framing()
+
+
 class JSONRPCError(Exception):
     def __init__(self, code: int, message: str, data: Any | None = None):
         super().__init__(message)
@@ -79,71 +108,33 @@ class JSONRPCError(Exception):
 
 
 class JSONRPCProtocol:
-    def __init__(self):
+    def __init__(self, input_stream: BinaryIO | None = None):
         # binary mode for exact byte lengths
-        self._in = sys.stdin.buffer
+        self._in = sys.stdin.buffer if input_stream is None else input_stream
         self._out = sys.stdout.buffer
-
-    def _read_exactly(self, n: int) -> bytes:
-        chunks = []
-        remaining = n
-        while remaining > 0:
-            b = self._in.read(remaining)
-            if not b:
-                break
-            chunks.append(b)
-            remaining -= len(b)
-        data = b"".join(chunks)
-        if len(data) != n:
-            raise JSONRPCError(-32700, f"Incomplete message body ({len(data)}/{n} bytes)")
-        return data
+        self._reader = framing.FrameReader(self._in)
+        self.codec = framing.JSON
 
     def read_message(self) -> dict[str, Any]:
-        headers: dict[str, str] = {}
-        # Read headers until blank line (accept CRLF or LF)
-        while True:
-            line = self._in.readline()
-            if not line:
-                raise EOFError("stdin closed")
-            # Accept both CRLF and LF as blank line delimiter
-            if line in (b"\r\n", b"\n"):
-                break
-            s = line.decode("utf-8").rstrip("\r\n")
-            if ":" not in s:
-                raise JSONRPCError(-32700, f"Invalid header: {s}")
-            k, v = s.split(":", 1)
-            # Store headers with lowercase keys for case-insensitive lookup
-            headers[k.strip().lower()] = v.strip()
-
-        if "content-length" not in headers:
-            raise JSONRPCError(-32700, "Missing Content-Length header")
         try:
-            length = int(headers["content-length"])
-        except ValueError:
-            raise JSONRPCError(-32700, f"Invalid Content-Length: {headers['content-length']}")
-
-        body = self._read_exactly(length)
-        try:
-            # Import json locally to avoid Python 3.13 scope issue
-            import json as json_module
-
-            msg = json_module.loads(body.decode("utf-8"))
-        except ValueError as e:
-            # Note: Using ValueError to catch JSON decode errors in Python 3.13
-            raise JSONRPCError(-32700, f"Invalid JSON: {e}")
+            headers, body = self._reader.read_frame()
+            msg = framing.decode(body, headers.get("content-type"))
+        except framing.FrameError as e:
+            raise JSONRPCError(-32700, str(e)) from e
         if not isinstance(msg, dict):
             raise JSONRPCError(-32600, "Message must be an object")
         return msg
 
-    def _write(self, payload: dict[str, Any]) -> None:
-        # Import json locally to avoid Python 3.13 scope issue
-        import json as json_module
+    def fileno(self) -> int:
+        return self._in.fileno()
 
-        body = json_module.dumps(payload, separators=(",", ":")).encode("utf-8")
-        self._out.write(f"Content-Length: {len(body)}\r\n".encode("ascii"))
-        self._out.write(b"\r\n")
-        self._out.write(body)
-        self._out.flush()
+    def has_buffered_input(self) -> bool:
+        """Whether a further message was partly read already (select() cannot see it)."""
+        return self._reader.buffered > 0
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        body, content_type = framing.encode(payload, self.codec)
+        framing.write_frame(self._out, body, content_type)
 
     def send_response(self, req_id: Any, result: Any) -> None:
         if req_id is None:
@@ -160,6 +151,55 @@ class JSONRPCProtocol:
         self._write({"jsonrpc": "2.0", "id": req_id, "error": err})
 
 
+# -----------------------------------------------------------------------------
+# Artifact compression (opt-in via MODELOPS_ARTIFACT_CODEC)
+# -----------------------------------------------------------------------------
+
+ARTIFACT_CODECS = ("lz4", "zstd")
+
+
+def _artifact_codec() -> str | None:
+    """Arrow IPC buffer compression to apply to outputs, if enabled and available."""
+    codec = os.environ.get("MODELOPS_ARTIFACT_CODEC", "").strip().lower()
+    if codec in ("", "none"):
+        return None
+    if codec not in ARTIFACT_CODECS:
+        logger.warning("Unknown MODELOPS_ARTIFACT_CODEC %r; sending uncompressed", codec)
+        return None
+    try:
+        import pyarrow as pa
+    except ImportError:
+        logger.warning("pyarrow not installed in bundle venv; sending uncompressed")
+        return None
+    if not pa.Codec.is_available(codec):
+        logger.warning("pyarrow was built without %s; sending uncompressed", codec)
+        return None
+    return codec
+
+
+def _compress_ipc(data: bytes, codec: str) -> bytes | None:
+    """Rewrite Arrow IPC bytes with compressed buffers, keeping file vs stream format.
+
+    Returns None for data that is not Arrow IPC (e.g. JSON metadata). Readers
+    (pl.read_ipc, pyarrow) decompress such tables transparently.
+    """
+    import pyarrow as pa
+
+    is_file = data[:6] == b"ARROW1"
+    try:
+        reader = pa.ipc.open_file(data) if is_file else pa.ipc.open_stream(data)
+        table = reader.read_all()
+    except (pa.ArrowInvalid, OSError):
+        return None
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+    new_writer = pa.ipc.new_file if is_file else pa.ipc.new_stream
+    with new_writer(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
 # -----------------------------------------------------------------------------
 # Subprocess Runner
 # -----------------------------------------------------------------------------
@@ -168,10 +208,18 @@ class JSONRPCProtocol:
 class SubprocessRunner:
     """Executes simulation tasks inside the venv interpreter."""
 
-    def __init__(self, bundle_path: Path, venv_path: Path, bundle_digest: str):
+    def __init__(
+        self,
+        bundle_path: Path,
+        venv_path: Path,
+        bundle_digest: str,
+        fork_per_task: bool = False,
+    ):
         self.bundle_path = bundle_path
         self.venv_path = venv_path
         self.bundle_digest = bundle_digest
+        self.fork_per_task = fork_per_task
+        self.artifact_codec = _artifact_codec()
         self.wire_fn: Callable[[str, dict[str, Any], int], dict[str, bytes]] | None = None
         self._setup()
 
@@ -241,7 +289,14 @@ class SubprocessRunner:
 
                     if need_install:
                         try:
-                            self._install_dependencies()
+                            clone_marker = self.venv_path / ".template_clone"
+                            if clone_marker.exists():
+                                # Venv was cloned from a node-level template with the
+                                # same deps; only the bundle package itself is stale
+                                self._install_bundle_package()
+                                clone_marker.unlink()
+                            else:
+                                self._install_dependencies()
                             # Only write marker if installation succeeded
                             self._atomic_write(deps_marker, wanted)
                         except Exception as e:
@@ -506,6 +561,43 @@ class SubprocessRunner:
         else:
             logger.warning("No dependency file found (pyproject.toml or requirements.txt)")
 
+    def _install_bundle_package(self) -> None:
+        """Reinstall just the bundle into a venv cloned from a deps template.
+
+        The template was built for identical dependency files, so only the
+        bundle's own package (whose code may differ) needs reinstalling. Falls
+        back to a full install if that fails.
+        """
+        pyproject = self.bundle_path / "pyproject.toml"
+        if not pyproject.exists():
+            # requirements.txt bundles are imported from the bundle dir, not installed
+            if str(self.bundle_path) not in sys.path:
+                sys.path.insert(0, str(self.bundle_path))
+            logger.info("Cloned venv reused as-is (no bundle package to install)")
+            return
+
+        logger.info("Cloned venv: reinstalling bundle package only")
+        self._configure_git_auth()
+        uv = shutil.which("uv")
+        if uv:
+            cmd = [uv, "pip", "install", "--python", sys.executable, "--no-deps", "--reinstall"]
+        else:
+            cmd = [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--isolated",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--no-deps",
+                "--force-reinstall",
+            ]
+        rc = self._run([*cmd, str(self.bundle_path)], check=False)
+        if rc != 0:
+            logger.warning("Bundle-only install failed; running full dependency install")
+            self._install_dependencies()
+
     # ------------------------- wire discovery --------------------------
 
     def _discover_wire_function(self) -> Callable:
@@ -613,6 +705,8 @@ class SubprocessRunner:
             "version": f"{sys.version_info.major}.{sys.version_info.minor}",
             "pid": os.getpid(),
             "venv": str(self.venv_path),
+            "fork_per_task": self.fork_per_task,
+            "artifact_codec": self.artifact_codec,
         }
 
     def execute(
@@ -621,7 +715,15 @@ class SubprocessRunner:
         params: dict[str, Any],
         seed: int,
         bundle_digest: str | None = None,
-    ) -> dict[str, str]:
+    ) -> dict[str, Any]:
+        """Run the wire function and encode its outputs for the parent.
+
+        Each output is a base64 string of its bytes. With an artifact codec,
+        Arrow outputs that shrink are sent as an envelope instead:
+        {"inline": base64 of the compressed IPC, "codec": codec, "checksum":
+        BLAKE2b-256 of the uncompressed bytes}, so provenance keys and
+        checksums do not depend on the codec.
+        """
         if bundle_digest and bundle_digest != self.bundle_digest:
             raise ValueError(
                 f"Bundle digest mismatch: expected {self.bundle_digest}, got {bundle_digest}"
@@ -637,7 +739,7 @@ class SubprocessRunner:
             with contextlib.redirect_stdout(sys.stderr):
                 result_bytes = self.wire_fn(entrypoint, params, seed)  # type: ignore[misc]
 
-            artifacts: dict[str, str] = {}
+            artifacts: dict[str, Any] = {}
             for name, data in result_bytes.items():
                 if not isinstance(data, (bytes, bytearray)):
                     logger.warning("Converting non-bytes result for %s", name)
@@ -648,7 +750,20 @@ class SubprocessRunner:
                         import json as json_module
 
                         data = json_module.dumps(data).encode("utf-8")
-                artifacts[name] = base64.b64encode(bytes(data)).decode("ascii")
+                data = bytes(data)
+                if self.artifact_codec and name not in ("metadata", "error"):
+                    packed = _compress_ipc(data, self.artifact_codec)
+                    if packed is not None and len(packed) < len(data):
+                        logger.debug(
+                            "Compressed %s: %d -> %d bytes", name, len(data), len(packed)
+                        )
+                        artifacts[name] = {
+                            "inline": base64.b64encode(packed).decode("ascii"),
+                            "codec": self.artifact_codec,
+                            "checksum": hashlib.blake2b(data, digest_size=32).hexdigest(),
+                        }
+                        continue
+                artifacts[name] = base64.b64encode(data).decode("ascii")
             return artifacts
         except Exception as e:
             logger.exception("Execution failed")
@@ -662,7 +777,7 @@ class SubprocessRunner:
                     "traceback": _tb.format_exc(),
                     "entrypoint": entrypoint,
                 },
-            )
+            ) from e
 
     def aggregate(
         self,
@@ -670,6 +785,7 @@ class SubprocessRunner:
         sim_returns: list[dict[str, Any]],  # Serialized SimReturns
         target_data: dict[str, Any] | None = None,
         bundle_digest: str | None = None,
+        partial: bool = False,
     ) -> dict[str, Any]:
         """Execute target evaluation/aggregation in the subprocess.
 
@@ -681,13 +797,13 @@ class SubprocessRunner:
             sim_returns: List of simulation results (serialized)
             target_data: Optional empirical data for comparison
             bundle_digest: Optional bundle digest for validation
+            partial: Evaluate one group of a tree-reduced aggregation: return
+                the per-replicate log-likelihoods instead of a loss
 
         Returns:
-            Aggregation result with loss and diagnostics
+            Aggregation result with loss and diagnostics (with partial,
+            loglik_per_rep and diagnostics)
         """
-        # Import base64 at the top of the method to avoid scope issues
-        import base64
-
         if bundle_digest and bundle_digest != self.bundle_digest:
             raise ValueError(
                 f"Bundle digest mismatch: expected {self.bundle_digest}, got {bundle_digest}"
@@ -808,8 +924,10 @@ class SubprocessRunner:
                                 raise RuntimeError(
                                     f"Replicate {idx} failed: {info.get('type','Error')}: {info.get('error')}"
                                 )
-                            except Exception:
-                                raise RuntimeError(f"Replicate {idx} failed with encoded error")
+                            except Exception as e:
+                                raise RuntimeError(
+                                    f"Replicate {idx} failed with encoded error"
+                                ) from e
 
                         sim_output = {}
                         outputs = sim_return.get("outputs", {})
@@ -879,6 +997,21 @@ class SubprocessRunner:
 
                     target_eval = target_obj.evaluate(sim_outputs)
 
+                    if partial:
+                        if not hasattr(target_eval, "loglik_per_rep"):
+                            raise ValueError(
+                                f"Tree aggregation needs per-replicate log-likelihoods, but "
+                                f"{type(target_eval).__name__} only provides a loss"
+                            )
+                        return {
+                            "loglik_per_rep": [float(x) for x in target_eval.loglik_per_rep],
+                            "n_replicates": len(sim_returns),
+                            "diagnostics": {
+                                "target_type": type(target_obj).__name__,
+                                "model_output": target_obj.model_output,
+                            },
+                        }
+
                     # Extract loss from result - handle both TargetLossResult and TargetLikelihoodResult
                     if hasattr(target_eval, "loss"):
                         # TargetLossResult - use loss directly
@@ -929,6 +1062,16 @@ class SubprocessRunner:
                     # Validate result structure
                     if not isinstance(result, dict):
                         raise ValueError(f"Target evaluator must return dict, got {type(result)}")
+                    if partial:
+                        if "loglik_per_rep" not in result:
+                            raise ValueError(
+                                "Tree aggregation needs 'loglik_per_rep' in the evaluator result"
+                            )
+                        return {
+                            "loglik_per_rep": [float(x) for x in result["loglik_per_rep"]],
+                            "n_replicates": len(sim_returns),
+                            "diagnostics": result.get("diagnostics", {}),
+                        }
                     if "loss" not in result:
                         raise ValueError("Target evaluator must return 'loss' in result dict")
 
@@ -956,7 +1099,287 @@ class SubprocessRunner:
                     "traceback": traceback.format_exc(),
                     "target_entrypoint": target_entrypoint,
                 },
-            )
+            ) from e
+
+
+# -----------------------------------------------------------------------------
+# Cancellation and deadlines
+# -----------------------------------------------------------------------------
+
+REQUEST_CANCELLED = -32800  # LSP convention for a request cancelled by the client
+DEADLINE_EXCEEDED = -32002
+
+# Fork mode: how long past its deadline a task child may run before it is killed
+DEADLINE_GRACE_SECONDS = 5.0
+
+
+class TaskInterrupted(BaseException):
+    """Raised inside a running wire function when its request is interrupted.
+
+    Derives from BaseException (like KeyboardInterrupt) so broad
+    `except Exception` blocks in model code cannot swallow it.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class _ActiveRequest:
+    """The request currently executing, so cancel notifications can reach it.
+
+    In process mode the reader thread calls cancel() and the main thread,
+    which runs the request, is interrupted with SIGUSR1 (deadlines use
+    SIGALRM). In fork mode the template is single-threaded: it calls cancel()
+    itself while waiting on the task child, which is killed outright.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled_ids: set[Any] = set()
+        self.req_id: Any = None
+        self.child_pid: int | None = None
+        self.interrupt: tuple[int, str] | None = None
+        self.interruptible = False
+
+    def start(self, req_id: Any) -> bool:
+        """Mark a request as running. Returns False if it was already cancelled."""
+        with self._lock:
+            if req_id in self._cancelled_ids:
+                self._cancelled_ids.discard(req_id)
+                return False
+            self.req_id = req_id
+            self.interrupt = None
+            return True
+
+    def finish(self) -> None:
+        with self._lock:
+            self.req_id = None
+            self.child_pid = None
+            self.interruptible = False
+
+    def cancel(
+        self, req_id: Any, code: int = REQUEST_CANCELLED, message: str = "Request cancelled"
+    ):
+        with self._lock:
+            if req_id != self.req_id:
+                # Not started yet (or already answered): answer it as cancelled on arrival
+                if req_id is not None:
+                    self._cancelled_ids.add(req_id)
+                return
+            self.interrupt = (code, message)
+            if self.child_pid is not None:
+                logger.info(
+                    "Cancelling request %s: killing task process %d", req_id, self.child_pid
+                )
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(self.child_pid, signal.SIGKILL)
+            elif self.interruptible:
+                logger.info("Cancelling request %s: interrupting wire function", req_id)
+                signal.pthread_kill(threading.main_thread().ident, signal.SIGUSR1)
+
+    def on_signal(self, signum: int, frame: Any) -> None:
+        """Signal handler: raise TaskInterrupted only while a wire function runs."""
+        if not self.interruptible:
+            return
+        if signum == signal.SIGALRM:
+            raise TaskInterrupted(DEADLINE_EXCEEDED, "Deadline exceeded")
+        if self.interrupt is not None:
+            raise TaskInterrupted(*self.interrupt)
+
+
+_ACTIVE = _ActiveRequest()
+
+
+def _install_interrupt_handlers() -> None:
+    signal.signal(signal.SIGUSR1, _ACTIVE.on_signal)
+    signal.signal(signal.SIGALRM, _ACTIVE.on_signal)
+
+
+def _call_with_deadline(fn: Callable, params: dict, deadline: float | None) -> Any:
+    """Call fn, raising TaskInterrupted if it is cancelled or runs past deadline.
+
+    Args:
+        fn: Runner method to call
+        params: Keyword arguments for fn
+        deadline: Absolute wall-clock deadline (time.time()), or None
+    """
+    if deadline is not None:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise TaskInterrupted(DEADLINE_EXCEEDED, "Deadline exceeded before start")
+        signal.setitimer(signal.ITIMER_REAL, remaining)
+    _ACTIVE.interruptible = True
+    try:
+        if _ACTIVE.interrupt is not None:
+            raise TaskInterrupted(*_ACTIVE.interrupt)
+        return fn(**params)
+    finally:
+        _ACTIVE.interruptible = False
+        if deadline is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _read_one(rpc: JSONRPCProtocol) -> Any:
+    """Read the next message, returning (not raising) EOFError and JSONRPCError."""
+    try:
+        return rpc.read_message()
+    except (EOFError, JSONRPCError) as e:
+        return e
+
+
+def _handle_cancel(msg: Any) -> bool:
+    """Act on a cancel notification. Returns False if msg is something else."""
+    if not isinstance(msg, dict) or msg.get("method") != "cancel" or msg.get("id") is not None:
+        return False
+    _ACTIVE.cancel((msg.get("params") or {}).get("id"))
+    return True
+
+
+def _reader_loop(rpc: JSONRPCProtocol, inbox: "queue.Queue[Any]") -> None:
+    """Read requests into inbox, handling cancel notifications immediately."""
+    while True:
+        msg = _read_one(rpc)
+        if not _handle_cancel(msg):
+            inbox.put(msg)
+        if isinstance(msg, EOFError):
+            return
+
+
+def _die_with_parent() -> None:
+    """Ask the kernel to SIGKILL this process when its parent exits (Linux only).
+
+    Keeps forked task children from outliving a template that was terminated
+    (e.g. on RPC timeout).
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        import ctypes
+
+        PR_SET_PDEATHSIG = 1
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
+    except Exception:
+        pass  # Best effort
+
+
+def _wait_for_child(
+    rpc: JSONRPCProtocol,
+    pid: int,
+    req_id: Any,
+    deadline: float | None,
+    backlog: "collections.deque[Any]",
+) -> int:
+    """Wait for a task child while watching stdin for cancel notifications.
+
+    Runs on the template's only thread. Cancel notifications are acted on at
+    once; any other message is appended to backlog for the main loop. The
+    child is killed if it is still running DEADLINE_GRACE_SECONDS past the
+    deadline.
+
+    Returns:
+        The child's wait status
+    """
+    stdin_fd = rpc.fileno()
+    # A pidfd makes the child's exit selectable; without one (non-Linux), poll
+    pidfd = os.pidfd_open(pid) if hasattr(os, "pidfd_open") else None
+    kill_at = None if deadline is None else deadline + DEADLINE_GRACE_SECONDS
+    stdin_open = True
+    try:
+        while True:
+            waited, status = os.waitpid(pid, os.WNOHANG)
+            if waited:
+                return status
+            if kill_at is not None and time.time() >= kill_at:
+                _ACTIVE.cancel(req_id, DEADLINE_EXCEEDED, "Deadline exceeded")
+                kill_at = None
+
+            if stdin_open and rpc.has_buffered_input():
+                stdin_ready = True
+            else:
+                timeout = None if pidfd is not None else 0.05
+                if kill_at is not None:
+                    remaining = max(0.0, kill_at - time.time())
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                fds = [fd for fd in (pidfd, stdin_fd if stdin_open else None) if fd is not None]
+                readable, _, _ = select.select(fds, [], [], timeout)
+                stdin_ready = stdin_fd in readable
+
+            if stdin_ready:
+                msg = _read_one(rpc)
+                if not _handle_cancel(msg):
+                    backlog.append(msg)
+                if isinstance(msg, EOFError):
+                    # Let the task finish; the main loop exits afterwards
+                    stdin_open = False
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _call_in_fork(
+    rpc: JSONRPCProtocol,
+    req_id: Any,
+    fn: Callable,
+    params: dict,
+    deadline: float | None,
+    backlog: "collections.deque[Any]",
+) -> None:
+    """Run one request in a forked child of this (template) process.
+
+    The template has the wire function and heavy modules already imported, so
+    the child starts in milliseconds with a copy-on-write snapshot of that
+    state. Whatever the task mutates (module globals, C++ statics, RNGs) dies
+    with the child. The child writes its own framed response to stdout; the
+    template only reports an error if the child died without replying.
+
+    The child enforces the deadline itself; the template kills it if it is
+    cancelled or still running DEADLINE_GRACE_SECONDS past the deadline.
+    Messages other than cancel notifications that arrive meanwhile are
+    appended to backlog.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            _die_with_parent()
+            try:
+                rpc.send_response(req_id, _call_with_deadline(fn, params, deadline))
+            except TaskInterrupted as e:
+                rpc.send_error(req_id, e.code, e.message)
+            except JSONRPCError as e:
+                rpc.send_error(req_id, e.code, e.message, e.data)
+            except Exception as e:
+                logger.exception("Unhandled error in forked task")
+                rpc.send_error(req_id, -32603, "Internal error", str(e))
+            exit_code = 0
+        finally:
+            # Skip atexit handlers and buffered-IO teardown inherited from the template
+            os._exit(exit_code)
+
+    _ACTIVE.child_pid = pid
+    status = _wait_for_child(rpc, pid, req_id, deadline, backlog)
+
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code != 0:
+        if _ACTIVE.interrupt is not None:
+            rpc.send_error(req_id, *_ACTIVE.interrupt)
+            return
+        reason = f"signal {-exit_code}" if exit_code < 0 else f"exit code {exit_code}"
+        if exit_code == -9:
+            reason += " (possibly OOM killed)"
+        logger.error("Forked task process %d died with %s", pid, reason)
+        rpc.send_error(
+            req_id,
+            -32000,
+            f"Task process died with {reason}",
+            {"exit_code": exit_code, "pid": pid},
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -969,6 +1392,11 @@ def main() -> None:
     parser.add_argument("--bundle-path", required=True, help="Path to bundle")
     parser.add_argument("--venv-path", required=True, help="Path to venv")
     parser.add_argument("--bundle-digest", required=True, help="Bundle digest")
+    parser.add_argument(
+        "--fork-per-task",
+        action="store_true",
+        help="Act as a fork server: run each execute/aggregate in a forked child",
+    )
     args = parser.parse_args()
 
     try:
@@ -976,29 +1404,71 @@ def main() -> None:
             bundle_path=Path(args.bundle_path),
             venv_path=Path(args.venv_path),
             bundle_digest=args.bundle_digest,
+            fork_per_task=args.fork_per_task,
         )
 
-        rpc = JSONRPCProtocol()
+        _install_interrupt_handlers()
+
+        inbox: queue.Queue[Any] | None = None
+        backlog: collections.deque[Any] = collections.deque()
+        if runner.fork_per_task:
+            # No threads in a fork server: a fork while another thread holds a
+            # lock (logging, stdin buffer) copies that lock held into the child.
+            # _call_in_fork watches stdin for cancels itself. Read stdin
+            # unbuffered so select() sees every byte the FrameReader has not.
+            rpc = JSONRPCProtocol(sys.stdin.buffer.raw)
+        else:
+            # A reader thread keeps consuming stdin while a task runs, so
+            # cancel notifications are seen immediately
+            rpc = JSONRPCProtocol()
+            inbox = queue.Queue()
+            threading.Thread(target=_reader_loop, args=(rpc, inbox), daemon=True).start()
         logger.info("JSON-RPC server started")
 
         while True:
             req_id = None
             try:
-                msg = rpc.read_message()
+                if backlog:
+                    msg = backlog.popleft()
+                elif inbox is not None:
+                    msg = inbox.get()
+                else:
+                    msg = _read_one(rpc)
+                if isinstance(msg, BaseException):
+                    raise msg
+                if _handle_cancel(msg):
+                    continue
                 method = msg.get("method")
                 params = msg.get("params", {}) or {}
                 req_id = msg.get("id")
 
                 if method == "ready":
-                    rpc.send_response(req_id, runner.ready())
-                elif method == "execute":
+                    if isinstance(params, dict) and "codecs" in params:
+                        # The parent decodes by Content-Type, so switching
+                        # before this response is safe
+                        rpc.codec = framing.choose_codec(params["codecs"])
+                    rpc.send_response(req_id, {**runner.ready(), "codec": rpc.codec})
+                elif method in ("execute", "aggregate"):
                     if not isinstance(params, dict):
                         raise JSONRPCError(-32602, "Invalid params (expected object)")
-                    rpc.send_response(req_id, runner.execute(**params))
-                elif method == "aggregate":
-                    if not isinstance(params, dict):
-                        raise JSONRPCError(-32602, "Invalid params (expected object)")
-                    rpc.send_response(req_id, runner.aggregate(**params))
+                    fn = runner.execute if method == "execute" else runner.aggregate
+                    deadline = params.pop("deadline", None)
+                    if not _ACTIVE.start(req_id):
+                        rpc.send_error(req_id, REQUEST_CANCELLED, "Request cancelled")
+                        continue
+                    try:
+                        if runner.fork_per_task:
+                            _call_in_fork(rpc, req_id, fn, params, deadline, backlog)
+                        else:
+                            try:
+                                result = _call_with_deadline(fn, params, deadline)
+                            except TaskInterrupted as e:
+                                logger.warning("Request %s interrupted: %s", req_id, e.message)
+                                rpc.send_error(req_id, e.code, e.message)
+                            else:
+                                rpc.send_response(req_id, result)
+                    finally:
+                        _ACTIVE.finish()
                 elif method == "shutdown":
                     rpc.send_response(req_id, {"ok": True})
                     logger.info("Shutdown requested")
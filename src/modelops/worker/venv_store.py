@@ -0,0 +1,224 @@
+"""Content-addressed venv store shared by workers on a node.
+
+Each worker process builds venvs under its own venvs_dir, so every new pod
+used to reinstall numpy/scipy/starsim from scratch on autoscale-up. The
+VenvStore lives on a node-local hostPath or shared volume and holds:
+
+    {root}/uv-cache/                      shared uv wheel cache
+    {root}/templates/{py}-{deps_hash}/    fully installed venv per deps fingerprint
+
+A worker that needs a venv for a deps fingerprint clones the template with
+hardlinks (falling back to copies across filesystems) instead of
+reinstalling. Templates are published after a venv has been successfully
+installed and become immutable once renamed into place. Unused templates are
+removed by gc().
+"""
+
+import errno
+import fcntl
+import logging
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Marker written into cloned venvs; the subprocess runner reads it to
+# reinstall only the bundle package instead of the full dependency set.
+CLONE_MARKER = ".template_clone"
+
+# Per-venv files that must never be shared through a template
+_EXCLUDE = {"logs", ".install.lock", ".deps_installed", CLONE_MARKER}
+
+
+class VenvStore:
+    """Shared store of template venvs keyed by dependency fingerprint."""
+
+    def __init__(self, root: Path, ttl_seconds: float = 14 * 24 * 3600):
+        """Initialize the store.
+
+        Args:
+            root: Store root (node-local hostPath or shared volume)
+            ttl_seconds: Templates unused for longer than this are garbage collected
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.templates_dir = self.root / "templates"
+        self.uv_cache_dir = self.root / "uv-cache"
+        self.templates_dir.mkdir(parents=True, exist_ok=True)
+        self.uv_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def template_key(deps_hash: str) -> str:
+        """Template name for a deps fingerprint under the current Python version."""
+        return f"py{sys.version_info.major}.{sys.version_info.minor}-{deps_hash}"
+
+    def env(self) -> dict[str, str]:
+        """Environment overrides so installs share the node-level wheel cache.
+
+        Hardlink mode lets uv link wheels from the cache into venvs instead of
+        copying them. Explicit settings in the worker environment win.
+        """
+        overrides = {}
+        if "UV_CACHE_DIR" not in os.environ:
+            overrides["UV_CACHE_DIR"] = str(self.uv_cache_dir)
+        if "UV_LINK_MODE" not in os.environ:
+            overrides["UV_LINK_MODE"] = "hardlink"
+        return overrides
+
+    def has_template(self, deps_hash: str) -> bool:
+        """Check whether a template exists for a deps fingerprint."""
+        template = self.templates_dir / self.template_key(deps_hash)
+        return (template / "bin" / "python").exists()
+
+    def clone(self, deps_hash: str, venv_path: Path) -> bool:
+        """Materialize a venv from the template for a deps fingerprint.
+
+        Args:
+            deps_hash: Dependency fingerprint of the bundle
+            venv_path: Destination venv path (must not exist)
+
+        Returns:
+            True if the venv was cloned, False if no template is available
+        """
+        template = self.templates_dir / self.template_key(deps_hash)
+        if not (template / "bin" / "python").exists():
+            return False
+
+        tmp_path = venv_path.with_name(f".{venv_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        start = time.perf_counter()
+        try:
+            _link_tree(template, tmp_path)
+            _rewrite_venv_paths(tmp_path, old=template, new=venv_path)
+            (tmp_path / CLONE_MARKER).write_text(deps_hash)
+            os.replace(tmp_path, venv_path)
+        except OSError as e:
+            logger.warning(f"Failed to clone venv template {template.name}: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return False
+
+        # Template mtime doubles as last-use time for gc()
+        os.utime(template)
+        logger.info(
+            f"Cloned venv template {template.name} -> {venv_path} "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+        return True
+
+    def publish(self, deps_hash: str, venv_path: Path) -> bool:
+        """Publish an installed venv as the template for its deps fingerprint.
+
+        The venv is linked into a temporary directory and renamed into place,
+        so readers never see a partial template. If another worker published
+        first, the existing template is kept.
+
+        Args:
+            deps_hash: Dependency fingerprint the venv was installed for
+            venv_path: Fully installed venv
+
+        Returns:
+            True if a new template was published
+        """
+        template = self.templates_dir / self.template_key(deps_hash)
+        if template.exists():
+            return False
+
+        tmp_path = self.templates_dir / f".{template.name}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            _link_tree(venv_path, tmp_path)
+            _rewrite_venv_paths(tmp_path, old=venv_path, new=template)
+            os.rename(tmp_path, template)
+            os.utime(template)
+        except OSError as e:
+            # EEXIST/ENOTEMPTY: lost the race to another worker, which is fine
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                logger.warning(f"Failed to publish venv template {template.name}: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return False
+
+        logger.info(f"Published venv template {template.name} from {venv_path}")
+        return True
+
+    def gc(self) -> list[str]:
+        """Remove templates not used within ttl_seconds and stale temp dirs.
+
+        Runs under an exclusive store lock so concurrent workers don't race.
+        Running venvs are unaffected: clones hold their own hardlinks.
+
+        Returns:
+            Names of removed entries
+        """
+        removed = []
+        cutoff = time.time() - self.ttl_seconds
+        lock_file = self.root / ".gc.lock"
+        lock_file.touch(exist_ok=True)
+
+        with open(lock_file, "r+") as lock:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another worker is collecting
+                return removed
+            try:
+                for entry in self.templates_dir.iterdir():
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+                    if mtime < cutoff:
+                        shutil.rmtree(entry, ignore_errors=True)
+                        removed.append(entry.name)
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+        if removed:
+            logger.info(f"Venv store GC removed {len(removed)} entries: {removed}")
+        return removed
+
+
+def _link_tree(src: Path, dst: Path) -> None:
+    """Recreate src at dst, hardlinking files and preserving symlinks.
+
+    Falls back to copying when src and dst are on different filesystems.
+    """
+
+    def link_or_copy(s: str, d: str) -> None:
+        try:
+            os.link(s, d)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                raise
+            shutil.copy2(s, d)
+
+    shutil.copytree(
+        src,
+        dst,
+        symlinks=True,
+        copy_function=link_or_copy,
+        ignore=lambda _dir, names: [n for n in names if n in _EXCLUDE],
+    )
+
+
+def _rewrite_venv_paths(venv_path: Path, old: Path, new: Path) -> None:
+    """Point activation scripts and console-script shebangs at the new venv.
+
+    Rewritten files are replaced rather than modified in place, so the
+    hardlinked template is never touched.
+    """
+    old_b, new_b = str(old).encode(), str(new).encode()
+    bin_dir = venv_path / "bin"
+    if not bin_dir.is_dir():
+        return
+    for path in bin_dir.iterdir():
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old_b not in data:
+            continue
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_bytes(data.replace(old_b, new_b))
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
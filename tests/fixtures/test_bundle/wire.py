@@ -0,0 +1,31 @@
+"""
+Wire function for the test bundle.
+
+Dispatches "test_module/<function>" entrypoints to the functions in
+test_module.py, so the bundle can run in a warm process (benchmarks use it).
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def wire(entrypoint: str, params: dict[str, Any], seed: int) -> dict[str, bytes]:
+    """Run a test_module function and return its artifacts.
+
+    Args:
+        entrypoint: "test_module/<function>", e.g. "test_module/bundle_simulation"
+        params: Simulation parameters
+        seed: Random seed for reproducibility
+
+    Returns:
+        Dictionary mapping artifact names to bytes
+    """
+    bundle_dir = Path(__file__).parent
+    if str(bundle_dir) not in sys.path:
+        sys.path.insert(0, str(bundle_dir))
+
+    import test_module
+
+    function = entrypoint.split("/")[-1] if "/" in entrypoint else "bundle_simulation"
+    return getattr(test_module, function)(params, seed)
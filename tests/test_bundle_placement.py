@@ -0,0 +1,97 @@
+"""Tests for locality-aware bundle placement."""
+
+from unittest.mock import Mock
+
+from modelops.services.bundle_placement import BundlePlacement, _worker_warm_bundles
+
+BUNDLE_A = "sha256:" + "a" * 64
+BUNDLE_B = "sha256:" + "b" * 64
+
+
+def _make_client(warm: dict[str, list[str]], nthreads: int = 2) -> Mock:
+    client = Mock()
+    client.scheduler_info.return_value = {
+        "workers": {addr: {"nthreads": nthreads} for addr in warm}
+    }
+    client.run.return_value = warm
+    return client
+
+
+def _future(done: bool) -> Mock:
+    future = Mock()
+    future.done.return_value = done
+    return future
+
+
+class TestBundlePlacement:
+    """Tests for BundlePlacement routing decisions."""
+
+    def test_routes_to_warm_workers(self):
+        """Tasks for a warm bundle go to the workers holding it."""
+        client = _make_client({"w1": [BUNDLE_A], "w2": [BUNDLE_B], "w3": []})
+        placement = BundlePlacement(client)
+
+        assert placement.workers_for(BUNDLE_A, 2) == ["w1"]
+        assert placement.workers_for(BUNDLE_B, 2) == ["w2"]
+
+    def test_cold_bundle_prefers_least_loaded_worker(self):
+        """A bundle nobody holds starts on the worker with fewest warm bundles."""
+        client = _make_client({"w1": [BUNDLE_A], "w2": []})
+        placement = BundlePlacement(client)
+
+        assert placement.workers_for(BUNDLE_B, 1) == ["w2"]
+        # Remembered until the next census, so follow-up submissions stay put
+        assert placement.workers_for(BUNDLE_B, 1) == ["w2"]
+
+    def test_spreads_only_on_backlog(self):
+        """Additional workers are added once pending work exceeds capacity."""
+        client = _make_client({"w1": [BUNDLE_A], "w2": [], "w3": []}, nthreads=2)
+        placement = BundlePlacement(client, backlog_factor=2.0)
+
+        # 4 tasks fit on w1 (2 threads * factor 2)
+        assert placement.workers_for(BUNDLE_A, 4) == ["w1"]
+        placement.track(BUNDLE_A, [_future(done=False) for _ in range(4)])
+
+        # 4 pending + 4 new exceeds w1's capacity -> spread to one more worker
+        assert placement.workers_for(BUNDLE_A, 4) == ["w1", "w2"]
+
+    def test_finished_futures_do_not_count_as_backlog(self):
+        """Completed futures are dropped from backlog accounting."""
+        client = _make_client({"w1": [BUNDLE_A], "w2": []}, nthreads=2)
+        placement = BundlePlacement(client, backlog_factor=2.0)
+        placement.track(BUNDLE_A, [_future(done=True) for _ in range(10)])
+
+        assert placement.workers_for(BUNDLE_A, 4) == ["w1"]
+
+    def test_census_is_cached(self):
+        """Workers are only polled once per refresh interval."""
+        client = _make_client({"w1": [BUNDLE_A]})
+        placement = BundlePlacement(client, refresh_interval=60.0)
+
+        placement.workers_for(BUNDLE_A, 1)
+        placement.workers_for(BUNDLE_A, 1)
+        assert client.run.call_count == 1
+
+        placement.refresh(force=True)
+        assert client.run.call_count == 2
+
+    def test_census_failure_disables_routing(self):
+        """If the cluster can't be polled, tasks are submitted unrestricted."""
+        client = Mock()
+        client.scheduler_info.side_effect = RuntimeError("scheduler gone")
+        placement = BundlePlacement(client)
+
+        assert placement.workers_for(BUNDLE_A, 1) is None
+
+
+class TestWorkerWarmBundles:
+    """Tests for the worker-side census function."""
+
+    def test_reports_exec_env_warm_refs(self):
+        worker = Mock()
+        worker.modelops_exec_env.warm_bundle_refs.return_value = [BUNDLE_A]
+        assert _worker_warm_bundles(worker) == [BUNDLE_A]
+
+    def test_exec_env_without_warm_pool(self):
+        worker = Mock(spec=["address"])
+        assert _worker_warm_bundles(worker) == []
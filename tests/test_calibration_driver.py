@@ -0,0 +1,190 @@
+"""Tests for the steady-state calibration driver."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from dask.distributed import Client
+from modelops_contracts import TrialStatus, UniqueParameterSet
+
+from modelops.services.calibration_driver import SteadyStateCalibration, cluster_capacity
+from modelops.services.dask_simulation import DaskFutureAdapter
+from modelops.services.progress import ProgressReporter
+
+
+def _simulate(task):
+    x = task.params.params["x"]
+    if x == 0:
+        time.sleep(1.0)  # straggler
+    if x < 0:
+        raise RuntimeError("simulation failed")
+    return x
+
+
+def _aggregate(*values, target):
+    return SimpleNamespace(loss=float(sum(values)) / len(values))
+
+
+class FakeSimService:
+    """Runs replicates and aggregations as plain Dask tasks."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def submit_replicates(self, replicate_set):
+        return [
+            DaskFutureAdapter(self.client.submit(_simulate, t, pure=False))
+            for t in replicate_set.tasks()
+        ]
+
+    def submit_aggregation(self, sim_futures, target, bundle_ref, param_id):
+        return DaskFutureAdapter(
+            self.client.submit(
+                _aggregate, *[f.wrapped for f in sim_futures], target=target, pure=False
+            )
+        )
+
+
+class FakeAlgorithm:
+    """Proposes x = 0, 1, 2, ... and records what it is told."""
+
+    def __init__(self, xs):
+        self.xs = list(xs)
+        self.told = []
+
+    def ask(self, n):
+        batch, self.xs = self.xs[:n], self.xs[n:]
+        return [UniqueParameterSet.from_dict({"x": x}) for x in batch]
+
+    def tell(self, results):
+        self.told.extend(results)
+
+    def finished(self):
+        return False
+
+
+@pytest.fixture(scope="module")
+def client():
+    with Client(processes=False, n_workers=1, threads_per_worker=4, dashboard_address=None) as c:
+        yield c
+
+
+def _driver(client, algo, **kwargs):
+    kwargs.setdefault("max_in_flight", 2)
+    return SteadyStateCalibration(
+        FakeSimService(client),
+        algo,
+        bundle_ref="local://bundle",
+        entrypoint="models.main/baseline",
+        target_entrypoints=["targets.fit/loss"],
+        **kwargs,
+    )
+
+
+class TestSteadyStateCalibration:
+    """Trials are told as they complete and replaced immediately."""
+
+    def test_straggler_does_not_block_other_trials(self, client):
+        algo = FakeAlgorithm(range(6))
+        n_told = _driver(client, algo).run()
+
+        assert n_told == 6
+        losses = [r.loss for r in algo.told]
+        # x=0 was submitted first but sleeps; the rest are told around it
+        assert losses[-1] == 0.0
+        assert sorted(losses) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_trial_budget_stops_asking(self, client):
+        algo = FakeAlgorithm(range(1, 100))
+        n_told = _driver(client, algo, max_trials=5).run()
+
+        assert n_told == 5
+        assert len(algo.told) == 5
+
+    def test_convergence_stops_early(self, client):
+        algo = FakeAlgorithm([5, 4, 3, 2, 1, 0.5, 7, 8, 9])
+        driver = _driver(client, algo, max_in_flight=1, max_loss=1.0)
+        driver.run()
+
+        assert driver.best.loss == 0.5
+        assert len(algo.told) == 6
+
+    def test_stop_cancels_outstanding_simulations(self, client):
+        class RecordingSimService(FakeSimService):
+            submitted = []
+
+            def submit_replicates(self, replicate_set):
+                futures = super().submit_replicates(replicate_set)
+                self.submitted.append((replicate_set.base_task.params.params["x"], futures))
+                return futures
+
+        service = RecordingSimService(client)
+        algo = FakeAlgorithm([0, 0.5])
+        driver = SteadyStateCalibration(
+            service,
+            algo,
+            bundle_ref="local://bundle",
+            entrypoint="models.main/baseline",
+            target_entrypoints=["targets.fit/loss"],
+            max_in_flight=2,
+            max_loss=1.0,
+            n_replicates=2,
+        )
+        driver.run()
+
+        # x=0.5 converged while the straggling x=0 trial was still simulating
+        assert [r.loss for r in algo.told] == [0.5]
+        straggler = dict(service.submitted)[0]
+        assert [f.wrapped.status for f in straggler] == ["cancelled", "cancelled"]
+
+    def test_job_cancel_ends_the_loop(self, client):
+        reporter = ProgressReporter(None, "cal-job")
+
+        class CancellingAlgorithm(FakeAlgorithm):
+            def tell(self, results):
+                super().tell(results)
+                if len(self.told) == 2:
+                    reporter.cancel()  # As when the reporter sees `mops jobs cancel`
+
+        algo = CancellingAlgorithm(range(1, 100))
+        n_told = _driver(client, algo, max_in_flight=2, progress=reporter).run()
+
+        assert n_told == 2
+        assert not reporter._tracked
+
+    def test_failed_trial_is_told_as_failed(self, client):
+        algo = FakeAlgorithm([-1, 2])
+        _driver(client, algo, n_replicates=2).run()
+
+        by_status = {r.status: r for r in algo.told}
+        assert by_status[TrialStatus.FAILED].diagnostics["errors"]
+        assert by_status[TrialStatus.COMPLETED].loss == 2.0
+
+    def test_cancelled_aggregation_fails_only_its_trial(self, client):
+        class CancellingSimService(FakeSimService):
+            def submit_aggregation(self, sim_futures, target, bundle_ref, param_id):
+                adapter = super().submit_aggregation(sim_futures, target, bundle_ref, param_id)
+                if param_id == UniqueParameterSet.from_dict({"x": 0}).param_id:
+                    self.client.cancel(adapter.wrapped)
+                return adapter
+
+        algo = FakeAlgorithm([0, 1, 2])
+        driver = _driver(client, algo)
+        driver.sim_service = CancellingSimService(client)
+        assert driver.run() == 3
+
+        failed = [r for r in algo.told if r.status == TrialStatus.FAILED]
+        assert len(failed) == 1
+        assert "cancelled" in failed[0].diagnostics["errors"]["targets.fit/loss"]
+        assert sorted(r.loss for r in algo.told if r.status == TrialStatus.COMPLETED) == [1, 2]
+
+    def test_requires_targets(self, client):
+        with pytest.raises(ValueError, match="target"):
+            SteadyStateCalibration(
+                FakeSimService(client), FakeAlgorithm([]), "b", "e", [], max_in_flight=1
+            )
+
+    def test_cluster_capacity(self, client):
+        assert cluster_capacity(client, n_replicates=1) == 4
+        assert cluster_capacity(client, n_replicates=3) == 1
+        assert cluster_capacity(client, n_replicates=10) == 1
@@ -0,0 +1,64 @@
+"""Tests for worker-side cooperative cancellation."""
+
+import threading
+import time
+
+import pytest
+from dask.distributed import Client
+
+from modelops.worker.cancellation import (
+    CancelToken,
+    cancel_scope,
+    current_token,
+    dask_task_scope,
+)
+
+_observed = threading.Event()
+
+
+def _wait_for_cancel():
+    with dask_task_scope(poll_interval=0.05) as token:
+        assert current_token() is token
+        if token.wait(10):
+            _observed.set()
+    return token.reason
+
+
+@pytest.fixture(scope="module")
+def client():
+    with Client(processes=False, n_workers=1, threads_per_worker=1, dashboard_address=None) as c:
+        yield c
+
+
+def test_cancel_scope_binds_token():
+    assert current_token() is None
+    token = CancelToken()
+    with cancel_scope(token):
+        assert current_token() is token
+    assert current_token() is None
+
+
+def test_cancel_records_first_reason():
+    token = CancelToken()
+    token.cancel("first")
+    token.cancel("second")
+    assert token.is_set()
+    assert token.reason == "first"
+
+
+def test_dask_cancel_fires_token(client):
+    _observed.clear()
+    future = client.submit(_wait_for_cancel, pure=False)
+    deadline = time.monotonic() + 5
+    while future.key not in str(client.processing()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    future.cancel()
+
+    assert _observed.wait(5), "Token should fire once Dask cancels the running task"
+
+
+def test_scope_outside_worker_is_inert():
+    with dask_task_scope() as token:
+        assert current_token() is token
+    assert not token.is_set()
@@ -0,0 +1,247 @@
+"""Tests for reusing one Dask client, and its cluster state, across jobs."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from dask.distributed import Client, LocalCluster, WorkerPlugin
+
+from modelops.runners import job_runner
+from modelops.services.cluster_session import session_for
+from modelops.services.dask_simulation import DaskSimulationService
+from modelops.services.job_registry import JobRegistry
+from modelops.services.job_state import JobCancelledError, JobStatus
+from modelops.services.storage.memory import InMemoryVersionedStore
+
+
+@pytest.fixture
+def cluster():
+    cluster = LocalCluster(
+        n_workers=1, threads_per_worker=1, processes=False, dashboard_address=None
+    )
+    yield cluster
+    cluster.close()
+
+
+@pytest.fixture
+def client(cluster):
+    client = Client(cluster)
+    yield client
+    client.close()
+
+
+class _NoopPlugin(WorkerPlugin):
+    pass
+
+
+def _wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.05)
+
+
+def test_plugin_is_registered_once_per_client(client):
+    session = session_for(client)
+    assert session_for(client) is session
+
+    plugin = _NoopPlugin()
+    assert session.register_plugin(plugin, name="noop")
+    assert not session.register_plugin(plugin, name="noop")
+    assert session.plugins == {"noop"}
+    assert "noop" in client.run(lambda dask_worker: list(dask_worker.plugins)).popitem()[1]
+
+
+def test_services_on_one_client_share_the_registration():
+    client = Mock()
+    DaskSimulationService(client)
+    DaskSimulationService(client)
+    assert client.register_plugin.call_count == 1
+
+
+def test_scheduler_info_is_cached_until_workers_change(client, cluster, monkeypatch):
+    session = session_for(client)
+    calls = []
+    scheduler_info = client.scheduler_info
+    monkeypatch.setattr(client, "scheduler_info", lambda: calls.append(1) or scheduler_info())
+    changes = []
+    session.on_change(changes.append)
+
+    def cached():
+        n_calls = len(calls)
+        session.scheduler_info()
+        return len(calls) == n_calls
+
+    # Caching starts once the scheduler has confirmed the event subscription
+    _wait_for(cached)
+    n_calls = len(calls)
+    assert len(session.scheduler_info()["workers"]) == 1
+    assert not session.has_resource("aggregation")
+    assert len(calls) == n_calls
+
+    cluster.scale(2)
+    _wait_for(lambda: changes)
+    assert changes[0]["action"] == "add-worker"
+    _wait_for(lambda: len(session.scheduler_info()["workers"]) == 2)
+    assert len(calls) > n_calls
+
+
+# The runner service loop
+
+
+def _queue(registry, job_id):
+    registry.register_job(
+        job_id=job_id, k8s_name=job_id, namespace="default", metadata={"blob_key": job_id}
+    )
+    registry.update_status(job_id, JobStatus.SUBMITTING)
+    registry.update_status(job_id, JobStatus.SCHEDULED)
+    registry.enqueue_job(job_id)
+
+
+def test_serve_runs_queued_jobs_on_one_client(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    client = Mock()
+    ran = []
+
+    def run_job(job, run_client):
+        assert run_client is client
+        if job == "job-bad":
+            raise RuntimeError("model crashed")
+        ran.append(job)
+
+    monkeypatch.setattr(job_runner, "run_job", run_job)
+    for job_id in ("job-1", "job-bad", "job-2"):
+        _queue(registry, job_id)
+
+    n_jobs = job_runner.serve(
+        client, registry, poll_interval=0.01, max_jobs=3, load_job=lambda key: key
+    )
+    assert n_jobs == 3
+    assert ran == ["job-1", "job-2"]
+    assert registry.get_job("job-1").status == JobStatus.VALIDATING
+    failed = registry.get_job("job-bad")
+    assert failed.status == JobStatus.FAILED
+    assert failed.error_message == "model crashed"
+    assert registry.queued_jobs() == []
+
+
+def test_serve_waits_for_jobs_until_stopped(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    stop = threading.Event()
+    monkeypatch.setattr(job_runner, "run_job", lambda job, client: stop.set())
+
+    runner = threading.Thread(
+        target=job_runner.serve,
+        args=(Mock(), registry),
+        kwargs={"poll_interval": 0.01, "stop": stop, "load_job": lambda key: key},
+    )
+    runner.start()
+    time.sleep(0.05)  # Idle while the queue is empty
+    _queue(registry, "job-late")
+    runner.join(timeout=10)
+    assert not runner.is_alive()
+    assert registry.get_job("job-late").status == JobStatus.VALIDATING
+
+
+def test_serve_survives_registry_errors(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    monkeypatch.setattr(job_runner, "run_job", lambda job, client: None)
+    _queue(registry, "job-1")
+
+    # The first listing fails, as with a transient storage error
+    queued_jobs = registry.queued_jobs
+    errors = [RuntimeError("storage unavailable")]
+
+    def flaky_queued_jobs():
+        if errors:
+            raise errors.pop()
+        return queued_jobs()
+
+    monkeypatch.setattr(registry, "queued_jobs", flaky_queued_jobs)
+    n_jobs = job_runner.serve(
+        Mock(), registry, poll_interval=0.01, max_jobs=1, load_job=lambda key: key
+    )
+    assert n_jobs == 1
+    assert registry.get_job("job-1").status == JobStatus.VALIDATING
+
+
+def test_serve_leaves_cancelled_jobs_cancelled(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+
+    def run_job(job, client):
+        if job == "job-cancelled":
+            registry.cancel_job(job)  # `mops jobs cancel` while it runs
+            raise JobCancelledError(f"Job {job} was cancelled")
+
+    monkeypatch.setattr(job_runner, "run_job", run_job)
+    for job_id in ("job-cancelled", "job-next"):
+        _queue(registry, job_id)
+
+    n_jobs = job_runner.serve(
+        Mock(), registry, poll_interval=0.01, max_jobs=2, load_job=lambda key: key
+    )
+    assert n_jobs == 2
+    assert registry.get_job("job-cancelled").status == JobStatus.CANCELLED
+    assert registry.get_job("job-next").status == JobStatus.VALIDATING
+
+
+def test_serve_tries_every_queued_job(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    ran = []
+    monkeypatch.setattr(job_runner, "run_job", lambda job, client: ran.append(job))
+    for job_id in ("job-taken", "job-free"):
+        _queue(registry, job_id)
+
+    # job-taken's marker outlives a claim another runner won
+    claim_job = registry.claim_job
+    monkeypatch.setattr(
+        registry,
+        "claim_job",
+        lambda job_id, *args, **kwargs: (
+            None if job_id == "job-taken" else claim_job(job_id, *args, **kwargs)
+        ),
+    )
+    n_jobs = job_runner.serve(
+        Mock(), registry, poll_interval=0.01, max_jobs=1, load_job=lambda key: key
+    )
+    assert n_jobs == 1
+    assert ran == ["job-free"]
+
+
+def test_serve_reclaims_jobs_of_lost_runners(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    monkeypatch.setattr(job_runner, "run_job", lambda job, client: None)
+    _queue(registry, "job-orphaned")
+    registry.claim_job("job-orphaned", "dead-runner", lease_seconds=0)
+
+    n_jobs = job_runner.serve(
+        Mock(), registry, poll_interval=0.01, max_jobs=1, load_job=lambda key: key
+    )
+    assert n_jobs == 1
+    state = registry.get_job("job-orphaned")
+    assert state.status == JobStatus.VALIDATING
+    assert state.metadata["reclaims"] == 1
+
+
+def test_serve_renews_the_lease_while_a_job_runs(monkeypatch):
+    registry = JobRegistry(InMemoryVersionedStore())
+    reclaimed = []
+
+    def run_job(job, client):
+        time.sleep(0.5)  # Several leases long
+        reclaimed.extend(registry.reclaim_stale_jobs())
+
+    monkeypatch.setattr(job_runner, "run_job", run_job)
+    _queue(registry, "job-long")
+    job_runner.serve(
+        Mock(),
+        registry,
+        poll_interval=0.01,
+        max_jobs=1,
+        load_job=lambda key: key,
+        lease_seconds=0.15,
+    )
+    assert reclaimed == []
+    assert registry.get_job("job-long").status == JobStatus.VALIDATING
@@ -1,7 +1,10 @@
 """Tests for contract compliance."""
 
+import hashlib
+
+import numpy as np
 import pytest
-from modelops.utils.seeds import derive_replicate_seeds, derive_single_seed
+from modelops.utils.seeds import derive_replicate_seeds, derive_seed_array, derive_single_seed
 from modelops_contracts import TrialResult, TrialStatus, UniqueParameterSet, make_param_id
 
 
@@ -44,6 +47,24 @@ def test_single_seed_derivation():
     assert seed0 != seed1
 
 
+def test_seed_array_matches_per_param_derivation():
+    """Batched seeds are bit-identical to the original per-seed BLAKE2b scheme."""
+    param_ids = ["p0", "p1", "a" * 64]
+
+    seeds = derive_seed_array(param_ids, 12)
+    assert seeds.dtype == np.uint64
+    for param_id, row in zip(param_ids, seeds.reshape(3, 12), strict=True):
+        digests = [
+            hashlib.blake2b(f"contracts:seed:v1|{param_id}:{i}".encode(), digest_size=8).digest()
+            for i in range(12)
+        ]
+        expected = [int.from_bytes(d, "little") for d in digests]
+        assert row.tolist() == expected == derive_replicate_seeds(param_id, 12)
+
+    ragged = derive_seed_array(param_ids, [1, 0, 3])
+    assert ragged.tolist() == derive_replicate_seeds("p0", 1) + derive_replicate_seeds("a" * 64, 3)
+
+
 def test_trialresult_invariants():
     """Test TrialResult contract invariants."""
     # Valid completed result
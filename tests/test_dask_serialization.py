@@ -218,6 +218,48 @@ def test_simreturn_with_error_serialization():
         pytest.fail(f"SimReturn with error serialization failed: {e}")
 
 
+def _large_sim_return(n_bytes: int = 64 * 1024) -> SimReturn:
+    body = bytes(range(256)) * (n_bytes // 256)
+    return SimReturn(
+        task_id="a" * 64,
+        outputs={
+            "result": TableArtifact(size=len(body), inline=body, checksum="b" * 64),
+            "metadata": TableArtifact(size=2, inline=b"{}", checksum="c" * 64),
+        },
+    )
+
+
+def test_simreturn_bodies_sent_out_of_band():
+    """Large artifact bodies travel as their own frames, without being copied."""
+    from distributed.protocol import deserialize, serialize
+
+    import modelops.worker.serialization  # noqa: F401
+
+    sim_return = _large_sim_return()
+    header, frames = serialize(sim_return)
+
+    assert header["serializer"] == "dask"
+    body = sim_return.outputs["result"].inline
+    # Pickled frame plus the large body; the 2-byte metadata stays in band
+    assert len(frames) == 2 and frames[1].obj is body
+    assert len(frames[0]) < 1024
+
+    restored = deserialize(header, frames)
+    assert restored == sim_return
+    assert type(restored.outputs["result"].inline) is bytes
+
+
+def test_simreturn_list_roundtrip_through_bytes():
+    """Lists of results, as gathered for aggregation or spilled, round-trip."""
+    from distributed.protocol import deserialize_bytes, serialize_bytelist
+
+    import modelops.worker.serialization  # noqa: F401
+
+    results = [_large_sim_return(), _large_sim_return(4096)]
+    payload = b"".join(bytes(frame) for frame in serialize_bytelist(results))
+    assert deserialize_bytes(payload) == results
+
+
 if __name__ == "__main__":
     # Run non-Dask tests
     print("Running serialization tests...\n")
@@ -0,0 +1,59 @@
+"""Tests for FileBundleRepository digest caching."""
+
+import os
+
+import pytest
+
+from modelops.adapters.bundle.file_repo import FileBundleRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    bundles_dir = tmp_path / "bundles"
+    bundle = bundles_dir / "model"
+    (bundle / "data").mkdir(parents=True)
+    (bundle / "model.py").write_text("def run(): pass\n")
+    (bundle / "data" / "input.csv").write_text("a,b\n1,2\n")
+    return FileBundleRepository(bundles_dir=str(bundles_dir), cache_dir=str(tmp_path / "cache"))
+
+
+class TestDigestCache:
+    """Repeat resolutions should not rehash unchanged bundles."""
+
+    def test_unchanged_bundle_is_hashed_once(self, repo, monkeypatch):
+        calls = []
+        original = repo._compute_digest
+        monkeypatch.setattr(repo, "_compute_digest", lambda p: calls.append(p) or original(p))
+
+        first = repo.ensure_local("model")
+        second = repo.ensure_local("model")
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_modified_bundle_is_rehashed(self, repo):
+        digest1, _ = repo.ensure_local("model")
+
+        data_file = repo.bundles_dir / "model" / "data" / "input.csv"
+        data_file.write_text("a,b\n1,2\n3,4\n")
+
+        digest2, path2 = repo.ensure_local("model")
+        assert digest2 != digest1
+        assert (path2 / "data" / "input.csv").read_text().endswith("3,4\n")
+
+    def test_touched_file_invalidates_snapshot(self, repo):
+        source = repo.bundles_dir / "model"
+        snapshot = repo._tree_snapshot(source)
+
+        st = (source / "model.py").stat()
+        os.utime(source / "model.py", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert repo._tree_snapshot(source) != snapshot
+
+    def test_added_file_invalidates_snapshot(self, repo):
+        source = repo.bundles_dir / "model"
+        snapshot = repo._tree_snapshot(source)
+
+        (source / "data" / "extra.csv").write_text("x\n")
+
+        assert repo._tree_snapshot(source) != snapshot
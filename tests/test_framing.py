@@ -0,0 +1,117 @@
+"""Tests for the frame reader/writer and codecs shared by worker and runner."""
+
+import io
+import math
+import os
+import threading
+
+import pytest
+
+from modelops.worker import framing
+from modelops.worker.framing import FrameError, FrameReader, decode, encode, write_frame
+from modelops.worker.jsonrpc import JSONRPCProtocol
+
+needs_msgpack = pytest.mark.skipif(framing.msgpack is None, reason="msgpack not installed")
+
+
+class TrickleStream(io.RawIOBase):
+    """Raw stream returning at most `step` bytes per read, like a busy pipe."""
+
+    def __init__(self, data: bytes, step: int):
+        self._data = memoryview(data)
+        self._pos = 0
+        self._step = step
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        self.reads += 1
+        n = min(len(b), self._step, len(self._data) - self._pos)
+        b[:n] = self._data[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+
+def _frames(*messages, codec=framing.JSON) -> bytes:
+    out = io.BytesIO()
+    for message in messages:
+        write_frame(out, *encode(message, codec))
+    return out.getvalue()
+
+
+def test_frames_split_across_reads_and_sharing_reads():
+    messages = [{"id": i, "data": "x" * (i * 5000)} for i in range(6)]
+    data = _frames(*messages)
+
+    for step in (1, 7, 4096, len(data)):
+        reader = FrameReader(TrickleStream(data, step), buffer_size=1024)
+        assert [decode(reader.read_frame()[1]) for _ in messages] == messages
+        with pytest.raises(EOFError):
+            reader.read_frame()
+
+    # Small frames that arrive together are parsed from a single read
+    stream = TrickleStream(_frames(*messages[:3]), step=1 << 20)
+    reader = FrameReader(stream)
+    for _ in range(3):
+        reader.read_frame()
+    assert stream.reads == 1
+
+
+def test_lf_headers_and_truncated_frames():
+    reader = FrameReader(io.BytesIO(b"content-length: 2\n\n{}"))
+    assert reader.read_frame() == ({"content-length": "2"}, b"{}")
+
+    with pytest.raises(FrameError, match="Incomplete message: expected 10 bytes, got 3"):
+        FrameReader(io.BytesIO(b"Content-Length: 10\r\n\r\nabc")).read_frame()
+    with pytest.raises(FrameError, match="Incomplete header"):
+        FrameReader(io.BytesIO(b"Content-Length: 1")).read_frame()
+    with pytest.raises(FrameError, match="exceeds"):
+        FrameReader(io.BytesIO(b"X" * 100), buffer_size=16).read_frame()
+
+
+def test_json_codec_keeps_nan_and_big_integers():
+    message = {"loss": math.nan, "seed": 2**70}
+    body, content_type = encode(message)
+    assert content_type is None
+
+    decoded = decode(body)
+    assert math.isnan(decoded["loss"]) and decoded["seed"] == 2**70
+
+
+@needs_msgpack
+def test_msgpack_frames_are_decoded_by_content_type():
+    out = io.BytesIO()
+    writer = JSONRPCProtocol(None, out)
+    writer.use_codec(framing.MSGPACK)
+    writer.send_response(1, {"payload": "x" * 70000, "values": [1.5, None, True]})
+    # Not representable in msgpack: sent as a json frame instead
+    writer.send_response(2, {"seed": 2**70})
+
+    assert b"Content-Type: application/msgpack" in out.getvalue()[:100]
+    reader = JSONRPCProtocol(io.BytesIO(out.getvalue()), None)
+    assert reader.read_message()["result"]["values"] == [1.5, None, True]
+    assert reader.read_message()["result"] == {"seed": 2**70}
+
+
+def test_codec_negotiation(monkeypatch):
+    assert framing.choose_codec(None) == framing.JSON
+    assert framing.choose_codec(["cbor", "json"]) == framing.JSON
+    monkeypatch.setattr(framing, "msgpack", None)
+    assert framing.choose_codec(["msgpack", "json"]) == framing.JSON
+    with pytest.raises(ValueError):
+        JSONRPCProtocol(None, io.BytesIO()).use_codec(framing.MSGPACK)
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="writev() not available")
+def test_large_frame_over_pipe():
+    read_fd, write_fd = os.pipe()
+    message = {"jsonrpc": "2.0", "id": 1, "result": "y" * (3 * 1024 * 1024)}
+
+    with open(read_fd, "rb", buffering=0) as r, open(write_fd, "wb", buffering=0) as w:
+        # The pipe fills up, so writev() returns short and the frame is finished in pieces
+        writer = threading.Thread(target=JSONRPCProtocol(None, w)._write_message, args=(message,))
+        writer.start()
+        assert JSONRPCProtocol(r, None).read_message() == message
+        writer.join()
@@ -0,0 +1,99 @@
+"""Cold-start budget for `import modelops` and the mops CLI.
+
+Each check runs in a fresh interpreter. Heavy dependencies must stay out of
+the start-up path entirely; the wall-clock budgets (from `python -X
+importtime`) are generous and can be scaled with
+MODELOPS_IMPORT_BUDGET_SCALE (e.g. 2.0) on slow machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "dask.distributed",
+    "polars",
+    "pyarrow",
+    "pulumi",
+    "kubernetes",
+    "azure",
+    "modelops_contracts",
+]
+
+# Cumulative import time budgets in milliseconds
+IMPORT_BUDGETS_MS = {
+    "modelops": 250,
+    "modelops.cli.main": 600,
+}
+
+_LOADED_HEAVY = f"""
+import json, sys
+print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))
+"""
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+def test_import_modelops_skips_heavy_dependencies():
+    result = _run("import modelops" + _LOADED_HEAVY)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
+
+
+def test_cli_help_skips_heavy_dependencies():
+    code = (
+        "import contextlib, io, sys\n"
+        "from modelops.cli.main import app\n"
+        "with contextlib.redirect_stdout(io.StringIO()) as out, contextlib.suppress(SystemExit):\n"
+        "    app(['--help'])\n"
+        "assert 'infra' in out.getvalue() and 'jobs' in out.getvalue()\n"
+    )
+    result = _run(code + _LOADED_HEAVY)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
+
+
+def test_lazy_attributes_resolve():
+    result = _run(
+        "import modelops.services as s, modelops.worker as w\n"
+        "assert 'DaskSimulationService' in dir(s)\n"
+        "assert w.RuntimeConfig.__module__ == 'modelops.worker.config'\n"
+        "from modelops.services import storage_catalog\n"
+        "try:\n"
+        "    s.NoSuchThing\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise SystemExit('missing attribute did not raise')\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_import_time_budget(module):
+    result = _run(f"import {module}", "-X", "importtime")
+    assert result.returncode == 0, result.stderr
+
+    # Lines look like "import time: self [us] | cumulative [us] | name"
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == module
+    )
+    scale = float(os.environ.get("MODELOPS_IMPORT_BUDGET_SCALE", "1"))
+    budget_ms = IMPORT_BUDGETS_MS[module] * scale
+    assert cumulative_us / 1000 <= budget_ms, (
+        f"import {module} took {cumulative_us / 1000:.0f} ms (budget {budget_ms:.0f} ms); "
+        f"run `python -X importtime -c 'import {module}'` to find the new dependency"
+    )
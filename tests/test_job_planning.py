@@ -0,0 +1,186 @@
+"""Tests for cache-aware job planning."""
+
+import hashlib
+
+import numpy as np
+import pytest
+from dask.distributed import Client, LocalCluster
+from modelops_contracts import ErrorInfo, SimReturn, SimTask, TableArtifact, UniqueParameterSet
+from modelops_contracts.simulation import ReplicateSet
+
+from modelops.services import dask_simulation
+from modelops.services.dask_simulation import DaskSimulationService, TaskKeys
+from modelops.services.job_planning import CachedSimRef, plan_job
+from modelops.services.provenance_store import ProvenanceStore
+from modelops.services.storage.local import LocalFileBackend
+
+TEST_BUNDLE_REF = "sha256:" + "a" * 64
+
+
+def _task(seed, x=1):
+    return SimTask(
+        bundle_ref=TEST_BUNDLE_REF,
+        entrypoint="model.sim/baseline",
+        params=UniqueParameterSet.from_dict({"x": x}),
+        seed=seed,
+    )
+
+
+def _sim_return(task):
+    data = str(task.seed).encode()
+    artifact = TableArtifact(
+        size=len(data), inline=data, checksum=hashlib.blake2b(data, digest_size=32).hexdigest()
+    )
+    return SimReturn(task_id=f"{task.seed:064x}", outputs={"seed": artifact})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProvenanceStore(storage_dir=tmp_path)
+
+
+@pytest.fixture
+def task_groups():
+    groups = {}
+    for x in (1, 2):
+        tasks = [_task(seed, x) for seed in (10, 20, 30)]
+        groups[tasks[0].params.param_id] = tasks
+    return groups
+
+
+def test_plan_splits_hits_and_misses(store, task_groups):
+    (p1, tasks1), (p2, tasks2) = task_groups.items()
+    store.put_sim(tasks1[1], _sim_return(tasks1[1]))
+    for task in tasks2:
+        store.put_sim(task, _sim_return(task))
+    # Stored failures are not hits
+    error = ErrorInfo(error_type="RuntimeError", message="boom", retryable=False)
+    store.put_sim(tasks1[2], SimReturn(task_id="f" * 64, outputs={}, error=error))
+
+    plan = plan_job(task_groups, store)
+
+    assert plan.misses(p1) == [tasks1[0], tasks1[2]]
+    assert plan.misses(p2) == []
+    assert [ref.task for ref in plan.hits(p1)] == [tasks1[1]]
+    assert plan.summary.to_dict() | {"seconds": 0} == {
+        "tasks": 6,
+        "hits": 4,
+        "misses": 2,
+        "cached_bytes": 8,  # Four 2-byte artifacts
+        "seconds": 0,
+    }
+
+    # Futures for the misses and refs for the hits, back in task order
+    inputs = plan.inputs(p1, ["f10", "f30"])
+    assert inputs[0] == "f10" and inputs[2] == "f30"
+    assert isinstance(inputs[1], CachedSimRef) and inputs[1].task == tasks1[1]
+
+    # The runner reads cached results back for the job's views
+    results = plan.results(p1, ["r10", "r30"], store)
+    assert results[0] == "r10" and results[2] == "r30"
+    assert results[1].outputs["seed"].inline == b"20"
+
+
+def test_vanished_hit_and_no_store(store, task_groups):
+    p1, tasks1 = next(iter(task_groups.items()))
+    store.put_sim(tasks1[0], _sim_return(tasks1[0]))
+    plan = plan_job(task_groups, store)
+
+    other = ProvenanceStore(storage_dir=store.storage_dir / "elsewhere")
+    results = plan.results(p1, ["r20", "r30"], other)
+    assert isinstance(results[0], LookupError)
+
+    plan = plan_job(task_groups, None)
+    assert plan.summary.hits == 0
+    assert plan.misses(p1) == tasks1
+
+
+def test_plan_sees_results_uploaded_by_workers(tmp_path, task_groups):
+    """A runner with its own storage_dir finds worker results in the remote backend."""
+    remote = LocalFileBackend(str(tmp_path / "remote"))
+    worker = ProvenanceStore(storage_dir=tmp_path / "worker")
+    worker._azure_backend = remote
+    p1, tasks1 = next(iter(task_groups.items()))
+    worker.put_sim(tasks1[0], _sim_return(tasks1[0]))
+    key = worker.sim_result_path(tasks1[0])
+    worker.upload_directory(worker.storage_dir / key, key)
+
+    runner = ProvenanceStore(storage_dir=tmp_path / "runner")
+    runner._azure_backend = remote
+    plan = plan_job(task_groups, runner)
+    assert plan.summary.hits == 1
+    results = plan.results(p1, ["r20", "r30"], runner)
+    assert results[0].outputs["seed"].inline == b"10"
+
+
+def test_planning_store_needs_storage_shared_with_workers(tmp_path, monkeypatch):
+    from modelops.runners.job_runner import _make_planning_store
+
+    for name in (
+        "MODELOPS_CACHE_PLANNING",
+        "MODELOPS_DISABLE_PROVENANCE",
+        "MODELOPS_SHARED_STORAGE",
+        "MODELOPS_UPLOAD_TO_AZURE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("MODELOPS_STORAGE_DIR", str(tmp_path))
+    assert _make_planning_store() is None
+
+    monkeypatch.setenv("MODELOPS_SHARED_STORAGE", "true")
+    assert _make_planning_store().storage_dir == tmp_path
+
+
+# Aggregation over a mix of submitted simulations and cached refs
+
+
+def _fake_run_task(task):
+    return _sim_return(task)
+
+
+def _fake_run_aggregation(agg_task):
+    return [int(r.outputs["seed"].inline) for r in agg_task.sim_returns]
+
+
+@pytest.fixture(scope="module")
+def client():
+    cluster = LocalCluster(
+        n_workers=1, threads_per_worker=2, processes=False, dashboard_address=None
+    )
+    client = Client(cluster)
+    yield client
+    client.close()
+    cluster.close()
+
+
+@pytest.mark.parametrize("content_addressed", [False, True])
+def test_aggregation_loads_cached_refs(client, monkeypatch, store, content_addressed):
+    monkeypatch.setattr(dask_simulation, "_worker_run_task", _fake_run_task)
+    monkeypatch.setattr(dask_simulation, "_worker_run_aggregation", _fake_run_aggregation)
+    service = DaskSimulationService.__new__(DaskSimulationService)
+    service.client = client
+    service.content_addressed_keys = content_addressed
+
+    tasks = [_task(seed) for seed in (10, 20, 30)]
+    store.put_sim(tasks[1], _sim_return(tasks[1]))
+    param_id = tasks[0].params.param_id
+    plan = plan_job({param_id: tasks}, store)
+
+    misses = plan.misses(param_id)
+    seeds = np.array([t.seed for t in misses], dtype=np.uint64)
+    sim_futures = service.submit_replicates(
+        ReplicateSet(base_task=misses[0], n_replicates=len(misses)), seeds=seeds
+    )
+    agg = service.submit_aggregation(
+        plan.inputs(param_id, sim_futures),
+        "targets.fit/loss",
+        bundle_ref=TEST_BUNDLE_REF,
+        param_id=param_id,
+    )
+
+    assert agg.result(timeout=30) == [10, 20, 30]
+    if content_addressed:
+        # Same key as if every simulation had been submitted
+        expected = TaskKeys.content_agg_key(
+            TEST_BUNDLE_REF, "targets.fit/loss", [TaskKeys.content_sim_key(t) for t in tasks]
+        )
+        assert agg.wrapped.key == expected
@@ -158,6 +158,28 @@ class TestJobRegistry:
         state = registry.update_progress("job-1", tasks_completed=100)
         assert state.tasks_completed == 100
 
+    def test_update_progress_adds_deltas(self, registry):
+        """Coalesced deltas accumulate and carry throughput/ETA."""
+        registry.register_job("job-1", "k8s-job-1", "default")
+
+        registry.update_progress("job-1", tasks_total=100, completed_delta=30)
+        state = registry.update_progress(
+            "job-1", completed_delta=20, tasks_per_second=12.5, eta_seconds=4.0
+        )
+        assert state.tasks_completed == 50
+        assert state.tasks_total == 100
+        assert state.tasks_per_second == 12.5
+        assert state.eta_seconds == 4.0
+
+    def test_record_plan(self, registry):
+        """The cache plan lands in metadata without touching other keys."""
+        registry.register_job("job-1", "k8s-job-1", "default", metadata={"algorithm": "grid"})
+
+        plan = {"tasks": 10, "hits": 7, "misses": 3, "cached_bytes": 4096, "seconds": 0.01}
+        state = registry.record_plan("job-1", plan)
+        assert state.metadata == {"algorithm": "grid", "plan": plan}
+        assert registry.get_job("job-1").metadata["plan"]["hits"] == 7
+
     def test_get_job(self, registry):
         """Test retrieving job state."""
         # Non-existent job
@@ -389,6 +411,60 @@ class TestJobRegistry:
         successful_status = results[0][1]
         assert successful_status in {JobStatus.SUBMITTING, JobStatus.CANCELLED}
 
+    def test_queue_claims_each_job_once(self, registry):
+        """Queued jobs are claimed oldest first, by exactly one runner."""
+        for job_id in ("job-a", "job-b", "job-c"):
+            registry.register_job(job_id=job_id, k8s_name=job_id, namespace="default")
+            registry.update_status(job_id, JobStatus.SUBMITTING)
+            registry.update_status(job_id, JobStatus.SCHEDULED)
+            registry.enqueue_job(job_id)
+        assert registry.queued_jobs() == ["job-a", "job-b", "job-c"]
+        assert registry.list_jobs(limit=10)[0].job_id == "job-c"  # Queue keys are not jobs
+
+        state = registry.claim_job("job-a", "runner-1")
+        assert state.status == JobStatus.RUNNING
+        assert state.metadata["runner_id"] == "runner-1"
+        assert registry.claim_job("job-a", "runner-2") is None
+
+        registry.cancel_job("job-b")
+        assert registry.claim_job("job-b", "runner-2") is None
+        assert registry.queued_jobs() == ["job-c"]
+
+    def test_stale_claims_are_requeued(self, registry):
+        """A job whose runner stopped renewing its lease goes back on the queue."""
+        for job_id in ("job-a", "job-b"):
+            registry.register_job(job_id=job_id, k8s_name=job_id, namespace="default")
+            registry.update_status(job_id, JobStatus.SUBMITTING)
+            registry.update_status(job_id, JobStatus.SCHEDULED)
+            registry.enqueue_job(job_id)
+        registry.claim_job("job-a", "runner-1", lease_seconds=0)  # Runner died at once
+        registry.claim_job("job-b", "runner-2")  # No lease: never reclaimed
+
+        assert registry.reclaim_stale_jobs() == ["job-a"]
+        state = registry.get_job("job-a")
+        assert state.status == JobStatus.SCHEDULED
+        assert state.metadata["reclaims"] == 1 and "runner_id" not in state.metadata
+        assert registry.queued_jobs() == ["job-a"]
+        assert not registry.renew_lease("job-a", "runner-1", 60)
+
+        registry.claim_job("job-a", "runner-3", lease_seconds=60)
+        assert registry.renew_lease("job-a", "runner-3", 60)
+        assert registry.reclaim_stale_jobs() == []
+        assert registry.get_job("job-b").status == JobStatus.RUNNING
+
+    def test_job_fails_after_too_many_reclaims(self, registry):
+        registry.register_job(job_id="job-a", k8s_name="job-a", namespace="default")
+        registry.update_status("job-a", JobStatus.SUBMITTING)
+        registry.update_status("job-a", JobStatus.SCHEDULED)
+        for _ in range(2):
+            registry.claim_job("job-a", "runner-1", lease_seconds=0)
+            registry.reclaim_stale_jobs(max_reclaims=1)
+
+        state = registry.get_job("job-a")
+        assert state.status == JobStatus.FAILED
+        assert state.error_code == "RunnerLost"
+        assert registry.queued_jobs() == []
+
     def test_metadata_merge(self, registry):
         """Test that metadata updates are merged, not replaced."""
         # Register with initial metadata
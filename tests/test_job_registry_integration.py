@@ -216,6 +216,37 @@ def test_cli_list_command():
         assert "test-002" not in result.stdout  # failed
 
 
+def test_cli_cancel_command():
+    """Test the CLI cancel command marks the job cancelled."""
+    from typer.testing import CliRunner
+
+    from modelops.cli.jobs import app
+
+    runner = CliRunner()
+    registry = JobRegistry(InMemoryVersionedStore())
+    for job_id in ("test-run", "test-done"):
+        registry.register_job(job_id=job_id, k8s_name=job_id, namespace="modelops-dask-dev")
+        registry.update_status(job_id, JobStatus.SUBMITTING)
+        registry.update_status(job_id, JobStatus.SCHEDULED)
+        registry.update_status(job_id, JobStatus.RUNNING)
+    registry.update_status("test-done", JobStatus.SUCCEEDED)
+
+    with (
+        patch("modelops.cli.utils.resolve_env", return_value="dev"),
+        patch("modelops.cli.jobs._get_registry", return_value=registry),
+    ):
+        result = runner.invoke(app, ["cancel", "test-run", "--reason", "wrong bundle"])
+        assert result.exit_code == 0
+        state = registry.get_job("test-run")
+        assert state.status == JobStatus.CANCELLED
+        assert state.error_message == "Cancelled: wrong bundle"
+
+        # Finished jobs stay as they are
+        result = runner.invoke(app, ["cancel", "test-done"])
+        assert result.exit_code == 1
+        assert registry.get_job("test-done").status == JobStatus.SUCCEEDED
+
+
 if __name__ == "__main__":
     test_job_submission_with_registry()
     test_cli_status_command()
@@ -15,9 +15,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from modelops.worker.jsonrpc import (
+    REQUEST_CANCELLED,
+    DeadlineExceededError,
     JSONRPCClient,
     JSONRPCError,
     JSONRPCProtocol,
+    RequestCancelledError,
 )
 
 
@@ -193,6 +196,59 @@ class TestJSONRPCClient:
         assert exc_info.value.code == -32601
 
 
+class TestJSONRPCClientCancellation:
+    """Cancel notifications sent by the client when it stops waiting."""
+
+    @staticmethod
+    def _serve(acknowledge: bool):
+        """Fake runner that only answers a request once it is cancelled."""
+        to_server_r, to_server_w = os.pipe()
+        to_client_r, to_client_w = os.pipe()
+        server = JSONRPCProtocol(os.fdopen(to_server_r, "rb"), os.fdopen(to_client_w, "wb"))
+        received = []
+
+        def run():
+            request = server.read_message()
+            received.append(request)
+            cancel = server.read_message()
+            received.append(cancel)
+            if acknowledge:
+                server.send_error(request["id"], REQUEST_CANCELLED, "Request cancelled")
+
+        threading.Thread(target=run, daemon=True).start()
+        client = JSONRPCClient(os.fdopen(to_server_w, "wb"), os.fdopen(to_client_r, "rb"))
+        # Keep the server's streams open for the duration of the test
+        client._fake_server = server
+        return client, received
+
+    def test_cancel_event_sends_notification(self):
+        client, received = self._serve(acknowledge=True)
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+
+        with pytest.raises(RequestCancelledError):
+            client.call("execute", {}, cancel=cancel)
+
+        request, notification = received
+        assert notification["method"] == "cancel"
+        assert "id" not in notification
+        assert notification["params"] == {"id": request["id"]}
+
+    def test_acknowledged_timeout_is_deadline_exceeded(self):
+        client, _ = self._serve(acknowledge=True)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            client.call("execute", {}, timeout=0.2)
+        assert isinstance(exc_info.value, TimeoutError)
+
+    def test_unacknowledged_cancel_times_out(self):
+        client, _ = self._serve(acknowledge=False)
+
+        with pytest.raises(TimeoutError) as exc_info:
+            client.call("execute", {}, timeout=0.1, cancel_grace=0.2)
+        assert not isinstance(exc_info.value, JSONRPCError)
+
+
 class TestSubprocessCommunication:
     """Test actual subprocess communication."""
 
@@ -3,9 +3,12 @@
 Tests core functionality without complex contract dependencies.
 """
 
+import hashlib
+import time
 import pytest
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import Mock
 from dataclasses import asdict
 
 from modelops.services.job_state import (
@@ -22,6 +25,7 @@ from modelops.services.output_manifest import (
     reconstruct_task_from_spec,
 )
 from modelops.services.provenance_store import ProvenanceStore
+from modelops.services.result_index import IndexEntry, IndexRecorder, JobResultIndex
 from modelops.services.provenance_schema import ProvenanceSchema
 from modelops.services.storage.memory import InMemoryVersionedStore
 
@@ -270,6 +274,280 @@ class TestJobRegistryValidation:
         assert tasks[0].params.params == {"x": 1, "y": 2}  # params are nested
 
 
+class TestResultIndexValidation:
+    """Validation and resume read the job's result index when present."""
+
+    @pytest.fixture
+    def registry_setup(self, tmp_path):
+        versioned_store = InMemoryVersionedStore()
+        schema = ProvenanceSchema()
+        provenance_store = ProvenanceStore(tmp_path / "provenance", schema)
+        registry = JobRegistry(
+            versioned_store, provenance_store=provenance_store, provenance_schema=schema
+        )
+        return registry, provenance_store
+
+    @staticmethod
+    def _index(registry, job_id, specs, status="ok"):
+        entries = [
+            IndexEntry(
+                job_id=job_id,
+                kind="sim",
+                param_id=spec.param_id,
+                seed=spec.seed,
+                target=None,
+                provenance_path=spec.provenance_path,
+                n_outputs=1,
+                size_bytes=10,
+                checksum="abc",
+                status=status,
+                recorded_at=now_iso(),
+            )
+            for spec in specs
+        ]
+        JobResultIndex(registry.provenance, job_id).append(entries)
+
+    def test_validate_outputs_uses_index(self, registry_setup):
+        """Indexed outputs count as verified without touching result paths."""
+        registry, _ = registry_setup
+        job_spec = SimpleNamespace(
+            metadata={"bundle_digest": "idx123"},
+            parameter_sets=[SimpleNamespace(param_id="p1", params={"x": 1}, replicate_count=3)],
+        )
+        state = registry.register_job("idx-job", "k8s-job", "namespace", job_spec=job_spec)
+        specs = [OutputSpec(**o) for o in state.expected_outputs]
+
+        # Only two of three results are indexed; no result files exist at all
+        self._index(registry, "idx-job", specs[:2])
+
+        result = registry.validate_outputs("idx-job")
+
+        assert result.status == "partial"
+        assert result.verified_count == 2
+        assert result.missing_outputs == [specs[2].provenance_path]
+
+    def test_failed_results_are_missing(self, registry_setup):
+        """Results recorded with an error are not verified."""
+        registry, _ = registry_setup
+        job_spec = SimpleNamespace(
+            metadata={"bundle_digest": "idx456"},
+            parameter_sets=[SimpleNamespace(param_id="p2", params={"x": 2}, replicate_count=1)],
+        )
+        state = registry.register_job("err-job", "k8s-job", "namespace", job_spec=job_spec)
+        specs = [OutputSpec(**o) for o in state.expected_outputs]
+        self._index(registry, "err-job", specs, status="error")
+
+        result = registry.validate_outputs("err-job")
+
+        assert result.status == "failed"
+        assert result.missing_count == 1
+
+    def test_resumable_tasks_reflect_index(self, registry_setup):
+        """Results indexed after validation are not resumed again."""
+        registry, _ = registry_setup
+        job_spec = SimpleNamespace(
+            metadata={"bundle_digest": "sha256:" + "1" * 64},
+            parameter_sets=[SimpleNamespace(param_id="p3", params={"x": 3}, replicate_count=3)],
+        )
+        state = registry.register_job("late-job", "k8s-job", "namespace", job_spec=job_spec)
+        specs = [OutputSpec(**o) for o in state.expected_outputs]
+
+        registry.update_status("late-job", JobStatus.SUBMITTING)
+        registry.update_status("late-job", JobStatus.SCHEDULED)
+        registry.update_status("late-job", JobStatus.RUNNING)
+        registry.transition_to_validating("late-job")
+        validation = ValidationResult(
+            status="partial",
+            verified_count=1,
+            missing_count=2,
+            missing_outputs=[specs[1].provenance_path, specs[2].provenance_path],
+        )
+        registry.finalize_with_validation("late-job", validation)
+
+        # Seed 1 landed after validation ran
+        self._index(registry, "late-job", [specs[0], specs[1]])
+
+        tasks = registry.get_resumable_tasks("late-job")
+
+        assert [t.seed for t in tasks] == [2]
+
+    def test_unindexed_results_are_probed_in_storage(self, registry_setup):
+        """A result the index lacks (e.g. the runner died first) is found in storage."""
+        registry, provenance_store = registry_setup
+        job_spec = SimpleNamespace(
+            metadata={"bundle_digest": "idx789"},
+            parameter_sets=[SimpleNamespace(param_id="p4", params={"x": 4}, replicate_count=3)],
+        )
+        state = registry.register_job("crash-job", "k8s-job", "namespace", job_spec=job_spec)
+        specs = [OutputSpec(**o) for o in state.expected_outputs]
+
+        self._index(registry, "crash-job", specs[:1])
+        result_dir = provenance_store.storage_dir / specs[1].provenance_path
+        result_dir.mkdir(parents=True)
+
+        result = registry.validate_outputs("crash-job")
+
+        assert result.status == "partial"
+        assert result.verified_count == 2
+        assert result.missing_outputs == [specs[2].provenance_path]
+
+    def test_resumable_tasks_probe_storage(self, registry_setup):
+        """Results a resume run stored (under its own job's index) are not resumed again."""
+        registry, provenance_store = registry_setup
+        job_spec = SimpleNamespace(
+            metadata={"bundle_digest": "sha256:" + "2" * 64},
+            parameter_sets=[SimpleNamespace(param_id="p5", params={"x": 5}, replicate_count=3)],
+        )
+        state = registry.register_job("orig-job", "k8s-job", "namespace", job_spec=job_spec)
+        specs = [OutputSpec(**o) for o in state.expected_outputs]
+
+        registry.update_status("orig-job", JobStatus.SUBMITTING)
+        registry.update_status("orig-job", JobStatus.SCHEDULED)
+        registry.update_status("orig-job", JobStatus.RUNNING)
+        registry.transition_to_validating("orig-job")
+        validation = ValidationResult(
+            status="partial",
+            verified_count=1,
+            missing_count=2,
+            missing_outputs=[specs[1].provenance_path, specs[2].provenance_path],
+        )
+        registry.finalize_with_validation("orig-job", validation)
+
+        self._index(registry, "orig-job", specs[:1])
+        (provenance_store.storage_dir / specs[1].provenance_path).mkdir(parents=True)
+
+        tasks = registry.get_resumable_tasks("orig-job")
+
+        assert [t.seed for t in tasks] == [2]
+
+
+class TestIndexRecorder:
+    """Results are appended to the index while the job is still running."""
+
+    @staticmethod
+    def _entry(seed):
+        return IndexEntry(
+            job_id="rec-job",
+            kind="sim",
+            param_id="p1",
+            seed=seed,
+            target=None,
+            provenance_path=f"sims/p1/seed_{seed}",
+            n_outputs=1,
+            size_bytes=10,
+            checksum="abc",
+            status="ok",
+            recorded_at=now_iso(),
+        )
+
+    def test_fragments_are_written_as_results_land(self, tmp_path):
+        index = JobResultIndex(ProvenanceStore(tmp_path, ProvenanceSchema()), "rec-job")
+        recorder = IndexRecorder(index, flush_interval=60.0, flush_every=2)
+
+        recorder.record([self._entry(0)])
+        assert recorder.flush()
+        assert [e.seed for e in index.read()] == [0]
+        assert recorder.is_recorded("sim", "p1", 0)
+        assert not recorder.is_recorded("sim", "p1", 1)
+
+        with recorder:
+            recorder.record([self._entry(1), self._entry(2)])
+            # flush_every entries wake the flush thread
+            for _ in range(100):
+                if len(index.read()) == 3:
+                    break
+                time.sleep(0.05)
+            assert len(index.read()) == 3
+            recorder.record([self._entry(3)])
+        assert sorted(e.seed for e in index.read()) == [0, 1, 2, 3]
+
+    def test_failed_write_is_retried(self, tmp_path, monkeypatch):
+        index = JobResultIndex(ProvenanceStore(tmp_path, ProvenanceSchema()), "rec-job")
+        recorder = IndexRecorder(index)
+        append = index.append
+        monkeypatch.setattr(index, "append", Mock(side_effect=OSError("disk full")))
+
+        recorder.record([self._entry(0)])
+        assert not recorder.flush()
+
+        monkeypatch.setattr(index, "append", append)
+        assert recorder.flush()
+        assert [e.seed for e in index.read()] == [0]
+
+    def test_deferred_entries_are_built_on_flush(self, tmp_path):
+        index = JobResultIndex(ProvenanceStore(tmp_path, ProvenanceSchema()), "rec-job")
+        recorder = IndexRecorder(index)
+        built = []
+
+        def build():
+            built.append(1)
+            return self._entry(0)
+
+        def fail():
+            raise RuntimeError("result lost")
+
+        recorder.record_deferred(("sim", "p1", 0, None), build)
+        recorder.record_deferred(("sim", "p1", 1, None), fail)
+        assert not built
+        assert recorder.is_recorded("sim", "p1", 1)
+
+        assert recorder.flush()
+        assert [e.seed for e in index.read()] == [0]
+        # A result whose entry could not be built is left for a later pass
+        assert not recorder.is_recorded("sim", "p1", 1)
+
+    def test_runner_indexes_simulations_as_they_finish(self, tmp_path):
+        """Finished simulations are indexed while others are still running."""
+        from dask.distributed import Client, Event
+        from modelops_contracts import SimReturn, SimTask, TableArtifact, UniqueParameterSet
+
+        from modelops.runners import job_runner
+        from modelops.services.dask_simulation import DaskFutureAdapter
+
+        index = JobResultIndex(ProvenanceStore(tmp_path, ProvenanceSchema()), "run-job")
+        recorder = IndexRecorder(index, flush_interval=0.05)
+        tasks = [
+            SimTask(
+                bundle_ref="sha256:" + "b" * 64,
+                params=UniqueParameterSet(params={"x": 1}, param_id="p1"),
+                seed=seed,
+                entrypoint="module.path/scenario",
+            )
+            for seed in range(3)
+        ]
+
+        def simulate(seed, release=None):
+            if release is not None:
+                Event(release).wait()
+            if seed == 1:
+                raise RuntimeError("model crashed")
+            checksum = hashlib.blake2b(b"data", digest_size=32).hexdigest()
+            artifact = TableArtifact(size=4, inline=b"data", checksum=checksum)
+            return SimReturn(task_id=f"task{seed}", outputs={"results": artifact})
+
+        client = Client(processes=False, n_workers=1, threads_per_worker=3, dashboard_address=None)
+        # The recorder closes first: its last entries are built from live futures
+        with client as c, recorder:
+            release = Event("release-last")
+            adapters = [
+                DaskFutureAdapter(c.submit(simulate, 0, pure=False)),
+                DaskFutureAdapter(c.submit(simulate, 1, pure=False)),
+                DaskFutureAdapter(c.submit(simulate, 2, "release-last", pure=False)),
+            ]
+            job_runner._index_simulations("run-job", recorder, tasks, adapters)
+
+            deadline = time.monotonic() + 10
+            while not index.read() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            # The failed simulation is not indexed, the running one not yet
+            assert [e.seed for e in index.read()] == [0]
+            assert not adapters[2].done()
+
+            release.set()
+            adapters[2].result()
+        assert sorted(e.seed for e in index.read()) == [0, 2]
+
+
 class TestJobStateFields:
     """Test JobState with new validation fields."""
 
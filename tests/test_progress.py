@@ -0,0 +1,145 @@
+"""Tests for coalesced job progress reporting."""
+
+import time
+
+import pytest
+from dask.distributed import Client, Event
+
+from modelops.services.dask_simulation import DaskFutureAdapter
+from modelops.services.job_registry import JobRegistry
+from modelops.services.job_state import JobStatus
+from modelops.services.progress import ProgressReporter, format_eta
+from modelops.services.storage.memory import InMemoryVersionedStore
+
+
+class CountingRegistry(JobRegistry):
+    """JobRegistry that counts progress writes."""
+
+    def __init__(self):
+        super().__init__(InMemoryVersionedStore())
+        self.writes = 0
+
+    def update_progress(self, *args, **kwargs):
+        self.writes += 1
+        return super().update_progress(*args, **kwargs)
+
+
+class FlakyRegistry(CountingRegistry):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def update_progress(self, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("storage unavailable")
+        return super().update_progress(*args, **kwargs)
+
+
+@pytest.fixture
+def registry():
+    registry = CountingRegistry()
+    registry.register_job("job-1", "k8s-job-1", "default")
+    return registry
+
+
+def test_completions_are_coalesced_into_few_writes(registry):
+    reporter = ProgressReporter(
+        registry, "job-1", tasks_total=5000, flush_interval=0.05, min_interval=0.05
+    )
+    with reporter:
+        for _ in range(5000):
+            reporter.task_done()
+        time.sleep(0.2)
+
+    state = registry.get_job("job-1")
+    assert state.tasks_completed == 5000
+    assert state.tasks_total == 5000
+    assert state.eta_seconds == 0
+    assert state.tasks_per_second > 0
+    assert registry.writes <= 3
+
+
+def test_flush_every_bounded_by_min_interval(registry):
+    reporter = ProgressReporter(
+        registry, "job-1", flush_interval=60, flush_every=10, min_interval=0.2
+    )
+    with reporter:
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            reporter.task_done()
+            time.sleep(0.001)
+
+    # One early flush per min_interval plus the final one, however fast tasks finish
+    assert 2 <= registry.writes <= 5
+    assert registry.get_job("job-1").tasks_completed == reporter.completed
+
+
+def test_failed_flush_keeps_delta():
+    registry = FlakyRegistry(failures=1)
+    registry.register_job("job-1", "k8s-job-1", "default")
+    reporter = ProgressReporter(registry, "job-1", tasks_total=10)
+
+    reporter.task_done(4)
+    assert not reporter.flush()
+    reporter.task_done(2)
+    assert reporter.flush()
+
+    state = registry.get_job("job-1")
+    assert state.tasks_completed == 6
+    assert state.tasks_total == 10
+
+
+def test_idle_reporter_does_not_write(registry):
+    reporter = ProgressReporter(registry, "job-1")
+    reporter.close()
+    assert registry.writes == 0
+
+
+def test_watch_counts_dask_futures(registry):
+    with Client(processes=False, n_workers=1, threads_per_worker=2, dashboard_address=None) as c:
+        reporter = ProgressReporter(registry, "job-1", tasks_total=20)
+        adapters = [DaskFutureAdapter(c.submit(pow, i, 2, pure=False)) for i in range(20)]
+        reporter.watch(adapters)
+        c.gather([a.wrapped for a in adapters])
+
+        deadline = time.monotonic() + 5
+        while reporter.completed < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        reporter.close()
+
+    assert registry.get_job("job-1").tasks_completed == 20
+
+
+def test_cancelled_job_cancels_tracked_futures(registry):
+    registry.update_status("job-1", JobStatus.SUBMITTING)
+    registry.update_status("job-1", JobStatus.SCHEDULED)
+    registry.update_status("job-1", JobStatus.RUNNING)
+
+    with Client(processes=False, n_workers=1, threads_per_worker=1, dashboard_address=None) as c:
+        release = Event("release")
+        blocked = [
+            DaskFutureAdapter(c.submit(lambda: release.wait(), pure=False)) for _ in range(2)
+        ]
+        reporter = ProgressReporter(registry, "job-1", tasks_total=3, flush_interval=0.05)
+        with reporter:
+            reporter.watch(blocked[:1])
+            reporter.track(blocked[1:])
+            assert not reporter.check_cancelled()
+
+            registry.cancel_job("job-1", reason="user request")
+            assert reporter.cancelled.wait(5)
+            assert [a.wrapped.status for a in blocked] == ["cancelled", "cancelled"]
+
+            # Work submitted after the cancel is stopped straight away
+            late = DaskFutureAdapter(c.submit(lambda: release.wait(), pure=False))
+            reporter.track([late])
+            assert late.wrapped.status == "cancelled"
+        release.set()
+
+
+def test_format_eta():
+    assert format_eta(None) == "unknown"
+    assert format_eta(42) == "42s"
+    assert format_eta(250) == "4m 10s"
+    assert format_eta(3900) == "1h 05m"
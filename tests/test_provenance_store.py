@@ -37,10 +37,12 @@ class TestProvenanceStoreBasics:
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
 
-    @pytest.fixture
-    def store(self, temp_storage_dir):
-        """Create a ProvenanceStore with default schema."""
-        return ProvenanceStore(storage_dir=temp_storage_dir, schema=BUNDLE_INVALIDATION_SCHEMA)
+    @pytest.fixture(params=["directory", "segments"])
+    def store(self, temp_storage_dir, request):
+        """Create a ProvenanceStore with default schema, in each layout."""
+        return ProvenanceStore(
+            storage_dir=temp_storage_dir, schema=BUNDLE_INVALIDATION_SCHEMA, layout=request.param
+        )
 
     def test_store_and_retrieve_sim(self, store):
         """Test storing and retrieving a SimReturn."""
@@ -520,3 +522,217 @@ class TestConcurrency:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestSegmentsLayout:
+    """Simulation results packed into segment files."""
+
+    @staticmethod
+    def _task(i):
+        return SimTask(
+            bundle_ref=TEST_BUNDLE_REF,
+            entrypoint="module.func/test",
+            params=UniqueParameterSet.from_dict({"x": i}),
+            seed=42,
+        )
+
+    @staticmethod
+    def _sim_return(i):
+        data = f"data{i}".encode()
+        artifact = TableArtifact(size=len(data), inline=data, checksum=make_valid_checksum(data))
+        return SimReturn(task_id=f"{i:064x}", outputs={"result": artifact})
+
+    def test_no_per_result_files(self, tmp_path):
+        store = ProvenanceStore(storage_dir=tmp_path, layout="segments")
+        for i in range(20):
+            store.put_sim(self._task(i), self._sim_return(i))
+
+        assert not (tmp_path / store.sim_result_path(self._task(0))).exists()
+        segments_dir = tmp_path / "token" / "v1" / "segments"
+        assert len(list(segments_dir.glob("*.seg"))) == 1
+
+        assert store.probe_sims([self._task(3), self._task(99)]) == [5, None]
+        listed = store.list_results("sim", limit=5)
+        assert len(listed) == 5 and {r["seed"] for r in listed} == {42}
+        assert sum(c.count for c in store.catalog.totals().values()) == 20
+
+        # Sealed on shutdown and readable by a fresh store
+        store.shutdown()
+        assert len(list(segments_dir.glob("*.idx"))) == 1
+        reopened = ProvenanceStore(storage_dir=tmp_path, layout="segments")
+        assert reopened.get_sim(self._task(7)).outputs["result"].inline == b"data7"
+
+    def test_reads_directory_results_after_switching(self, tmp_path):
+        ProvenanceStore(storage_dir=tmp_path).put_sim(self._task(1), self._sim_return(1))
+
+        store = ProvenanceStore(storage_dir=tmp_path, layout="segments")
+        assert store.get_sim(self._task(1)).outputs["result"].inline == b"data1"
+        assert store.probe_sims([self._task(1)]) == [5]
+
+    def test_layout_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MODELOPS_PROVENANCE_LAYOUT", "segments")
+        assert ProvenanceStore(storage_dir=tmp_path).layout == "segments"
+        monkeypatch.setenv("MODELOPS_PROVENANCE_LAYOUT", "bogus")
+        with pytest.raises(ValueError, match="bogus"):
+            ProvenanceStore(storage_dir=tmp_path)
+
+
+class TestArtifactDedup:
+    """Identical artifact bodies are stored once in the blob area."""
+
+    @staticmethod
+    def _task(seed):
+        return SimTask(
+            bundle_ref=TEST_BUNDLE_REF,
+            entrypoint="module.func/test",
+            params=UniqueParameterSet.from_dict({"x": 1}),
+            seed=seed,
+        )
+
+    @staticmethod
+    def _sim_return(seed, data):
+        artifact = TableArtifact(size=len(data), inline=data, checksum=make_valid_checksum(data))
+        return SimReturn(task_id=f"{seed:064x}", outputs={"result": artifact})
+
+    @pytest.fixture
+    def table(self):
+        import io
+
+        import polars as pl
+
+        buffer = io.BytesIO()
+        pl.DataFrame({"day": range(50), "infected": [0] * 50}).write_ipc(buffer)
+        return buffer.getvalue()
+
+    def test_identical_outputs_share_files(self, tmp_path, table):
+        store = ProvenanceStore(storage_dir=tmp_path, dedup=True)
+        for seed in range(3):
+            store.put_sim(self._task(seed), self._sim_return(seed, table))
+
+        dirs = [tmp_path / store.sim_result_path(self._task(seed)) for seed in range(3)]
+        for suffix in ("arrow", "parquet"):
+            inodes = {(d / f"artifact_result.{suffix}").stat().st_ino for d in dirs}
+            assert len(inodes) == 1
+            # Three results plus the blob itself
+            assert (dirs[0] / f"artifact_result.{suffix}").stat().st_nlink == 4
+
+        result_json = json.loads((dirs[0] / "result.json").read_text())
+        digest = result_json["outputs"]["result"]["blob"]
+        assert (tmp_path / "_blobs" / digest[:2] / f"{digest}.arrow").exists()
+        assert store.get_sim(self._task(2)).outputs["result"].inline == table
+
+    def test_clear_schema_collects_unreferenced_blobs(self, tmp_path):
+        store = ProvenanceStore(storage_dir=tmp_path, dedup=True)
+        store.put_sim(self._task(1), self._sim_return(1, b"same"))
+        store.put_sim(self._task(2), self._sim_return(2, b"same"))
+        assert store.collect_blobs() == (0, 0)
+
+        store.clear_schema()
+        assert not list((tmp_path / "_blobs").rglob("*.arrow"))
+
+        # Storing again after the collection recreates the blob
+        store.put_sim(self._task(1), self._sim_return(1, b"same"))
+        assert store.get_sim(self._task(1)).outputs["result"].inline == b"same"
+
+    def test_dedup_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("MODELOPS_PROVENANCE_DEDUP", raising=False)
+        store = ProvenanceStore(storage_dir=tmp_path)
+        store.put_sim(self._task(1), self._sim_return(1, b"same"))
+
+        result_dir = tmp_path / store.sim_result_path(self._task(1))
+        assert (result_dir / "artifact_result.arrow").stat().st_nlink == 1
+        outputs = json.loads((result_dir / "result.json").read_text())["outputs"]
+        assert "blob" not in outputs["result"]
+        assert not (tmp_path / "_blobs").exists()
+
+        monkeypatch.setenv("MODELOPS_PROVENANCE_DEDUP", "true")
+        assert ProvenanceStore(storage_dir=tmp_path).dedup
+
+    def test_segments_store_each_body_once(self, tmp_path):
+        data = b"x" * 65536
+        store = ProvenanceStore(storage_dir=tmp_path, layout="segments", dedup=True)
+        for seed in range(10):
+            store.put_sim(self._task(seed), self._sim_return(seed, data))
+        store.shutdown()
+
+        (segment,) = (tmp_path / "token" / "v1" / "segments").glob("*.seg")
+        assert segment.stat().st_size < 2 * len(data)
+        reopened = ProvenanceStore(storage_dir=tmp_path, layout="segments")
+        assert reopened.get_sim(self._task(9)).outputs["result"].inline == data
+        assert reopened.probe_sims([self._task(3)]) == [len(data)]
+
+
+class TestScan:
+    """Querying one output across stored results."""
+
+    @staticmethod
+    def _task(beta, seed):
+        return SimTask(
+            bundle_ref=TEST_BUNDLE_REF,
+            entrypoint="module.func/test",
+            params=UniqueParameterSet.from_dict({"beta": beta}),
+            seed=seed,
+        )
+
+    @staticmethod
+    def _sim_return(beta, seed):
+        import io
+
+        import polars as pl
+
+        buffer = io.BytesIO()
+        pl.DataFrame({"day": [0, 1], "infected": [float(seed), seed * beta]}).write_ipc(buffer)
+        data = buffer.getvalue()
+        artifact = TableArtifact(size=len(data), inline=data, checksum=make_valid_checksum(data))
+        return SimReturn(task_id=f"{seed:064x}", outputs={"prevalence": artifact})
+
+    def _fill(self, store, betas=(0.1, 0.2), seeds=(1, 2, 3)):
+        for beta in betas:
+            for seed in seeds:
+                store.put_sim(self._task(beta, seed), self._sim_return(beta, seed))
+
+    @pytest.mark.parametrize("layout", ["directory", "segments"])
+    def test_scan_with_filters(self, tmp_path, layout):
+        import polars as pl
+
+        store = ProvenanceStore(storage_dir=tmp_path, layout=layout)
+        self._fill(store)
+
+        everything = store.scan("sim", "prevalence").collect()
+        assert everything.height == 12
+        assert {"day", "infected", "bundle_digest", "param_id", "seed", "params.beta"} <= set(
+            everything.columns
+        )
+
+        rows = (
+            store.scan("sim", "prevalence", {"beta": 0.2, "seed": [1, 2]})
+            .filter(pl.col("day") == 1)
+            .sort("seed")
+            .collect()
+        )
+        assert rows["infected"].to_list() == pytest.approx([0.2, 0.4])
+
+        param_id = self._task(0.1, 1).params.param_id
+        by_id = store.scan("sim", "prevalence", {"param_id": param_id}).collect()
+        assert set(by_id["params.beta"]) == {0.1}
+        by_expr = store.scan("sim", "prevalence", pl.col("seed") >= 3).collect()
+        assert set(by_expr["seed"]) == {3}
+
+        assert store.scan("sim", "missing").collect().is_empty()
+        assert store.scan("sim", "prevalence", {"gamma": 1}).collect().is_empty()
+        with pytest.raises(ValueError):
+            store.scan("agg", "prevalence")
+
+    def test_index_follows_new_results_and_clears(self, tmp_path):
+        store = ProvenanceStore(storage_dir=tmp_path)
+        self._fill(store, betas=(0.1,))
+        assert store.scan("sim", "prevalence").collect().height == 6
+        assert list((tmp_path / "_catalog" / "scan").glob("*.parquet"))
+
+        # A new store reads the cached index and folds in only the new results
+        self._fill(ProvenanceStore(storage_dir=tmp_path), betas=(0.3,), seeds=(7,))
+        seeds = store.scan("sim", "prevalence").collect()["seed"]
+        assert sorted(set(seeds)) == [1, 2, 3, 7]
+
+        store.clear_schema()
+        assert store.scan("sim", "prevalence").collect().is_empty()
@@ -0,0 +1,172 @@
+"""Tests for concurrent, resumable result downloads."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from modelops.cli.results import _find_latest_job, _local_path_for
+from modelops.services.storage.download import (
+    BlobDownload,
+    download_blob_to_path,
+    download_blobs,
+)
+
+
+class FakeStream:
+    def __init__(self, data: bytes, chunk_size: int, fail_after: int | None):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+
+    def chunks(self):
+        sent = 0
+        for i in range(0, len(self.data), self.chunk_size):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise ConnectionError("connection reset")
+            chunk = self.data[i : i + self.chunk_size]
+            sent += len(chunk)
+            yield chunk
+
+    def readall(self):
+        return self.data
+
+
+class FakeContainer:
+    """Just enough of azure ContainerClient for downloads."""
+
+    def __init__(self, blobs: dict[str, bytes], chunk_size: int = 4):
+        self.blobs = blobs
+        self.etags = {name: f'"{hash(data)}"' for name, data in blobs.items()}
+        self.chunk_size = chunk_size
+        self.fail_after: int | None = None
+        self.requests: list[tuple[str, int]] = []
+
+    def get_blob_client(self, name):
+        container = self
+
+        class _Client:
+            def download_blob(self, offset=0, etag=None, match_condition=None):
+                if name not in container.blobs:
+                    raise FileNotFoundError(name)
+                if etag is not None and etag != container.etags[name]:
+                    raise RuntimeError("ConditionNotMet")
+                container.requests.append((name, offset))
+                return FakeStream(
+                    container.blobs[name][offset:], container.chunk_size, container.fail_after
+                )
+
+        return _Client()
+
+    def list_blobs(self, name_starts_with=""):
+        return [
+            SimpleNamespace(name=n, size=len(d), etag=self.etags[n])
+            for n, d in self.blobs.items()
+            if n.startswith(name_starts_with)
+        ]
+
+    def item(self, name: str, path: Path) -> BlobDownload:
+        return BlobDownload(name, path, len(self.blobs[name]), self.etags[name])
+
+
+def test_download_streams_to_disk_and_skips_when_current(tmp_path):
+    container = FakeContainer({"a.parquet": b"0123456789abcdef"})
+    item = container.item("a.parquet", tmp_path / "out" / "a.parquet")
+
+    outcome = download_blob_to_path(container, item)
+    assert outcome.status == "downloaded"
+    assert item.local_path.read_bytes() == b"0123456789abcdef"
+    assert not (tmp_path / "out" / "a.parquet.part").exists()
+
+    outcome = download_blob_to_path(container, item)
+    assert outcome.status == "skipped"
+    assert len(container.requests) == 1
+
+
+def test_interrupted_download_resumes_from_partial_file(tmp_path):
+    container = FakeContainer({"a.parquet": b"0123456789abcdef"})
+    item = container.item("a.parquet", tmp_path / "a.parquet")
+
+    container.fail_after = 8
+    with pytest.raises(ConnectionError):
+        download_blob_to_path(container, item)
+    assert (tmp_path / "a.parquet.part").read_bytes() == b"01234567"
+
+    container.fail_after = None
+    outcome = download_blob_to_path(container, item)
+    assert outcome.status == "resumed"
+    assert outcome.bytes_transferred == 8
+    assert container.requests[-1] == ("a.parquet", 8)
+    assert item.local_path.read_bytes() == b"0123456789abcdef"
+
+
+def test_changed_blob_is_downloaded_again(tmp_path):
+    container = FakeContainer({"a.parquet": b"old-contents"})
+    download_blob_to_path(container, container.item("a.parquet", tmp_path / "a.parquet"))
+
+    container.blobs["a.parquet"] = b"new-contents"
+    container.etags["a.parquet"] = '"v2"'
+    outcome = download_blob_to_path(container, container.item("a.parquet", tmp_path / "a.parquet"))
+
+    assert outcome.status == "downloaded"
+    assert (tmp_path / "a.parquet").read_bytes() == b"new-contents"
+
+
+
+def test_interrupted_update_does_not_pass_old_file_as_current(tmp_path):
+    container = FakeContainer({"a.parquet": b"old-contents"})
+    download_blob_to_path(container, container.item("a.parquet", tmp_path / "a.parquet"))
+
+    # Same size, new ETag; the update is cut off halfway
+    container.blobs["a.parquet"] = b"new-contents"
+    container.etags["a.parquet"] = '"v2"'
+    container.fail_after = 4
+    item = container.item("a.parquet", tmp_path / "a.parquet")
+    with pytest.raises(ConnectionError):
+        download_blob_to_path(container, item)
+
+    container.fail_after = None
+    outcome = download_blob_to_path(container, item)
+    assert outcome.status == "resumed"
+    assert (tmp_path / "a.parquet").read_bytes() == b"new-contents"
+    assert not (tmp_path / ".a.parquet.part.etag").exists()
+
+def test_download_blobs_reports_failures_without_stopping(tmp_path):
+    container = FakeContainer({f"f{i}": bytes([i]) * 10 for i in range(6)})
+    items = [container.item(name, tmp_path / name) for name in container.blobs]
+    items.append(BlobDownload("missing", tmp_path / "missing", 10, '"x"'))
+
+    seen = []
+    outcomes = download_blobs(container, items, max_workers=3, on_complete=seen.append)
+
+    assert len(seen) == len(outcomes) == 7
+    assert sorted(o.status for o in outcomes).count("downloaded") == 6
+    (failed,) = [o for o in outcomes if o.status == "failed"]
+    assert failed.item.blob_name == "missing"
+
+
+def test_local_path_mapping():
+    assert _local_path_for("targets/prev/data.parquet", "parquet", None) == Path(
+        "targets/prev/data.parquet"
+    )
+    assert _local_path_for("targets/prev/data.parquet", "parquet", ["inc"]) is None
+    assert _local_path_for("model_outputs/cases.parquet", "all", None) == Path(
+        "model_outputs/cases.parquet"
+    )
+    assert _local_path_for("index/part-0.parquet", "parquet", None) == Path("index/part-0.parquet")
+    assert _local_path_for("manifest.json", "parquet", None) is None
+    assert _local_path_for("manifest.json", "manifest", None) == Path("manifest.json")
+    assert _local_path_for("targets/prev/data.parquet", "manifest", None) is None
+    assert _local_path_for("calibration/summary.json", "parquet", None) == Path(
+        "calibration/summary.json"
+    )
+
+
+def test_latest_job_read_from_pointer_without_listing():
+    pointer = {"job_id": "job-abc", "created_at": "2026-01-01T00:00:00+00:00"}
+    container = FakeContainer({"views/latest.json": json.dumps(pointer).encode()})
+    container.list_blobs = lambda **kw: pytest.fail("latest job lookup should not list blobs")
+
+    job_id, _ = _find_latest_job(container, "UseDevelopmentStorage=true", verbose=False)
+    assert job_id == "job-abc"
@@ -0,0 +1,105 @@
+"""Tests for the packed segment store behind the segments provenance layout."""
+
+import os
+
+from modelops.services.segment_store import SegmentStore
+
+
+def _store(root, **kwargs):
+    kwargs.setdefault("refresh_interval", 0)
+    kwargs.setdefault("auto_compact", False)
+    return SegmentStore(root, **kwargs)
+
+
+def test_put_get_and_overwrite(tmp_path):
+    store = _store(tmp_path)
+    size = store.put("a/1", {"seed": 1}, {"x": b"abc", "y": b""})
+    store.put("a/2", {"seed": 2}, {"x": b"def"})
+
+    meta, blobs = store.get("a/1")
+    assert meta == {"seed": 1, "blobs": {"x": 3, "y": 0}}
+    assert blobs == {"x": b"abc", "y": b""}
+    assert store.size("a/1") == size
+    assert store.get("missing") is None and "missing" not in store
+
+    # The newest record wins
+    store.put("a/1", {"seed": 1, "rerun": True}, {"x": b"xyz"})
+    assert store.get("a/1")[1] == {"x": b"xyz"}
+    assert store.get_meta("a/1")["rerun"] is True
+
+
+def test_sealing_and_readers_in_other_processes(tmp_path):
+    sealed = []
+    writer = _store(tmp_path, segment_bytes=200, on_seal=lambda seg, idx: sealed.append(seg.name))
+    for i in range(5):
+        writer.put(f"k{i}", {"i": i}, {"data": bytes(100)})
+
+    # Every record overflows a 200-byte segment after at most two puts
+    assert sealed and all((tmp_path / name).with_suffix(".idx").exists() for name in sealed)
+    assert len(list(tmp_path.glob("*.seg"))) > len(sealed)  # The last one is still open
+
+    # A second store (e.g. another worker process) sees sealed and open segments
+    reader = _store(tmp_path)
+    assert [reader.get_meta(f"k{i}")["i"] for i in range(5)] == list(range(5))
+
+    writer.put("late", {}, {"data": b"new"})
+    assert reader.get("late")[1] == {"data": b"new"}
+
+
+def test_torn_and_damaged_records(tmp_path):
+    writer = _store(tmp_path)
+    writer.put("good", {}, {"data": b"payload"})
+    writer.put("bad", {}, {"data": b"payload"})
+    (segment,) = tmp_path.glob("*.seg")
+
+    # Flip a payload byte of the second record and leave a partial header behind it
+    with open(segment, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"X")
+        f.seek(0, os.SEEK_END)
+        f.write(b"MSEG\x01\x00")
+
+    reader = _store(tmp_path)
+    assert reader.get("good")[1] == {"data": b"payload"}
+    assert reader.get("bad") is None
+
+
+def test_compaction_keeps_latest_records(tmp_path):
+    removed = []
+    writer = _store(tmp_path, segment_bytes=300, on_remove=lambda seg, idx: removed.append(seg))
+    for rerun in range(4):
+        for i in range(3):
+            writer.put(f"k{i}", {"rerun": rerun}, {"data": bytes(100)})
+    writer.flush()
+    reader = _store(tmp_path)
+    assert reader.get_meta("k0")["rerun"] == 3
+
+    before = set(tmp_path.glob("*.seg"))
+    assert writer.compact() == len(removed) > 0
+    after = set(tmp_path.glob("*.seg"))
+    assert len(after) < len(before)
+    assert not any(path.exists() for path in removed)
+
+    for store in (writer, reader, _store(tmp_path)):
+        assert [store.get_meta(f"k{i}")["rerun"] for i in range(3)] == [3, 3, 3]
+        assert store.get("k2")[1] == {"data": bytes(100)}
+
+
+def test_compaction_lock_is_exclusive(tmp_path):
+    import fcntl
+
+    store = _store(tmp_path, segment_bytes=100)
+    for i in range(4):
+        store.put("k", {"i": i}, {"data": bytes(100)})
+    with open(tmp_path / ".compact.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        assert store.compact() == 0
+    assert store.compact() > 0
+
+
+def test_idle_segment_is_sealed_before_appending(tmp_path):
+    store = _store(tmp_path, idle_seconds=0)
+    store.put("a", {}, {"data": b"1"})
+    store.put("b", {}, {"data": b"2"})
+    assert len(list(tmp_path.glob("*.seg"))) == 2
+    assert len(list(tmp_path.glob("*.idx"))) == 1
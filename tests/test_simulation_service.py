@@ -238,6 +238,117 @@ class TestDaskSimulationService:
         mock_client.close.assert_called_once()
 
 
+class TestContentAddressedKeys:
+    """Tests for opt-in content-addressed task keys."""
+
+    def _make_service(self, content_addressed_keys: bool):
+        mock_client = Mock()
+        mock_client.map.side_effect = lambda fn, tasks, key, pure: [Mock(key=k) for k in key]
+        service = DaskSimulationService.__new__(DaskSimulationService)
+        service.client = mock_client
+        service._plugin_installed = True
+        service.content_addressed_keys = content_addressed_keys
+        return service, mock_client
+
+    def _make_task(self, seed: int = 42, bundle_ref: str = TEST_BUNDLE_REF) -> SimTask:
+        return SimTask(
+            bundle_ref=bundle_ref,
+            entrypoint="example.func/test",
+            params=UniqueParameterSet.from_dict({"x": 10}),
+            seed=seed,
+        )
+
+    def test_content_key_is_deterministic(self):
+        """Same task content produces the same key."""
+        from modelops.services.dask_simulation import TaskKeys
+
+        key1 = TaskKeys.content_sim_key(self._make_task())
+        key2 = TaskKeys.content_sim_key(self._make_task())
+        assert key1 == key2
+        assert key1.startswith("sim-")
+
+    def test_content_key_varies_with_inputs(self):
+        """Seed and bundle both change the key."""
+        from modelops.services.dask_simulation import TaskKeys
+
+        base = TaskKeys.content_sim_key(self._make_task())
+        assert TaskKeys.content_sim_key(self._make_task(seed=43)) != base
+        assert TaskKeys.content_sim_key(self._make_task(bundle_ref=TEST_BUNDLE_REF_2)) != base
+
+    def test_content_key_ignores_repository_prefix(self):
+        """Bundle identity is the digest, not the repository it was pulled from."""
+        from modelops.services.dask_simulation import TaskKeys
+
+        bare = TaskKeys.content_sim_key(self._make_task(bundle_ref=TEST_BUNDLE_REF))
+        prefixed = TaskKeys.content_sim_key(
+            self._make_task(bundle_ref=f"ghcr.io/org/models@{TEST_BUNDLE_REF}")
+        )
+        assert bare == prefixed
+
+    def test_submit_replicates_uses_content_keys(self):
+        """Two submissions of the same replicate set share keys and use pure=True."""
+        from modelops_contracts.simulation import ReplicateSet
+
+        service, mock_client = self._make_service(content_addressed_keys=True)
+        replicate_set = ReplicateSet(base_task=self._make_task(), n_replicates=3, seed_offset=0)
+
+        service.submit_replicates(replicate_set)
+        service.submit_replicates(replicate_set)
+
+        first, second = mock_client.map.call_args_list
+        assert first.kwargs["key"] == second.kwargs["key"]
+        assert first.kwargs["pure"] is True
+        assert len(set(first.kwargs["key"])) == 3
+
+    def test_submit_replicates_default_keys_are_unique(self):
+        """Default mode keeps per-submission keys."""
+        from modelops_contracts.simulation import ReplicateSet
+
+        service, mock_client = self._make_service(content_addressed_keys=False)
+        replicate_set = ReplicateSet(base_task=self._make_task(), n_replicates=3, seed_offset=0)
+
+        service.submit_replicates(replicate_set)
+        service.submit_replicates(replicate_set)
+
+        first, second = mock_client.map.call_args_list
+        assert first.kwargs["key"] != second.kwargs["key"]
+        assert first.kwargs["pure"] is False
+
+    def test_submit_replicates_with_seed_vector(self):
+        """An explicit seed vector replaces the set's consecutive seeds."""
+        import numpy as np
+        from modelops_contracts.simulation import ReplicateSet
+
+        service, mock_client = self._make_service(content_addressed_keys=True)
+        replicate_set = ReplicateSet(base_task=self._make_task(), n_replicates=3)
+        seeds = np.array([7, 2**63 + 5, 11], dtype=np.uint64)
+
+        service.submit_replicates(replicate_set, seeds=seeds)
+
+        tasks = mock_client.map.call_args.args[1]
+        assert [t.seed for t in tasks] == [7, 2**63 + 5, 11]
+        assert all(type(t.seed) is int for t in tasks)
+        with pytest.raises(ValueError, match="2 seeds"):
+            service.submit_replicates(replicate_set, seeds=seeds[:2])
+
+    def test_submit_aggregation_content_key(self):
+        """Aggregation key is derived from target and input keys."""
+        from modelops_contracts.simulation import ReplicateSet
+
+        service, mock_client = self._make_service(content_addressed_keys=True)
+        replicate_set = ReplicateSet(base_task=self._make_task(), n_replicates=2, seed_offset=0)
+        sim_futures = service.submit_replicates(replicate_set)
+
+        service.submit_aggregation(sim_futures, "targets.t/a", TEST_BUNDLE_REF, "pid")
+        service.submit_aggregation(sim_futures, "targets.t/a", TEST_BUNDLE_REF, "pid")
+        service.submit_aggregation(sim_futures, "targets.t/b", TEST_BUNDLE_REF, "pid")
+
+        keys = [c.kwargs["key"] for c in mock_client.submit.call_args_list]
+        assert keys[0] == keys[1]
+        assert keys[0] != keys[2]
+        assert all(c.kwargs["pure"] is True for c in mock_client.submit.call_args_list)
+
+
 class TestSimulationIntegration:
     """Integration tests with actual simulation functions."""
 
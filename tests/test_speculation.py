@@ -0,0 +1,117 @@
+"""Tests for speculative re-execution of straggling tasks."""
+
+import time
+
+import pytest
+from dask.distributed import Client, LocalCluster, get_worker
+from modelops_contracts import SimTask, UniqueParameterSet
+
+from modelops.services import dask_simulation
+from modelops.services.dask_simulation import DaskFutureAdapter, DaskSimulationService
+from modelops.services.speculation import SpeculationPolicy, StragglerMonitor, _percentile
+
+
+def _fake_run_task(task):
+    """Slow on the worker named in the task params, fast everywhere else."""
+    if get_worker().address == task.params.params.get("slow_on"):
+        time.sleep(3.0)
+    return task.seed
+
+
+def _sum(*values):
+    return sum(values)
+
+
+@pytest.fixture(scope="module")
+def client():
+    cluster = LocalCluster(
+        n_workers=2, threads_per_worker=2, processes=False, dashboard_address=None
+    )
+    client = Client(cluster)
+    yield client
+    client.close()
+    cluster.close()
+
+
+@pytest.fixture
+def monitor(client, monkeypatch):
+    monkeypatch.setattr(dask_simulation, "_worker_run_task", _fake_run_task)
+    policy = SpeculationPolicy(min_samples=3, min_runtime=0.2, poll_interval=0.05)
+    return StragglerMonitor(client, policy)
+
+
+def _task(seed, slow_on=None):
+    params = UniqueParameterSet.from_dict({"slow_on": slow_on} if slow_on else {"x": 1})
+    return SimTask(bundle_ref="local://b", entrypoint="m/e", params=params, seed=seed)
+
+
+def _submit(client, monitor, tasks, worker):
+    adapters = [
+        DaskFutureAdapter(client.submit(_fake_run_task, t, pure=False, workers=[worker]))
+        for t in tasks
+    ]
+    monitor.track(adapters, tasks)
+    return adapters
+
+
+def _warm_up(client, monitor, worker):
+    """Complete enough fast tasks for the group to have a duration baseline."""
+    adapters = _submit(client, monitor, [_task(i) for i in range(4)], worker)
+    for a in adapters:
+        a.result()
+    deadline = time.monotonic() + 5
+    while monitor._tracked and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+class TestStragglerMonitor:
+    """Duplicates race stragglers and the first result wins."""
+
+    def test_duplicate_wins_over_straggler(self, client, monitor):
+        slow, fast = sorted(client.scheduler_info()["workers"])
+        _warm_up(client, monitor, slow)
+
+        (adapter,) = _submit(client, monitor, [_task(42, slow_on=slow)], slow)
+        primary = adapter.wrapped
+
+        start = time.monotonic()
+        while adapter.wrapped is primary and time.monotonic() - start < 2.5:
+            time.sleep(0.05)
+
+        assert adapter.wrapped is not primary
+        assert adapter.result(timeout=2) == 42
+        assert monitor.n_speculated == 1
+        assert monitor.n_won == 1
+
+    def test_dependent_aggregation_is_resubmitted(self, client, monitor):
+        slow, fast = sorted(client.scheduler_info()["workers"])
+        _warm_up(client, monitor, slow)
+
+        sims = _submit(client, monitor, [_task(1), _task(2, slow_on=slow)], slow)
+        agg = DaskFutureAdapter(client.submit(_sum, *[s.wrapped for s in sims], pure=False))
+        monitor.track_dependent(
+            agg, sims, lambda inputs: client.submit(_sum, *inputs, pure=False)
+        )
+
+        service = DaskSimulationService.__new__(DaskSimulationService)
+        service.client = client
+        service.straggler_monitor = monitor
+
+        start = time.monotonic()
+        (result,) = service.gather([agg])
+        assert result == 3
+        assert time.monotonic() - start < 2.5
+
+    def test_no_speculation_without_baseline(self, client, monitor):
+        slow, _ = sorted(client.scheduler_info()["workers"])
+        (adapter,) = _submit(client, monitor, [_task(7, slow_on=slow)], slow)
+
+        assert adapter.result(timeout=10) == 7
+        assert monitor.n_speculated == 0
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 11)]
+    assert _percentile(values, 0.0) == 1.0
+    assert _percentile(values, 0.9) == 9.0
+    assert _percentile(values, 1.0) == 10.0
@@ -0,0 +1,103 @@
+"""Tests for the local Pulumi stack output cache."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pulumi.automation as auto
+import pytest
+
+from modelops.core import automation, stack_cache
+from modelops.core.stack_cache import StackOutputCache, local_stack_names
+
+PROJECT = "modelops-storage"
+STACK = "modelops-storage-dev"
+
+
+@pytest.fixture
+def backend(tmp_path):
+    """A file:// backend holding one project-scoped stack checkpoint."""
+    stacks = tmp_path / "backend" / ".pulumi" / "stacks" / PROJECT
+    stacks.mkdir(parents=True)
+    (stacks / f"{STACK}.json").write_text("{}")
+    return SimpleNamespace(
+        url=f"file://{tmp_path / 'backend'}", checkpoint=stacks / f"{STACK}.json"
+    )
+
+
+@pytest.fixture
+def fake_pulumi(monkeypatch, tmp_path, backend):
+    """Route automation.outputs() to a counting fake stack."""
+    monkeypatch.setattr(stack_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(automation, "get_backend_url", lambda: backend.url)
+    monkeypatch.setattr(automation, "_ensure_passphrase", lambda: None)
+
+    reads = []
+
+    def select_stack(component, env, run_id=None, program=None, work_dir=None):
+        def outputs():
+            reads.append(component)
+            return {
+                "connection_string": auto.OutputValue("conn", True),
+                "account_name": auto.OutputValue("acct", False),
+            }
+
+        return SimpleNamespace(outputs=outputs, refresh=lambda on_output: None)
+
+    monkeypatch.setattr(automation, "select_stack", select_stack)
+    return reads
+
+
+def test_entry_is_invalidated_by_checkpoint_change_and_ttl(tmp_path, backend):
+    cache = StackOutputCache(tmp_path / "cache", ttl=60)
+    outputs = {"k": {"value": "v", "secret": False}}
+    cache.put(PROJECT, STACK, backend.url, outputs)
+    assert cache.get(PROJECT, STACK, backend.url) == outputs
+    assert oct(next(cache.cache_dir.iterdir()).stat().st_mode & 0o777) == "0o600"
+
+    # Any update rewrites the checkpoint
+    later = time.time() + 5
+    os.utime(backend.checkpoint, (later, later))
+    assert cache.get(PROJECT, STACK, backend.url) is None
+
+    cache.put(PROJECT, STACK, backend.url, outputs)
+    assert StackOutputCache(tmp_path / "cache", ttl=0).get(PROJECT, STACK, backend.url) is None
+    cache.ttl = 1e-9
+    assert cache.get(PROJECT, STACK, backend.url) is None
+
+
+def test_outputs_are_read_once_across_keys_and_refetched_on_refresh(fake_pulumi):
+    assert automation.get_stack_output("storage", "connection_string", "dev") == "conn"
+    assert automation.get_stack_output("storage", "account_name", "dev") == "acct"
+    assert fake_pulumi == ["storage"]
+
+    cached = automation.outputs("storage", "dev", refresh=False)
+    assert cached["connection_string"].secret is True
+    assert fake_pulumi == ["storage"]
+
+    automation.outputs("storage", "dev", refresh=False, use_cache=False)
+    automation.outputs("storage", "dev", refresh=True)
+    assert fake_pulumi == ["storage"] * 3
+
+
+def test_outputs_many_keeps_order_and_captures_errors(fake_pulumi, monkeypatch):
+    original = automation.outputs
+
+    def outputs(component, env, **kwargs):
+        if component == "broken":
+            raise RuntimeError("no stack")
+        return original(component, env, **kwargs)
+
+    monkeypatch.setattr(automation, "outputs", outputs)
+    results = automation.outputs_many(
+        [{"component": "storage", "env": "dev"}, {"component": "broken", "env": "dev"}]
+    )
+
+    assert results[0]["account_name"].value == "acct"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_stacks_are_listed_from_file_backend(backend):
+    assert local_stack_names(backend.url, PROJECT) == [STACK]
+    assert local_stack_names(backend.url, "modelops-infra") == []
+    assert local_stack_names("azblob://state", PROJECT) is None
@@ -0,0 +1,136 @@
+"""Tests for incremental storage accounting."""
+
+import hashlib
+import shutil
+
+import pytest
+from modelops_contracts import SimReturn, SimTask, TableArtifact, UniqueParameterSet
+from modelops_contracts.simulation import AggregationReturn, AggregationTask
+
+from modelops.services import storage_catalog
+from modelops.services.provenance_schema import BUNDLE_INVALIDATION_SCHEMA
+from modelops.services.provenance_store import ProvenanceStore
+from modelops.services.storage_catalog import CATALOG_DIR, StorageCatalog
+
+BUNDLE_A = "sha256:" + "a" * 64
+BUNDLE_B = "sha256:" + "b" * 64
+
+
+def _sim(bundle_ref, x, seed=0, data=b"payload"):
+    task = SimTask(
+        bundle_ref=bundle_ref,
+        entrypoint="model.func/baseline",
+        params=UniqueParameterSet.from_dict({"x": x}),
+        seed=seed,
+    )
+    checksum = hashlib.blake2b(data, digest_size=32).hexdigest()
+    result = SimReturn(
+        task_id=hashlib.sha256(f"{bundle_ref}{x}{seed}".encode()).hexdigest(),
+        outputs={"result": TableArtifact(size=len(data), inline=data, checksum=checksum)},
+    )
+    return task, result
+
+
+def _agg(store, bundle_ref):
+    _, sim_return = _sim(bundle_ref, 0)
+    task = AggregationTask(
+        bundle_ref=bundle_ref, target_entrypoint="targets.t/compute", sim_returns=[sim_return]
+    )
+    result = AggregationReturn(
+        aggregation_id=task.aggregation_id(), loss=0.1, diagnostics={}, outputs={}, n_replicates=1
+    )
+    store.put_agg(task, result)
+
+
+def _counts(totals):
+    return {key: (c.count, c.bytes, c.artifacts) for key, c in totals.items()}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProvenanceStore(storage_dir=tmp_path, schema=BUNDLE_INVALIDATION_SCHEMA)
+
+
+def test_counters_follow_writes_and_match_rebuild(store, tmp_path):
+    for i in range(3):
+        store.put_sim(*_sim(BUNDLE_A, i))
+    store.put_sim(*_sim(BUNDLE_B, 0))
+    _agg(store, BUNDLE_A)
+
+    totals = store.catalog.totals()
+    assert totals[("bundle", "v1", "sim", "a" * 12)].count == 3
+    assert totals[("bundle", "v1", "sim", "b" * 12)].count == 1
+    assert totals[("bundle", "v1", "agg", "a" * 12)].count == 1
+    assert all(c.bytes > 0 for c in totals.values())
+
+    assert _counts(StorageCatalog(tmp_path).rebuild()) == _counts(totals)
+
+
+def test_overwrite_is_not_double_counted(store):
+    task, result = _sim(BUNDLE_A, 1, data=b"short")
+    store.put_sim(task, result)
+    _, bigger = _sim(BUNDLE_A, 1, data=b"a much longer payload")
+    store.put_sim(task, bigger)
+
+    (counts,) = store.catalog.totals().values()
+    assert counts.count == 1
+    result_dir = store.storage_dir / store.sim_result_path(task)
+    assert counts.bytes == storage_catalog.measure(result_dir).bytes
+
+
+def test_list_results_reads_catalog_newest_first(store, monkeypatch):
+    for i in range(5):
+        store.put_sim(*_sim(BUNDLE_A, i))
+
+    monkeypatch.setattr(
+        type(store.storage_dir), "rglob", lambda *a: pytest.fail("listing should not walk")
+    )
+    results = store.list_results("sim", limit=3)
+
+    assert [r["params"]["x"] for r in results] == [4, 3, 2]
+    assert all(r["path"].startswith(str(store.storage_dir)) for r in results)
+
+
+def test_clear_schema_resets_counters_and_listing(store):
+    store.put_sim(*_sim(BUNDLE_A, 0))
+    store.clear_schema()
+
+    assert store.catalog.totals() == {}
+    assert store.list_results("sim") == []
+
+    store.put_sim(*_sim(BUNDLE_A, 1))
+    assert [r["params"]["x"] for r in store.list_results("sim")] == [1]
+
+
+def test_store_predating_catalog_is_rebuilt_on_first_read(store, tmp_path):
+    store.put_sim(*_sim(BUNDLE_A, 0))
+    store.put_sim(*_sim(BUNDLE_A, 1))
+    shutil.rmtree(tmp_path / CATALOG_DIR)
+
+    reopened = ProvenanceStore(storage_dir=tmp_path, schema=BUNDLE_INVALIDATION_SCHEMA)
+    assert not reopened.catalog.has_baseline()
+
+    assert len(reopened.list_results("sim")) == 2
+    (counts,) = reopened.catalog.totals().values()
+    assert counts.count == 2
+
+
+def test_sim_index_describes_results_without_catalog_metadata(store, tmp_path):
+    store.put_sim(*_sim(BUNDLE_A, 0, seed=3))
+    shutil.rmtree(tmp_path / CATALOG_DIR)  # The rebuilt journal has no scan metadata
+
+    reopened = ProvenanceStore(storage_dir=tmp_path, schema=BUNDLE_INVALIDATION_SCHEMA)
+    schema = reopened.schema
+    (row,) = reopened.catalog.sim_index(schema.name, f"v{schema.version}").to_dicts()
+    assert row["bundle_digest"] == "a" * 64
+    assert (row["seed"], row["params.x"], row["output.result"]) == (3, 0, "arrow")
+
+
+def test_journal_is_compacted_into_summary(store, monkeypatch):
+    monkeypatch.setattr(storage_catalog, "COMPACT_BYTES", 1)
+    store.put_sim(*_sim(BUNDLE_A, 0))
+    before = _counts(store.catalog.totals())
+
+    offset, counters = store.catalog._read_summary()
+    assert offset == store.catalog.journal_path.stat().st_size
+    assert _counts(counters) == before == _counts(store.catalog.totals())
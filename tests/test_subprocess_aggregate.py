@@ -482,3 +482,42 @@ def {func_name}():
     assert result["loss"] == 0.25
     # Custom diagnostics are not preserved
     assert "target_type" in result["diagnostics"]
+
+
+def test_aggregate_partial_returns_logliks():
+    """Partial mode (tree aggregation leaves) returns per-replicate log-likelihoods."""
+    from modelops.worker.subprocess_runner import SubprocessRunner
+
+    arrow_bytes = df_to_ipc_bytes(pl.DataFrame({"day": [0, 1], "infected": [1, 2]}))
+    with patch("modelops.worker.subprocess_runner.SubprocessRunner._setup"):
+        runner = SubprocessRunner(
+            bundle_path=Path("/tmp/test"), venv_path=Path("/tmp/venv"), bundle_digest="test123"
+        )
+
+    class LikelihoodEvaluation:
+        name = "lik"
+        loglik_per_rep = [-1.0, -2.0, -3.0]
+
+    likelihood_target = Mock(model_output="prevalence")
+    likelihood_target.evaluate = Mock(return_value=LikelihoodEvaluation())
+    loss_target = Mock(model_output="prevalence")
+    loss_target.evaluate = Mock(return_value=MockTargetEvaluation(loss=0.5))
+
+    modname = "_test_targets_aggregate_partial"
+    targets_module = MagicMock()
+    targets_module.likelihood = lambda: likelihood_target
+    targets_module.loss_only = lambda: loss_target
+    sys.modules[modname] = targets_module
+    sim_returns = [{"outputs": {"prevalence": {"data": arrow_bytes}}} for _ in range(3)]
+
+    try:
+        result = runner.aggregate(f"{modname}:likelihood", deepcopy(sim_returns), partial=True)
+        assert result["loglik_per_rep"] == [-1.0, -2.0, -3.0]
+        assert result["n_replicates"] == 3
+        assert "loss" not in result
+
+        with pytest.raises(JSONRPCError) as exc_info:
+            runner.aggregate(f"{modname}:loss_only", deepcopy(sim_returns), partial=True)
+        assert "per-replicate log-likelihoods" in exc_info.value.data["exc"]
+    finally:
+        sys.modules.pop(modname, None)
@@ -1,9 +1,14 @@
 """Test subprocess_runner with large messages."""
 
 import json
+import os
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 import pytest
@@ -14,7 +19,8 @@ from modelops.worker.jsonrpc import JSONRPCClient
 class TestSubprocessRunnerLargeMessages:
     """Test subprocess_runner handling of large messages."""
 
-    def test_subprocess_runner_70kb_params(self, tmp_path):
+    @pytest.mark.parametrize("fork_per_task", [False, True])
+    def test_subprocess_runner_70kb_params(self, tmp_path, fork_per_task):
         """Test subprocess_runner with 70KB parameters."""
         # Create a minimal test bundle
         bundle_path = tmp_path / "test_bundle"
@@ -59,6 +65,7 @@ test_bundle = "wire:wire"
                 str(venv_path),
                 "--bundle-digest",
                 "test123",
+                *(["--fork-per-task"] if fork_per_task else []),
             ],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
@@ -95,3 +102,276 @@ test_bundle = "wire:wire"
             stderr = proc.stderr.read()
             if stderr:
                 print(f"Subprocess stderr: {stderr.decode('utf-8', errors='replace')}")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() not available")
+class TestForkPerTask:
+    """Test the fork-server dispatch used by ForkServerExecEnv."""
+
+    @pytest.fixture
+    def rpc(self, tmp_path):
+        from modelops.worker import subprocess_runner
+
+        read_fd, write_fd = os.pipe()
+        with (
+            open(read_fd, "rb", buffering=0) as stdin,
+            open(write_fd, "wb", buffering=0) as stdin_writer,
+            open(tmp_path / "rpc.out", "w+b") as out,
+        ):
+            proto = subprocess_runner.JSONRPCProtocol(stdin)
+            proto._out = out
+            proto.stdin = stdin_writer
+            yield proto
+
+    @staticmethod
+    def _send(rpc, message: dict) -> None:
+        from modelops.worker import framing
+
+        framing.write_frame(rpc.stdin, *framing.encode(message))
+
+    @staticmethod
+    def _messages(rpc) -> list[dict]:
+        rpc._out.flush()
+        rpc._out.seek(0)
+        data = rpc._out.read()
+        messages = []
+        while data:
+            header, _, rest = data.partition(b"\r\n\r\n")
+            length = int(header.split(b":", 1)[1])
+            messages.append(json.loads(rest[:length]))
+            data = rest[length:]
+        return messages
+
+    def test_child_state_does_not_leak(self, rpc):
+        from modelops.worker.subprocess_runner import _call_in_fork
+
+        state = {"calls": 0}
+
+        def task(x):
+            state["calls"] += 1
+            return {"x": x, "calls": state["calls"]}
+
+        _call_in_fork(rpc, 1, task, {"x": 1}, None, deque())
+        _call_in_fork(rpc, 2, task, {"x": 2}, None, deque())
+
+        messages = self._messages(rpc)
+        assert [m["result"] for m in messages] == [{"x": 1, "calls": 1}, {"x": 2, "calls": 1}]
+        assert state["calls"] == 0
+
+    def test_task_exception_is_reported_by_child(self, rpc):
+        from modelops.worker.subprocess_runner import _call_in_fork
+
+        def task():
+            raise RuntimeError("boom")
+
+        _call_in_fork(rpc, 7, task, {}, None, deque())
+
+        (message,) = self._messages(rpc)
+        assert message["id"] == 7
+        assert message["error"]["code"] == -32603
+        assert "boom" in message["error"]["data"]
+
+    def test_cancel_kills_child_and_reports_cancelled(self, rpc, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        def task():
+            time.sleep(30)
+
+        assert sr._ACTIVE.start(9)
+        # Both arrive on stdin while the child runs; only the cancel is acted on
+        self._send(rpc, {"jsonrpc": "2.0", "method": "cancel", "params": {"id": 9}})
+        self._send(rpc, {"jsonrpc": "2.0", "id": 10, "method": "execute", "params": {}})
+        backlog = deque()
+        start = time.monotonic()
+        try:
+            sr._call_in_fork(rpc, 9, task, {}, None, backlog)
+        finally:
+            sr._ACTIVE.finish()
+
+        (message,) = self._messages(rpc)
+        assert message["error"]["code"] == sr.REQUEST_CANCELLED
+        assert time.monotonic() - start < 5
+        assert [m["id"] for m in backlog] == [10]
+
+    def test_child_enforces_deadline(self, rpc, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        def task():
+            while True:
+                time.sleep(0.05)
+
+        assert sr._ACTIVE.start(4)
+        try:
+            sr._call_in_fork(rpc, 4, task, {}, time.time() + 0.3, deque())
+        finally:
+            sr._ACTIVE.finish()
+
+        (message,) = self._messages(rpc)
+        assert message["error"]["code"] == sr.DEADLINE_EXCEEDED
+
+    def test_killed_child_is_reported_by_template(self, rpc):
+        from modelops.worker.subprocess_runner import _call_in_fork
+
+        def task():
+            os.kill(os.getpid(), signal.SIGKILL)
+
+        _call_in_fork(rpc, 3, task, {}, None, deque())
+
+        (message,) = self._messages(rpc)
+        assert message["id"] == 3
+        assert message["error"]["code"] == -32000
+        assert "OOM" in message["error"]["message"]
+        assert message["error"]["data"]["exit_code"] == -9
+
+
+@pytest.fixture
+def interrupt_handlers():
+    """Install the runner's signal handlers, restoring the previous ones (and timers)."""
+    from modelops.worker import subprocess_runner as sr
+
+    saved = {sig: signal.getsignal(sig) for sig in (signal.SIGALRM, signal.SIGUSR1)}
+    saved_timer = signal.getitimer(signal.ITIMER_REAL)
+    sr._install_interrupt_handlers()
+    yield
+    for sig, handler in saved.items():
+        signal.signal(sig, handler)
+    if saved_timer[0]:
+        signal.setitimer(signal.ITIMER_REAL, *saved_timer)
+
+
+class TestInterruption:
+    """Test cancel and deadline handling for in-process requests."""
+
+    def test_deadline_interrupts_wire_function(self, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        def task():
+            while True:
+                time.sleep(0.05)
+
+        assert sr._ACTIVE.start(1)
+        try:
+            with pytest.raises(sr.TaskInterrupted) as exc_info:
+                sr._call_with_deadline(task, {}, time.time() + 0.2)
+        finally:
+            sr._ACTIVE.finish()
+        assert exc_info.value.code == sr.DEADLINE_EXCEEDED
+
+    def test_expired_deadline_fails_fast(self, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        with pytest.raises(sr.TaskInterrupted):
+            sr._call_with_deadline(lambda: None, {}, time.time() - 1)
+
+    def test_cancel_interrupts_blocking_call(self, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        def task():
+            time.sleep(30)
+
+        assert sr._ACTIVE.start(2)
+        threading.Timer(0.2, sr._ACTIVE.cancel, args=(2,)).start()
+        start = time.monotonic()
+        try:
+            with pytest.raises(sr.TaskInterrupted) as exc_info:
+                sr._call_with_deadline(task, {}, None)
+        finally:
+            sr._ACTIVE.finish()
+        assert exc_info.value.code == sr.REQUEST_CANCELLED
+        assert time.monotonic() - start < 5
+
+    def test_interrupt_escapes_broad_except(self, interrupt_handlers):
+        from modelops.worker import subprocess_runner as sr
+
+        def task():
+            try:
+                time.sleep(30)
+            except Exception:
+                return "swallowed"
+
+        assert sr._ACTIVE.start(3)
+        threading.Timer(0.2, sr._ACTIVE.cancel, args=(3,)).start()
+        try:
+            with pytest.raises(sr.TaskInterrupted):
+                sr._call_with_deadline(task, {}, None)
+        finally:
+            sr._ACTIVE.finish()
+
+    def test_cancel_before_start(self):
+        from modelops.worker import subprocess_runner as sr
+
+        sr._ACTIVE.cancel(5)
+        assert not sr._ACTIVE.start(5)
+        # Only the cancelled id is affected
+        assert sr._ACTIVE.start(6)
+        sr._ACTIVE.finish()
+
+
+class TestArtifactCompression:
+    """Opt-in Arrow IPC buffer compression of runner outputs."""
+
+    @pytest.fixture
+    def table(self):
+        import io
+
+        import polars as pl
+
+        df = pl.DataFrame({"day": range(1000), "infected": [0] * 900 + list(range(100))})
+        buffer = io.BytesIO()
+        df.write_ipc(buffer)
+        return df, buffer.getvalue()
+
+    @staticmethod
+    def _runner(monkeypatch, codec, outputs):
+        from unittest.mock import patch
+
+        from modelops.worker.subprocess_runner import SubprocessRunner
+
+        monkeypatch.setenv("MODELOPS_ARTIFACT_CODEC", codec)
+        with patch("modelops.worker.subprocess_runner.SubprocessRunner._setup"):
+            runner = SubprocessRunner(
+                bundle_path=Path("/tmp/test"), venv_path=Path("/tmp/venv"), bundle_digest="d"
+            )
+        runner.wire_fn = lambda entrypoint, params, seed: outputs
+        return runner
+
+    @pytest.mark.parametrize("codec", ["lz4", "zstd"])
+    def test_outputs_compressed_with_logical_checksum(self, monkeypatch, table, codec):
+        import base64
+        import hashlib
+
+        import polars as pl
+        from modelops_contracts import SimTask, UniqueParameterSet
+        from polars.testing import assert_frame_equal
+
+        from modelops.adapters.exec_env.isolated_warm import IsolatedWarmExecEnv
+
+        df, ipc = table
+        runner = self._runner(monkeypatch, codec, {"table": ipc, "metadata": b'{"ok": 1}'})
+        assert runner.ready()["artifact_codec"] == codec
+
+        artifacts = runner.execute("model/baseline", {}, 1)
+        envelope = artifacts["table"]
+        assert envelope["codec"] == codec
+        assert len(base64.b64decode(envelope["inline"])) < len(ipc)
+        assert isinstance(artifacts["metadata"], str)  # Not Arrow, sent as is
+
+        # The host keeps the compressed bytes and the checksum of the original
+        task = SimTask(
+            bundle_ref="sha256:" + "a" * 64,
+            entrypoint="model/baseline",
+            params=UniqueParameterSet.from_dict({"x": 1}),
+            seed=1,
+        )
+        env = IsolatedWarmExecEnv.__new__(IsolatedWarmExecEnv)
+        artifact = env._create_sim_return(task, artifacts).outputs["table"]
+        assert artifact.checksum == hashlib.blake2b(ipc, digest_size=32).hexdigest()
+        assert artifact.size == len(artifact.inline) < len(ipc)
+        assert_frame_equal(pl.read_ipc(artifact.inline), df)
+
+    def test_disabled_or_unknown_codec(self, monkeypatch, table):
+        _, ipc = table
+        for codec in ("none", "brotli"):
+            runner = self._runner(monkeypatch, codec, {"table": ipc})
+            assert runner.artifact_codec is None
+            assert isinstance(runner.execute("model/baseline", {}, 1)["table"], str)
@@ -0,0 +1,190 @@
+"""Tests for tree-reduced aggregation over large replicate sets."""
+
+import hashlib
+import math
+
+import numpy as np
+import pytest
+from dask.distributed import Client, LocalCluster
+from modelops_contracts import SimReturn, SimTask, TableArtifact, UniqueParameterSet
+from modelops_contracts.simulation import ReplicateSet
+
+from modelops.services import dask_simulation
+from modelops.services.dask_simulation import DaskSimulationService, TaskKeys
+from modelops.services.job_planning import plan_job
+from modelops.services.provenance_store import ProvenanceStore
+from modelops.services.tree_aggregation import (
+    PartialAggregation,
+    reduction_groups,
+    tree_fan_in_from_env,
+)
+
+TEST_BUNDLE_REF = "sha256:" + "a" * 64
+
+
+def _flat_loss(logliks):
+    """The runner's loss for a likelihood target over all replicates at once."""
+    peak = max(logliks)
+    log_marginal = peak + math.log(sum(math.exp(x - peak) for x in logliks))
+    return -(log_marginal - math.log(len(logliks)))
+
+
+def test_combined_partials_match_flat_loss():
+    logliks = [-1000.0 - i * 0.37 for i in range(23)]  # Would underflow without the shift
+    ids = [f"{i:064x}" for i in range(23)]
+    parts = [
+        PartialAggregation.from_logliks(logliks[i : i + 5], ids[i : i + 5])
+        for i in range(0, 23, 5)
+    ]
+
+    # Any tree shape gives the same result
+    total = PartialAggregation.combine(
+        [PartialAggregation.combine(parts[:2]), PartialAggregation.combine(parts[2:])]
+    )
+    assert total.n_replicates == 23
+    assert total.task_ids == tuple(ids)
+    assert total.loss == pytest.approx(_flat_loss(logliks), rel=1e-12)
+
+    with pytest.raises(ValueError):
+        PartialAggregation.from_logliks([-1.0], ids[:2])
+
+
+def test_reduction_groups_and_fan_in_env(monkeypatch):
+    assert reduction_groups(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    with pytest.raises(ValueError):
+        reduction_groups([1, 2], 1)
+
+    assert tree_fan_in_from_env() == 0
+    monkeypatch.setenv("MODELOPS_AGG_TREE_FANIN", "16")
+    assert tree_fan_in_from_env() == 16
+    monkeypatch.setenv("MODELOPS_AGG_TREE_FANIN", "1")
+    with pytest.raises(ValueError):
+        tree_fan_in_from_env()
+
+
+# Tree submission on a cluster, with a fake execution environment
+
+
+def _task(seed):
+    return SimTask(
+        bundle_ref=TEST_BUNDLE_REF,
+        entrypoint="model.sim/baseline",
+        params=UniqueParameterSet.from_dict({"x": 1}),
+        seed=seed,
+    )
+
+
+def _fake_run_task(task):
+    data = str(task.seed).encode()
+    artifact = TableArtifact(
+        size=len(data), inline=data, checksum=hashlib.blake2b(data, digest_size=32).hexdigest()
+    )
+    return SimReturn(task_id=f"{task.seed:064x}", outputs={"seed": artifact})
+
+
+class _FakeLikelihoodEnv:
+    """Log-likelihood of a replicate is minus its seed / 10."""
+
+    def __init__(self):
+        self.group_sizes = []
+
+    def run_partial_aggregation(self, task):
+        self.group_sizes.append(len(task.sim_returns))
+        logliks = [-int(sr.outputs["seed"].inline) / 10 for sr in task.sim_returns]
+        return PartialAggregation.from_logliks(logliks, [sr.task_id for sr in task.sim_returns])
+
+
+@pytest.fixture(scope="module")
+def client():
+    cluster = LocalCluster(
+        n_workers=2, threads_per_worker=2, processes=False, dashboard_address=None
+    )
+    client = Client(cluster)
+    yield client
+    client.close()
+    cluster.close()
+
+
+@pytest.fixture
+def group_sizes(client, monkeypatch):
+    """Install the fake environment; returns a callable listing the leaf group sizes."""
+    monkeypatch.setattr(dask_simulation, "_worker_run_task", _fake_run_task)
+
+    def install(dask_worker):
+        dask_worker.modelops_exec_env = _FakeLikelihoodEnv()
+
+    def sizes():
+        per_worker = client.run(lambda dask_worker: dask_worker.modelops_exec_env.group_sizes)
+        return sorted(size for sizes in per_worker.values() for size in sizes)
+
+    client.run(install)
+    yield sizes
+    client.run(lambda dask_worker: delattr(dask_worker, "modelops_exec_env"))
+
+
+def _service(client, fan_in):
+    service = DaskSimulationService.__new__(DaskSimulationService)
+    service.client = client
+    service.tree_fan_in = fan_in
+    return service
+
+
+@pytest.mark.parametrize("content_addressed", [False, True])
+def test_tree_aggregation_with_cached_refs(client, group_sizes, tmp_path, content_addressed):
+    service = _service(client, fan_in=3)
+    service.content_addressed_keys = content_addressed
+    tasks = [_task(seed) for seed in range(1, 21)]
+
+    # Two replicates come from the provenance store
+    store = ProvenanceStore(storage_dir=tmp_path)
+    for task in tasks[4:6]:
+        store.put_sim(task, _fake_run_task(task))
+    param_id = tasks[0].params.param_id
+    plan = plan_job({param_id: tasks}, store)
+    misses = plan.misses(param_id)
+    seeds = np.array([t.seed for t in misses], dtype=np.uint64)
+    sim_futures = service.submit_replicates(
+        ReplicateSet(base_task=misses[0], n_replicates=len(misses)), seeds=seeds
+    )
+
+    agg = service.submit_aggregation(
+        plan.inputs(param_id, sim_futures),
+        "targets.fit/loglik",
+        bundle_ref=TEST_BUNDLE_REF,
+        param_id=param_id,
+    ).result(timeout=30)
+
+    assert agg.n_replicates == 20
+    assert agg.loss == pytest.approx(_flat_loss([-seed / 10 for seed in range(1, 21)]))
+    assert agg.diagnostics["tree_fan_in"] == 3
+    # 20 replicates in groups of at most 3; only partial summaries are combined
+    assert group_sizes() == [2] + [3] * 6
+
+
+def test_small_sets_aggregate_directly(client, group_sizes, monkeypatch):
+    monkeypatch.setattr(
+        dask_simulation, "_worker_run_aggregation", lambda agg_task: len(agg_task.sim_returns)
+    )
+    service = _service(client, fan_in=8)
+    tasks = [_task(seed) for seed in range(1, 5)]
+    sim_futures = service.submit_replicates(
+        ReplicateSet(base_task=tasks[0], n_replicates=4),
+        seeds=np.array([t.seed for t in tasks], dtype=np.uint64),
+    )
+    agg = service.submit_aggregation(
+        sim_futures, "targets.fit/loss", bundle_ref=TEST_BUNDLE_REF, param_id="p"
+    )
+    assert agg.result(timeout=30) == 4
+    assert group_sizes() == []
+
+
+def test_content_agg_key_covers_bundle_and_mode():
+    sim_keys = ["sim-a", "sim-b"]
+    direct = TaskKeys.content_agg_key(TEST_BUNDLE_REF, "targets.fit/loss", sim_keys)
+
+    assert direct == TaskKeys.content_agg_key(TEST_BUNDLE_REF, "targets.fit/loss", sim_keys[::-1])
+    # A tree root returns a partial summary, not what a direct aggregation returns
+    assert direct != TaskKeys.content_agg_key(
+        TEST_BUNDLE_REF, "targets.fit/loss", sim_keys, mode="tree-2"
+    )
+    assert direct != TaskKeys.content_agg_key("sha256:" + "b" * 64, "targets.fit/loss", sim_keys)
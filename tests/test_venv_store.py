@@ -0,0 +1,89 @@
+"""Tests for the node-level venv store."""
+
+import os
+import time
+from pathlib import Path
+
+from modelops.worker.venv_store import CLONE_MARKER, VenvStore
+
+
+def _make_venv(path: Path) -> Path:
+    """Create a minimal fake venv with a console script pointing at itself."""
+    (path / "bin").mkdir(parents=True)
+    (path / "bin" / "python").write_text("#!/bin/sh\n")
+    (path / "bin" / "tool").write_text(f"#!{path}/bin/python\nprint('hi')\n")
+    (path / "lib" / "site-packages" / "numpy").mkdir(parents=True)
+    (path / "lib" / "site-packages" / "numpy" / "__init__.py").write_text("x = 1\n")
+    (path / ".deps_installed").write_text("fingerprint")
+    (path / "logs").mkdir()
+    (path / "logs" / "runner.stderr").write_text("noise")
+    return path
+
+
+class TestVenvStore:
+    """Tests for publish/clone/gc of template venvs."""
+
+    def test_clone_without_template(self, tmp_path):
+        store = VenvStore(tmp_path / "store")
+        assert not store.clone("deadbeef", tmp_path / "venvs" / "v1")
+        assert not (tmp_path / "venvs" / "v1").exists()
+
+    def test_publish_then_clone(self, tmp_path):
+        store = VenvStore(tmp_path / "store")
+        source = _make_venv(tmp_path / "venvs" / "source")
+
+        assert store.publish("deadbeef", source)
+        assert store.has_template("deadbeef")
+        # Second publish for the same fingerprint keeps the first template
+        assert not store.publish("deadbeef", source)
+
+        clone = tmp_path / "venvs" / "clone"
+        assert store.clone("deadbeef", clone)
+
+        # Packages are shared via hardlinks
+        src_init = source / "lib" / "site-packages" / "numpy" / "__init__.py"
+        clone_init = clone / "lib" / "site-packages" / "numpy" / "__init__.py"
+        assert os.stat(src_init).st_ino == os.stat(clone_init).st_ino
+
+        # Per-venv state is not shared, and the clone is marked for the runner
+        assert not (clone / ".deps_installed").exists()
+        assert not (clone / "logs").exists()
+        assert (clone / CLONE_MARKER).read_text() == "deadbeef"
+
+    def test_clone_rewrites_scripts_without_touching_template(self, tmp_path):
+        store = VenvStore(tmp_path / "store")
+        store.publish("deadbeef", _make_venv(tmp_path / "venvs" / "source"))
+        template = store.templates_dir / store.template_key("deadbeef")
+
+        clone = tmp_path / "venvs" / "clone"
+        store.clone("deadbeef", clone)
+
+        assert (clone / "bin" / "tool").read_text().startswith(f"#!{clone}/bin/python")
+        assert (template / "bin" / "tool").read_text().startswith(f"#!{template}/bin/python")
+
+    def test_gc_removes_stale_templates(self, tmp_path):
+        store = VenvStore(tmp_path / "store", ttl_seconds=3600)
+        store.publish("old", _make_venv(tmp_path / "venvs" / "a"))
+        store.publish("new", _make_venv(tmp_path / "venvs" / "b"))
+
+        old_template = store.templates_dir / store.template_key("old")
+        stale = time.time() - 7200
+        os.utime(old_template, (stale, stale))
+
+        removed = store.gc()
+
+        assert removed == [store.template_key("old")]
+        assert not store.has_template("old")
+        assert store.has_template("new")
+
+    def test_env_shares_uv_cache(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("UV_CACHE_DIR", raising=False)
+        monkeypatch.delenv("UV_LINK_MODE", raising=False)
+        store = VenvStore(tmp_path / "store")
+
+        env = store.env()
+        assert env["UV_CACHE_DIR"] == str(store.uv_cache_dir)
+        assert env["UV_LINK_MODE"] == "hardlink"
+
+        monkeypatch.setenv("UV_CACHE_DIR", "/custom")
+        assert "UV_CACHE_DIR" not in store.env()
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from modelops.worker.jsonrpc import DeadlineExceededError
 from modelops.worker.process_manager import WarmProcessManager
 from modelops.utils.test_bundle_digest import compute_test_bundle_digest, format_test_bundle_ref
 
@@ -12,20 +13,23 @@ def _hung_bundle_path() -> Path:
     return Path(__file__).resolve().parent.parent / "examples" / "hung_bundle"
 
 
-@pytest.mark.timeout(60)
-def test_execute_task_times_out_and_evicts_process(tmp_path):
-    """Hung wire functions should trigger TimeoutError and process eviction."""
-    bundle_path = _hung_bundle_path()
-    digest = format_test_bundle_ref(compute_test_bundle_digest(bundle_path))
-
-    manager = WarmProcessManager(
+def _manager(tmp_path) -> WarmProcessManager:
+    return WarmProcessManager(
         max_processes=1,
         venvs_dir=tmp_path / "venvs",
         force_fresh_venv=True,
         rpc_timeout_seconds=2,
     )
 
-    with pytest.raises(TimeoutError):
+
+@pytest.mark.timeout(60)
+def test_execute_task_deadline_keeps_process_warm(tmp_path):
+    """The runner stops a task at its deadline and the warm process survives."""
+    bundle_path = _hung_bundle_path()
+    digest = format_test_bundle_ref(compute_test_bundle_digest(bundle_path))
+    manager = _manager(tmp_path)
+
+    with pytest.raises(DeadlineExceededError):
         manager.execute_task(
             bundle_digest=digest,
             bundle_path=bundle_path,
@@ -34,4 +38,24 @@ def test_execute_task_times_out_and_evicts_process(tmp_path):
             seed=123,
         )
 
+    assert manager.active_count() == 1, "Interrupted process should stay in the pool"
+    assert manager.get_process(digest, bundle_path).is_alive()
+
+
+@pytest.mark.timeout(60)
+def test_execute_task_times_out_and_evicts_process(tmp_path):
+    """Wire functions that can't be interrupted trigger TimeoutError and eviction."""
+    bundle_path = _hung_bundle_path()
+    digest = format_test_bundle_ref(compute_test_bundle_digest(bundle_path))
+    manager = _manager(tmp_path)
+
+    with pytest.raises(TimeoutError):
+        manager.execute_task(
+            bundle_digest=digest,
+            bundle_path=bundle_path,
+            entrypoint="hung_bundle/uninterruptible",
+            params={},
+            seed=123,
+        )
+
     assert not manager._processes, "Hung process should be evicted after timeout"